@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# BENCHMARK FAST TIER - Built-In Lint Tier Benchmark
+# ///////////////////////////////////////////////////////////////
+
+"""
+Built-in fast lint tier benchmark.
+
+Builds a synthetic project and times the built-in ast checks (in-process and
+on the worker pool) against a ruff run over the same files. The fast tier
+runs before every check, so it should stay a small fraction of ruff's time.
+Cold runs parse every file; warm runs only hash files whose results are in
+the lint result cache, which is what the "cached" row measures.
+
+Usage:
+    python .scripts/dev/benchmark_fast_tier.py [options]
+
+Options:
+    --root PATH        Where to build the synthetic project (default: temp dir)
+    --files N          Number of Python files to generate (default: 2000)
+    --repeat N         Runs per configuration, best time is kept (default: 3)
+    --help             Show this help
+"""
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import argparse
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Third-party imports
+from rich.console import Console
+from rich.table import Table
+
+# Project root is 2 levels up from .scripts/dev/benchmark_fast_tier.py
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+# Local imports
+from womm.services import LintService  # noqa: E402
+from womm.shared.configs.lint.python_linting_config import (  # noqa: E402
+    PythonLintingConfig,
+)
+from womm.utils.lint import check_files, hash_file_content  # noqa: E402
+
+# ///////////////////////////////////////////////////////////////
+# VARIABLES
+# ///////////////////////////////////////////////////////////////
+
+MARKER_NAME = ".womm-bench-project"
+
+MODULE_TEMPLATE = '''"""Synthetic module {index}."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+
+class Handler{index}:
+    """Handle records."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.items: list[dict[str, Any]] = []
+
+    def load(self, name: str) -> dict[str, Any]:
+        with (self.root / name).open(encoding="utf-8") as handle:
+            data = json.load(handle)
+        self.items.append(data)
+        return data
+
+    def summary(self) -> str:
+        lines = [f"{{key}}={{value}}" for item in self.items for key, value in item.items()]
+        return os.linesep.join(lines)
+
+
+def main(argv: list[str]) -> int:
+    handler = Handler{index}(Path(argv[0]))
+    for name in argv[1:]:
+        handler.load(name)
+    print(handler.summary())
+    return 0
+'''
+
+# ///////////////////////////////////////////////////////////////
+# FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def build_project(root: Path, total_files: int) -> list[str]:
+    """Create a synthetic project of ``total_files`` modules.
+
+    Args:
+        root: Directory to populate
+        total_files: Number of modules to create
+
+    Returns:
+        list[str]: Absolute paths of the modules
+    """
+    marker = root / MARKER_NAME
+    files = [
+        root / f"pkg_{index // 100}" / f"module_{index}.py"
+        for index in range(total_files)
+    ]
+    if marker.exists() and marker.read_text(encoding="utf-8") == str(total_files):
+        return [str(path) for path in files]
+
+    for index, path in enumerate(files):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(MODULE_TEMPLATE.format(index=index), encoding="utf-8")
+
+    marker.write_text(str(total_files), encoding="utf-8")
+    return [str(path) for path in files]
+
+
+def best_time(func, repeat: int) -> float:
+    """Run ``func`` several times and keep the fastest run.
+
+    Args:
+        func: Callable to time
+        repeat: Number of runs
+
+    Returns:
+        float: Best wall time in seconds
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+# ///////////////////////////////////////////////////////////////
+# MAIN
+# ///////////////////////////////////////////////////////////////
+
+
+def main() -> int:
+    """Run the benchmark.
+
+    Returns:
+        int: Exit code
+    """
+    parser = argparse.ArgumentParser(description="Built-in fast lint tier benchmark")
+    parser.add_argument("--root", type=Path, default=None)
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    console = Console()
+    root = args.root or Path(tempfile.gettempdir()) / f"womm-bench-lint-{args.files}"
+
+    with console.status(f"Building synthetic project in {root}..."):
+        files = build_project(root, args.files)
+
+    lint_service = LintService()
+    table = Table(title=f"Fast lint tier: {args.files:,} files")
+    table.add_column("Run")
+    table.add_column("Best time (s)", justify="right")
+    table.add_column("vs ruff", justify="right")
+
+    timings = {
+        "ast (in-process)": best_time(
+            lambda: check_files(files, str(root)), args.repeat
+        ),
+        "ast (worker pool)": best_time(
+            lambda: lint_service.run_builtin_check(
+                PythonLintingConfig.FAST_TIER_TOOL,
+                files,
+                root,
+                PythonLintingConfig.FAST_TIER_BATCH_SIZE,
+            ),
+            args.repeat,
+        ),
+        "ast (cached)": best_time(
+            lambda: [hash_file_content(file_path) for file_path in files], args.repeat
+        ),
+    }
+    lint_service.shutdown_process_pool()
+
+    ruff = shutil.which("ruff")
+    ruff_time = None
+    if ruff:
+        ruff_time = best_time(
+            lambda: subprocess.run(
+                [
+                    ruff,
+                    "check",
+                    "--no-cache",
+                    "--no-fix",
+                    "--output-format",
+                    "json",
+                    ".",
+                ],
+                cwd=root,
+                capture_output=True,
+                check=False,
+            ),
+            args.repeat,
+        )
+        timings["ruff check"] = ruff_time
+
+    for name, elapsed in timings.items():
+        ratio = f"{elapsed / ruff_time:.2f}x" if ruff_time else "n/a"
+        table.add_row(name, f"{elapsed:.3f}", ratio)
+
+    console.print(table)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# BENCHMARK SCANNER - File Scanner Traversal Benchmark
+# ///////////////////////////////////////////////////////////////
+
+"""
+File scanner traversal benchmark.
+
+Builds a synthetic source tree (500k files by default) and times the serial
+walker against the threaded walker for a range of worker counts. Network
+filesystems can be emulated with --latency-ms, which adds a fixed delay to
+every directory listing.
+
+Usage:
+    python .scripts/dev/benchmark_scanner.py [options]
+
+Options:
+    --root PATH        Where to build the synthetic tree (default: temp dir)
+    --files N          Approximate number of files to generate (default: 500000)
+    --workers LIST     Comma-separated worker counts (default: 1,2,4,8,16,32)
+    --latency-ms MS    Simulated per-directory listing latency (default: 0)
+    --repeat N         Runs per configuration, best time is kept (default: 3)
+    --help             Show this help
+"""
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Third-party imports
+from rich.console import Console
+from rich.table import Table
+
+# Project root is 2 levels up from .scripts/dev/benchmark_scanner.py
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+# Local imports
+from womm.utils.common import file_scanner_utils  # noqa: E402
+
+# ///////////////////////////////////////////////////////////////
+# VARIABLES
+# ///////////////////////////////////////////////////////////////
+
+FILES_PER_DIR = 40
+DIRS_PER_LEVEL = 10
+MARKER_NAME = ".womm-bench-tree"
+
+# ///////////////////////////////////////////////////////////////
+# FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def build_tree(root: Path, total_files: int) -> int:
+    """Create a synthetic tree of roughly ``total_files`` files.
+
+    Every directory holds a mix of Python and non-Python files; a
+    ``node_modules`` directory is added at each level so pruning is exercised.
+
+    Args:
+        root: Directory to populate
+        total_files: Approximate number of files to create
+
+    Returns:
+        int: Number of Python files created outside excluded directories
+    """
+    marker = root / MARKER_NAME
+    if marker.exists() and marker.read_text(encoding="utf-8").startswith(
+        f"{total_files}:"
+    ):
+        return int(marker.read_text(encoding="utf-8").split(":")[1])
+
+    created = 0
+    python_files = 0
+    queue = [root]
+    while queue and created < total_files:
+        current = queue.pop(0)
+        current.mkdir(parents=True, exist_ok=True)
+        for index in range(FILES_PER_DIR):
+            suffix = ".py" if index % 2 == 0 else ".txt"
+            (current / f"module_{index}{suffix}").touch()
+            created += 1
+            python_files += suffix == ".py"
+        vendored = current / "node_modules"
+        vendored.mkdir(exist_ok=True)
+        (vendored / "vendored.py").touch()
+        created += 1
+        queue.extend(current / f"pkg_{index}" for index in range(DIRS_PER_LEVEL))
+
+    marker.write_text(f"{total_files}:{python_files}", encoding="utf-8")
+    return python_files
+
+
+def simulate_latency(latency_ms: float) -> None:
+    """Add a fixed delay to every directory listing.
+
+    Args:
+        latency_ms: Delay in milliseconds
+    """
+    if latency_ms <= 0:
+        return
+
+    original = file_scanner_utils.scan_directory_entries
+
+    def slow_scan(
+        directory: str, extensions: set[str] | None = None
+    ) -> tuple[list[str], list[str]]:
+        time.sleep(latency_ms / 1000)
+        return original(directory, extensions)
+
+    file_scanner_utils.scan_directory_entries = slow_scan
+
+
+def best_time(func, repeat: int) -> tuple[float, int]:
+    """Run ``func`` several times and keep the fastest run.
+
+    Args:
+        func: Callable returning a sized collection
+        repeat: Number of runs
+
+    Returns:
+        tuple[float, int]: Best wall time in seconds and result size
+    """
+    best = float("inf")
+    count = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = len(func())
+        best = min(best, time.perf_counter() - start)
+    return best, count
+
+
+# ///////////////////////////////////////////////////////////////
+# MAIN
+# ///////////////////////////////////////////////////////////////
+
+
+def main() -> int:
+    """Run the benchmark.
+
+    Returns:
+        int: Exit code
+    """
+    parser = argparse.ArgumentParser(description="File scanner traversal benchmark")
+    parser.add_argument("--root", type=Path, default=None)
+    parser.add_argument("--files", type=int, default=500_000)
+    parser.add_argument("--workers", default="1,2,4,8,16,32")
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    console = Console()
+    root = args.root or Path(tempfile.gettempdir()) / f"womm-bench-{args.files}"
+
+    with console.status(f"Building synthetic tree in {root}..."):
+        expected = build_tree(root, args.files)
+
+    simulate_latency(args.latency_ms)
+
+    table = Table(title=f"File scanner: {args.files:,} files, {expected:,} Python")
+    table.add_column("Walker")
+    table.add_column("Workers", justify="right")
+    table.add_column("Best time (s)", justify="right")
+    table.add_column("Speedup", justify="right")
+    table.add_column("Files", justify="right")
+
+    serial_time, count = best_time(
+        lambda: list(file_scanner_utils.walk_python_files(root)), args.repeat
+    )
+    table.add_row("serial", "1", f"{serial_time:.3f}", "1.00x", f"{count:,}")
+
+    for workers in (int(value) for value in args.workers.split(",")):
+        elapsed, count = best_time(
+            lambda workers=workers: file_scanner_utils.walk_python_files_parallel(
+                root, workers=workers
+            ),
+            args.repeat,
+        )
+        table.add_row(
+            "threaded",
+            str(workers),
+            f"{elapsed:.3f}",
+            f"{serial_time / elapsed:.2f}x",
+            f"{count:,}",
+        )
+
+    console.print(table)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
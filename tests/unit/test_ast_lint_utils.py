@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# TEST AST LINT UTILS - Built-in fast lint tier unit tests
+# Project: Works On My Machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the built-in fast lint tier.
+
+Covers syntax error detection, the unused and duplicate import rules,
+noqa suppression and issue formatting.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+from pathlib import Path
+
+# Local imports
+from womm.utils.lint.ast_lint_utils import (
+    DUPLICATE_IMPORT_CODE,
+    SYNTAX_ERROR_CODE,
+    UNUSED_IMPORT_CODE,
+    check_files,
+    check_source,
+    format_issues,
+    is_syntax_error,
+)
+
+# ///////////////////////////////////////////////////////////////
+# HELPERS
+# ///////////////////////////////////////////////////////////////
+
+
+def _codes_and_rows(source: str, file_name: str = "module.py") -> list[tuple]:
+    """Run the checks and keep each issue's code and row."""
+    return [
+        (issue["code"], issue["location"]["row"])
+        for issue in check_source(source.encode("utf-8"), file_name)
+    ]
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES - SYNTAX ERRORS
+# ///////////////////////////////////////////////////////////////
+
+
+class TestSyntaxErrors:
+    """Tests for syntax error detection."""
+
+    def test_syntax_error_reported(self):
+        """Test that a file that does not parse gets a single E999 issue."""
+        issues = check_source(b"import os\ndef broken(:\n", "broken.py")
+
+        assert len(issues) == 1
+        assert issues[0]["code"] == SYNTAX_ERROR_CODE
+        assert issues[0]["location"]["row"] == 2
+        assert is_syntax_error(issues[0])
+
+    def test_syntax_error_reported_without_import_checks(self):
+        """Test that syntax errors are reported when import checks are off."""
+        issues = check_source(b"x = (\n", "broken.py", check_imports=False)
+
+        assert [issue["code"] for issue in issues] == [SYNTAX_ERROR_CODE]
+
+    def test_import_checks_disabled(self):
+        """Test that import issues are not reported when disabled."""
+        assert check_source(b"import os\n", "module.py", check_imports=False) == []
+
+    def test_unreadable_file_reported(self, temp_dir: Path):
+        """Test that a missing file is reported as a syntax error."""
+        issues = check_files(["missing.py"], str(temp_dir))
+
+        assert len(issues) == 1
+        assert is_syntax_error(issues[0])
+
+    def test_import_issue_is_not_syntax_error(self):
+        """Test that import issues are not treated as syntax errors."""
+        issues = check_source(b"import os\n", "module.py")
+
+        assert issues
+        assert not any(is_syntax_error(issue) for issue in issues)
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES - IMPORT RULES
+# ///////////////////////////////////////////////////////////////
+
+
+class TestImportRules:
+    """Tests for the unused and duplicate import rules."""
+
+    def test_unused_import_reported(self):
+        """Test that an unused import is reported."""
+        assert _codes_and_rows("import os\n") == [(UNUSED_IMPORT_CODE, 1)]
+
+    def test_used_import_not_reported(self):
+        """Test that a used import is not reported."""
+        assert _codes_and_rows("import os\nprint(os.sep)\n") == []
+
+    def test_dotted_import_uses_top_level_name(self):
+        """Test that ``import a.b`` counts uses of ``a``."""
+        assert _codes_and_rows("import os.path\nos.getcwd()\n") == []
+
+    def test_explicit_reexport_not_reported(self):
+        """Test that ``import x as x`` is never reported as unused."""
+        assert _codes_and_rows("from os import sep as sep\n") == []
+
+    def test_init_file_not_reported(self):
+        """Test that imports in ``__init__.py`` are never reported as unused."""
+        assert _codes_and_rows("from .module import name\n", "__init__.py") == []
+
+    def test_future_and_nested_imports_ignored(self):
+        """Test that ``__future__`` and function-level imports are ignored."""
+        source = "from __future__ import annotations\n\ndef f():\n    import os\n"
+
+        assert _codes_and_rows(source) == []
+
+    def test_multiline_import_reported_on_alias_line(self):
+        """Test that issues of a multi-line import point at the alias line."""
+        source = "from os import (\n    path,\n    sep,\n)\nprint(path)\n"
+
+        issues = check_source(source.encode("utf-8"), "module.py")
+
+        assert len(issues) == 1
+        assert issues[0]["code"] == UNUSED_IMPORT_CODE
+        assert issues[0]["message"] == "`os.sep` imported but unused"
+        assert issues[0]["location"] == {"row": 3, "column": 5}
+
+    def test_duplicate_unused_import_reported(self):
+        """Test that re-importing an unused name is reported as F811."""
+        source = "import os\nimport os\n"
+
+        assert _codes_and_rows(source) == [
+            (UNUSED_IMPORT_CODE, 1),
+            (DUPLICATE_IMPORT_CODE, 2),
+        ]
+
+    def test_duplicate_used_import_not_reported(self):
+        """Test that re-importing a used name is not reported."""
+        source = "import os\nprint(os.sep)\nimport os\nprint(os.sep)\n"
+
+        assert _codes_and_rows(source) == []
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES - NOQA HANDLING
+# ///////////////////////////////////////////////////////////////
+
+
+class TestNoqaHandling:
+    """Tests for noqa suppression."""
+
+    def test_bare_noqa_suppresses(self):
+        """Test that a bare noqa comment suppresses the issue."""
+        assert _codes_and_rows("import os  # noqa\n") == []
+
+    def test_matching_code_suppresses(self):
+        """Test that a noqa comment listing the rule suppresses the issue."""
+        assert _codes_and_rows("import os  # noqa: E501, F401\n") == []
+
+    def test_other_code_does_not_suppress(self):
+        """Test that a noqa comment for another rule keeps the issue."""
+        assert _codes_and_rows("import os  # noqa: E501\n") == [(UNUSED_IMPORT_CODE, 1)]
+
+    def test_noqa_on_alias_line_of_multiline_import(self):
+        """Test that noqa applies to the alias line it is written on."""
+        source = "from os import (\n    path,  # noqa: F401\n    sep,\n)\n"
+
+        assert _codes_and_rows(source) == [(UNUSED_IMPORT_CODE, 3)]
+
+    def test_noqa_on_statement_line_does_not_cover_aliases(self):
+        """Test that noqa on the opening line does not hide later aliases."""
+        source = "from os import (  # noqa\n    sep,\n)\n"
+
+        assert _codes_and_rows(source) == [(UNUSED_IMPORT_CODE, 2)]
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES - FORMATTING
+# ///////////////////////////////////////////////////////////////
+
+
+class TestFormatIssues:
+    """Tests for issue formatting."""
+
+    def test_format_with_code(self, temp_dir: Path):
+        """Test that issues are formatted as path:row:column: CODE message."""
+        issues = check_source(b"import os\n", str(temp_dir / "module.py"))
+
+        assert (
+            format_issues(issues, str(temp_dir))
+            == "module.py:1:8: F401 `os` imported but unused"
+        )
+
+    def test_format_without_code(self, temp_dir: Path):
+        """Test that issues without a code (ruff syntax errors) are formatted."""
+        issue = {
+            "code": None,
+            "message": "SyntaxError: invalid syntax",
+            "filename": "module.py",
+            "location": {"row": 2, "column": 1},
+        }
+
+        assert (
+            format_issues([issue], str(temp_dir))
+            == "module.py:2:1: SyntaxError: invalid syntax"
+        )
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# TEST CACHE CONFIG - Persistent cache location unit tests
+# Project: Works On My Machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the location of WOMM persistent caches.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import os
+from pathlib import Path
+
+# Third-party imports
+import pytest
+
+# Local imports
+from womm.shared.configs.cache_config import CacheConfig
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+@pytest.mark.skipif(os.name == "nt", reason="XDG cache home is POSIX only")
+class TestCacheDirectory:
+    """Tests for the per-user cache directory."""
+
+    def test_xdg_cache_home(self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test that caches live under $XDG_CACHE_HOME when it is set."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(temp_dir))
+
+        assert CacheConfig.get_cache_dir() == temp_dir / "womm"
+        assert CacheConfig.is_cache_dir_writable()
+        assert (temp_dir / "womm").is_dir()
+
+    def test_default_cache_home(self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test that caches default to ~/.cache/womm."""
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+        monkeypatch.setenv("HOME", str(temp_dir))
+
+        assert CacheConfig.get_cache_dir() == temp_dir / ".cache" / "womm"
+
+    def test_unusable_cache_dir(self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test that a cache directory that cannot be created is reported."""
+        blocker = temp_dir / "file"
+        blocker.write_text("")
+        monkeypatch.setenv("XDG_CACHE_HOME", str(blocker))
+
+        assert not CacheConfig.is_cache_dir_writable()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# TEST FILE SCANNER UTILS - Directory walker unit tests
+# Project: Works On My Machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the serial and threaded Python file walkers.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import os
+from pathlib import Path
+from threading import Event
+
+# Third-party imports
+import pytest
+
+# Local imports
+from womm.utils.common import file_scanner_utils
+from womm.utils.common.file_scanner_utils import (
+    iter_python_files_parallel,
+    walk_python_files,
+    walk_python_files_parallel,
+)
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES - THREADED WALKER
+# ///////////////////////////////////////////////////////////////
+
+
+class TestParallelWalk:
+    """Tests for walking directories with a thread pool."""
+
+    def test_matches_serial_walk(self, temp_dir: Path):
+        """Test that the threaded walkers find the same files as the serial one."""
+        for package in ("a", "b", os.path.join("b", "c")):
+            (temp_dir / package).mkdir()
+            (temp_dir / package / "module.py").touch()
+        (temp_dir / "top.py").touch()
+        (temp_dir / "notes.txt").touch()
+
+        expected = sorted(walk_python_files(temp_dir))
+
+        assert len(expected) == 4
+        assert walk_python_files_parallel(temp_dir, workers=3) == expected
+        assert sorted(iter_python_files_parallel(temp_dir, workers=3)) == expected
+
+    def test_yields_before_walk_completes(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that files are yielded while other listings are pending."""
+        (temp_dir / "slow").mkdir()
+        (temp_dir / "slow" / "late.py").touch()
+        (temp_dir / "early.py").touch()
+
+        original = file_scanner_utils.scan_directory_entries
+        release = Event()
+        slow_listed = Event()
+
+        def blocking_scan(
+            directory: str, extensions: set[str] | None = None
+        ) -> tuple[list[str], list[str]]:
+            if directory.endswith("slow"):
+                release.wait(timeout=5)
+                slow_listed.set()
+            return original(directory, extensions)
+
+        monkeypatch.setattr(file_scanner_utils, "scan_directory_entries", blocking_scan)
+
+        files = iter_python_files_parallel(temp_dir, workers=2)
+        first = next(files)
+        yielded_early = not slow_listed.is_set()
+        release.set()
+
+        assert first == temp_dir / "early.py"
+        assert yielded_early
+        assert list(files) == [temp_dir / "slow" / "late.py"]
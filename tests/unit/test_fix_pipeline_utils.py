@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# TEST FIX PIPELINE UTILS - Single-pass fix pipeline unit tests
+# Project: Works On My Machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the single-pass isort/black fix pipeline.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+from pathlib import Path
+
+# Third-party imports
+import pytest
+
+black = pytest.importorskip("black")
+
+# Local imports
+from womm.utils.lint.fix_pipeline_utils import format_files  # noqa: E402
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class TestBlackFormatting:
+    """Tests for formatting files like the black command does."""
+
+    STUB_SOURCE = "def first() -> int: ...\n\n\ndef second() -> str: ...\n"
+
+    def test_module_formatted_as_black(self, temp_dir: Path):
+        """Test that a module gets the same output as black."""
+        file_path = temp_dir / "module.py"
+        file_path.write_text("x = {  'a':1 }\n")
+
+        path, changed_by, errors = format_files(
+            [str(file_path)], str(temp_dir), ["black"]
+        )[0]
+
+        assert path == str(file_path)
+        assert changed_by == ["black"]
+        assert errors == {}
+        assert file_path.read_text() == 'x = {"a": 1}\n'
+
+    def test_stub_formatted_in_stub_mode(self, temp_dir: Path):
+        """Test that a stub file is formatted with black's stub rules."""
+        file_path = temp_dir / "module.pyi"
+        file_path.write_text(self.STUB_SOURCE)
+        expected = black.format_str(self.STUB_SOURCE, mode=black.Mode(is_pyi=True))
+
+        format_files([str(file_path)], str(temp_dir), ["black"])
+
+        assert file_path.read_text() == expected
+        assert expected != self.STUB_SOURCE
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# TEST LINT CACHE UTILS - Lint result cache unit tests
+# Project: Works On My Machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the persistent lint result cache: cache keys, tool
+configuration fingerprints and persistence.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+
+# Third-party imports
+import pytest
+
+# Local imports
+from womm.utils.lint.lint_cache_utils import (
+    find_config_dirs,
+    get_json_error_files,
+    get_lint_cache_key,
+    get_tool_config_fingerprint,
+    hash_file_content,
+    load_lint_cache,
+    save_lint_cache,
+    split_json_issues,
+    split_json_metrics,
+)
+
+# ///////////////////////////////////////////////////////////////
+# HELPERS
+# ///////////////////////////////////////////////////////////////
+
+
+def _fingerprint(project_root: Path, **overrides) -> str:
+    """Compute a ruff fingerprint with default arguments."""
+    arguments = {
+        "tool_name": "ruff",
+        "version": "0.6.0",
+        "args": ["check"],
+        "config_files": ["pyproject.toml", "ruff.toml"],
+        "cache_version": 1,
+    }
+    arguments.update(overrides)
+    return get_tool_config_fingerprint(project_root, **arguments)
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES - INVALIDATION
+# ///////////////////////////////////////////////////////////////
+
+
+class TestCacheKeys:
+    """Tests for content hashes and cache keys."""
+
+    def test_content_hash_follows_content(self, temp_dir: Path):
+        """Test that the content hash changes only with the content."""
+        file_path = temp_dir / "module.py"
+        file_path.write_text("x = 1\n")
+        first = hash_file_content(str(file_path))
+
+        assert hash_file_content(str(file_path)) == first
+
+        file_path.write_text("x = 2\n")
+
+        assert hash_file_content(str(file_path)) != first
+
+    def test_key_depends_on_every_part(self):
+        """Test that the key changes with fingerprint, path and content."""
+        key = get_lint_cache_key("fingerprint", "/project/a.py", "hash")
+
+        assert get_lint_cache_key("fingerprint", "/project/a.py", "hash") == key
+        assert get_lint_cache_key("other", "/project/a.py", "hash") != key
+        assert get_lint_cache_key("fingerprint", "/project/b.py", "hash") != key
+        assert get_lint_cache_key("fingerprint", "/project/a.py", "other") != key
+
+
+class TestToolConfigFingerprint:
+    """Tests for tool configuration fingerprints."""
+
+    def test_stable(self, temp_dir: Path):
+        """Test that an unchanged configuration gives the same fingerprint."""
+        (temp_dir / "ruff.toml").write_text("line-length = 88\n")
+
+        assert _fingerprint(temp_dir) == _fingerprint(temp_dir)
+
+    def test_tool_settings_invalidate(self, temp_dir: Path):
+        """Test that version, arguments and cache version invalidate."""
+        base = _fingerprint(temp_dir)
+
+        assert _fingerprint(temp_dir, version="0.7.0") != base
+        assert _fingerprint(temp_dir, args=["check", "--fix"]) != base
+        assert _fingerprint(temp_dir, cache_version=2) != base
+
+    def test_config_file_invalidates(self, temp_dir: Path):
+        """Test that creating or editing a configuration file invalidates."""
+        missing = _fingerprint(temp_dir)
+        (temp_dir / "ruff.toml").write_text("line-length = 88\n")
+        created = _fingerprint(temp_dir)
+        (temp_dir / "ruff.toml").write_text("line-length = 100\n")
+        edited = _fingerprint(temp_dir)
+
+        assert len({missing, created, edited}) == 3
+
+    def test_pyproject_only_tool_table(self, temp_dir: Path):
+        """Test that only the tool's own pyproject.toml table is considered."""
+        pyproject = temp_dir / "pyproject.toml"
+        pyproject.write_text(
+            '[project]\nversion = "1.0"\n\n[tool.ruff]\nline-length = 88\n'
+        )
+        base = _fingerprint(temp_dir)
+
+        pyproject.write_text(
+            '[project]\nversion = "2.0"\n\n[tool.ruff]\nline-length = 88\n'
+        )
+        assert _fingerprint(temp_dir) == base
+
+        pyproject.write_text(
+            '[project]\nversion = "2.0"\n\n[tool.ruff]\nline-length = 100\n'
+        )
+        assert _fingerprint(temp_dir) != base
+
+    def test_requires_python_invalidates(self, temp_dir: Path):
+        """Test that the project's target Python version invalidates."""
+        pyproject = temp_dir / "pyproject.toml"
+        pyproject.write_text('[project]\nrequires-python = ">=3.9"\n')
+        base = _fingerprint(temp_dir)
+
+        pyproject.write_text('[project]\nrequires-python = ">=3.12"\n')
+        assert _fingerprint(temp_dir) != base
+
+    def test_extended_config_invalidates(self, temp_dir: Path):
+        """Test that files named by ruff's extend setting are followed."""
+        (temp_dir / "ruff.toml").write_text('extend = "shared/base.toml"\n')
+        (temp_dir / "shared").mkdir()
+        base_config = temp_dir / "shared" / "base.toml"
+        base_config.write_text('extend = "../ruff.toml"\nline-length = 88\n')
+        base = _fingerprint(temp_dir)
+
+        base_config.write_text('extend = "../ruff.toml"\nline-length = 100\n')
+        assert _fingerprint(temp_dir) != base
+
+    def test_nested_config_invalidates(self, temp_dir: Path):
+        """Test that configuration files in given subdirectories count."""
+        nested = temp_dir / "pkg"
+        nested.mkdir()
+        (nested / "ruff.toml").write_text("line-length = 88\n")
+        base = _fingerprint(temp_dir, config_dirs=[nested])
+
+        (nested / "ruff.toml").write_text("line-length = 100\n")
+        assert _fingerprint(temp_dir, config_dirs=[nested]) != base
+
+
+class TestFindConfigDirs:
+    """Tests for finding configuration files closer to linted files."""
+
+    def test_finds_directories_between_file_and_root(self, temp_dir: Path):
+        """Test that only configured directories above the files are found."""
+        root = temp_dir.resolve()
+        (root / "pyproject.toml").touch()
+        (root / "a" / "b").mkdir(parents=True)
+        (root / "a" / "ruff.toml").touch()
+        (root / "c").mkdir()
+        (root / "c" / "ruff.toml").touch()
+
+        found = find_config_dirs(
+            root,
+            [str(root / "a" / "b" / "x.py"), str(root / "y.py")],
+            ["pyproject.toml", "ruff.toml"],
+        )
+
+        assert found == [root / "a"]
+
+
+class TestJsonReportAttribution:
+    """Tests for attributing JSON report items to absolute file paths."""
+
+    def test_relative_cwd_matches_absolute_filenames(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test that a relative cwd gives the keys of absolute report paths."""
+        monkeypatch.chdir(temp_dir)
+        expected = os.path.normpath(os.path.join(temp_dir.resolve(), "pkg", "a.py"))
+        ruff_report = [{"filename": expected, "code": "F401"}]
+        bandit_report = {
+            "results": [{"filename": os.path.join("pkg", "a.py")}],
+            "metrics": {os.path.join("pkg", "a.py"): {"loc": 3}},
+            "errors": [{"filename": expected}],
+        }
+
+        assert list(split_json_issues(ruff_report, Path("."))) == [expected]
+        assert list(split_json_issues(bandit_report, Path("."))) == [expected]
+        assert list(split_json_metrics(bandit_report, Path("."))) == [expected]
+        assert get_json_error_files(bandit_report, Path(".")) == {expected}
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES - PERSISTENCE
+# ///////////////////////////////////////////////////////////////
+
+
+class TestLintCachePersistence:
+    """Tests for loading and saving the lint cache."""
+
+    def test_round_trip_keeps_order(self, temp_dir: Path):
+        """Test that saved entries load back in the same order."""
+        cache_path = temp_dir / "cache" / "lint.json"
+        entries = OrderedDict([("b", {"issues": 1}), ("a", {"issues": 0})])
+
+        save_lint_cache(cache_path, 1, entries)
+        loaded = load_lint_cache(cache_path, 1)
+
+        assert list(loaded.items()) == list(entries.items())
+        assert list(cache_path.parent.iterdir()) == [cache_path]
+
+    def test_missing_cache_is_empty(self, temp_dir: Path):
+        """Test that a missing cache loads as empty."""
+        assert load_lint_cache(temp_dir / "lint.json", 1) == OrderedDict()
+
+    def test_version_mismatch_is_empty(self, temp_dir: Path):
+        """Test that a cache from another format version is discarded."""
+        cache_path = temp_dir / "lint.json"
+        save_lint_cache(cache_path, 1, OrderedDict([("a", {})]))
+
+        assert load_lint_cache(cache_path, 2) == OrderedDict()
+
+    def test_corrupt_cache_is_empty(self, temp_dir: Path):
+        """Test that an unreadable or malformed cache loads as empty."""
+        cache_path = temp_dir / "lint.json"
+        cache_path.write_text("{not json")
+
+        assert load_lint_cache(cache_path, 1) == OrderedDict()
+
+        cache_path.write_text(json.dumps({"version": 1, "entries": []}))
+
+        assert load_lint_cache(cache_path, 1) == OrderedDict()
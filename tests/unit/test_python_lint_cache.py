@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# TEST PYTHON LINT CACHE - Cached lint runs unit tests
+# Project: Works On My Machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for reusing lint results across runs of PythonLintService.
+
+The services package needs the Windows registry module, so these tests only
+run where it is available.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import os
+from pathlib import Path
+from typing import Any
+
+# Third-party imports
+import pytest
+
+pytest.importorskip("winreg")
+
+# Local imports
+from womm.services.lint.python_lint_service import PythonLintService  # noqa: E402
+from womm.shared.results.lint_results import ToolResult  # noqa: E402
+
+# ///////////////////////////////////////////////////////////////
+# HELPERS
+# ///////////////////////////////////////////////////////////////
+
+
+class _MemoryLintCache:
+    """In-memory stand-in for the lint result cache service."""
+
+    def __init__(self) -> None:
+        self.entries: dict[str, Any] = {}
+
+    def lookup(self, project_root: Path, keys: dict[str, str]) -> dict[str, Any]:
+        return {
+            file_path: self.entries[key]
+            for file_path, key in keys.items()
+            if key in self.entries
+        }
+
+    def store(self, project_root: Path, new_entries: dict[str, Any]) -> None:
+        self.entries.update(new_entries)
+
+
+class _RuffStub:
+    """Lint service stand-in reporting one issue per file, ruff style."""
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def run_tool_check(self, target_dirs: list[str], **kwargs: Any) -> ToolResult:
+        self.calls.append(list(target_dirs))
+        # ruff reports absolute file names, whatever the working directory
+        issues = [
+            {"filename": os.path.abspath(target), "code": "F401"}
+            for target in target_dirs
+        ]
+        return ToolResult(
+            success=not issues,
+            tool_name="ruff",
+            files_checked=len(target_dirs),
+            issues_found=len(issues),
+            data=issues,
+        )
+
+
+@pytest.fixture
+def service(monkeypatch: pytest.MonkeyPatch) -> PythonLintService:
+    """Provide the lint service with an in-memory cache and a ruff stub."""
+    lint_service = PythonLintService()
+    monkeypatch.setattr(lint_service, "lint_cache", _MemoryLintCache())
+    monkeypatch.setattr(lint_service, "lint_service", _RuffStub())
+    monkeypatch.setattr(
+        lint_service, "_get_cache_fingerprint", lambda *_args, **_kwargs: "fp"
+    )
+    return lint_service
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES
+# ///////////////////////////////////////////////////////////////
+
+
+class TestCachedCheckRuns:
+    """Tests for check runs that go through the lint result cache."""
+
+    def test_relative_cwd_keeps_cached_issues(
+        self,
+        service: PythonLintService,
+        temp_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Test that issues survive the cache when cwd is relative."""
+        (temp_dir / "pkg").mkdir()
+        (temp_dir / "pkg" / "a.py").write_text("import os\n")
+        monkeypatch.chdir(temp_dir)
+        target = os.path.join("pkg", "a.py")
+
+        first = service._run_check_tool("ruff", [target], Path("."), 100, True)
+        second = service._run_check_tool("ruff", [target], Path("."), 100, True)
+
+        assert first.issues_found == 1
+        assert second.issues_found == 1
+        assert not second.success
+        assert service.lint_service.calls == [[target]]
+
+
+class TestFastTier:
+    """Tests for the built-in checks run ahead of the linting tools."""
+
+    def test_ruff_run_skips_host_grammar_gate(
+        self, service: PythonLintService, temp_dir: Path
+    ):
+        """Test that a file the host cannot parse still reaches ruff."""
+        (temp_dir / "a.py").write_text("type Alias = list[int]\nmatch = (\n")
+        service.get_available_tools = lambda: {"ruff": True}
+
+        results = service.check_python_code(["a.py"], temp_dir, use_cache=False)
+
+        assert list(results) == ["ruff"]
+        assert service.lint_service.calls == [["a.py"]]
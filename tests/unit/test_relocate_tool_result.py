@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# TEST RELOCATE TOOL RESULT - Tool result path relocation unit tests
+# Project: Works On My Machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for rewriting the paths of a tool result from the directory a
+tool ran on (e.g. exported staged content) to the real project.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+from pathlib import Path
+from unittest import mock
+
+# Local imports
+from womm.shared.results import ToolResult
+from womm.utils.lint.lint_utils import relocate_tool_result
+
+# ///////////////////////////////////////////////////////////////
+# HELPERS
+# ///////////////////////////////////////////////////////////////
+
+OLD_ROOT = Path("/var/folders/export")
+RESOLVED_ROOT = Path("/private/var/folders/export")
+NEW_ROOT = Path("/home/user/project")
+
+
+def _relocate(message: str, data=None) -> ToolResult:
+    """Relocate a result whose old root resolves through /private."""
+    result = ToolResult(success=True, tool_name="ruff", message=message, data=data)
+    with mock.patch.object(Path, "resolve", return_value=RESOLVED_ROOT):
+        return relocate_tool_result(result, OLD_ROOT, NEW_ROOT)
+
+
+def _join(root: Path, *parts: str) -> str:
+    """Build a path string under a root."""
+    return str(root.joinpath(*parts))
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES - RELOCATION
+# ///////////////////////////////////////////////////////////////
+
+
+class TestRelocateToolResult:
+    """Tests for relocating tool result paths."""
+
+    def test_given_root_relocated(self):
+        """Test that paths under the given root are rewritten."""
+        result = _relocate(f"{_join(OLD_ROOT, 'a.py')}:1:1: F401")
+
+        assert result.message == f"{_join(NEW_ROOT, 'a.py')}:1:1: F401"
+
+    def test_resolved_root_relocated_whole(self):
+        """Test that the resolved root is rewritten without leaving a prefix."""
+        result = _relocate(f"{_join(RESOLVED_ROOT, 'a.py')}:1:1: F401")
+
+        assert result.message == f"{_join(NEW_ROOT, 'a.py')}:1:1: F401"
+
+    def test_root_itself_relocated(self):
+        """Test that the root on its own, quoted or at the end, is rewritten."""
+        result = _relocate(f"cwd='{OLD_ROOT}' root {RESOLVED_ROOT}")
+
+        assert result.message == f"cwd='{NEW_ROOT}' root {NEW_ROOT}"
+
+    def test_lookalike_directory_unchanged(self):
+        """Test that a sibling sharing the root as a prefix is not rewritten."""
+        message = f"{OLD_ROOT}-backup {OLD_ROOT}2 {OLD_ROOT}.orig"
+
+        assert _relocate(message).message == message
+
+    def test_root_inside_other_path_unchanged(self):
+        """Test that the root is only matched at the start of a path."""
+        message = str(Path("/mnt") / str(OLD_ROOT).lstrip("/\\") / "a.py")
+
+        assert _relocate(message).message == message
+
+    def test_data_relocated(self):
+        """Test that strings nested in lists and dicts are rewritten."""
+        data = [
+            {
+                "filename": _join(RESOLVED_ROOT, "pkg", "a.py"),
+                "location": {"row": 1, "column": 1},
+                "fix": None,
+            },
+            {_join(OLD_ROOT, "b.py"): [_join(OLD_ROOT, "b.py")]},
+        ]
+
+        result = _relocate("", data)
+
+        assert result.data == [
+            {
+                "filename": _join(NEW_ROOT, "pkg", "a.py"),
+                "location": {"row": 1, "column": 1},
+                "fix": None,
+            },
+            {_join(NEW_ROOT, "b.py"): [_join(NEW_ROOT, "b.py")]},
+        ]
+
+    def test_original_result_unchanged(self):
+        """Test that relocation returns a copy."""
+        original = ToolResult(
+            success=True, tool_name="ruff", message=_join(OLD_ROOT, "a.py")
+        )
+
+        with mock.patch.object(Path, "resolve", return_value=RESOLVED_ROOT):
+            relocated = relocate_tool_result(original, OLD_ROOT, NEW_ROOT)
+
+        assert original.message == _join(OLD_ROOT, "a.py")
+        assert relocated is not original
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# TEST SECURITY VALIDATOR BATCH - Batch path validation unit tests
+# Project: Works On My Machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for validating many file paths in one pass.
+
+The services package needs the Windows registry module, so these tests only
+run where it is available.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import os
+from pathlib import Path
+
+# Third-party imports
+import pytest
+
+pytest.importorskip("winreg")
+
+# Local imports
+from womm.services.common.security_validator_service import (  # noqa: E402
+    SecurityValidatorService,
+)
+
+# ///////////////////////////////////////////////////////////////
+# FIXTURES
+# ///////////////////////////////////////////////////////////////
+
+
+@pytest.fixture
+def validator() -> SecurityValidatorService:
+    """Provide the security validator service."""
+    return SecurityValidatorService()
+
+
+@pytest.fixture
+def system_dir() -> Path:
+    """Provide an existing system directory of the current platform."""
+    for candidate in ("C:\\Windows", "/etc"):
+        if os.path.isdir(candidate):
+            return Path(candidate)
+    pytest.skip("No known system directory on this platform")
+
+
+def _symlink(target: Path, link: Path, target_is_directory: bool = False) -> None:
+    """Create a symbolic link, skipping the test where that is not allowed."""
+    try:
+        link.symlink_to(target, target_is_directory=target_is_directory)
+    except (OSError, NotImplementedError):
+        pytest.skip("Symbolic links cannot be created here")
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES - BATCH VALIDATION
+# ///////////////////////////////////////////////////////////////
+
+
+class TestValidateFilePaths:
+    """Tests for batch path validation."""
+
+    def test_project_files_valid(self, validator, temp_dir: Path):
+        """Test that ordinary project files are valid, in order."""
+        paths = [str(temp_dir / "a.py"), str(temp_dir / "pkg" / "b.py"), "c.py"]
+        (temp_dir / "a.py").write_text("")
+
+        result = validator.validate_file_paths(paths, base_dir=temp_dir)
+
+        assert result.success
+        assert result.valid_paths == paths
+        assert result.rejected_paths == {}
+        assert result.base_dir == str(temp_dir)
+
+    def test_empty_and_traversal_rejected(self, validator):
+        """Test that empty paths and excessive traversal are rejected."""
+        traversal = "/".join([".."] * 10 + ["a.py"])
+
+        result = validator.validate_file_paths(["", traversal])
+
+        assert result.valid_paths == []
+        assert set(result.rejected_paths) == {"", traversal}
+
+    def test_system_directory_rejected(self, validator, system_dir: Path):
+        """Test that paths inside system directories are rejected."""
+        file_path = str(system_dir / "hosts")
+
+        result = validator.validate_file_paths([file_path])
+
+        assert file_path in result.rejected_paths
+        assert result.valid_paths == []
+
+    def test_file_symlink_into_system_directory_rejected(
+        self, validator, temp_dir: Path, system_dir: Path
+    ):
+        """Test that a file symlink pointing into a system directory is caught."""
+        link = temp_dir / "innocent.py"
+        _symlink(system_dir / "hosts", link)
+
+        result = validator.validate_file_paths([str(link), str(temp_dir / "a.py")])
+
+        assert result.rejected_paths[str(link)].startswith("Access to system")
+        assert result.valid_paths == [str(temp_dir / "a.py")]
+
+    def test_directory_symlink_into_system_directory_rejected(
+        self, validator, temp_dir: Path, system_dir: Path
+    ):
+        """Test that files under a symlinked system directory are caught."""
+        link = temp_dir / "config"
+        _symlink(system_dir, link, target_is_directory=True)
+        paths = [str(link / "a.py"), str(link / "b.py")]
+
+        result = validator.validate_file_paths(paths)
+
+        assert set(result.rejected_paths) == set(paths)
+        assert all(
+            reason.startswith("Access to system")
+            for reason in result.rejected_paths.values()
+        )
+
+    def test_matches_single_path_validation(self, validator, temp_dir: Path):
+        """Test that batch results agree with ``validate_file_path``."""
+        paths = [
+            str(temp_dir / "a.py"),
+            "relative/b.py",
+            "/etc/passwd",
+            "C:\\Windows\\system.ini",
+            "../" * 10 + "c.py",
+        ]
+
+        result = validator.validate_file_paths(paths)
+
+        for file_path in paths:
+            expected = validator.validate_file_path(file_path).is_valid
+            assert (file_path in result.valid_paths) is expected, file_path
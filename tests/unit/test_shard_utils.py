@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# TEST SHARD UTILS - Tool sharding unit tests
+# Project: Works On My Machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for splitting tool targets into shards and merging the JSON
+reports of the shards.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+from pathlib import Path
+
+# Local imports
+from womm.utils.lint.shard_utils import (
+    get_argument_size,
+    merge_json_outputs,
+    order_shards_by_cost,
+    shard_targets,
+)
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES - SHARDING
+# ///////////////////////////////////////////////////////////////
+
+
+class TestShardTargets:
+    """Tests for splitting targets into shards."""
+
+    def test_no_targets(self):
+        """Test that no targets give a single empty shard."""
+        assert shard_targets(["ruff", "check"], [], budget=1000) == [[]]
+
+    def test_all_targets_fit(self):
+        """Test that targets within the budget stay in one shard."""
+        targets = ["a.py", "b.py", "c.py"]
+
+        assert shard_targets(["ruff"], targets, budget=10_000) == [targets]
+
+    def test_budget_respected(self):
+        """Test that every shard fits in the budget and order is kept."""
+        command = ["ruff", "check"]
+        targets = [f"package/module_{index}.py" for index in range(50)]
+        budget = sum(get_argument_size(argument) for argument in command) + 100
+
+        shards = shard_targets(command, targets, budget=budget)
+
+        assert len(shards) > 1
+        assert [target for shard in shards for target in shard] == targets
+        for shard in shards:
+            size = sum(get_argument_size(argument) for argument in command + shard)
+            assert size <= budget
+
+    def test_max_files_respected(self):
+        """Test that shards hold at most ``max_files`` targets."""
+        targets = [f"{index}.py" for index in range(7)]
+
+        shards = shard_targets(["ruff"], targets, budget=10_000, max_files=3)
+
+        assert [len(shard) for shard in shards] == [3, 3, 1]
+        assert [target for shard in shards for target in shard] == targets
+
+    def test_oversized_target_gets_own_shard(self):
+        """Test that a target larger than the budget is still kept."""
+        targets = ["a.py", "x" * 500, "b.py"]
+
+        shards = shard_targets(["ruff"], targets, budget=100)
+
+        assert ["x" * 500] in shards
+        assert [target for shard in shards for target in shard] == targets
+
+
+class TestOrderShardsByCost:
+    """Tests for ordering shards longest first."""
+
+    def test_largest_shard_first(self, temp_dir: Path):
+        """Test that shards are ordered by total file size, largest first."""
+        (temp_dir / "small.py").write_text("x = 1\n")
+        (temp_dir / "large.py").write_text("x = 1\n" * 100)
+
+        order = order_shards_by_cost([["small.py"], ["large.py"]], str(temp_dir))
+
+        assert order == [1, 0]
+
+    def test_directory_shard_first(self, temp_dir: Path):
+        """Test that a shard containing a directory is treated as largest."""
+        (temp_dir / "large.py").write_text("x = 1\n" * 100)
+        (temp_dir / "package").mkdir()
+
+        order = order_shards_by_cost([["large.py"], ["package"]], str(temp_dir))
+
+        assert order == [1, 0]
+
+    def test_equal_costs_keep_order(self, temp_dir: Path):
+        """Test that shards of equal cost keep their original order."""
+        order = order_shards_by_cost([["a.py"], ["b.py"], ["c.py"]], str(temp_dir))
+
+        assert order == [0, 1, 2]
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES - MERGING
+# ///////////////////////////////////////////////////////////////
+
+
+class TestMergeJsonOutputs:
+    """Tests for merging shard reports."""
+
+    def test_list_reports_concatenated(self):
+        """Test that list reports are concatenated in shard order."""
+        outputs = [[{"code": "F401"}], [], [{"code": "E501"}]]
+
+        assert merge_json_outputs(outputs, object_report=False) == [
+            {"code": "F401"},
+            {"code": "E501"},
+        ]
+
+    def test_list_reports_skip_other_shapes(self):
+        """Test that non-list outputs are skipped for list reports."""
+        outputs = [[{"code": "F401"}], {"results": [{"code": "B101"}]}, None]
+
+        assert merge_json_outputs(outputs, object_report=False) == [{"code": "F401"}]
+
+    def test_empty_list_reports(self):
+        """Test that no list reports give an empty list."""
+        assert merge_json_outputs([], object_report=False) == []
+
+    def test_single_object_report_unchanged(self):
+        """Test that a single object report is returned as is."""
+        report = {"results": [{"test_id": "B101"}], "errors": []}
+
+        assert merge_json_outputs([report], object_report=True) is report
+
+    def test_empty_object_reports(self):
+        """Test that no object reports give an empty results object."""
+        assert merge_json_outputs([[], None], object_report=True) == {"results": []}
+
+    def test_object_reports_merged(self):
+        """Test that results, errors and metrics of object reports merge."""
+        outputs = [
+            {
+                "generated_at": "first",
+                "results": [{"test_id": "B101"}],
+                "errors": [],
+                "metrics": {
+                    "a.py": {"loc": 10},
+                    "_totals": {"loc": 10, "SEVERITY.LOW": 1, "note": "x"},
+                },
+            },
+            [{"code": "F401"}],
+            {
+                "generated_at": "second",
+                "results": [{"test_id": "B603"}],
+                "errors": [{"filename": "c.py"}],
+                "metrics": {
+                    "b.py": {"loc": 5},
+                    "_totals": {"loc": 5, "SEVERITY.LOW": 2, "note": "y"},
+                },
+            },
+        ]
+
+        merged = merge_json_outputs(outputs, object_report=True)
+
+        assert merged["generated_at"] == "first"
+        assert merged["results"] == [{"test_id": "B101"}, {"test_id": "B603"}]
+        assert merged["errors"] == [{"filename": "c.py"}]
+        assert merged["metrics"] == {
+            "a.py": {"loc": 10},
+            "b.py": {"loc": 5},
+            "_totals": {"loc": 15, "SEVERITY.LOW": 3, "note": "x"},
+        }
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# TEST SPELL CACHE UTILS - Spell check result cache unit tests
+# Project: Works On My Machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Unit tests for the persistent spell check result cache: fingerprints,
+invalidation after project word changes and persistence.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+from collections import OrderedDict
+from pathlib import Path
+
+# Local imports
+from womm.utils.cspell.spell_cache_utils import (
+    build_word_index,
+    get_dictionary_fingerprint,
+    get_dictionary_words,
+    get_invalidated_files,
+    get_settings_fingerprint,
+    load_spell_cache,
+    save_spell_cache,
+)
+
+# ///////////////////////////////////////////////////////////////
+# HELPERS
+# ///////////////////////////////////////////////////////////////
+
+CACHED_FILES = {
+    "a.py": {"hash": "1", "issues": [[1, 1, "Foobar", "a.py"]]},
+    "b.py": {"hash": "2", "issues": [[3, 5, "quux", "b.py"], [4, 1, "zork", "b.py"]]},
+    "c.py": {"hash": "3", "issues": []},
+}
+
+
+def _settings(config: dict, word_lists: list[Path] | None = None) -> str:
+    """Compute a settings fingerprint with a fixed checker."""
+    return get_settings_fingerprint(config, {"backend": "native"}, word_lists or [], 1)
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES - FINGERPRINTS
+# ///////////////////////////////////////////////////////////////
+
+
+class TestFingerprints:
+    """Tests for settings and dictionary fingerprints."""
+
+    def test_settings_ignore_project_words(self):
+        """Test that project words do not change the settings fingerprint."""
+        base = _settings({"language": "en"})
+
+        assert _settings({"language": "en", "words": ["womm"]}) == base
+        assert _settings({"language": "en", "ignoreWords": ["zork"]}) == base
+        assert _settings({"language": "fr"}) != base
+
+    def test_settings_follow_base_word_lists(self, temp_dir: Path):
+        """Test that editing a base word list changes the settings."""
+        word_list = temp_dir / "base.txt"
+        word_list.write_text("alpha\n")
+        base = _settings({}, [word_list])
+
+        word_list.write_text("alpha\nbeta\n")
+
+        assert _settings({}, [word_list]) != base
+
+    def test_dictionary_follows_words(self, temp_dir: Path):
+        """Test that configuration words and word lists change the dictionary."""
+        word_list = temp_dir / "project.txt"
+        word_list.write_text("alpha\n")
+        base = get_dictionary_fingerprint({"words": ["womm"]}, [word_list])
+
+        assert get_dictionary_fingerprint({"words": ["womm"]}, [word_list]) == base
+        assert get_dictionary_fingerprint({"words": ["other"]}, [word_list]) != base
+
+        word_list.write_text("alpha\nbeta\n")
+
+        assert get_dictionary_fingerprint({"words": ["womm"]}, [word_list]) != base
+
+    def test_dictionary_words_normalized(self, temp_dir: Path):
+        """Test that project words are gathered, normalized and sorted."""
+        word_list = temp_dir / "project.txt"
+        word_list.write_text("# comment\nZeta\n!forbidden\n")
+
+        words = get_dictionary_words(
+            {"words": ["Café"], "ignoreWords": ["beta"]}, [word_list], False
+        )
+
+        assert words == ["beta", "cafe", "zeta"]
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES - INVALIDATION
+# ///////////////////////////////////////////////////////////////
+
+
+class TestInvalidation:
+    """Tests for finding stale results after project word changes."""
+
+    def test_word_index(self):
+        """Test that unknown words map to the files reporting them."""
+        index = build_word_index(CACHED_FILES, case_sensitive=False)
+
+        assert index == {"foobar": {"a.py"}, "quux": {"b.py"}, "zork": {"b.py"}}
+
+    def test_added_word_invalidates_reporting_files(self):
+        """Test that adding a word only invalidates the files reporting it."""
+        stale = get_invalidated_files(
+            CACHED_FILES, ["alpha"], ["alpha", "zork"], False, False
+        )
+
+        assert stale == {"b.py"}
+
+    def test_unreported_word_invalidates_nothing(self):
+        """Test that adding a word nobody reports keeps every result."""
+        assert get_invalidated_files(CACHED_FILES, [], ["gamma"], False, False) == set()
+
+    def test_unchanged_words_invalidate_nothing(self):
+        """Test that unchanged words keep every result."""
+        assert get_invalidated_files(CACHED_FILES, ["a"], ["a"], False, False) == set()
+
+    def test_removed_word_invalidates_everything(self):
+        """Test that removing a word invalidates every result."""
+        assert (
+            get_invalidated_files(CACHED_FILES, ["alpha"], ["zork"], False, False)
+            is None
+        )
+
+    def test_compound_words_match_substrings(self):
+        """Test that with compound words, longer unknown words are stale."""
+        assert get_invalidated_files(CACHED_FILES, [], ["foo"], False, False) == set()
+        assert get_invalidated_files(CACHED_FILES, [], ["foo"], False, True) == {"a.py"}
+
+    def test_case_sensitive_index(self):
+        """Test that case-sensitive checks match the reported case."""
+        assert get_invalidated_files(CACHED_FILES, [], ["foobar"], True, False) == set()
+        assert get_invalidated_files(CACHED_FILES, [], ["Foobar"], True, False) == {
+            "a.py"
+        }
+
+
+# ///////////////////////////////////////////////////////////////
+# TEST CLASSES - PERSISTENCE
+# ///////////////////////////////////////////////////////////////
+
+
+class TestSpellCachePersistence:
+    """Tests for loading and saving the spell check cache."""
+
+    def test_round_trip(self, temp_dir: Path):
+        """Test that a saved cache loads back unchanged."""
+        cache_path = temp_dir / "cache" / "spell.json"
+        cache = {
+            "settings": "s",
+            "dictionary": "d",
+            "words": ["alpha"],
+            "files": OrderedDict(CACHED_FILES),
+        }
+
+        save_spell_cache(cache_path, 1, cache)
+        loaded = load_spell_cache(cache_path, 1)
+
+        assert loaded == cache
+        assert list(loaded["files"]) == list(CACHED_FILES)
+
+    def test_version_mismatch_is_empty(self, temp_dir: Path):
+        """Test that a cache from another format version is discarded."""
+        cache_path = temp_dir / "spell.json"
+        save_spell_cache(
+            cache_path,
+            1,
+            {"settings": "s", "dictionary": "d", "words": [], "files": {"a.py": {}}},
+        )
+
+        loaded = load_spell_cache(cache_path, 2)
+
+        assert loaded["files"] == OrderedDict()
+        assert loaded["settings"] == ""
+
+    def test_corrupt_cache_is_empty(self, temp_dir: Path):
+        """Test that a malformed cache loads as empty."""
+        cache_path = temp_dir / "spell.json"
+        cache_path.write_text('{"version": 1, "files": [], "words": []}')
+
+        assert load_spell_cache(cache_path, 1)["files"] == OrderedDict()
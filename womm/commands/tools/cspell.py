@@ -27,6 +27,7 @@ from ezpl.types import LogLevel
 # Local imports
 from ...exceptions.cspell import CSpellDictionaryInterfaceError, CSpellInterfaceError
 from ...interfaces import CSpellCheckerInterface, CSpellDictionaryInterface
+from ...shared.configs.cspell_config import CSpellConfig
 from ...ui.common import ezpl_bridge, ezprinter
 
 # ///////////////////////////////////////////////////////////////
@@ -289,6 +290,31 @@ def dict_list(verbose: bool) -> None:
     default=False,
     help="Add detected unknown words to cspell.json",
 )
+@click.option(
+    "--fail-fast",
+    is_flag=True,
+    help="Stop at the first unknown word and exit with an error",
+)
+@click.option(
+    "--backend",
+    type=click.Choice(CSpellConfig.BACKENDS),
+    default=CSpellConfig.DEFAULT_BACKEND,
+    show_default=True,
+    help="Spell checker: CSpell, the built-in Python checker (no Node.js), or auto (CSpell when installed)",
+)
+@click.option(
+    "--cache/--no-cache",
+    "use_cache",
+    default=True,
+    show_default=True,
+    help="Reuse results for files unchanged since the last check",
+)
+@click.option(
+    "--suggestions",
+    "show_suggestions",
+    is_flag=True,
+    help="Ask CSpell for spelling suggestions (slower, included in the JSON export)",
+)
 @click.option(
     "-v",
     "--verbose",
@@ -296,7 +322,15 @@ def dict_list(verbose: bool) -> None:
     help="Enable verbose output (DEBUG level)",
 )
 def spell_lint(
-    path: str, json_export: bool, directory: Path | None, add_words: bool, verbose: bool
+    path: str,
+    json_export: bool,
+    directory: Path | None,
+    add_words: bool,
+    fail_fast: bool,
+    backend: str,
+    use_cache: bool,
+    show_suggestions: bool,
+    verbose: bool,
 ) -> None:
     """🔍 Lint spelling in files."""
     if verbose:
@@ -312,6 +346,10 @@ def spell_lint(
             json_export=json_export,
             directory=directory,
             add_words=add_words,
+            fail_fast=fail_fast,
+            backend=backend,
+            use_cache=use_cache,
+            show_suggestions=show_suggestions,
         )
         sys.exit(0 if result.success else 1)
     except CSpellInterfaceError as e:
@@ -27,6 +27,7 @@ from ezpl.types import LogLevel
 # Local imports
 from ...exceptions.lint import PythonLintInterfaceError
 from ...interfaces import PythonLintInterface
+from ...shared.configs.lint import PythonLintingConfig
 from ...ui.common import ezpl_bridge, ezprinter
 
 # ///////////////////////////////////////////////////////////////
@@ -66,6 +67,81 @@ def lint_group(ctx: click.Context) -> None:
     type=click.Path(file_okay=False, dir_okay=True),
     help="Output directory for detailed reports (one file per tool)",
 )
+@click.option(
+    "--rebuild-index",
+    is_flag=True,
+    help="Ignore the cached file index and rescan the whole project",
+)
+@click.option(
+    "--git/--no-git",
+    "use_git",
+    default=True,
+    show_default=True,
+    help="Discover files from the git index (honours .gitignore) when in a work tree",
+)
+@click.option(
+    "--scan-workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Threads listing directories in parallel (useful on network filesystems; unused when files come from git)",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=PythonLintingConfig.DEFAULT_JOBS,
+    show_default=True,
+    help="Linting tools run concurrently in check mode (fix mode is sequential)",
+)
+@click.option(
+    "--shard-size",
+    type=click.IntRange(min=1),
+    default=PythonLintingConfig.MAX_FILES_PER_SHARD,
+    show_default=True,
+    help="Maximum files per tool invocation; larger sets run as parallel shards",
+)
+@click.option(
+    "--cache/--no-cache",
+    "use_cache",
+    default=True,
+    show_default=True,
+    help="Reuse results for files unchanged since the last check",
+)
+@click.option(
+    "--since",
+    metavar="REF",
+    help="Only lint Python files changed relative to a git ref",
+)
+@click.option(
+    "--staged",
+    is_flag=True,
+    help="Only lint staged Python files, using their staged content",
+)
+@click.option(
+    "--in-process",
+    is_flag=True,
+    help="Run black and isort in reusable worker processes (falls back to "
+    "subprocesses when they are not installed alongside womm)",
+)
+@click.option(
+    "--single-pass/--no-single-pass",
+    default=True,
+    show_default=True,
+    help="Apply isort and black in one read/write pass per file in fix mode",
+)
+@click.option(
+    "--fast-tier/--no-fast-tier",
+    default=True,
+    show_default=True,
+    help="Run built-in syntax and import checks first when ruff is not "
+    "available; syntax errors stop the run before the linting tools start",
+)
+@click.option(
+    "--fail-fast",
+    is_flag=True,
+    help="Stop all tools as soon as one reports issues or fails (check mode)",
+)
 @click.option(
     "-v",
     "--verbose",
@@ -77,12 +153,28 @@ def lint_python(
     fix: bool,
     tools: str | None,
     output_dir: str | None,
+    rebuild_index: bool,
+    use_git: bool,
+    scan_workers: int,
+    jobs: int,
+    shard_size: int,
+    use_cache: bool,
+    since: str | None,
+    staged: bool,
+    in_process: bool,
+    single_pass: bool,
+    fast_tier: bool,
+    fail_fast: bool,
     verbose: bool,
 ) -> None:
     """Lint Python code with ruff, black, isort, and bandit."""
     if verbose:
         ezpl_bridge.set_level(LogLevel.DEBUG.label)
 
+    if staged and fix:
+        ezprinter.error("--staged cannot be combined with --fix")
+        sys.exit(1)
+
     # Print header
     ezprinter.print_header("Python Linting")
 
@@ -96,12 +188,30 @@ def lint_python(
                 target_paths=[path] if path != "." else None,
                 tools=[t.strip() for t in tools.split(",")] if tools else None,
                 output_dir=output_dir,
+                rebuild_index=rebuild_index,
+                use_git=use_git,
+                scan_workers=scan_workers,
+                shard_size=shard_size,
+                since=since,
+                in_process=in_process,
+                single_pass=single_pass,
             )
         else:
             summary = lint_interface.check_python_code(
                 target_paths=[path] if path != "." else None,
                 tools=[t.strip() for t in tools.split(",")] if tools else None,
                 output_dir=output_dir,
+                rebuild_index=rebuild_index,
+                use_git=use_git,
+                scan_workers=scan_workers,
+                jobs=jobs,
+                shard_size=shard_size,
+                use_cache=use_cache,
+                since=since,
+                staged=staged,
+                in_process=in_process,
+                fast_tier=fast_tier,
+                fail_fast=fail_fast,
             )
 
         # Exit with appropriate code
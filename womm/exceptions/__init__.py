@@ -37,6 +37,7 @@ from __future__ import annotations
 # ///////////////////////////////////////////////////////////////
 # Local imports - Common exceptions
 from .common import (
+    CommandCancelledError,
     CommandExecutionError,
     CommandServiceError,
     CommandUtilityError,
@@ -145,6 +146,7 @@ from .womm_deployment import (
 
 __all__ = [  # noqa: RUF022
     # Common exceptions
+    "CommandCancelledError",
     "CommandExecutionError",
     "CommandServiceError",
     "CommandUtilityError",
@@ -18,6 +18,7 @@ This package exports all exceptions for common services:
 # ///////////////////////////////////////////////////////////////
 # Local imports
 from .command_service import (
+    CommandCancelledError,
     CommandExecutionError,
     CommandServiceError,
     CommandUtilityError,
@@ -44,6 +45,7 @@ from .validation_service import ValidationServiceError
 
 __all__ = [  # noqa: RUF022
     # command_service
+    "CommandCancelledError",
     "CommandExecutionError",
     "CommandServiceError",
     "CommandUtilityError",
@@ -50,13 +50,23 @@ class TimeoutError(CommandServiceError):
     def __init__(
         self,
         command: str,
-        timeout_seconds: int,
+        timeout_seconds: float,
         details: str | None = None,
     ) -> None:
         """Initialize timeout error."""
         self.command = command
         self.timeout_seconds = timeout_seconds
-        message = f"Command timed out after {timeout_seconds}s: {command}"
+        message = f"Command timed out after {timeout_seconds:g}s: {command}"
+        super().__init__(message, details)
+
+
+class CommandCancelledError(CommandServiceError):
+    """Exception raised when a command is cancelled before it completes."""
+
+    def __init__(self, command: str, details: str | None = None) -> None:
+        """Initialize command cancelled error."""
+        self.command = command
+        message = f"Command cancelled: {command}"
         super().__init__(message, details)
 
 
@@ -84,6 +94,7 @@ class CommandExecutionError(CommandServiceError):
 
 
 __all__ = [
+    "CommandCancelledError",
     "CommandExecutionError",
     "CommandServiceError",
     "CommandUtilityError",
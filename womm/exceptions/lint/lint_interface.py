@@ -54,6 +54,7 @@ class PythonLintInterfaceError(LintInterfaceError):
         self,
         message: str,
         operation: str | None = None,
+        target_path: str | None = None,
         details: str | None = None,
     ) -> None:
         """Initialize Python lint interface error.
@@ -61,9 +62,11 @@ class PythonLintInterfaceError(LintInterfaceError):
         Args:
             message: Human-readable error message
             operation: Optional operation that failed
+            target_path: Optional path that caused the error
             details: Optional technical details for debugging
         """
         self.operation = operation
+        self.target_path = target_path
         super().__init__(message, details)
 
 
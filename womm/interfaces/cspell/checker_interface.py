@@ -22,7 +22,10 @@ from __future__ import annotations
 # Standard library imports
 import logging
 import time
+from collections.abc import Callable
 from pathlib import Path
+from threading import Lock
+from typing import Any
 
 # Local imports
 from ...exceptions.cspell import (
@@ -31,6 +34,7 @@ from ...exceptions.cspell import (
     CSpellServiceError,
 )
 from ...services import CSpellCheckerService
+from ...shared.configs.cspell_config import CSpellConfig
 from ...shared.results import CSpellInstallResult, CSpellResult
 from ...ui.common import ezprinter
 from ...ui.cspell import display_spell_status_table
@@ -135,9 +139,10 @@ class CSpellCheckerInterface:
     # ///////////////////////////////////////////////////////////////
 
     def invalidate_cspell_cache(self) -> None:
-        """Invalidate CSpell availability cache."""
+        """Invalidate CSpell availability cache, including the persisted one."""
         self._cspell_available = None
         self._cache_timestamp = None
+        self._checker_service.invalidate_detection()
 
     def install_cspell(self) -> CSpellInstallResult:
         """Install CSpell globally with integrated UI.
@@ -235,6 +240,48 @@ class CSpellCheckerInterface:
                 details=str(e),
             ) from e
 
+    @staticmethod
+    def _make_issue_reporter(progress: Any, task: Any) -> Callable[[Any], None]:
+        """
+        Build a callback showing the unknown word count as words are found.
+
+        Args:
+            progress: Spinner progress display
+            task: Spinner task to update
+
+        Returns:
+            Callable[[Any], None]: Thread-safe callback taking an issue
+        """
+        found = 0
+        lock = Lock()
+
+        def report(_issue: Any) -> None:
+            nonlocal found
+            with lock:
+                found += 1
+                progress.update(
+                    task, status=f"Linting files... ({found} unknown words)"
+                )
+
+        return report
+
+    def _has_native_word_list(self, path: Path) -> bool:
+        """
+        Check whether the built-in Python spell checker can check a path.
+
+        Args:
+            path: Path to check
+
+        Returns:
+            bool: True if a base word list is available, False otherwise
+            (including when the CSpell configuration cannot be read)
+        """
+        try:
+            return self._checker_service.has_native_word_list(path)
+        except CheckServiceError as e:
+            logger.debug(f"Python spell checker unavailable: {e}")
+            return False
+
     def display_project_status(self, project_path: Path | None = None) -> CSpellResult:
         """
         Get and display CSpell configuration status for a project with integrated UI.
@@ -333,6 +380,10 @@ class CSpellCheckerInterface:
         json_export: bool = False,
         directory: Path | None = None,
         add_words: bool = False,
+        fail_fast: bool = False,
+        backend: str = CSpellConfig.DEFAULT_BACKEND,
+        use_cache: bool = True,
+        show_suggestions: bool = False,
     ) -> CSpellResult:
         """
         Perform spell lint with integrated UI and optional JSON export.
@@ -344,6 +395,10 @@ class CSpellCheckerInterface:
             json_export: Export results to default path ~/.womm/spell-results/
             directory: Custom path to export results as JSON
             add_words: Add detected unknown words to cspell.json
+            fail_fast: Stop at the first unknown word and report a failure
+            backend: Spell checker to run (see ``CSpellConfig.BACKENDS``)
+            use_cache: Whether to skip files unchanged since a previous check
+            show_suggestions: Whether to ask CSpell for spelling suggestions
 
         Returns:
             SpellResult: Result of the spell lint operation
@@ -366,10 +421,22 @@ class CSpellCheckerInterface:
                 # Use custom path specified
                 export_path = directory
 
+            # Without CSpell, "auto" falls back to the built-in Python checker
+            # when it has a word list; otherwise CSpell is reported missing
+            if backend == CSpellConfig.BACKEND_AUTO:
+                if not self.cspell_available and self._has_native_word_list(path):
+                    backend = CSpellConfig.BACKEND_PYTHON
+                    ezprinter.info(
+                        "CSpell is not installed, using the built-in Python spell checker"
+                    )
+                else:
+                    backend = CSpellConfig.BACKEND_CSPELL
+
             # Check CSpell availability - early return if not available
-            cspell_check = self._ensure_cspell_available("spell lint")
-            if cspell_check is not None:  # Error occurred
-                return cspell_check
+            if backend == CSpellConfig.BACKEND_CSPELL:
+                cspell_check = self._ensure_cspell_available("spell lint")
+                if cspell_check is not None:  # Error occurred
+                    return cspell_check
 
             # Use CSpellCheckerService for the actual spell lint
             with ezprinter.create_spinner_with_status("Running spell lint...") as (
@@ -379,12 +446,18 @@ class CSpellCheckerInterface:
                 progress.update(task, status="Linting files...")
 
                 try:
-                    lint_result = self._checker_service.run_spellcheck(path)
+                    lint_result = self._checker_service.run_spellcheck(
+                        path,
+                        on_issue=self._make_issue_reporter(progress, task),
+                        fail_fast=fail_fast,
+                        backend=backend,
+                        use_cache=use_cache,
+                        show_suggestions=show_suggestions,
+                    )
                 except (CheckServiceError, CSpellServiceError) as e:
                     logger.error(f"Spell lint service error: {e}", exc_info=True)
                     raise CSpellInterfaceError(
                         f"Failed to run spell lint: {e.message}",
-                        operation="run_spellcheck",
                         details=str(e),
                     ) from e
                 except Exception as e:
@@ -393,16 +466,12 @@ class CSpellCheckerInterface:
                     )
                     raise CSpellInterfaceError(
                         f"An unexpected error occurred: {e}",
-                        operation="run_spellcheck",
                         details=str(e),
                     ) from e
 
                 if not (lint_result.success or lint_result.issues_found > 0):
                     progress.update(task, status="Spell lint failed")
-                    raise CSpellInterfaceError(
-                        "Spell lint failed",
-                        operation="run_spellcheck",
-                    )
+                    raise CSpellInterfaceError("Spell lint failed")
 
                 progress.update(task, status="Spell lint completed!")
 
@@ -488,7 +557,8 @@ class CSpellCheckerInterface:
                     logger.warning(f"Failed to export lint results to JSON: {e}")
 
             return CSpellResult(
-                success=True,
+                # With fail_fast, unknown words fail the lint (CI gating)
+                success=not (fail_fast and issues),
                 message=message,
                 data={
                     "path": str(path),
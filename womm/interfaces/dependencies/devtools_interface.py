@@ -13,13 +13,16 @@ from __future__ import annotations
 import logging
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Any
 
 # Local imports
 from ...exceptions.common import ValidationServiceError
 from ...exceptions.dependencies import DevToolsInterfaceError
 from ...exceptions.womm_deployment import DependencyServiceError
 from ...services import CommandRunnerService, DevToolsService
+from ...shared.configs.command_config import CommandConfig
 from ...shared.configs.dependencies import DevToolsConfig
 from ...shared.results import DevToolResult
 from ...ui.common import ezprinter
@@ -127,13 +130,13 @@ class DevToolsInterface:
             cache_key = f"{language}:{tool_type}:{tool}"
 
             if cache_key in self.cache:
-                available = self.cache[cache_key]
+                available, path = self.cache[cache_key]
                 return DevToolResult(
                     success=available,
                     tool_name=tool,
                     language=language,
                     tool_type=tool_type,
-                    path=shutil.which(tool) if available else None,
+                    path=path,
                     message=f"Dev tool {tool} {'available' if available else 'not found'}",
                     error=None if available else f"Dev tool {tool} not installed",
                 )
@@ -142,18 +145,19 @@ class DevToolsInterface:
             try:
                 check_result = self.dev_tools_service.check_tool_availability(tool)
                 available = check_result.is_available
+                path = check_result.path
             except Exception as e:
                 logger.warning(f"Failed to check tool availability for {tool}: {e}")
-                available = False
+                available, path = False, None
 
-            self.cache[cache_key] = available
+            self.cache[cache_key] = (available, path)
 
             return DevToolResult(
                 success=available,
                 tool_name=tool,
                 language=language,
                 tool_type=tool_type,
-                path=shutil.which(tool) if available else None,
+                path=path,
                 message=f"Dev tool {tool} {'available' if available else 'not found'}",
                 error=None if available else f"Dev tool {tool} not installed",
             )
@@ -176,6 +180,8 @@ class DevToolsInterface:
         Check all development tools with a single spinner and display results.
 
         Uses a single spinner with status updates, then displays a summary table.
+        Tools are checked concurrently, so this takes about as long as the
+        slowest check.
 
         Returns:
             Dictionary mapping tool names to DevToolResult objects
@@ -195,36 +201,18 @@ class DevToolsInterface:
         ) as (progress, task):
             progress.update(task, status="Initializing...")
 
-            for category, subcategory, tool in tool_configs:
-                progress.update(task, status=f"Checking {tool}")
-
-                try:
-                    # Direct service call (no UI)
-                    result = self.dev_tools_service.check_tool_availability(tool)
-                    is_available = result.is_available
-
-                    cache_key = f"{category}:{subcategory}:{tool}"
-                    self.cache[cache_key] = is_available
-
-                    results[tool] = DevToolResult(
-                        success=is_available,
-                        tool_name=tool,
-                        language=category,
-                        tool_type=subcategory,
-                        path=shutil.which(tool) if is_available else None,
-                        message=f"Dev tool {tool} {'available' if is_available else 'not found'}",
-                        error=(
-                            None if is_available else f"Dev tool {tool} not installed"
-                        ),
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to check {tool}: {e}")
+            outcomes = self._check_tools_concurrently(tool_configs, progress, task)
+            for tool, outcome in outcomes.items():
+                if isinstance(outcome, Exception):
+                    logger.warning(f"Failed to check {tool}: {outcome}")
                     results[tool] = DevToolResult(
                         success=False,
                         tool_name=tool,
                         message=f"Failed to check {tool}",
-                        error=str(e),
+                        error=str(outcome),
                     )
+                else:
+                    results[tool] = outcome
 
             progress.update(task, status="Check completed")
 
@@ -553,8 +541,11 @@ class DevToolsInterface:
             ezprinter.deps(f"Checking and installing {language} development tools...")
 
             results = {}
-            total_tools = sum(len(tools) for tools in DEV_TOOLS[language].values())
-            processed = 0
+            tool_specs = [
+                (language, tool_type, tool)
+                for tool_type, tools in DEV_TOOLS[language].items()
+                for tool in tools
+            ]
 
             with ezprinter.create_spinner_with_status(
                 f"Processing {language} dev tools..."
@@ -562,42 +553,37 @@ class DevToolsInterface:
                 progress,
                 task,
             ):
-                for tool_type, tools in DEV_TOOLS[language].items():
-                    for tool in tools:
-                        processed += 1
-                        progress.update(
-                            task,
-                            status=f"Processing {tool} ({processed}/{total_tools})...",
+                # Check every tool at once; installations then run one by one
+                checks = self._check_tools_concurrently(tool_specs, progress, task)
+                for _language, tool_type, tool in tool_specs:
+                    try:
+                        result = checks[tool]
+                        if isinstance(result, Exception):
+                            raise result
+                        if not result.success:
+                            # Try to install the tool
+                            progress.update(task, status=f"Installing {tool}...")
+                            result = self.install_dev_tool(language, tool_type, tool)
+                        else:
+                            ezprinter.success(f"Dev tool {tool} already available")
+                    except (
+                        DevToolsInterfaceError,
+                        ValidationServiceError,
+                    ):
+                        # Re-raise our custom exceptions
+                        raise
+                    except Exception as e:
+                        logger.warning(f"Failed to process tool {tool}: {e}")
+                        result = DevToolResult(
+                            success=False,
+                            tool_name=tool,
+                            language=language,
+                            tool_type=tool_type,
+                            message=f"Failed to process tool {tool}",
+                            error=str(e),
                         )
 
-                        try:
-                            result = self.check_dev_tool(language, tool_type, tool)
-                            if not result.success:
-                                # Try to install the tool
-                                progress.update(task, status=f"Installing {tool}...")
-                                result = self.install_dev_tool(
-                                    language, tool_type, tool
-                                )
-                            else:
-                                ezprinter.success(f"Dev tool {tool} already available")
-                        except (
-                            DevToolsInterfaceError,
-                            ValidationServiceError,
-                        ):
-                            # Re-raise our custom exceptions
-                            raise
-                        except Exception as e:
-                            logger.warning(f"Failed to process tool {tool}: {e}")
-                            result = DevToolResult(
-                                success=False,
-                                tool_name=tool,
-                                language=language,
-                                tool_type=tool_type,
-                                message=f"Failed to process tool {tool}",
-                                error=str(e),
-                            )
-
-                        results[tool] = result
+                    results[tool] = result
 
                 progress.update(task, status="All tools processed!")
 
@@ -750,6 +736,43 @@ class DevToolsInterface:
     # Methods _check_tool_availability and _get_installation_method
     # have been moved to DevToolsService
 
+    def _check_tools_concurrently(
+        self, tool_specs: list[tuple[str, str, str]], progress: Any, task: Any
+    ) -> dict[str, DevToolResult | Exception]:
+        """
+        Check tools on a bounded worker pool, showing completions in a spinner.
+
+        Args:
+            tool_specs: (language, tool_type, tool) of each tool to check
+            progress: Spinner progress display
+            task: Spinner task to update
+
+        Returns:
+            dict[str, DevToolResult | Exception]: Result of each tool, or the
+            exception its check raised, in ``tool_specs`` order
+        """
+        if not tool_specs:
+            return {}
+
+        outcomes: dict[str, DevToolResult | Exception] = {}
+        with ThreadPoolExecutor(
+            max_workers=min(CommandConfig.BATCH_CONCURRENCY, len(tool_specs)),
+            thread_name_prefix="womm-devtools",
+        ) as executor:
+            futures = {
+                executor.submit(self.check_dev_tool, *spec): spec[2]
+                for spec in tool_specs
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                tool = futures[future]
+                try:
+                    outcomes[tool] = future.result()
+                except Exception as e:
+                    outcomes[tool] = e
+                progress.update(task, status=f"Checked {tool} ({done}/{len(futures)})")
+
+        return {tool: outcomes[tool] for _, _, tool in tool_specs}
+
     def _install_python_tool(self, tool: str) -> bool:
         """
         Install a Python development tool.
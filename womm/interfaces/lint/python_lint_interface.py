@@ -21,7 +21,12 @@ from __future__ import annotations
 # ///////////////////////////////////////////////////////////////
 # Standard library imports
 import logging
+import os
+import tempfile
+from collections.abc import Callable
 from pathlib import Path
+from threading import Lock
+from typing import Any
 
 from ...exceptions.common import ValidationServiceError
 from ...exceptions.lint import (
@@ -31,12 +36,17 @@ from ...exceptions.lint import (
     ToolExecutionServiceError,
 )
 from ...services import FileScannerService, PythonLintService
-from ...shared.results.lint_results import LintSummaryResult, ToolStatusResult
+from ...shared.configs.lint import PythonLintingConfig
+from ...shared.results.lint_results import (
+    LintSummaryResult,
+    ToolResult,
+    ToolStatusResult,
+)
 
 # Local imports
 from ...ui.common import ezprinter
 from ...ui.lint import display_lint_summary, display_tool_status
-from ...utils.lint import export_lint_results_to_json
+from ...utils.lint import export_lint_results_to_json, relocate_tool_result
 
 # ///////////////////////////////////////////////////////////////
 # LOGGER SETUP
@@ -123,6 +133,17 @@ class PythonLintInterface:
         target_paths: list[str] | None = None,
         tools: list[str] | None = None,
         output_dir: str | None = None,
+        rebuild_index: bool = False,
+        use_git: bool = True,
+        scan_workers: int = 1,
+        jobs: int = PythonLintingConfig.DEFAULT_JOBS,
+        shard_size: int = PythonLintingConfig.MAX_FILES_PER_SHARD,
+        use_cache: bool = True,
+        since: str | None = None,
+        staged: bool = False,
+        in_process: bool = False,
+        fast_tier: bool = True,
+        fail_fast: bool = False,
     ) -> LintSummaryResult:
         """
         Run Python linting tools in check mode.
@@ -131,6 +152,18 @@ class PythonLintInterface:
             target_paths: Specific paths to check (if None, scan entire project)
             tools: Specific tools to run (if None, run all available)
             output_dir: Output directory for detailed reports
+            rebuild_index: Whether to rebuild the project file index
+            use_git: Whether to discover files from the git index when possible
+            scan_workers: Number of threads listing directories during the scan
+            jobs: Maximum number of linting tools running at once
+            shard_size: Maximum number of files per tool invocation
+            use_cache: Whether to skip files unchanged since a previous check
+            since: Only check Python files changed relative to this git ref
+            staged: Only check staged Python files, using their staged content
+            in_process: Whether to run black and isort in reusable workers
+            fast_tier: Whether to run the built-in syntax and import checks
+                first when ruff is not available
+            fail_fast: Whether to stop every tool at the first failure
 
         Returns:
             LintSummary: Summary of linting results
@@ -149,7 +182,14 @@ class PythonLintInterface:
                 )
 
                 try:
-                    python_files = self._get_target_files(target_paths)
+                    python_files = self._get_target_files(
+                        target_paths,
+                        rebuild_index=rebuild_index,
+                        use_git=use_git,
+                        scan_workers=scan_workers,
+                        since=since,
+                        staged=staged,
+                    )
                 except (
                     LintServiceError,
                     ToolExecutionServiceError,
@@ -201,11 +241,33 @@ class PythonLintInterface:
                 progress.update(task, status="Running linting tools...")
 
                 target_dirs = [str(f) for f in python_files]
+                on_issue = self._make_issue_reporter(progress, task)
 
                 try:
-                    tool_results = self.python_lint_service.check_python_code(
-                        target_dirs=target_dirs, cwd=self.project_root, tools=tools
-                    )
+                    if staged:
+                        tool_results = self._check_staged_files(
+                            python_files,
+                            tools=tools,
+                            jobs=jobs,
+                            shard_size=shard_size,
+                            in_process=in_process,
+                            fast_tier=fast_tier,
+                            on_issue=on_issue,
+                            fail_fast=fail_fast,
+                        )
+                    else:
+                        tool_results = self.python_lint_service.check_python_code(
+                            target_dirs=target_dirs,
+                            cwd=self.project_root,
+                            tools=tools,
+                            jobs=jobs,
+                            shard_size=shard_size,
+                            use_cache=use_cache,
+                            in_process=in_process,
+                            fast_tier=fast_tier,
+                            on_issue=on_issue,
+                            fail_fast=fail_fast,
+                        )
                 except (
                     LintServiceError,
                     ToolExecutionServiceError,
@@ -274,6 +336,13 @@ class PythonLintInterface:
         target_paths: list[str] | None = None,
         tools: list[str] | None = None,
         output_dir: str | None = None,
+        rebuild_index: bool = False,
+        use_git: bool = True,
+        scan_workers: int = 1,
+        shard_size: int = PythonLintingConfig.MAX_FILES_PER_SHARD,
+        since: str | None = None,
+        in_process: bool = False,
+        single_pass: bool = True,
     ) -> LintSummaryResult:
         """
         Run Python linting tools in fix mode.
@@ -282,6 +351,13 @@ class PythonLintInterface:
             target_paths: Specific paths to fix (if None, scan entire project)
             tools: Specific tools to run (if None, run all available fixable tools)
             output_dir: Output directory for detailed reports
+            rebuild_index: Whether to rebuild the project file index
+            use_git: Whether to discover files from the git index when possible
+            scan_workers: Number of threads listing directories during the scan
+            shard_size: Maximum number of files per tool invocation
+            since: Only fix Python files changed relative to this git ref
+            in_process: Whether to run black and isort in reusable workers
+            single_pass: Whether to apply isort and black in one read/write pass
 
         Returns:
             LintSummary: Summary of fixing results
@@ -300,7 +376,13 @@ class PythonLintInterface:
                 )
 
                 try:
-                    python_files = self._get_target_files(target_paths)
+                    python_files = self._get_target_files(
+                        target_paths,
+                        rebuild_index=rebuild_index,
+                        use_git=use_git,
+                        scan_workers=scan_workers,
+                        since=since,
+                    )
                 except (
                     LintServiceError,
                     ToolExecutionServiceError,
@@ -355,7 +437,12 @@ class PythonLintInterface:
 
                 try:
                     tool_results = self.python_lint_service.fix_python_code(
-                        target_dirs=target_dirs, cwd=self.project_root, tools=tools
+                        target_dirs=target_dirs,
+                        cwd=self.project_root,
+                        tools=tools,
+                        shard_size=shard_size,
+                        in_process=in_process,
+                        single_pass=single_pass,
                     )
                 except (
                     LintServiceError,
@@ -474,12 +561,28 @@ class PythonLintInterface:
     # PRIVATE METHODS
     # ///////////////////////////////////////////////////////////////
 
-    def _get_target_files(self, target_paths: list[str] | None) -> list[Path]:
+    def _get_target_files(
+        self,
+        target_paths: list[str] | None,
+        rebuild_index: bool = False,
+        use_git: bool = True,
+        scan_workers: int = 1,
+        since: str | None = None,
+        staged: bool = False,
+    ) -> list[Path]:
         """
         Get list of Python files to process.
 
+        With ``since`` or ``staged``, only files changed in git are returned
+        (restricted to ``target_paths`` when given).
+
         Args:
             target_paths: Specific paths to check (if None, scan entire project)
+            rebuild_index: Whether to rebuild the project file index
+            use_git: Whether to discover files from the git index when possible
+            scan_workers: Number of threads listing directories during the scan
+            since: Only return files changed relative to this git ref
+            staged: Only return files with staged changes
 
         Returns:
             list[Path]: List of Python files to process
@@ -488,11 +591,18 @@ class PythonLintInterface:
             PythonLintInterfaceError: If file scanning fails
         """
         try:
+            if since or staged:
+                return self._get_changed_files(target_paths, since, staged)
+
             if not target_paths:
                 # Scan entire project
                 try:
                     search_result = self.file_scanner.get_project_python_files(
-                        self.project_root
+                        self.project_root,
+                        use_index=True,
+                        rebuild_index=rebuild_index,
+                        use_git=use_git,
+                        workers=scan_workers,
                     )
                     if not search_result.success:
                         raise PythonLintInterfaceError(
@@ -533,7 +643,7 @@ class PythonLintInterface:
 
                     try:
                         search_result = self.file_scanner.find_python_files(
-                            path, recursive=True
+                            path, recursive=True, workers=scan_workers
                         )
                         if search_result.success and search_result.files_found:
                             python_files.extend(search_result.files_found)
@@ -575,3 +685,138 @@ class PythonLintInterface:
                 operation="_get_target_files",
                 details=f"Exception type: {type(e).__name__}",
             ) from e
+
+    def _get_changed_files(
+        self, target_paths: list[str] | None, since: str | None, staged: bool
+    ) -> list[Path]:
+        """
+        Get Python files changed in git, optionally under specific paths.
+
+        Args:
+            target_paths: Paths to restrict the result to (if None, whole project)
+            since: Git ref to compare against
+            staged: Whether to list staged changes
+
+        Returns:
+            list[Path]: Changed Python files
+
+        Raises:
+            PythonLintInterfaceError: If changed files cannot be listed
+        """
+        search_result = self.file_scanner.get_changed_python_files(
+            self.project_root, since=since, staged=staged
+        )
+        if not search_result.success:
+            raise PythonLintInterfaceError(
+                message=f"Failed to list changed files: {search_result.error}",
+                operation="_get_target_files",
+                target_path=str(self.project_root),
+                details="Listing changed files from git failed",
+            )
+
+        changed_files = search_result.files_found or []
+        if not target_paths:
+            return changed_files
+
+        roots = [Path(path_str).resolve() for path_str in target_paths]
+        return [
+            file_path
+            for file_path in changed_files
+            if any(
+                root == file_path.resolve() or root in file_path.resolve().parents
+                for root in roots
+            )
+        ]
+
+    @staticmethod
+    def _make_issue_reporter(progress: Any, task: Any) -> Callable[[str, Any], None]:
+        """
+        Build a callback showing issue counts in the spinner as they are found.
+
+        Args:
+            progress: Spinner progress display
+            task: Spinner task to update
+
+        Returns:
+            Callable[[str, Any], None]: Thread-safe callback taking the tool
+            name and an issue
+        """
+        counts: dict[str, int] = {}
+        lock = Lock()
+
+        def report(tool_name: str, _issue: Any) -> None:
+            with lock:
+                counts[tool_name] = counts.get(tool_name, 0) + 1
+                found = ", ".join(f"{name}: {count}" for name, count in counts.items())
+                progress.update(task, status=f"Running linting tools... ({found})")
+
+        return report
+
+    def _check_staged_files(
+        self,
+        python_files: list[Path],
+        tools: list[str] | None,
+        jobs: int,
+        shard_size: int,
+        in_process: bool = False,
+        fast_tier: bool = True,
+        on_issue: Callable[[str, Any], None] | None = None,
+        fail_fast: bool = False,
+    ) -> dict[str, ToolResult]:
+        """
+        Check the staged content of files instead of their work tree copy.
+
+        The staged files and tool configuration are exported to a temporary
+        directory, checked there (without the result cache), and reported
+        paths are rewritten to point at the project.
+
+        Args:
+            python_files: Files with staged changes
+            tools: Specific tools to run (if None, run all available)
+            jobs: Maximum number of linting tools running at once
+            shard_size: Maximum number of files per tool invocation
+            in_process: Whether to run black and isort in reusable workers
+            fast_tier: Whether to run the built-in syntax and import checks
+                first when ruff is not available
+            on_issue: Called with the tool name and each issue found while
+                the tools run
+            fail_fast: Whether to stop every tool at the first failure
+
+        Returns:
+            dict[str, ToolResult]: Tool name -> result mapping
+        """
+        rel_files = [
+            Path(os.path.relpath(file_path, self.project_root)).as_posix()
+            for file_path in python_files
+        ]
+        config_files = sorted(
+            {
+                name
+                for names in PythonLintingConfig.CONFIG_FILES.values()
+                for name in names
+            }
+        )
+
+        with tempfile.TemporaryDirectory(prefix="womm-staged-") as tmp_dir:
+            snapshot_root = self.file_scanner.export_staged_files(
+                self.project_root, [*rel_files, *config_files], Path(tmp_dir)
+            )
+            tool_results = self.python_lint_service.check_python_code(
+                target_dirs=[str(snapshot_root / rel) for rel in rel_files],
+                cwd=snapshot_root,
+                tools=tools,
+                jobs=jobs,
+                shard_size=shard_size,
+                use_cache=False,
+                in_process=in_process,
+                fast_tier=fast_tier,
+                on_issue=on_issue,
+                fail_fast=fail_fast,
+                timing_root=self.project_root.resolve(),
+            )
+            return {
+                tool_name: relocate_tool_result(
+                    result, snapshot_root, self.project_root.resolve()
+                )
+                for tool_name, result in tool_results.items()
+            }
@@ -20,8 +20,12 @@ from __future__ import annotations
 from .common import (
     BaseValidationService,
     CommandRunnerService,
+    CommandStream,
     FileScannerService,
+    PathIndexService,
+    ProbeCacheService,
     SecurityValidatorService,
+    TimingService,
 )
 
 # Local imports - Context services
@@ -33,13 +37,13 @@ from .context import (
 )
 
 # Local imports - Cspell services
-from .cspell import CSpellCheckerService, CSpellDictionaryService
+from .cspell import CSpellCheckerService, CSpellDictionaryService, SpellCacheService
 
 # Local imports - Dependencies services
 from .dependencies import DevToolsService, RuntimeService, SystemPackageManagerService
 
 # Local imports - Lint services
-from .lint import LintService, PythonLintService
+from .lint import LintCacheService, LintService, PythonLintService
 
 # Local imports - Project services
 from .project import (
@@ -65,8 +69,12 @@ __all__ = [  # noqa: RUF022
     # Common services
     "BaseValidationService",
     "CommandRunnerService",
+    "CommandStream",
     "FileScannerService",
+    "PathIndexService",
+    "ProbeCacheService",
     "SecurityValidatorService",
+    "TimingService",
     # Context services
     "ContextParametersService",
     "ContextRegistryService",
@@ -75,11 +83,13 @@ __all__ = [  # noqa: RUF022
     # Cspell services
     "CSpellCheckerService",
     "CSpellDictionaryService",
+    "SpellCacheService",
     # Dependencies services
     "DevToolsService",
     "SystemPackageManagerService",
     "RuntimeService",
     # Lint services
+    "LintCacheService",
     "LintService",
     "PythonLintService",
     # Project services
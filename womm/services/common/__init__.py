@@ -17,9 +17,12 @@ from __future__ import annotations
 # ///////////////////////////////////////////////////////////////
 # Local imports
 from .base_validation_service import BaseValidationService
-from .command_runner_service import CommandRunnerService
+from .command_runner_service import CommandRunnerService, CommandStream
 from .file_scanner_service import FileScannerService
+from .path_index_service import PathIndexService
+from .probe_cache_service import ProbeCacheService
 from .security_validator_service import SecurityValidatorService
+from .timing_service import TimingService
 
 # ///////////////////////////////////////////////////////////////
 # PUBLIC API
@@ -28,6 +31,10 @@ from .security_validator_service import SecurityValidatorService
 __all__ = [
     "BaseValidationService",
     "CommandRunnerService",
+    "CommandStream",
     "FileScannerService",
+    "PathIndexService",
+    "ProbeCacheService",
     "SecurityValidatorService",
+    "TimingService",
 ]
@@ -10,6 +10,8 @@ CommandRunnerService - unified, secure command execution service.
 Provides a singleton service for running commands with:
 - optional security validation
 - retry/timeout handling
+- concurrent batches of commands (asyncio and blocking APIs)
+- streamed output for long-running, verbose commands
 - structured error reporting via dedicated exceptions.
 """
 
@@ -19,23 +21,268 @@ from __future__ import annotations
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
 # Standard library imports
+import asyncio
 import logging
 import subprocess
+import tempfile
+import threading
 import time
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from threading import Lock
-from typing import Any, ClassVar
+from typing import IO, Any, ClassVar
 
 # Local imports
 from ...exceptions.common import (
+    CommandCancelledError,
     CommandExecutionError,
     CommandServiceError,
     CommandUtilityError,
     CommandValidationError,
     TimeoutError,
 )
+from ...shared.configs.command_config import CommandConfig
 from ...shared.result_models import CommandResult
 from ...shared.results import CommandAvailabilityResult, CommandVersionResult
+from ...utils.common.process_utils import get_process_group_options, kill_process_tree
+from .path_index_service import PathIndexService
+from .probe_cache_service import ProbeCacheService
+from .timing_service import TimingService
+
+# ///////////////////////////////////////////////////////////////
+# COMMAND STREAM CLASS
+# ///////////////////////////////////////////////////////////////
+
+
+class CommandStream:
+    """Output of a running command, readable line by line as it arrives.
+
+    Iterating yields standard output lines as the command writes them.
+    Both output streams are also copied to spooled buffers that move to a
+    temporary file once they exceed ``CommandConfig.STREAM_SPOOL_MAX_SIZE``
+    characters, so verbose commands do not hold their whole output in
+    memory. Use it as a context manager so the process is always reaped.
+
+    The process runs in its own process group, which is killed as a whole
+    when the stream times out, is cancelled, terminated or closed early.
+    """
+
+    def __init__(
+        self,
+        process: subprocess.Popen[str],
+        command: list[str],
+        cwd: Path,
+        timeout: float | None,
+        security_validated: bool = False,
+        cancel_event: threading.Event | None = None,
+    ) -> None:
+        """Start collecting a process's output.
+
+        Args:
+            process: Process started with piped standard output and error,
+                in a process group of its own
+            command: Command the process runs
+            cwd: Working directory of the process
+            timeout: Seconds after which the process is killed (None = never)
+            security_validated: Whether the command passed security validation
+            cancel_event: Event that kills the process when set
+        """
+        self.command = command
+        self.cwd = cwd
+        self.timeout = timeout
+        self.security_validated = security_validated
+        self._process = process
+        self._cancel_event = cancel_event
+        self._start_time = time.time()
+        self._timed_out = False
+        self._cancelled = False
+        self._done = threading.Event()
+        self._stdout = self._create_spool()
+        self._stderr = self._create_spool()
+
+        self._stderr_thread = threading.Thread(target=self._drain_stderr, daemon=True)
+        self._stderr_thread.start()
+        if timeout or cancel_event is not None:
+            threading.Thread(target=self._watch, daemon=True).start()
+
+    def __enter__(self) -> CommandStream:
+        """Enter the stream context.
+
+        Returns:
+            CommandStream: This stream
+        """
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        """Kill the process if it is still running and release buffers."""
+        self.close()
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield standard output lines as the command writes them.
+
+        Yields:
+            str: Output line, including its trailing newline if any
+        """
+        if self._process.stdout is None:
+            return
+        for line in self._process.stdout:
+            self._stdout.write(line)
+            yield line
+
+    # ///////////////////////////////////////////////////////////////
+    # PUBLIC METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def wait(self) -> int:
+        """Wait for the command to exit, collecting any unread output.
+
+        Returns:
+            int: Exit code
+
+        Raises:
+            TimeoutError: If the command was killed for exceeding its timeout
+            CommandCancelledError: If the command was killed by its cancel event
+        """
+        for _ in self:
+            pass
+        returncode = self._process.wait()
+        self._stderr_thread.join()
+        self._done.set()
+
+        if self._cancelled:
+            raise CommandCancelledError(
+                command=" ".join(self.command),
+                details="Streamed command killed on cancellation",
+            )
+        if self._timed_out and self.timeout is not None:
+            raise TimeoutError(
+                command=" ".join(self.command),
+                timeout_seconds=self.timeout,
+                details="Streamed command killed after exceeding its timeout",
+            )
+        return returncode
+
+    def read_stdout(self) -> str:
+        """Return the standard output collected so far.
+
+        Returns:
+            str: Collected standard output
+        """
+        return self._read_spool(self._stdout)
+
+    def read_stderr(self) -> str:
+        """Return the standard error collected so far.
+
+        Returns:
+            str: Collected standard error
+        """
+        self._stderr_thread.join()
+        return self._read_spool(self._stderr)
+
+    def to_result(self, include_stdout: bool = True) -> CommandResult:
+        """Wait for the command and build its result.
+
+        Args:
+            include_stdout: Whether to load the collected standard output into
+                the result; callers that consumed it line by line can skip it
+
+        Returns:
+            CommandResult: Result of command execution
+
+        Raises:
+            TimeoutError: If the command was killed for exceeding its timeout
+            CommandCancelledError: If the command was killed by its cancel event
+        """
+        returncode = self.wait()
+        return CommandResult(
+            returncode=returncode,
+            stdout=self.read_stdout() if include_stdout else "",
+            stderr=self.read_stderr(),
+            command=self.command,
+            cwd=self.cwd,
+            security_validated=self.security_validated,
+            execution_time=time.time() - self._start_time,
+        )
+
+    def terminate(self) -> None:
+        """Kill the process and its children, keeping the output read so far.
+
+        ``wait`` and ``to_result`` remain usable and report the kill through
+        the exit code.
+        """
+        if not self._done.is_set():
+            kill_process_tree(self._process)
+
+    def close(self) -> None:
+        """Kill the process if it is still running and release buffers."""
+        if self._process.poll() is None:
+            kill_process_tree(self._process)
+        self._process.wait()
+        self._done.set()
+        self._stderr_thread.join()
+        for stream in (self._process.stdout, self._process.stderr):
+            if stream is not None:
+                stream.close()
+        self._stdout.close()
+        self._stderr.close()
+
+    # ///////////////////////////////////////////////////////////////
+    # PRIVATE METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    @staticmethod
+    def _create_spool() -> IO[str]:
+        """Create an output buffer that spills to a temporary file.
+
+        Returns:
+            IO[str]: Text buffer
+        """
+        return tempfile.SpooledTemporaryFile(
+            max_size=CommandConfig.STREAM_SPOOL_MAX_SIZE,
+            mode="w+",
+            encoding="utf-8",
+            newline="",
+        )
+
+    @staticmethod
+    def _read_spool(spool: IO[str]) -> str:
+        """Read a whole buffer, leaving it positioned for further writes.
+
+        Args:
+            spool: Buffer to read
+
+        Returns:
+            str: Buffer content
+        """
+        spool.seek(0)
+        content = spool.read()
+        spool.seek(0, 2)
+        return content
+
+    def _drain_stderr(self) -> None:
+        """Copy standard error to its buffer until the process closes it."""
+        if self._process.stderr is None:
+            return
+        for line in self._process.stderr:
+            self._stderr.write(line)
+
+    def _watch(self) -> None:
+        """Kill the process when its timeout expires or it is cancelled."""
+        deadline = time.monotonic() + self.timeout if self.timeout else None
+        while not self._done.wait(CommandConfig.CANCEL_POLL_INTERVAL):
+            if self._process.poll() is not None:
+                return
+            if self._cancel_event is not None and self._cancel_event.is_set():
+                self._cancelled = True
+            elif deadline is not None and time.monotonic() >= deadline:
+                self._timed_out = True
+            else:
+                continue
+            kill_process_tree(self._process)
+            return
+
 
 # ///////////////////////////////////////////////////////////////
 # COMMAND RUNNER SERVICE CLASS
@@ -49,7 +296,25 @@ class CommandRunnerService:
     _initialized: ClassVar[bool] = False
     _lock: ClassVar[Lock] = Lock()
 
-    def __new__(cls) -> CommandRunnerService:
+    # Subprocess arguments ``stream`` passes through; the output streams are
+    # owned by the stream itself
+    STREAM_SUBPROCESS_ARGS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "env",
+            "close_fds",
+            "pass_fds",
+            "restore_signals",
+            "start_new_session",
+            "group",
+            "extra_groups",
+            "user",
+            "umask",
+            "startupinfo",
+            "creationflags",
+        }
+    )
+
+    def __new__(cls, *_args: Any, **_kwargs: Any) -> CommandRunnerService:
         """Create or return the singleton instance."""
         with cls._lock:
             if cls._instance is None:
@@ -113,15 +378,25 @@ class CommandRunnerService:
         description: str = "",
         cwd: str | Path | None = None,
         validate_security: bool = False,
+        cancel_event: threading.Event | None = None,
+        timeout: float | None = None,
+        max_retries: int | None = None,
         **kwargs: Any,
     ) -> CommandResult:
         """Execute a command with optional security validation.
 
+        With ``cancel_event``, the command runs in a process group of its own
+        and the whole group is killed as soon as the event is set, or if the
+        calling thread is interrupted (Ctrl+C) while waiting for it.
+
         Args:
             command: Command to execute
             description: Description for logging
             cwd: Working directory
             validate_security: Whether to validate command security
+            cancel_event: Event that cancels the command when set
+            timeout: Timeout of each attempt in seconds (default: service timeout)
+            max_retries: Retries after a failed attempt (default: service setting)
             **kwargs: Additional subprocess arguments
 
         Returns:
@@ -132,6 +407,7 @@ class CommandRunnerService:
             CommandValidationError: If security validation fails
             TimeoutError: If command times out
             CommandExecutionError: If command execution fails
+            CommandCancelledError: If the command was cancelled
         """
         try:
             # Input validation
@@ -158,12 +434,20 @@ class CommandRunnerService:
                 self.logger.info(f"Executing command: {description}")
 
             # Execute command with retries
+            attempt_timeout = self.timeout if timeout is None else timeout
+            retries = self.max_retries if max_retries is None else max_retries
             start_time = time.time()
             last_error = None
 
-            for attempt in range(self.max_retries + 1):
+            for attempt in range(retries + 1):
                 try:
-                    result = self._execute_command(command, working_dir, **kwargs)
+                    result = self._execute_command(
+                        command,
+                        working_dir,
+                        cancel_event,
+                        timeout=attempt_timeout,
+                        **kwargs,
+                    )
                     execution_time = time.time() - start_time
 
                     return CommandResult(
@@ -176,13 +460,17 @@ class CommandRunnerService:
                         execution_time=execution_time,
                     )
 
+                except CommandCancelledError:
+                    # Cancelled commands are never retried
+                    raise
+
                 except subprocess.TimeoutExpired as e:
                     last_error = TimeoutError(
                         command=str(command),
-                        timeout_seconds=self.timeout,
-                        details=f"Attempt {attempt + 1}/{self.max_retries + 1}",
+                        timeout_seconds=attempt_timeout,
+                        details=f"Attempt {attempt + 1}/{retries + 1}",
                     )
-                    if attempt < self.max_retries:
+                    if attempt < retries:
                         time.sleep(self.retry_delay)
                         continue
                     else:
@@ -193,9 +481,9 @@ class CommandRunnerService:
                         command=str(command),
                         return_code=getattr(e, "returncode", -1),
                         stderr=str(e),
-                        details=f"Attempt {attempt + 1}/{self.max_retries + 1}: {e}",
+                        details=f"Attempt {attempt + 1}/{retries + 1}: {e}",
                     )
-                    if attempt < self.max_retries:
+                    if attempt < retries:
                         time.sleep(self.retry_delay)
                         continue
                     else:
@@ -206,22 +494,28 @@ class CommandRunnerService:
                         command=str(command),
                         return_code=-1,
                         stderr=str(e),
-                        details=f"Unexpected error on attempt {attempt + 1}/{self.max_retries + 1}: {e}",
+                        details=f"Unexpected error on attempt {attempt + 1}/{retries + 1}: {e}",
                     )
-                    if attempt < self.max_retries:
+                    if attempt < retries:
                         time.sleep(self.retry_delay)
                         continue
                     else:
                         raise last_error from e
 
-            # This should never be reached, but just in case
-            raise last_error
+            # Only reached when no attempt was made (negative retry count)
+            raise last_error or CommandExecutionError(
+                command=str(command),
+                return_code=-1,
+                stderr="",
+                details="Command was not attempted",
+            )
 
         except (
             CommandUtilityError,
             CommandValidationError,
             TimeoutError,
             CommandExecutionError,
+            CommandCancelledError,
         ):
             # Re-raise specialized exceptions as-is
             raise
@@ -235,6 +529,192 @@ class CommandRunnerService:
                 details=f"Exception type: {type(e).__name__}, Command: {command}",
             ) from e
 
+    def stream(
+        self,
+        command: str | list[str],
+        cwd: str | Path | None = None,
+        validate_security: bool = False,
+        cancel_event: threading.Event | None = None,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> CommandStream:
+        """Start a command and stream its output instead of buffering it.
+
+        Unlike ``run``, the command is not retried: its output may already
+        have been consumed when it fails.
+
+        Args:
+            command: Command to execute
+            cwd: Working directory
+            validate_security: Whether to validate command security
+            cancel_event: Event that kills the command and its children when set
+            timeout: Timeout in seconds (default: service timeout)
+            **kwargs: Additional subprocess arguments (``env`` and process
+                creation options; output streams are always piped)
+
+        Returns:
+            CommandStream: Stream of the running command
+
+        Raises:
+            CommandUtilityError: If command validation fails
+            CommandValidationError: If security validation fails
+            CommandExecutionError: If the command cannot be started
+            CommandCancelledError: If cancellation was requested before start
+        """
+        try:
+            self._validate_command_input(command)
+            if isinstance(command, str):
+                command = [command]
+
+            working_dir = Path(cwd) if cwd else self.default_cwd
+            if validate_security:
+                self._validate_command_security(command)
+
+            popen_args = get_process_group_options()
+            popen_args.update(
+                {
+                    key: value
+                    for key, value in kwargs.items()
+                    if key in self.STREAM_SUBPROCESS_ARGS
+                }
+            )
+            if cancel_event is not None and cancel_event.is_set():
+                raise CommandCancelledError(
+                    command=" ".join(command),
+                    details="Cancellation requested before the command started",
+                )
+            try:
+                process = subprocess.Popen(
+                    command,
+                    cwd=working_dir,
+                    stdin=subprocess.DEVNULL,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    encoding="utf-8",
+                    errors="replace",
+                    bufsize=1,
+                    shell=False,  # Explicitly disable shell for security
+                    **popen_args,
+                )
+            except OSError as e:
+                raise CommandExecutionError(
+                    command=str(command),
+                    return_code=-1,
+                    stderr=str(e),
+                    details=f"Failed to start streamed command: {e}",
+                ) from e
+
+            return CommandStream(
+                process,
+                command,
+                working_dir,
+                self.timeout if timeout is None else timeout,
+                security_validated=validate_security,
+                cancel_event=cancel_event,
+            )
+
+        except (
+            CommandUtilityError,
+            CommandValidationError,
+            CommandExecutionError,
+            CommandCancelledError,
+        ):
+            # Re-raise specialized exceptions as-is
+            raise
+        except Exception as e:
+            # Wrap unexpected external exceptions
+            raise CommandUtilityError(
+                message=f"Unexpected error while starting streamed command: {e}",
+                details=f"Exception type: {type(e).__name__}, Command: {command}",
+            ) from e
+
+    async def run_many(
+        self,
+        commands: Sequence[str | list[str]],
+        concurrency: int = CommandConfig.BATCH_CONCURRENCY,
+        probe: bool = False,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> list[CommandResult | BaseException]:
+        """Execute several commands concurrently.
+
+        Each command goes through ``run`` (or ``run_probe`` with ``probe``)
+        in a worker thread, so security validation, retries, timeouts and
+        results are exactly those of a single command; timeouts apply to
+        each command on its own. At most ``concurrency`` commands run at once.
+
+        If the batch is cancelled, or a command fails without
+        ``return_exceptions``, queued commands never start and running ones
+        are killed along with their children.
+
+        Args:
+            commands: Commands to execute
+            concurrency: Maximum number of commands running at once
+            probe: Whether to run the commands as probes (see ``run_probe``)
+            return_exceptions: Whether a failing command's exception takes
+                its place in the results instead of being raised
+            **kwargs: Additional arguments for run method, applied to every
+                command
+
+        Returns:
+            list[CommandResult | BaseException]: Result of each command, in
+            command order
+
+        Raises:
+            CommandUtilityError: If ``concurrency`` is invalid
+            CommandServiceError: The first failure, as raised by ``run``,
+                unless ``return_exceptions`` is set
+        """
+        if concurrency < 1:
+            raise CommandUtilityError(
+                message=f"Concurrency must be at least 1, got: {concurrency}",
+                details="Invalid concurrency for batch command execution",
+            )
+        if not commands:
+            return []
+
+        cancel_event = kwargs.pop("cancel_event", None) or threading.Event()
+        execute = partial(
+            self.run_probe if probe else self.run, cancel_event=cancel_event, **kwargs
+        )
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(
+            max_workers=min(concurrency, len(commands)),
+            thread_name_prefix="womm-batch",
+        )
+        tasks = [
+            loop.run_in_executor(executor, execute, command) for command in commands
+        ]
+        try:
+            return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        except BaseException:
+            # Also reached on cancellation: never leave children behind
+            cancel_event.set()
+            for task in tasks:
+                task.cancel()
+            raise
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def run_many_sync(
+        self, commands: Sequence[str | list[str]], **kwargs: Any
+    ) -> list[CommandResult | BaseException]:
+        """Execute several commands concurrently, blocking until all finish.
+
+        Must not be called from a running event loop: await ``run_many``
+        there instead.
+
+        Args:
+            commands: Commands to execute
+            **kwargs: Additional arguments for run_many method
+
+        Returns:
+            list[CommandResult | BaseException]: Result of each command, in
+            command order
+        """
+        return asyncio.run(self.run_many(commands, **kwargs))
+
     # ///////////////////////////////////////////////////////////////
     # PRIVATE EXECUTION HELPERS
     # ///////////////////////////////////////////////////////////////
@@ -243,6 +723,8 @@ class CommandRunnerService:
         self,
         cmd: list[str],
         cwd: Path,
+        cancel_event: threading.Event | None = None,
+        timeout: float | None = None,
         **kwargs: Any,
     ) -> subprocess.CompletedProcess[str]:
         """Execute a single command attempt.
@@ -250,6 +732,8 @@ class CommandRunnerService:
         Args:
             cmd: Command to execute as list of strings
             cwd: Working directory
+            cancel_event: Event that cancels the command when set
+            timeout: Timeout in seconds (default: service timeout)
             **kwargs: Additional subprocess arguments
 
         Returns:
@@ -257,6 +741,7 @@ class CommandRunnerService:
 
         Raises:
             CommandUtilityError: If command validation fails
+            CommandCancelledError: If the command was cancelled
             subprocess.TimeoutExpired: If command times out
             subprocess.SubprocessError: If command execution fails
         """
@@ -279,7 +764,7 @@ class CommandRunnerService:
             # Prepare subprocess arguments with explicit security settings
             subprocess_args = {
                 "cwd": cwd,
-                "timeout": self.timeout,
+                "timeout": self.timeout if timeout is None else timeout,
                 "text": True,
                 "encoding": "utf-8",
                 "errors": "replace",
@@ -318,10 +803,13 @@ class CommandRunnerService:
 
             # Execute command with explicit security validation
             # The command has already been validated by the calling method
+            if cancel_event is not None:
+                return self._execute_cancellable(cmd, subprocess_args, cancel_event)
             return subprocess.run(cmd, check=False, **subprocess_args)
 
         except (
             CommandUtilityError,
+            CommandCancelledError,
             subprocess.TimeoutExpired,
             subprocess.SubprocessError,
         ):
@@ -334,6 +822,75 @@ class CommandRunnerService:
                 details=f"Exception type: {type(e).__name__}, Command: {cmd}",
             ) from e
 
+    def _execute_cancellable(
+        self,
+        cmd: list[str],
+        subprocess_args: dict[str, Any],
+        cancel_event: threading.Event,
+    ) -> subprocess.CompletedProcess[str]:
+        """Execute a command attempt that stops as soon as it is cancelled.
+
+        The command runs in a new process group, so cancelling it also kills
+        the processes it started.
+
+        Args:
+            cmd: Command to execute as list of strings
+            subprocess_args: Prepared ``subprocess.run`` arguments
+            cancel_event: Event that cancels the command when set
+
+        Returns:
+            subprocess.CompletedProcess: Result of command execution
+
+        Raises:
+            CommandCancelledError: If the command was cancelled
+            subprocess.TimeoutExpired: If command times out
+        """
+        if cancel_event.is_set():
+            raise CommandCancelledError(
+                command=" ".join(cmd),
+                details="Cancellation requested before the command started",
+            )
+
+        popen_args = dict(subprocess_args)
+        timeout = popen_args.pop("timeout")
+        input_data = popen_args.pop("input", None)
+        popen_args.pop("check", None)
+        if popen_args.pop("capture_output"):
+            popen_args.setdefault("stdout", subprocess.PIPE)
+            popen_args.setdefault("stderr", subprocess.PIPE)
+        if input_data is not None:
+            popen_args["stdin"] = subprocess.PIPE
+        for key, value in get_process_group_options().items():
+            popen_args.setdefault(key, value)
+
+        deadline = time.monotonic() + timeout
+        with subprocess.Popen(cmd, **popen_args) as process:
+            try:
+                while True:
+                    wait = min(
+                        CommandConfig.CANCEL_POLL_INTERVAL,
+                        max(deadline - time.monotonic(), 0),
+                    )
+                    try:
+                        stdout, stderr = process.communicate(input_data, timeout=wait)
+                        return subprocess.CompletedProcess(
+                            cmd, process.returncode, stdout, stderr
+                        )
+                    except subprocess.TimeoutExpired:
+                        # Pending input is kept by communicate between calls
+                        input_data = None
+                        if cancel_event.is_set():
+                            raise CommandCancelledError(
+                                command=" ".join(cmd),
+                                details="Command killed on cancellation",
+                            ) from None
+                        if time.monotonic() >= deadline:
+                            raise subprocess.TimeoutExpired(cmd, timeout) from None
+            except BaseException:
+                # Also reached on KeyboardInterrupt: never leave children behind
+                kill_process_tree(process)
+                raise
+
     # ///////////////////////////////////////////////////////////////
     # PUBLIC CONVENIENCE METHODS (INSTANCE)
     # ///////////////////////////////////////////////////////////////
@@ -350,6 +907,67 @@ class CommandRunnerService:
         """
         return self.run(command, **kwargs)
 
+    def run_probe(
+        self, command: list[str], cache: bool = True, **kwargs: Any
+    ) -> CommandResult:
+        """Execute a quick informational command such as ``tool --version``.
+
+        Probes are never retried and their timeout is derived from previous
+        probe durations on this machine (see ``CommandConfig.PROBE_TIMEOUT``),
+        so a hung executable is given up on in seconds rather than minutes.
+
+        With ``cache``, the result is kept across WOMM invocations and reused
+        until the probed binary changes (see ``ProbeCacheService``). Timeouts
+        are not cached: a slow first run (cold disk, ``npx`` download) must
+        not hide the tool until the entry expires. Disable the cache for
+        probes whose output does not only depend on the binary. It is never
+        used with ``validate_security``.
+
+        Args:
+            command: Command to execute as list of strings
+            cache: Whether to use the persistent probe cache
+            **kwargs: Additional arguments for run method
+
+        Returns:
+            CommandResult: Result of command execution
+
+        Raises:
+            TimeoutError: If the probe times out
+            CommandExecutionError: If the probe cannot be executed
+        """
+        cwd = kwargs.get("cwd")
+        probe_cache = ProbeCacheService()
+        cache = cache and not kwargs.get("validate_security", False)
+        if cache:
+            cached = probe_cache.lookup(command, cwd)
+            if cached is not None:
+                return CommandResult(
+                    returncode=cached["returncode"],
+                    stdout=cached["stdout"],
+                    stderr=cached["stderr"],
+                    command=command,
+                    cwd=Path(cwd) if cwd else self.default_cwd,
+                )
+
+        timing_service = TimingService()
+        key = "probe:" + " ".join([Path(command[0]).name, *command[1:]])
+        timeout = timing_service.get_timeout(
+            None,
+            key,
+            CommandConfig.PROBE_TIMEOUT,
+            CommandConfig.PROBE_TIMEOUT_MIN,
+            CommandConfig.PROBE_TIMEOUT_MAX,
+        )
+        result = self.run(command, timeout=timeout, max_retries=0, **kwargs)
+        # Timed out probes are not recorded: a hung executable must not
+        # lengthen the timeout of the next probes
+        timing_service.record(None, key, result.execution_time)
+        if cache:
+            probe_cache.store(
+                command, result.returncode, result.stdout, result.stderr, cwd
+            )
+        return result
+
     def run_secure(
         self,
         command: str | list[str],
@@ -387,9 +1005,7 @@ class CommandRunnerService:
                     security_validated=False,
                 )
 
-            import shutil
-
-            if not shutil.which(command):
+            if not PathIndexService().which(command):
                 return CommandAvailabilityResult(
                     success=False,
                     message=f"Command '{command}' not found in PATH",
@@ -468,7 +1084,7 @@ class CommandRunnerService:
                     version_flag=version_flag,
                 )
 
-            result = self.run_silent([command, version_flag])
+            result = self.run_probe([command, version_flag])
             if bool(result) and result.stdout.strip():
                 # Extract version from output
                 output = result.stdout.strip()
@@ -19,10 +19,12 @@ from __future__ import annotations
 # ///////////////////////////////////////////////////////////////
 # Standard library imports
 import logging
+import os
 import time
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from threading import Lock
-from typing import ClassVar
+from typing import Any, ClassVar
 
 # Local imports
 from ...exceptions.common import (
@@ -31,14 +33,23 @@ from ...exceptions.common import (
     FileValidationError,
     SecurityFilterError,
 )
+from ...shared.configs.cache_config import CacheConfig
 from ...shared.configs.security import FileScannerConfig
 from ...shared.result_models import FileScanResult
 from ...shared.results import FileSearchResult
 from ...utils.common import (
     contains_security_sensitive_pattern,
+    get_scanner_fingerprint,
     is_python_file,
+    iter_python_files_parallel,
+    load_file_index,
+    save_file_index,
     should_exclude_path,
+    walk_python_files,
+    walk_python_files_indexed,
+    walk_python_files_parallel,
 )
+from .command_runner_service import CommandRunnerService
 from .security_validator_service import SecurityValidatorService
 
 # ///////////////////////////////////////////////////////////////
@@ -71,6 +82,7 @@ class FileScannerService:
 
         self.logger = logging.getLogger(__name__)
         self.security_validator = SecurityValidatorService()
+        self.command_runner = CommandRunnerService()
         FileScannerService._initialized = True
 
     # ///////////////////////////////////////////////////////////////
@@ -78,13 +90,14 @@ class FileScannerService:
     # ///////////////////////////////////////////////////////////////
 
     def find_python_files(
-        self, target_path: Path, recursive: bool = True
+        self, target_path: Path, recursive: bool = True, workers: int = 1
     ) -> FileSearchResult:
         """Find Python files in the given path.
 
         Args:
             target_path: Path to search (file or directory)
             recursive: Whether to search recursively in subdirectories
+            workers: Number of threads listing directories (1 = serial walk)
 
         Returns:
             FileSearchResult: Result with list of Python file paths
@@ -97,28 +110,10 @@ class FileScannerService:
         """
         start_time = time.time()
         try:
-            # Input validation
-            self._validate_target_path(target_path)
-
-            python_files = []
-
-            if target_path.is_file():
-                if is_python_file(target_path):
-                    python_files.append(target_path)
-            elif target_path.is_dir():
-                python_files.extend(self._scan_directory(target_path, recursive))
-            else:
-                raise FileScanError(
-                    message="Path is neither a file nor a directory",
-                    operation="find_python_files",
-                    target_path=str(target_path),
-                    details=(
-                        f"Path type: {target_path.stat().st_mode if target_path.exists() else 'unknown'}"
-                    ),
-                )
-
-            # Filter out files that match security patterns
-            filtered_files = self._filter_secure_files(python_files)
+            # Discovery, validation and security filtering are streamed
+            filtered_files = list(
+                self.iter_python_files(target_path, recursive, workers)
+            )
 
             search_time = time.time() - start_time
             self.logger.debug(
@@ -161,11 +156,124 @@ class FileScannerService:
                 search_time=search_time,
             )
 
-    def get_project_python_files(self, project_root: Path) -> FileSearchResult:
+    def iter_python_files(
+        self, target_path: Path, recursive: bool = True, workers: int = 1
+    ) -> Iterator[Path]:
+        """Yield Python files in the given path as they are discovered.
+
+        Applies the same exclusion and security filtering as
+        ``find_python_files`` without building the full list first, so
+        consumers can start working while the scan is still running.
+        Validation happens on the first iteration. With ``workers > 1``
+        directories are listed by a thread pool and the files of each
+        directory are yielded as its listing completes, in no fixed order.
+
+        Args:
+            target_path: Path to search (file or directory)
+            recursive: Whether to search recursively in subdirectories
+            workers: Number of threads listing directories (1 = serial walk)
+
+        Yields:
+            Path: Python files that passed security filtering
+
+        Raises:
+            FileValidationError: If input validation fails
+            FileScanError: If target path does not exist
+            FileAccessError: If directory access fails
+        """
+        # Input validation
+        self._validate_target_path(target_path)
+
+        if target_path.is_file():
+            candidates: Iterable[Path] = (
+                [target_path] if is_python_file(target_path) else []
+            )
+        elif target_path.is_dir():
+            candidates = self._iter_directory(target_path, recursive, workers)
+        else:
+            raise FileScanError(
+                message="Path is neither a file nor a directory",
+                operation="iter_python_files",
+                target_path=str(target_path),
+                details=(
+                    f"Path type: {target_path.stat().st_mode if target_path.exists() else 'unknown'}"
+                ),
+            )
+
+        # Filter out files that match security patterns, one chunk at a time
+        base_dir = target_path if target_path.is_dir() else None
+        chunk: list[Path] = []
+        for file_path in candidates:
+            chunk.append(file_path)
+            if len(chunk) >= FileScannerConfig.SECURITY_FILTER_BATCH_SIZE:
+                yield from self._filter_secure_files(chunk, base_dir)
+                chunk = []
+        if chunk:
+            yield from self._filter_secure_files(chunk, base_dir)
+
+    def iter_python_file_batches(
+        self,
+        target_path: Path,
+        batch_size: int,
+        recursive: bool = True,
+        workers: int = 1,
+    ) -> Iterator[list[Path]]:
+        """Yield Python files in the given path in fixed-size batches.
+
+        Args:
+            target_path: Path to search (file or directory)
+            batch_size: Maximum number of paths per batch
+            recursive: Whether to search recursively in subdirectories
+            workers: Number of threads listing directories (1 = serial walk)
+
+        Yields:
+            list[Path]: Batches of at most ``batch_size`` Python files
+
+        Raises:
+            FileValidationError: If input validation fails
+            FileScanError: If target path does not exist
+            FileAccessError: If directory access fails
+        """
+        if batch_size <= 0:
+            raise FileValidationError(
+                message=f"Batch size must be positive, got: {batch_size}",
+                operation="iter_python_file_batches",
+                target_path=str(target_path),
+                details="Input validation failed for batched file scanning",
+            )
+
+        batch: list[Path] = []
+        for file_path in self.iter_python_files(target_path, recursive, workers):
+            batch.append(file_path)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+    def get_project_python_files(
+        self,
+        project_root: Path,
+        use_index: bool = False,
+        rebuild_index: bool = False,
+        use_git: bool = False,
+        workers: int = 1,
+    ) -> FileSearchResult:
         """Get all Python files in a project, excluding common non-source directories.
 
+        When ``use_git`` is set and the project lives in a git work tree, files
+        are taken from the git index (tracked plus untracked, non-ignored)
+        instead of walking the filesystem, so ``.gitignore`` rules apply.
+
         Args:
             project_root: Root directory of the project
+            use_index: Whether to reuse and update the persistent file index
+            rebuild_index: Whether to ignore the existing index and rebuild it
+            use_git: Whether to list files from git when available
+            workers: Number of threads listing directories when walking the
+                filesystem, with or without the index (1 = serial walk); files
+                listed from git involve no walk
 
         Returns:
             FileSearchResult: Result with list of Python source files
@@ -183,14 +291,19 @@ class FileScannerService:
 
             python_files = []
 
-            # Walk through all subdirectories
+            # Walk through all subdirectories, pruning excluded ones
             try:
-                for item in project_root.rglob("*"):
-                    if should_exclude_path(item):
-                        continue
-
-                    if item.is_file() and is_python_file(item):
-                        python_files.append(item)
+                git_files = self._list_git_files(project_root) if use_git else None
+                if git_files is not None:
+                    python_files.extend(git_files)
+                elif use_index:
+                    python_files.extend(
+                        self._scan_project_indexed(project_root, rebuild_index, workers)
+                    )
+                else:
+                    python_files.extend(
+                        self._walk(project_root, recursive=True, workers=workers)
+                    )
 
             except (PermissionError, OSError) as e:
                 search_time = time.time() - start_time
@@ -204,7 +317,7 @@ class FileScannerService:
                 )
 
             # Filter security patterns
-            filtered_files = self._filter_secure_files(python_files)
+            filtered_files = self._filter_secure_files(python_files, project_root)
 
             search_time = time.time() - start_time
             self.logger.debug(
@@ -245,6 +358,225 @@ class FileScannerService:
                 search_time=search_time,
             )
 
+    def get_project_files(
+        self,
+        project_root: Path,
+        extensions: set[str],
+        use_git: bool = True,
+        workers: int = 1,
+    ) -> FileSearchResult:
+        """Get the files of a project with the given extensions.
+
+        Same discovery and filtering as ``get_project_python_files`` (without
+        the persistent index, which only holds Python files), for tools that
+        check more than Python sources.
+
+        Args:
+            project_root: Root directory of the project
+            extensions: Lower-case file extensions to include (e.g. ``".md"``)
+            use_git: Whether to list files from git when available
+            workers: Number of threads listing directories when walking
+                (1 = serial walk)
+
+        Returns:
+            FileSearchResult: Result with list of matching files
+        """
+        start_time = time.time()
+        try:
+            self._validate_project_root(project_root)
+
+            try:
+                git_files = (
+                    self._list_git_files(project_root, extensions) if use_git else None
+                )
+                files = (
+                    git_files
+                    if git_files is not None
+                    else list(self._walk(project_root, True, workers, extensions))
+                )
+            except (PermissionError, OSError) as e:
+                return FileSearchResult(
+                    success=False,
+                    error=f"Permission or OS error: {e}",
+                    target_path=project_root,
+                    files_found=[],
+                    recursive=True,
+                    search_time=time.time() - start_time,
+                )
+
+            filtered_files = self._filter_secure_files(files, project_root)
+
+            self.logger.debug(
+                f"Found {len(filtered_files)} files in project {project_root.name}"
+            )
+            return FileSearchResult(
+                success=True,
+                message=f"Found {len(filtered_files)} files in project",
+                target_path=project_root,
+                files_found=filtered_files,
+                recursive=True,
+                search_time=time.time() - start_time,
+            )
+
+        except (
+            FileValidationError,
+            FileScanError,
+            FileAccessError,
+            SecurityFilterError,
+        ) as e:
+            return FileSearchResult(
+                success=False,
+                error=str(e),
+                target_path=project_root,
+                files_found=[],
+                recursive=True,
+                search_time=time.time() - start_time,
+            )
+        except Exception as e:
+            return FileSearchResult(
+                success=False,
+                error=f"Unexpected error during project file scanning: {e}",
+                target_path=project_root,
+                files_found=[],
+                recursive=True,
+                search_time=time.time() - start_time,
+            )
+
+    def get_changed_python_files(
+        self,
+        project_root: Path,
+        since: str | None = None,
+        staged: bool = False,
+    ) -> FileSearchResult:
+        """Get Python files changed in a git work tree.
+
+        With ``since``, lists files that differ between the ref and the work
+        tree, plus untracked (non-ignored) files. With ``staged``, lists files
+        whose index content differs from ``HEAD`` (or from ``since`` when
+        both are given); such files may not match the work tree copy, see
+        ``export_staged_files``. Deleted files are never listed. Results go
+        through the usual exclusion and security filtering.
+
+        Args:
+            project_root: Root directory of the project (inside a git work tree)
+            since: Git ref to compare against
+            staged: Whether to list staged changes instead of work tree changes
+
+        Returns:
+            FileSearchResult: Result with list of changed Python files
+        """
+        start_time = time.time()
+        try:
+            # Input validation
+            self._validate_project_root(project_root)
+            if not since and not staged:
+                raise FileValidationError(
+                    message="A ref or staged mode is required",
+                    operation="get_changed_python_files",
+                    target_path=str(project_root),
+                    details="Neither 'since' nor 'staged' was provided",
+                )
+
+            # --relative keeps paths relative to (and inside) project_root
+            diff_args = [
+                "diff",
+                "--name-only",
+                "-z",
+                "--relative",
+                "--diff-filter=ACMR",
+            ]
+            if staged:
+                diff_args.append("--cached")
+            if since:
+                diff_args.extend([since, "--"])
+            output = self._run_git(project_root, diff_args)
+
+            if not staged:
+                output += self._run_git(
+                    project_root, ["ls-files", "-z", "--others", "--exclude-standard"]
+                )
+
+            python_files = self._filter_git_paths(project_root, output)
+            if not staged:
+                python_files = [path for path in python_files if path.is_file()]
+
+            filtered_files = self._filter_secure_files(python_files, project_root)
+
+            search_time = time.time() - start_time
+            self.logger.debug(
+                f"Found {len(filtered_files)} changed Python files in {project_root.name}"
+            )
+            return FileSearchResult(
+                success=True,
+                message=f"Found {len(filtered_files)} changed Python files",
+                target_path=project_root,
+                files_found=filtered_files,
+                recursive=True,
+                search_time=search_time,
+            )
+
+        except (
+            FileValidationError,
+            FileScanError,
+            FileAccessError,
+            SecurityFilterError,
+        ) as e:
+            search_time = time.time() - start_time
+            return FileSearchResult(
+                success=False,
+                error=str(e),
+                target_path=project_root,
+                files_found=[],
+                recursive=True,
+                search_time=search_time,
+            )
+        except Exception as e:
+            search_time = time.time() - start_time
+            return FileSearchResult(
+                success=False,
+                error=f"Unexpected error while listing changed files: {e}",
+                target_path=project_root,
+                files_found=[],
+                recursive=True,
+                search_time=search_time,
+            )
+
+    def export_staged_files(
+        self, project_root: Path, paths: Iterable[str], destination: Path
+    ) -> Path:
+        """Write the staged (index) content of files under a directory.
+
+        Files are laid out as in the repository, so ``project_root`` maps to
+        a subdirectory of ``destination`` when it is not the repository top
+        level. Paths that are not in the index are skipped, so optional files
+        such as tool configuration can be requested unconditionally.
+
+        Args:
+            project_root: Root directory of the project (inside a git work tree)
+            paths: File paths relative to ``project_root``
+            destination: Directory to write the files into
+
+        Returns:
+            Path: Location of ``project_root`` inside ``destination``
+
+        Raises:
+            FileScanError: If git is unavailable or the export fails
+        """
+        # checkout-index fails on paths missing from the index
+        indexed = set(self._run_git(project_root, ["ls-files", "-z"]).split("\0"))
+        stdin = "".join(f"{path}\0" for path in paths if path in indexed)
+
+        # checkout-index writes <prefix><path from repository top level>
+        prefix = os.path.join(os.path.abspath(destination), "")
+        self._run_git(
+            project_root,
+            ["checkout-index", "-q", "-f", "-z", "--stdin", f"--prefix={prefix}"],
+            input=stdin,
+        )
+
+        top_level_prefix = self._run_git(project_root, ["rev-parse", "--show-prefix"])
+        return Path(prefix, top_level_prefix.strip())
+
     def get_scan_summary(
         self, target_path: Path | list[Path] | None = None
     ) -> FileScanResult:
@@ -268,7 +600,7 @@ class FileScannerService:
                 actual_path = python_files[0].parent if python_files else None
             elif target_path is not None:
                 # Need to scan
-                python_files = self.find_python_files(target_path)
+                python_files = list(self.iter_python_files(target_path))
                 actual_path = target_path
             else:
                 # No path provided, return empty summary
@@ -304,79 +636,237 @@ class FileScannerService:
     # PRIVATE METHODS
     # ///////////////////////////////////////////////////////////////
 
-    def _scan_directory(self, directory: Path, recursive: bool) -> list[Path]:
-        """Scan a directory for Python files.
+    def _walk(
+        self,
+        directory: Path,
+        recursive: bool,
+        workers: int,
+        extensions: set[str] | None = None,
+        ordered: bool = True,
+    ) -> Iterable[Path]:
+        """Select the serial or threaded walker.
 
         Args:
             directory: Directory to scan
             recursive: Whether to scan recursively
+            workers: Number of threads listing directories (1 = serial walk)
+            extensions: File extensions to find (default: Python)
+            ordered: Whether the threaded walker sorts its results; otherwise
+                files are yielded as directory listings complete
 
         Returns:
-            List[Path]: List of Python files found
+            Iterable[Path]: Files found
+
+        Raises:
+            OSError: If the directory cannot be listed
+        """
+        if workers > 1 and not ordered:
+            return iter_python_files_parallel(directory, recursive, workers, extensions)
+        if workers > 1:
+            return walk_python_files_parallel(directory, recursive, workers, extensions)
+        return walk_python_files(directory, recursive, extensions)
+
+    def _iter_directory(
+        self, directory: Path, recursive: bool, workers: int = 1
+    ) -> Iterator[Path]:
+        """Yield Python files from a directory as they are found.
+
+        Args:
+            directory: Directory to scan
+            recursive: Whether to scan recursively
+            workers: Number of threads listing directories (1 = serial walk)
+
+        Yields:
+            Path: Python files found
 
         Raises:
             FileScanError: If directory does not exist
             FileAccessError: If directory access fails
         """
+        if not directory.exists():
+            raise FileScanError(
+                message="Directory does not exist",
+                operation="scan_directory",
+                target_path=str(directory),
+                details=f"Directory {directory} was not found",
+            )
+
+        scan_kind = "recursive scan" if recursive else "directory scan"
         try:
-            if not directory.exists():
-                raise FileScanError(
-                    message="Directory does not exist",
-                    operation="scan_directory",
-                    target_path=str(directory),
-                    details=f"Directory {directory} was not found",
-                )
+            yield from self._walk(directory, recursive, workers, ordered=False)
+        except (PermissionError, OSError) as e:
+            raise FileAccessError(
+                message=f"Permission or OS error during {scan_kind}: {e}",
+                operation=scan_kind.replace(" ", "_"),
+                file_path=str(directory),
+                reason=f"Permission or OS error during {scan_kind}: {e}",
+                details=f"Failed to scan directory {directory}",
+            ) from e
 
-            python_files = []
+    def _list_git_files(
+        self, project_root: Path, extensions: set[str] | None = None
+    ) -> list[Path] | None:
+        """List Python files known to git under a project root.
 
-            if recursive:
-                # Recursive scan
-                try:
-                    for item in directory.rglob("*"):
-                        if should_exclude_path(item):
-                            continue
-
-                        if item.is_file() and is_python_file(item):
-                            python_files.append(item)
-                except (PermissionError, OSError) as e:
-                    raise FileAccessError(
-                        message=f"Permission or OS error during recursive scan: {e}",
-                        operation="recursive_scan",
-                        file_path=str(directory),
-                        reason=f"Permission or OS error during recursive scan: {e}",
-                        details=f"Failed to recursively scan directory {directory}",
-                    ) from e
-            else:
-                # Non-recursive scan
-                try:
-                    for item in directory.iterdir():
-                        if should_exclude_path(item):
-                            continue
-
-                        if item.is_file() and is_python_file(item):
-                            python_files.append(item)
-                except (PermissionError, OSError) as e:
-                    raise FileAccessError(
-                        message=f"Permission or OS error during directory scan: {e}",
-                        operation="directory_scan",
-                        file_path=str(directory),
-                        reason=f"Permission or OS error during directory scan: {e}",
-                        details=f"Failed to scan directory {directory}",
-                    ) from e
-
-            return python_files
-
-        except (FileScanError, FileAccessError):
-            # Re-raise specialized exceptions as-is
-            raise
+        Uses ``git ls-files`` for tracked and untracked-but-not-ignored files,
+        then applies the same exclusion and extension rules as the walker.
+
+        Args:
+            project_root: Root directory of the project
+            extensions: File extensions to list (default: Python)
+
+        Returns:
+            list[Path] | None: Matching files, or None if git is unavailable
+            or the project is not inside a git work tree
+        """
+        if should_exclude_path(project_root):
+            return []
+
+        try:
+            if not self.command_runner.check_command_available("git").is_available:
+                return None
+
+            result = self.command_runner.run_silent(
+                ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+                cwd=project_root,
+            )
         except Exception as e:
-            # Wrap unexpected external exceptions
+            self.logger.debug(f"git ls-files failed in {project_root}: {e}")
+            return None
+
+        if not result:
+            self.logger.debug(
+                f"Not using git index for {project_root}: {result.stderr.strip()}"
+            )
+            return None
+
+        # The index can list files deleted from the work tree
+        files = [
+            file_path
+            for file_path in self._filter_git_paths(
+                project_root, result.stdout, extensions
+            )
+            if file_path.is_file()
+        ]
+
+        self.logger.debug(f"git index listed {len(files)} files in {project_root}")
+        return files
+
+    def _filter_git_paths(
+        self, project_root: Path, output: str, extensions: set[str] | None = None
+    ) -> list[Path]:
+        """Turn NUL-separated git path output into Python file paths.
+
+        Applies the same exclusion and extension rules as the walker and
+        drops duplicates, keeping the first occurrence.
+
+        Args:
+            project_root: Directory the paths are relative to
+            output: NUL-separated paths printed by git (``-z``)
+            extensions: File extensions to keep (default: Python)
+
+        Returns:
+            list[Path]: Matching file paths under ``project_root``
+        """
+        excluded_dirs = FileScannerConfig.EXCLUDED_DIRS
+        if extensions is None:
+            extensions = FileScannerConfig.PYTHON_EXTENSIONS
+        python_files: list[Path] = []
+        seen: set[str] = set()
+
+        for rel in output.split("\0"):
+            # Deleted-but-unstaged files may appear twice (cached + others)
+            if not rel or rel in seen:
+                continue
+            seen.add(rel)
+
+            if os.path.splitext(rel)[1].lower() not in extensions:
+                continue
+            if any(part in excluded_dirs for part in rel.split("/")):
+                continue
+
+            python_files.append(project_root / rel)
+
+        return python_files
+
+    def _run_git(self, project_root: Path, args: list[str], **kwargs: Any) -> str:
+        """Run a git command in a project and return its output.
+
+        Args:
+            project_root: Directory to run git in
+            args: Arguments after ``git``
+            **kwargs: Additional subprocess arguments (e.g. ``input``)
+
+        Returns:
+            str: Standard output of the command
+
+        Raises:
+            FileScanError: If git is unavailable or the command fails
+        """
+        if not self.command_runner.check_command_available("git").is_available:
             raise FileScanError(
-                message=f"Unexpected error during directory scanning: {e}",
-                operation="scan_directory",
-                target_path=str(directory),
-                details=f"Exception type: {type(e).__name__}",
-            ) from e
+                message="git is not available",
+                operation="git",
+                target_path=str(project_root),
+                details="git must be installed to list changed files",
+            )
+
+        result = self.command_runner.run_silent(
+            ["git", *args], cwd=project_root, **kwargs
+        )
+        if not result:
+            raise FileScanError(
+                message=f"git {args[0]} failed: {result.stderr.strip()}",
+                operation="git",
+                target_path=str(project_root),
+                details=f"Command: git {' '.join(args)}",
+            )
+        return result.stdout
+
+    def _scan_project_indexed(
+        self, project_root: Path, rebuild_index: bool, workers: int = 1
+    ) -> list[Path]:
+        """Scan a project through its persistent file index.
+
+        Only directories whose mtime changed since the last scan are listed
+        again. Index read/write failures never fail the scan itself; without
+        a writable cache directory, the project is walked without the index.
+
+        Args:
+            project_root: Root directory of the project
+            rebuild_index: Whether to ignore the existing index
+            workers: Number of threads checking directories (1 = serial walk)
+
+        Returns:
+            List[Path]: List of Python files found
+
+        Raises:
+            OSError: If the project root cannot be read
+        """
+        if not CacheConfig.is_cache_dir_writable():
+            self.logger.debug("Cache directory not writable, scanning without index")
+            return list(self._walk(project_root, recursive=True, workers=workers))
+
+        index_path = CacheConfig.get_file_index_path(project_root)
+
+        fingerprint = get_scanner_fingerprint(CacheConfig.FILE_INDEX_VERSION)
+        cached = {} if rebuild_index else load_file_index(index_path, fingerprint)
+
+        python_files, directories, listed = walk_python_files_indexed(
+            project_root, cached, CacheConfig.FILE_INDEX_RACY_WINDOW, workers
+        )
+        self.logger.debug(
+            f"File index: listed {listed}/{len(directories)} directories "
+            f"in {project_root}"
+        )
+
+        if listed or rebuild_index or len(directories) != len(cached):
+            try:
+                save_file_index(index_path, fingerprint, project_root, directories)
+            except OSError as e:
+                self.logger.debug(f"Failed to save file index {index_path}: {e}")
+
+        return python_files
 
     def _validate_target_path(self, target_path: Path) -> None:
         """Validate target path for file scanning.
@@ -432,11 +922,55 @@ class FileScannerService:
                 ),
             )
 
-    def _filter_secure_files(self, files: list[Path]) -> list[Path]:
+    def _is_secure_file(self, file_path: Path) -> bool:
+        """Check a single file against security patterns.
+
+        Args:
+            file_path: File to check
+
+        Returns:
+            bool: True if the file may be processed
+        """
+        try:
+            # Check if file path contains security-sensitive patterns
+            if contains_security_sensitive_pattern(file_path):
+                self.logger.debug(f"Skipping security-sensitive file: {file_path}")
+                return False
+
+            # Additional security validation using SecurityValidator
+            try:
+                validation_result = self.security_validator.validate_file_path(
+                    str(file_path)
+                )
+                if validation_result.is_valid:
+                    return True
+
+                # If security validation fails, log and skip the file
+                self.logger.warning(
+                    f"Security validation failed for {file_path}: {validation_result.validation_reason}"
+                )
+                return False
+            except Exception as e:
+                # If security validation fails, log and include the file
+                self.logger.warning(f"Security validation failed for {file_path}: {e}")
+                return True
+
+        except Exception as e:
+            # Log individual file processing errors but continue
+            self.logger.warning(f"Error processing file {file_path}: {e}")
+            return True  # Include on error for safety
+
+    def _filter_secure_files(
+        self, files: list[Path], base_dir: Path | None = None
+    ) -> list[Path]:
         """Filter files based on security patterns.
 
+        Validates the whole list in one batch; falls back to per-file checks
+        if the batch validation itself fails.
+
         Args:
             files: List of files to filter
+            base_dir: Directory the files were discovered under, if known
 
         Returns:
             List[Path]: Filtered list of files
@@ -445,42 +979,28 @@ class FileScannerService:
             SecurityFilterError: If security filtering fails
         """
         try:
-            filtered_files = []
-
-            for file_path in files:
-                try:
-                    # Check if file path contains security-sensitive patterns
-                    if contains_security_sensitive_pattern(file_path):
-                        self.logger.debug(
-                            f"Skipping security-sensitive file: {file_path}"
-                        )
-                        continue
-
-                    # Additional security validation using SecurityValidator
-                    try:
-                        validation_result = self.security_validator.validate_file_path(
-                            str(file_path)
-                        )
-                        if validation_result.is_valid:
-                            filtered_files.append(file_path)
-                        else:
-                            # If security validation fails, log and skip the file
-                            self.logger.warning(
-                                f"Security validation failed for {file_path}: {validation_result.validation_reason}"
-                            )
-                    except Exception as e:
-                        # If security validation fails, log and include the file
-                        self.logger.warning(
-                            f"Security validation failed for {file_path}: {e}"
-                        )
-                        filtered_files.append(file_path)
-
-                except Exception as e:
-                    # Log individual file processing errors but continue
-                    self.logger.warning(f"Error processing file {file_path}: {e}")
-                    filtered_files.append(file_path)  # Include on error for safety
-
-            return filtered_files
+            try:
+                batch = self.security_validator.validate_file_paths(
+                    files, base_dir=base_dir, exclude_sensitive=True
+                )
+            except Exception as e:
+                self.logger.warning(f"Batch security validation failed: {e}")
+                return [
+                    file_path for file_path in files if self._is_secure_file(file_path)
+                ]
+
+            rejected_paths = batch.rejected_paths or {}
+            for file_path, reason in rejected_paths.items():
+                if reason == "File path contains security-sensitive patterns":
+                    self.logger.debug(f"Skipping security-sensitive file: {file_path}")
+                else:
+                    self.logger.warning(
+                        f"Security validation failed for {file_path}: {reason}"
+                    )
+
+            return [
+                file_path for file_path in files if str(file_path) not in rejected_paths
+            ]
 
         except Exception as e:
             raise SecurityFilterError(
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# PATH INDEX SERVICE - Executable Lookup Service
+# Project: works-on-my-machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Path Index Service - Singleton service resolving executables on PATH.
+
+Drop-in replacement for ``shutil.which(command)``. The ``PATH``
+directories are listed once into an index; lookups then only check the
+matching files. The index is rebuilt when ``PATH``, ``PATHEXT`` or the
+current directory changes, when a ``PATH`` directory is modified (checked
+at most every ``CommandConfig.PATH_INDEX_CHECK_INTERVAL`` seconds), and
+after WOMM installs something.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import logging
+import os
+import shutil
+import time
+from threading import Lock
+from typing import ClassVar
+
+# Local imports
+from ...shared.configs.command_config import CommandConfig
+from ...utils.common.path_index_utils import (
+    build_path_index,
+    get_directory_mtimes,
+    get_executable_extensions,
+    get_path_directories,
+    lookup_executable,
+)
+
+# ///////////////////////////////////////////////////////////////
+# PATH INDEX SERVICE CLASS
+# ///////////////////////////////////////////////////////////////
+
+
+class PathIndexService:
+    """Singleton service for indexed executable lookups."""
+
+    _instance: ClassVar[PathIndexService | None] = None
+    _initialized: ClassVar[bool] = False
+    _lock: ClassVar[Lock] = Lock()
+
+    def __new__(cls) -> PathIndexService:
+        """Create or return the singleton instance.
+
+        Returns:
+            PathIndexService: The singleton instance
+        """
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self) -> None:
+        """Initialize path index service (only once)."""
+        if PathIndexService._initialized:
+            return
+
+        self.logger = logging.getLogger(__name__)
+        self._index: dict[str, list[tuple[int, str]]] | None = None
+        self._environment: tuple[str, ...] = ()
+        self._directories: list[str] = []
+        self._extensions: list[str] = []
+        self._mtimes: list[int | None] = []
+        self._checked_at = 0.0
+        self._resolved: dict[str, str | None] = {}
+        self._index_lock = Lock()
+        PathIndexService._initialized = True
+
+    # ///////////////////////////////////////////////////////////////
+    # PUBLIC METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def which(self, command: str) -> str | None:
+        """Return the path of the executable a command resolves to.
+
+        Args:
+            command: Command name, or path to an executable
+
+        Returns:
+            str | None: Path of the executable, or None if it is not found
+            (same result as ``shutil.which(command)``)
+        """
+        if not command:
+            return None
+        if os.path.dirname(command):
+            # Paths are not looked up on PATH
+            return shutil.which(command)
+
+        with self._index_lock:
+            self._refresh_if_stale()
+            if command not in self._resolved:
+                self._resolved[command] = lookup_executable(
+                    self._index or {}, command, self._extensions
+                )
+            return self._resolved[command]
+
+    def invalidate(self) -> None:
+        """Drop the index so the next lookup lists PATH again.
+
+        Called after installing a tool or runtime, which can add
+        executables faster than directory modification times show.
+        """
+        with self._index_lock:
+            self._index = None
+
+    # ///////////////////////////////////////////////////////////////
+    # PRIVATE METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def _refresh_if_stale(self) -> None:
+        """Rebuild the index if PATH or one of its directories changed."""
+        environment = (
+            os.environ.get("PATH", os.defpath),
+            os.environ.get("PATHEXT", ""),
+            os.getcwd(),
+        )
+        now = time.monotonic()
+        if self._index is not None and environment == self._environment:
+            if now - self._checked_at < CommandConfig.PATH_INDEX_CHECK_INTERVAL:
+                return
+            self._checked_at = now
+            if get_directory_mtimes(self._directories) == self._mtimes:
+                return
+
+        self._environment = environment
+        self._directories = get_path_directories(environment[0])
+        self._extensions = get_executable_extensions()
+        # Modification times are taken before listing, so a directory
+        # changing while it is listed is listed again next time
+        self._mtimes = get_directory_mtimes(self._directories)
+        self._index = build_path_index(self._directories)
+        self._resolved = {}
+        self._checked_at = now
+        self.logger.debug(
+            f"Indexed {len(self._index)} names in {len(self._directories)} "
+            "PATH directories"
+        )
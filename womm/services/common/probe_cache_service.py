@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# PROBE CACHE SERVICE - Persistent Binary Probe Cache Service
+# Project: works-on-my-machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Probe Cache Service - Singleton service for the persistent probe cache.
+
+Keeps the results of binary probes (``tool --version`` and the like)
+across WOMM invocations, so checking dependencies on a machine whose
+tools did not change runs no subprocess at all. Entries are reused until
+the probed binary or ``PATH`` changes, or they expire; installing
+something through WOMM drops all of them.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import atexit
+import logging
+import time
+from pathlib import Path
+from threading import Lock
+from typing import Any, ClassVar
+
+# Local imports
+from ...shared.configs.cache_config import CacheConfig
+from ...utils.common.probe_cache_utils import (
+    get_binary_fingerprint,
+    get_path_fingerprint,
+    is_probe_entry_valid,
+    load_probe_cache,
+    save_probe_cache,
+)
+from .path_index_service import PathIndexService
+
+# ///////////////////////////////////////////////////////////////
+# PROBE CACHE SERVICE CLASS
+# ///////////////////////////////////////////////////////////////
+
+
+class ProbeCacheService:
+    """Singleton service for persistent binary probe results."""
+
+    _instance: ClassVar[ProbeCacheService | None] = None
+    _initialized: ClassVar[bool] = False
+    _lock: ClassVar[Lock] = Lock()
+
+    def __new__(cls) -> ProbeCacheService:
+        """Create or return the singleton instance.
+
+        Returns:
+            ProbeCacheService: The singleton instance
+        """
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self) -> None:
+        """Initialize probe cache service (only once)."""
+        if ProbeCacheService._initialized:
+            return
+
+        self.logger = logging.getLogger(__name__)
+        self._entries: dict[str, Any] | None = None
+        self._dirty = False
+        self._cache_lock = Lock()
+        self._path_index = PathIndexService()
+        atexit.register(self.flush)
+        ProbeCacheService._initialized = True
+
+    # ///////////////////////////////////////////////////////////////
+    # PUBLIC METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def lookup(
+        self, command: list[str], cwd: str | Path | None = None
+    ) -> dict[str, Any] | None:
+        """Return the cached result of a probe if it is still valid.
+
+        Args:
+            command: Probe command
+            cwd: Directory the probe runs in, if it matters
+
+        Returns:
+            dict[str, Any] | None: ``returncode``, ``stdout`` and ``stderr``
+            of the last run, or None if there is no valid entry
+        """
+        binary = self._get_binary_fingerprint(command[0])
+        if binary is None:
+            return None
+
+        with self._cache_lock:
+            entry = self._get_entries().get(self._get_key(command, cwd))
+        if entry is None or not is_probe_entry_valid(
+            entry,
+            binary,
+            get_path_fingerprint(),
+            time.time(),
+            CacheConfig.PROBE_CACHE_TTL,
+        ):
+            return None
+        return {
+            "returncode": entry["returncode"],
+            "stdout": entry.get("stdout", ""),
+            "stderr": entry.get("stderr", ""),
+        }
+
+    def store(
+        self,
+        command: list[str],
+        returncode: int,
+        stdout: str,
+        stderr: str,
+        cwd: str | Path | None = None,
+    ) -> None:
+        """Record the result of a probe, evicting the oldest entries.
+
+        Args:
+            command: Probe command
+            returncode: Exit code of the probe
+            stdout: Standard output of the probe
+            stderr: Standard error of the probe
+            cwd: Directory the probe ran in, if it matters
+        """
+        binary = self._get_binary_fingerprint(command[0])
+        if binary is None:
+            return
+
+        entry = {
+            "binary": binary,
+            "path": get_path_fingerprint(),
+            "time": time.time(),
+            "returncode": returncode,
+            "stdout": stdout,
+            "stderr": stderr,
+        }
+        with self._cache_lock:
+            entries = self._get_entries()
+            key = self._get_key(command, cwd)
+            entries.pop(key, None)
+            entries[key] = entry
+            while len(entries) > CacheConfig.PROBE_CACHE_MAX_ENTRIES:
+                del entries[next(iter(entries))]
+            self._dirty = True
+
+    def invalidate(self) -> None:
+        """Drop every cached probe result.
+
+        Called after installing a tool or runtime: an installation can change
+        probe results without changing the probed binary (``npx cspell``).
+        """
+        with self._cache_lock:
+            self._entries = {}
+            self._dirty = True
+
+    def flush(self) -> None:
+        """Write the cache to disk if it changed.
+
+        Failures are logged and ignored: the cache is only an optimization.
+        """
+        with self._cache_lock:
+            if not self._dirty or self._entries is None:
+                return
+            if not CacheConfig.is_cache_dir_writable():
+                return
+            try:
+                save_probe_cache(
+                    CacheConfig.get_probe_cache_path(),
+                    CacheConfig.PROBE_CACHE_VERSION,
+                    self._entries,
+                )
+                self._dirty = False
+            except OSError as e:
+                self.logger.debug(f"Could not save probe cache: {e}")
+
+    # ///////////////////////////////////////////////////////////////
+    # PRIVATE METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def _get_entries(self) -> dict[str, Any]:
+        """Return the entries, loading them from disk on first use.
+
+        Returns:
+            dict[str, Any]: Entries keyed by probe key, oldest first
+        """
+        if self._entries is None:
+            self._entries = load_probe_cache(
+                CacheConfig.get_probe_cache_path(), CacheConfig.PROBE_CACHE_VERSION
+            )
+        return self._entries
+
+    def _get_binary_fingerprint(self, executable: str) -> list[Any] | None:
+        """Fingerprint the binary a command name resolves to.
+
+        Args:
+            executable: Command name or path
+
+        Returns:
+            list[Any] | None: Binary fingerprint, or None if the executable
+            cannot be found
+        """
+        executable_path = self._path_index.which(executable)
+        if executable_path is None:
+            return None
+        return get_binary_fingerprint(executable_path)
+
+    @staticmethod
+    def _get_key(command: list[str], cwd: str | Path | None) -> str:
+        """Build the cache key of a probe.
+
+        Args:
+            command: Probe command
+            cwd: Directory the probe runs in, if it matters
+
+        Returns:
+            str: Cache key
+        """
+        key = "\0".join(command)
+        return f"{key}\0{Path(cwd).resolve()}" if cwd else key
@@ -18,6 +18,9 @@ from __future__ import annotations
 # ///////////////////////////////////////////////////////////////
 # Standard library imports
 import logging
+import os
+import re
+from collections.abc import Iterable
 from pathlib import Path
 from threading import Lock
 from typing import ClassVar
@@ -31,15 +34,19 @@ from ...exceptions.common import (
 from ...shared.configs.security import SecurityPatternsConfig
 from ...shared.results import (
     CommandValidationResult,
+    PathBatchValidationResult,
     PathValidationResult,
     SecurityReportResult,
 )
 from ...utils.security import (
+    get_dangerous_file_regex,
+    get_path_filter_regex,
     has_dangerous_command_patterns,
     has_dangerous_file_patterns,
     has_excessive_traversal,
     is_dangerous_argument,
     is_system_directory,
+    is_system_path,
     validate_permission_command,
 )
 
@@ -274,6 +281,68 @@ class SecurityValidatorService:
                 details=f"Exception type: {type(e).__name__}, Path: {file_path}",
             ) from e
 
+    def validate_file_paths(
+        self,
+        file_paths: Iterable[str | Path],
+        base_dir: Path | None = None,
+        exclude_sensitive: bool = False,
+    ) -> PathBatchValidationResult:
+        """Validate many file paths for security concerns in one pass.
+
+        Applies the same checks as ``validate_file_path`` using a single
+        precompiled matcher. For the system-directory check, each parent
+        directory is resolved once per batch; a path is only resolved on its
+        own when it is a symbolic link.
+
+        Args:
+            file_paths: File paths to validate
+            base_dir: Directory the paths are expected to live under
+            exclude_sensitive: Whether to also reject paths matching
+                ``FileScannerConfig.SECURITY_SENSITIVE_PATTERNS``
+
+        Returns:
+            PathBatchValidationResult: Valid paths and rejected paths with reasons
+
+        Raises:
+            SecurityServiceError: If unexpected error occurs during validation
+        """
+        try:
+            matcher = (
+                get_path_filter_regex()
+                if exclude_sensitive
+                else get_dangerous_file_regex()
+            )
+
+            resolved_dirs: dict[str, str] = {}
+            valid_paths: list[str] = []
+            rejected_paths: dict[str, str] = {}
+
+            for raw_path in file_paths:
+                file_path = str(raw_path)
+                reason = self._check_batch_path(file_path, matcher, resolved_dirs)
+                if reason:
+                    rejected_paths[file_path] = reason
+                else:
+                    valid_paths.append(file_path)
+
+            return PathBatchValidationResult(
+                success=True,
+                message=f"Validated {len(valid_paths) + len(rejected_paths)} paths",
+                base_dir=str(base_dir) if base_dir is not None else "",
+                valid_paths=valid_paths,
+                rejected_paths=rejected_paths,
+            )
+
+        except (PathValidationError, SecurityServiceError):
+            # Re-raise security exceptions as-is
+            raise
+        except Exception as e:
+            # Catch unexpected errors and wrap them
+            raise SecurityServiceError(
+                message=f"Unexpected error during batch path validation: {e}",
+                details=f"Exception type: {type(e).__name__}, Base dir: {base_dir}",
+            ) from e
+
     def validate_directory_path(self, dir_path: str) -> PathValidationResult:
         """Validate a directory path for security concerns.
 
@@ -350,3 +419,63 @@ class SecurityValidatorService:
                 arguments=command[1:] if len(command) > 1 else [],
                 checks_performed=[],
             )
+
+    # ///////////////////////////////////////////////////////////////
+    # PRIVATE METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def _check_batch_path(
+        self,
+        file_path: str,
+        matcher: re.Pattern[str],
+        resolved_dirs: dict[str, str],
+    ) -> str:
+        """Check a single path for ``validate_file_paths``.
+
+        Args:
+            file_path: Path to check
+            matcher: Compiled path filter
+            resolved_dirs: Resolved directories of the batch, by directory;
+                filled as paths are checked
+
+        Returns:
+            str: Rejection reason, or an empty string if the path is valid
+        """
+        if not file_path:
+            return "File path cannot be empty"
+
+        match = matcher.search(file_path)
+        if match:
+            if match.lastgroup == "sensitive":
+                return "File path contains security-sensitive patterns"
+            return "File path contains dangerous patterns"
+
+        if has_excessive_traversal(file_path):
+            return f"Excessive directory traversal: {file_path.count('..')} levels"
+
+        if not os.path.isabs(file_path):
+            return ""
+
+        try:
+            directory, sep, name = file_path.rpartition(os.sep)
+            if (
+                not sep
+                or name in ("", ".", "..")
+                or (os.altsep and os.altsep in name)
+                or os.path.islink(file_path)
+            ):
+                resolved = os.path.realpath(file_path)
+            else:
+                resolved_dir = resolved_dirs.get(directory)
+                if resolved_dir is None:
+                    resolved_dir = os.path.realpath(directory + sep)
+                    if not resolved_dir.endswith(sep):
+                        resolved_dir += sep
+                    resolved_dirs[directory] = resolved_dir
+                resolved = resolved_dir + name
+        except (OSError, ValueError, RuntimeError):
+            return f"Invalid file path format: {file_path}"
+
+        if is_system_path(resolved):
+            return f"Access to system directory: {file_path}"
+        return ""
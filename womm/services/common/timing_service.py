@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# TIMING SERVICE - Tool Timing History Service
+# Project: works-on-my-machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Timing Service - Singleton service for the tool timing history.
+
+Records the wall time of tool runs per project (and of tool probes
+globally) and answers two questions from it: how long a run is expected
+to take, used to decide which tools to start first, and how long it may
+take before it is considered hung. Timing keys are built by the caller
+(for example ``"ruff:check"``) so this service stays tool-agnostic.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import atexit
+import logging
+import statistics
+from pathlib import Path
+from threading import Lock
+from typing import ClassVar
+
+# Local imports
+from ...shared.configs.cache_config import CacheConfig
+from ...shared.configs.command_config import CommandConfig
+from ...utils.common.timing_utils import compute_timeout, load_timings, save_timings
+
+# ///////////////////////////////////////////////////////////////
+# TIMING SERVICE CLASS
+# ///////////////////////////////////////////////////////////////
+
+
+class TimingService:
+    """Singleton service for per-project tool run durations.
+
+    A project root of None designates the global history, used for runs
+    that do not depend on a project such as version probes.
+    """
+
+    _instance: ClassVar[TimingService | None] = None
+    _initialized: ClassVar[bool] = False
+    _lock: ClassVar[Lock] = Lock()
+
+    def __new__(cls) -> TimingService:
+        """Create or return the singleton instance.
+
+        Returns:
+            TimingService: The singleton instance
+        """
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self) -> None:
+        """Initialize timing service (only once)."""
+        if TimingService._initialized:
+            return
+
+        self.logger = logging.getLogger(__name__)
+        self._timings: dict[Path | None, dict[str, list[float]]] = {}
+        self._dirty: set[Path | None] = set()
+        self._timings_lock = Lock()
+        atexit.register(self.flush_all)
+        TimingService._initialized = True
+
+    # ///////////////////////////////////////////////////////////////
+    # PUBLIC METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def record(self, project_root: Path | None, key: str, duration: float) -> None:
+        """Record the duration of a run, dropping the oldest ones.
+
+        Args:
+            project_root: Project the run belongs to, or None for global
+            key: Timing key
+            duration: Wall time in seconds
+        """
+        with self._timings_lock:
+            samples = self._get_samples(project_root).setdefault(key, [])
+            samples.append(round(duration, 3))
+            del samples[: -CacheConfig.TIMINGS_MAX_SAMPLES]
+            self._dirty.add(project_root)
+
+    def get_expected_duration(
+        self, project_root: Path | None, key: str
+    ) -> float | None:
+        """Return the median duration of previous runs.
+
+        Args:
+            project_root: Project the runs belong to, or None for global
+            key: Timing key
+
+        Returns:
+            float | None: Median duration in seconds, or None if no run was
+            recorded
+        """
+        with self._timings_lock:
+            samples = self._get_samples(project_root).get(key)
+            return statistics.median(samples) if samples else None
+
+    def get_timeout(
+        self,
+        project_root: Path | None,
+        key: str,
+        default: float,
+        minimum: float,
+        maximum: float,
+    ) -> float:
+        """Return a timeout derived from previous run durations.
+
+        Args:
+            project_root: Project the runs belong to, or None for global
+            key: Timing key
+            default: Timeout used until enough runs were recorded
+            minimum: Lower bound of derived timeouts
+            maximum: Upper bound of derived timeouts
+
+        Returns:
+            float: Timeout in seconds (see ``CommandConfig.TIMEOUT_PERCENTILE``)
+        """
+        with self._timings_lock:
+            samples = list(self._get_samples(project_root).get(key, []))
+        return compute_timeout(
+            samples,
+            default,
+            minimum,
+            maximum,
+            CommandConfig.TIMEOUT_PERCENTILE,
+            CommandConfig.TIMEOUT_MULTIPLIER,
+            CommandConfig.TIMING_MIN_SAMPLES,
+        )
+
+    def flush(self, project_root: Path | None) -> None:
+        """Write a timing history to disk if it changed.
+
+        Failures are logged and ignored: the history is only an optimization.
+
+        Args:
+            project_root: Project whose history to write, or None for global
+        """
+        with self._timings_lock:
+            if project_root not in self._dirty:
+                return
+            if not CacheConfig.is_cache_dir_writable():
+                return
+            try:
+                save_timings(
+                    CacheConfig.get_timings_path(project_root),
+                    CacheConfig.TIMINGS_VERSION,
+                    self._timings[project_root],
+                )
+                self._dirty.discard(project_root)
+            except OSError as e:
+                self.logger.debug(f"Could not save tool timings: {e}")
+
+    def flush_all(self) -> None:
+        """Write every changed timing history to disk."""
+        for project_root in list(self._dirty):
+            self.flush(project_root)
+
+    # ///////////////////////////////////////////////////////////////
+    # PRIVATE METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def _get_samples(self, project_root: Path | None) -> dict[str, list[float]]:
+        """Return a history, loading it from disk on first use.
+
+        Args:
+            project_root: Project whose history to return, or None for global
+
+        Returns:
+            dict[str, list[float]]: Durations per key, oldest first
+        """
+        samples = self._timings.get(project_root)
+        if samples is None:
+            samples = load_timings(
+                CacheConfig.get_timings_path(project_root),
+                CacheConfig.TIMINGS_VERSION,
+            )
+            self._timings[project_root] = samples
+        return samples
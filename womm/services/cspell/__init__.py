@@ -18,6 +18,7 @@ from __future__ import annotations
 # Local imports
 from .checker_service import CSpellCheckerService
 from .dictionary_service import CSpellDictionaryService
+from .spell_cache_service import SpellCacheService
 
 # ///////////////////////////////////////////////////////////////
 # PUBLIC API
@@ -26,4 +27,5 @@ from .dictionary_service import CSpellDictionaryService
 __all__ = [
     "CSpellCheckerService",
     "CSpellDictionaryService",
+    "SpellCacheService",
 ]
@@ -17,18 +17,60 @@ from __future__ import annotations
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
 # Standard library imports
+import json
 import logging
-import shutil
+import os
+import tempfile
 import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from threading import Lock
-from typing import ClassVar
+from threading import Event, Lock
+from typing import Any, ClassVar
 
 # Local imports
+from ...exceptions.common import CommandCancelledError, TimeoutError
 from ...exceptions.cspell import CheckServiceError, CSpellServiceError
-from ...shared.results import CSpellCheckResult, CSpellConfigResult
+from ...shared.configs.cache_config import CacheConfig
+from ...shared.configs.cspell_config import CSpellConfig
+from ...shared.results import CommandResult, CSpellCheckResult, CSpellConfigResult
+from ...utils.common.probe_cache_utils import (
+    get_binary_fingerprint,
+    get_path_fingerprint,
+)
+from ...utils.cspell.cspell_detection_utils import (
+    find_cspell_executable,
+    get_directory_states,
+    get_global_bin_dirs,
+    get_local_bin_dirs,
+    is_cspell_detection_valid,
+    load_cspell_detection,
+    save_cspell_detection,
+)
+from ...utils.cspell.native_spell_utils import (
+    build_spell_settings,
+    check_spell_files,
+    check_spell_files_in_worker,
+    collect_spell_files,
+    find_cspell_config,
+    get_report_name,
+    init_spell_worker,
+    load_cspell_config,
+    load_word_list,
+    merge_cspell_configs,
+)
+from ...utils.cspell.spell_cache_utils import (
+    get_dictionary_fingerprint,
+    get_dictionary_words,
+    get_settings_fingerprint,
+)
+from ...utils.lint.lint_cache_utils import hash_file_content
 from ...utils.womm_setup import get_womm_installation_path
 from ..common.command_runner_service import CommandRunnerService
+from ..common.file_scanner_service import FileScannerService
+from ..common.path_index_service import PathIndexService
+from .spell_cache_service import SpellCacheService
 
 # ///////////////////////////////////////////////////////////////
 # MODULE LOGGER
@@ -66,6 +108,11 @@ class CSpellCheckerService:
 
         self.logger = logging.getLogger(__name__)
         self._command_runner = CommandRunnerService()
+        self._file_scanner = FileScannerService()
+        self._path_index = PathIndexService()
+        self._spell_cache = SpellCacheService()
+        self._detection: dict[str, Any] | None = None
+        self._detection_lock = Lock()
         CSpellCheckerService._initialized = True
 
     # ///////////////////////////////////////////////////////////////
@@ -174,39 +221,52 @@ class CSpellCheckerService:
             ) from e
 
     @staticmethod
-    def _check_cspell_installed(command_runner: CommandRunnerService) -> bool:
-        """Check if CSpell is installed using multiple methods."""
-        import shutil
+    def _check_cspell_installed(command_runner: CommandRunnerService) -> bool | None:
+        """Check if CSpell is installed using multiple methods.
 
+        Returns None instead of False if a check timed out, since a slow
+        first ``npx`` run does not mean CSpell is missing.
+        """
         from ...shared.configs.dependencies.devtools_config import DevToolsConfig
 
         cspell_config = DevToolsConfig.TOOL_CONFIGS.get("cspell", {})
         check_commands = cspell_config.get("check_commands", [])
 
+        timed_out = False
         # Try each check command in order
         for cmd in check_commands:
             try:
                 # Handle both string and list formats
                 if isinstance(cmd, str):
                     # Direct command check via PATH
-                    if shutil.which(cmd):
+                    if PathIndexService().which(cmd):
                         return True
                 else:
-                    # Command list (e.g., ["npx", "cspell"])
-                    result = command_runner.run_silent([*cmd, "--version"])
+                    # Command list (e.g., ["npx", "cspell"]); its result
+                    # depends on the npx cache, not on the npx binary
+                    result = command_runner.run_probe([*cmd, "--version"], cache=False)
                     if bool(result) and result.stdout.strip():
                         return True
+            except TimeoutError as e:
+                logger.debug(f"Timed out checking CSpell via {cmd}: {e}")
+                timed_out = True
             except Exception as e:
                 logger.debug(f"Failed to check CSpell via {cmd}: {e}")
                 continue
 
         # Fallback: check via npm global list
         try:
-            result = command_runner.run_silent(["npm", "list", "-g", "cspell"])
-            return bool(result) and "cspell@" in result.stdout
+            result = command_runner.run_probe(
+                ["npm", "list", "-g", "cspell"], cache=False
+            )
+            if bool(result) and "cspell@" in result.stdout:
+                return True
+        except TimeoutError as e:
+            logger.debug(f"Timed out checking CSpell via npm: {e}")
+            timed_out = True
         except Exception as e:
             logger.debug(f"Failed to check CSpell via npm: {e}")
-            return False
+        return None if timed_out else False
 
     @staticmethod
     def _detect_project_type(project_path: Path) -> str | None:
@@ -225,62 +285,37 @@ class CSpellCheckerService:
         return None
 
     @staticmethod
-    def _parse_cspell_output(output: str) -> list[dict[str, str | int]]:
-        """Parse CSpell output to extract spell checking issues.
+    def _parse_cspell_record(line: str, cwd: str) -> dict[str, Any] | None:
+        """Parse one line of output of the WOMM CSpell reporter.
 
-        Expected format:
-        womm/bin/refresh_env.cmd:105:100 - Unknown word (HKLM)
-        womm/cli.py:129:72 - Unknown word (ezpl)
-        """
-        issues: list[dict[str, str | int]] = []
+        Expected format (see ``CSpellConfig.get_reporter_path``):
+        {"type": "issue", "file": "/abs/womm/cli.py", "line": 129,
+        "column": 72, "word": "ezpl", "suggestions": []}
 
-        if not output:
-            return issues
+        Args:
+            line: Output line
+            cwd: Directory reported file names are relative to
 
+        Returns:
+            dict[str, Any] | None: Issue, or None if the line is not an
+            issue record
+        """
+        if not line.startswith("{"):
+            return None
         try:
-            lines = output.strip().split("\n")
-            for line in lines:
-                if not line.strip():
-                    continue
-
-                # Parse line format: file:line:col - Unknown word (word)
-                if "- Unknown word" in line:
-                    # Split by first colon to get file path
-                    if ":" not in line:
-                        continue
-
-                    parts = line.split(":", 2)
-                    if len(parts) < 3:
-                        continue
-
-                    file_path = parts[0]
-
-                    try:
-                        line_num = int(parts[1])
-                        col_num_str = parts[2].split(" ")[0]
-                        col_num = int(col_num_str)
-                    except ValueError:
-                        line_num = 0
-                        col_num = 0
-
-                    # Extract word from parentheses
-                    word = ""
-                    if "(" in line and ")" in line:
-                        word = line.split("(")[1].split(")")[0]
-
-                    if word:  # Only add if we extracted a word
-                        issues.append(
-                            {
-                                "file": file_path,
-                                "line": line_num,
-                                "column": col_num,
-                                "word": word,
-                            }
-                        )
-        except Exception as e:
-            logging.warning(f"Failed to parse CSpell output: {e}")
-
-        return issues
+            record = json.loads(line)
+            if record.get("type") != "issue":
+                return None
+            return {
+                "file": get_report_name(str(record["file"]), cwd),
+                "line": int(record["line"]),
+                "column": int(record["column"]),
+                "word": str(record["word"]),
+                "suggestions": [str(word) for word in record.get("suggestions", [])],
+            }
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to parse CSpell record: {e}")
+            return None
 
     # ///////////////////////////////////////////////////////////////
     # PUBLIC METHODS
@@ -289,6 +324,8 @@ class CSpellCheckerService:
     def is_installed(self) -> bool:
         """Check if CSpell is installed.
 
+        The detection result is persisted; see ``_get_detection``.
+
         Returns:
             bool: True if CSpell is available, False otherwise
 
@@ -296,7 +333,29 @@ class CSpellCheckerService:
             CSpellError: If CSpell detection fails unexpectedly
         """
         try:
-            return self._check_cspell_installed(self._command_runner)
+            return bool(self._get_detection()["installed"])
+        except CheckServiceError:
+            raise
+        except Exception as e:
+            raise CheckServiceError(
+                message=f"Failed to check CSpell installation: {e}",
+                operation="detection",
+                reason=f"Failed to check CSpell installation: {e}",
+                details=f"Exception type: {type(e).__name__}",
+            ) from e
+
+    def get_executable(self) -> str | None:
+        """Return the CSpell executable found by the installation check.
+
+        Returns:
+            str | None: Path of the CSpell executable, or None if CSpell is
+            not installed or only reachable through npx
+
+        Raises:
+            CSpellError: If CSpell detection fails unexpectedly
+        """
+        try:
+            return self._get_detection().get("executable")
         except CheckServiceError:
             raise
         except Exception as e:
@@ -307,11 +366,74 @@ class CSpellCheckerService:
                 details=f"Exception type: {type(e).__name__}",
             ) from e
 
-    def run_spellcheck(self, path: Path) -> CSpellCheckResult:
+    def invalidate_detection(self) -> None:
+        """Forget the persisted installation check, e.g. after installing CSpell."""
+        with self._detection_lock:
+            self._detection = {}
+            self._save_detection()
+
+    def has_native_word_list(self, path: Path) -> bool:
+        """Check whether the built-in Python spell checker can check a path.
+
+        It needs a base word list: a system word list of one of the
+        configured languages, or a plain text ``dictionaryDefinitions`` entry.
+
+        Args:
+            path: Path to check
+
+        Returns:
+            bool: True if a base word list is available
+
+        Raises:
+            CheckServiceError: If a configuration file is invalid
+        """
+        config, _root = self._load_spell_config(path.resolve())
+        return bool(
+            self._get_system_word_lists(self._get_languages(config))
+            or self._get_defined_word_lists(config)
+        )
+
+    def run_spellcheck(
+        self,
+        path: Path,
+        on_issue: Callable[[dict[str, Any]], None] | None = None,
+        fail_fast: bool = False,
+        backend: str = CSpellConfig.DEFAULT_BACKEND,
+        use_cache: bool = True,
+        show_suggestions: bool = False,
+        keep_raw_output: bool = False,
+    ) -> CSpellCheckResult:
         """Run spell check and return detailed results.
 
+        For a directory, WOMM lists the files to check itself (git-aware,
+        pruned, limited to ``CSpellConfig.SPELL_CHECK_EXTENSIONS``) and
+        hands them to CSpell through ``--file-list``, split into shards
+        checked in parallel. CSpell reports issues as JSON lines (see
+        ``CSpellConfig.get_reporter_path``), parsed as they are printed
+        rather than buffered, so each issue can be reported while the check
+        runs. The raw output is only kept on request.
+
+        With ``use_cache``, files checked before with the same content,
+        settings and project words reuse their result (see
+        ``SpellCacheService``) and only the others are checked.
+
         Args:
             path: Path to check for spelling errors
+            on_issue: Called with each issue as soon as CSpell reports it
+                (from worker threads when several shards run; calls are
+                serialized)
+            fail_fast: Whether to stop CSpell (and the processes it started)
+                at the first unknown word
+            backend: Spell checker to run (see ``CSpellConfig.BACKENDS``);
+                "auto" runs CSpell if it is installed and the built-in
+                Python checker otherwise
+            use_cache: Whether to reuse and update the spell check result
+                cache
+            show_suggestions: Whether CSpell computes spelling suggestions
+                for each issue (slower; the Python backend has none)
+            keep_raw_output: Whether to keep the CSpell output in
+                ``raw_output`` (only that of the files actually checked when
+                results are cached)
 
         Returns:
             SpellCheckResult: Spell check results with issues and summary
@@ -330,83 +452,79 @@ class CSpellCheckerService:
                     details="Invalid path provided for spell checking",
                 )
 
-            if not self.is_installed():
-                return CSpellCheckResult(
-                    success=False,
-                    error="CSpell not installed - use: spellcheck --install",
-                    target_path=path,
-                    files_checked=0,
-                    issues_found=0,
-                    issues=[],
-                    raw_output="",
-                    raw_stderr="",
-                    check_time=time.time() - start_time,
+            if backend not in CSpellConfig.BACKENDS:
+                raise CSpellServiceError(
+                    message=f"Unknown spell check backend: {backend}",
+                    operation="run_spellcheck",
+                    details=f"Supported backends: {', '.join(CSpellConfig.BACKENDS)}",
+                )
+            if backend == CSpellConfig.BACKEND_AUTO:
+                backend = (
+                    CSpellConfig.BACKEND_CSPELL
+                    if self.is_installed()
+                    else CSpellConfig.BACKEND_PYTHON
+                )
+            executable = None
+            if backend == CSpellConfig.BACKEND_PYTHON:
+                config, root = self._load_spell_config(path.resolve())
+                settings = self._load_native_settings(config, root)
+                files = [
+                    str(file) for file in collect_spell_files(path.resolve(), settings)
+                ]
+                check = partial(self._run_native_checks, settings)
+                self.logger.debug(
+                    f"Checking {len(files)} files with the Python backend: {path}"
                 )
-
-            # Check if cspell is directly available in PATH
-            cspell_path = shutil.which("cspell")
-            cspell_direct_available = cspell_path is not None
-
-            # Choose appropriate command
-            if cspell_direct_available:
-                cmd = [str(cspell_path), "lint", str(path)]
             else:
-                cmd = ["npx", "cspell", "lint", str(path)]
-
-            cmd.extend(["--no-progress", "--no-summary"])
-            self.logger.debug(f"Checking: {path}")
-
-            # Execute command
-            try:
-                result = self._command_runner.run_silent(cmd)
-            except Exception as e:
-                raise CheckServiceError(
-                    message=f"Failed to execute CSpell command: {e}",
-                    operation="execution",
-                    reason=f"Failed to execute CSpell command: {e}",
-                    details=f"Command: {' '.join(cmd)}",
-                ) from e
+                if not self.is_installed():
+                    return CSpellCheckResult(
+                        success=False,
+                        error="CSpell not installed - use: spellcheck --install",
+                        target_path=path,
+                        files_checked=0,
+                        issues_found=0,
+                        issues=[],
+                        raw_output="",
+                        raw_stderr="",
+                        check_time=time.time() - start_time,
+                    )
+
+                files = self._list_spellcheck_files(path)
+
+                # Run the detected executable directly, npx only as a fallback
+                executable = self.get_executable()
+                if executable is not None:
+                    cmd = [executable, "lint"]
+                else:
+                    cmd = ["npx", "cspell", "lint"]
+
+                # Files listed but excluded by the CSpell configuration are
+                # not an error
+                cmd.extend(
+                    [
+                        "--no-progress",
+                        "--no-summary",
+                        "--no-must-find-files",
+                        "--reporter",
+                        str(CSpellConfig.get_reporter_path()),
+                    ]
+                )
+                if show_suggestions:
+                    cmd.append("--show-suggestions")
+                check = partial(
+                    self._run_cspell_shards, cmd, keep_raw_output=keep_raw_output
+                )
+                self.logger.debug(f"Checking {len(files)} files: {path}")
 
-            self.logger.debug(
-                f"CSpell command result: success={bool(result)}, "
-                f"returncode={result.returncode}"
+            cache_root = (
+                self._prepare_spell_cache(
+                    path.resolve(), backend, executable, show_suggestions
+                )
+                if use_cache
+                else None
             )
-            self.logger.debug(f"CSpell stdout: {result.stdout}")
-            self.logger.debug(f"CSpell stderr: {result.stderr}")
-
-            # Parse output
-            issues = self._parse_cspell_output(result.stdout) if result.stdout else []
-
-            # Build issues_by_file dict: file -> set of unknown words
-            issues_by_file: dict[str, set[str]] = {}
-            for issue in issues:
-                file_path = issue["file"]
-                word = issue.get("word", "")
-                if word:
-                    if file_path not in issues_by_file:
-                        issues_by_file[file_path] = set()
-                    issues_by_file[file_path].add(word)
-
-            # Count files and issues
-            files_checked = len({issue["file"] for issue in issues}) if issues else 0
-            issues_found = len(issues)
-
-            # CSpell returns code 1 when errors are found, which is normal
-            success = bool(result) or result.returncode == 1
-
-            check_time = time.time() - start_time
-
-            return CSpellCheckResult(
-                success=success,
-                message=f"Spell check completed: {issues_found} issues found in {files_checked} files",
-                target_path=path,
-                files_checked=files_checked,
-                issues_found=issues_found,
-                issues=issues,
-                issues_by_file=issues_by_file,
-                raw_output=result.stdout,
-                raw_stderr=result.stderr,
-                check_time=check_time,
+            return self._check_files(
+                path, files, check, on_issue, fail_fast, cache_root, start_time
             )
 
         except (CheckServiceError, CSpellServiceError):
@@ -485,3 +603,832 @@ class CSpellCheckerService:
                 operation="get_project_status",
                 details=f"Exception type: {type(e).__name__}",
             ) from e
+
+    # ///////////////////////////////////////////////////////////////
+    # PRIVATE METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def _get_detection(self) -> dict[str, Any]:
+        """Return the CSpell installation check, running it only if needed.
+
+        The result is persisted with the executable it resolved to and
+        reused until that executable or ``PATH`` changes. A negative result
+        is reused until a directory CSpell could be installed to changes.
+
+        Returns:
+            dict[str, Any]: Detection result (``installed`` and
+            ``executable`` keys)
+        """
+        with self._detection_lock:
+            path_fingerprint = get_path_fingerprint()
+            local_bin_dirs = get_local_bin_dirs(Path.cwd())
+            if self._detection is None:
+                self._detection = load_cspell_detection(
+                    CacheConfig.get_cspell_detection_path(),
+                    CacheConfig.CSPELL_DETECTION_VERSION,
+                )
+            if is_cspell_detection_valid(
+                self._detection, path_fingerprint, local_bin_dirs
+            ):
+                return self._detection
+
+            self._detection, conclusive = self._detect_cspell(
+                path_fingerprint, local_bin_dirs
+            )
+            # A check that timed out is retried by the next invocation
+            if conclusive:
+                self._save_detection()
+            return self._detection
+
+    def _detect_cspell(
+        self, path_fingerprint: str, local_bin_dirs: list[Path]
+    ) -> tuple[dict[str, Any], bool]:
+        """Find the CSpell executable and check that it runs.
+
+        The executable is looked up on PATH and in the npm directories npx
+        would use; the npx and npm based checks only run if none is found.
+
+        Args:
+            path_fingerprint: Current fingerprint of ``PATH``
+            local_bin_dirs: ``node_modules/.bin`` directories of the project
+
+        Returns:
+            tuple[dict[str, Any], bool]: Detection result to persist, and
+            whether it is conclusive (no check timed out)
+        """
+        global_bin_dirs = get_global_bin_dirs(
+            self._get_npm_setting(["npm", "prefix", "-g"]),
+            self._get_npm_setting(["npm", "config", "get", "cache"]),
+        )
+        executable = self._path_index.which("cspell") or find_cspell_executable(
+            [*local_bin_dirs, *global_bin_dirs]
+        )
+
+        installed = False
+        conclusive = True
+        if executable is not None:
+            try:
+                result = self._command_runner.run_probe([executable, "--version"])
+                installed = bool(result) and bool(result.stdout.strip())
+            except Exception as e:
+                self.logger.debug(f"Failed to run CSpell at {executable}: {e}")
+
+        if not installed:
+            found = self._check_cspell_installed(self._command_runner)
+            installed = bool(found)
+            conclusive = found is not None
+            # npx may have just installed CSpell into its cache
+            executable = find_cspell_executable(global_bin_dirs) if installed else None
+
+        self.logger.debug(
+            f"CSpell detection: installed={installed}, executable={executable}"
+        )
+        detection = {
+            "installed": installed,
+            "executable": executable,
+            "binary": get_binary_fingerprint(executable) if executable else None,
+            "path": path_fingerprint,
+            # Without an executable, watch where CSpell would be installed
+            "directories": (
+                [] if executable else get_directory_states(global_bin_dirs)
+            ),
+        }
+        return detection, conclusive
+
+    def _get_npm_setting(self, command: list[str]) -> str:
+        """Return the output of an npm setting query.
+
+        The query is not cached: its output follows the npm configuration
+        (``.npmrc``, prefix), not the npm binary.
+
+        Args:
+            command: npm command printing a single value
+
+        Returns:
+            str: Printed value, or an empty string if npm is not available
+        """
+        npm = self._path_index.which("npm")
+        if npm is None:
+            return ""
+        try:
+            result = self._command_runner.run_probe([npm, *command[1:]], cache=False)
+        except Exception as e:
+            self.logger.debug(f"Failed to run {' '.join(command)}: {e}")
+            return ""
+        return result.stdout.strip() if result else ""
+
+    def _save_detection(self) -> None:
+        """Persist the detection result (failures are logged and ignored)."""
+        if not CacheConfig.is_cache_dir_writable():
+            return
+        try:
+            save_cspell_detection(
+                CacheConfig.get_cspell_detection_path(),
+                CacheConfig.CSPELL_DETECTION_VERSION,
+                self._detection or {},
+            )
+        except OSError as e:
+            self.logger.debug(f"Could not save CSpell detection: {e}")
+
+    def _list_spellcheck_files(self, path: Path) -> list[str]:
+        """List the files CSpell checks for a path.
+
+        Args:
+            path: File or directory to check
+
+        Returns:
+            list[str]: The file itself, or the files of the directory with a
+            spell-checked extension (see ``CSpellConfig.SPELL_CHECK_EXTENSIONS``)
+
+        Raises:
+            CheckServiceError: If the directory cannot be scanned
+        """
+        if path.is_file():
+            return [str(path)]
+
+        scan = self._file_scanner.get_project_files(
+            path, CSpellConfig.SPELL_CHECK_EXTENSIONS, use_git=True
+        )
+        if not scan.success:
+            raise CheckServiceError(
+                message=f"Failed to list files to spell check: {scan.error}",
+                operation="file_discovery",
+                reason=f"Failed to list files to spell check: {scan.error}",
+                details=f"Path: {path}",
+            )
+        return [str(file_path) for file_path in scan.files_found or []]
+
+    def _run_cspell_shards(
+        self,
+        command: list[str],
+        files: list[str],
+        on_issue: Callable[[dict[str, Any]], None] | None,
+        fail_fast: bool,
+        keep_raw_output: bool = False,
+    ) -> tuple[list[dict[str, Any]], bool, str, str]:
+        """Check files with CSpell, in parallel shards of the file list.
+
+        Each shard is written to a temporary file passed with ``--file-list``,
+        so the command line does not grow with the number of files. A list
+        shorter than two ``CSpellConfig.MIN_FILES_PER_SHARD`` runs in a
+        single process.
+
+        Args:
+            command: CSpell command, without file arguments
+            files: Files to check
+            on_issue: Called with each issue as soon as CSpell reports it
+            fail_fast: Whether to stop every shard at the first unknown word
+            keep_raw_output: Whether to return the standard output of the
+                shards
+
+        Returns:
+            tuple[list[dict[str, Any]], bool, str, str]: Issues in shard
+            order, whether every shard completed (or was stopped by
+            ``fail_fast``), and the standard output (empty unless
+            ``keep_raw_output``) and standard error of the shards
+
+        Raises:
+            CheckServiceError: If a shard cannot be run
+        """
+        shard_count = max(
+            1,
+            min(os.cpu_count() or 1, len(files) // CSpellConfig.MIN_FILES_PER_SHARD),
+        )
+        shard_size = -(-len(files) // shard_count)
+        shards = [
+            files[index : index + shard_size]
+            for index in range(0, len(files), shard_size)
+        ]
+
+        cancel_event = Event()
+        report_lock = Lock()
+        reported: list[dict[str, Any]] = []
+
+        def report(issue: dict[str, Any]) -> None:
+            with report_lock:
+                if fail_fast and cancel_event.is_set():
+                    # Another shard already reported the first issue
+                    return
+                reported.append(issue)
+                if on_issue is not None:
+                    on_issue(issue)
+                if fail_fast:
+                    cancel_event.set()
+
+        run_shard = partial(
+            self._run_cspell_shard,
+            command,
+            report=report,
+            cancel_event=cancel_event,
+            keep_raw_output=keep_raw_output,
+        )
+        if len(shards) == 1:
+            outcomes = [run_shard(shards[0])]
+        else:
+            self.logger.debug(
+                f"Running CSpell on {len(files)} files in {len(shards)} shards"
+            )
+            with ThreadPoolExecutor(
+                max_workers=len(shards), thread_name_prefix="womm-cspell"
+            ) as executor:
+                futures = [executor.submit(run_shard, shard) for shard in shards]
+                try:
+                    outcomes = [future.result() for future in futures]
+                except BaseException:
+                    # Stop the other shards instead of waiting for them
+                    cancel_event.set()
+                    raise
+
+        issues = (
+            reported
+            if fail_fast
+            else [issue for shard_issues, _ in outcomes for issue in shard_issues]
+        )
+        results = [result for _, result in outcomes if result is not None]
+        raw_output = "".join(result.stdout for result in results)
+        raw_stderr = "".join(result.stderr for result in results)
+        self.logger.debug(
+            "CSpell shard results: "
+            + ", ".join(f"returncode={result.returncode}" for result in results)
+        )
+        self.logger.debug(f"CSpell stderr: {raw_stderr}")
+
+        # CSpell returns code 1 when errors are found, which is normal;
+        # with fail_fast it was killed after the first one
+        success = (fail_fast and bool(issues)) or (
+            len(results) == len(outcomes)
+            and all(bool(result) or result.returncode == 1 for result in results)
+        )
+        return issues, success, raw_output, raw_stderr
+
+    def _run_cspell_shard(
+        self,
+        command: list[str],
+        shard: list[str],
+        report: Callable[[dict[str, Any]], None],
+        cancel_event: Event,
+        keep_raw_output: bool = False,
+    ) -> tuple[list[dict[str, Any]], CommandResult | None]:
+        """Check one shard of files with CSpell.
+
+        Args:
+            command: CSpell command, without file arguments
+            shard: Files to check
+            report: Called with each issue as it is parsed
+            cancel_event: Event that stops the shard when set
+            keep_raw_output: Whether to keep the standard output in the result
+
+        Returns:
+            tuple[list[dict[str, Any]], CommandResult | None]: Issues of
+            the shard, and its result (None if it was cancelled)
+
+        Raises:
+            CheckServiceError: If CSpell cannot be run
+        """
+        fd, file_list = tempfile.mkstemp(prefix="womm-cspell-", suffix=".txt")
+        cmd = [*command, "--file-list", file_list]
+        issues: list[dict[str, Any]] = []
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write("\n".join(shard) + "\n")
+
+            # Execute command, parsing issues as they are printed
+            cwd = os.getcwd()
+            with self._command_runner.stream(cmd, cancel_event=cancel_event) as stream:
+                for line in stream:
+                    issue = self._parse_cspell_record(line, cwd)
+                    if issue is None:
+                        continue
+                    issues.append(issue)
+                    report(issue)
+                    if cancel_event.is_set():
+                        # Stopped at the first issue, or by a failed shard
+                        stream.terminate()
+                        break
+                return issues, stream.to_result(include_stdout=keep_raw_output)
+        except CommandCancelledError:
+            return issues, None
+        except Exception as e:
+            raise CheckServiceError(
+                message=f"Failed to execute CSpell command: {e}",
+                operation="execution",
+                reason=f"Failed to execute CSpell command: {e}",
+                details=f"Command: {' '.join(cmd)}",
+            ) from e
+        finally:
+            Path(file_list).unlink(missing_ok=True)
+
+    @staticmethod
+    def _build_spellcheck_result(
+        path: Path,
+        issues: list[dict[str, Any]],
+        success: bool,
+        stopped: bool,
+        raw_output: str,
+        raw_stderr: str,
+        start_time: float,
+    ) -> CSpellCheckResult:
+        """Build the result of a spell check from its issues.
+
+        Args:
+            path: Checked path
+            issues: Issues, in report order
+            success: Whether the check ran to completion (or was stopped)
+            stopped: Whether the check was stopped at the first issue
+            raw_output: Standard output of the checker, if kept
+            raw_stderr: Standard error of the checker
+            start_time: Time the check started
+
+        Returns:
+            CSpellCheckResult: Spell check results with issues and summary
+        """
+        # Build issues_by_file dict: file -> set of unknown words
+        issues_by_file: dict[str, set[str]] = {}
+        for issue in issues:
+            file_path = issue["file"]
+            word = issue.get("word", "")
+            if word:
+                if file_path not in issues_by_file:
+                    issues_by_file[file_path] = set()
+                issues_by_file[file_path].add(word)
+
+        # Count files and issues
+        files_checked = len({issue["file"] for issue in issues}) if issues else 0
+        issues_found = len(issues)
+
+        return CSpellCheckResult(
+            success=success,
+            message=(
+                f"Spell check stopped at the first issue: {issues[0]['file']}"
+                if stopped
+                else f"Spell check completed: {issues_found} issues found in {files_checked} files"
+            ),
+            target_path=path,
+            files_checked=files_checked,
+            issues_found=issues_found,
+            issues=issues,
+            issues_by_file=issues_by_file,
+            raw_output=raw_output,
+            raw_stderr=raw_stderr,
+            check_time=time.time() - start_time,
+        )
+
+    def _check_files(
+        self,
+        path: Path,
+        files: list[str],
+        check: Callable[..., tuple[list[dict[str, Any]], bool, str, str]],
+        on_issue: Callable[[dict[str, Any]], None] | None,
+        fail_fast: bool,
+        cache_root: Path | None,
+        start_time: float,
+    ) -> CSpellCheckResult:
+        """Check files, reusing the cached results of unchanged files.
+
+        Cached issues are reported first; only the other files are checked,
+        and their results cached unless the check was stopped or failed.
+
+        Args:
+            path: Checked path
+            files: Files to check
+            check: Backend check, called with the files to check,
+                ``on_issue`` and ``fail_fast``; returns the issues, whether
+                the check completed, and its standard output and error
+            on_issue: Called with each issue as soon as it is found
+            fail_fast: Whether to stop at the first unknown word
+            cache_root: Project whose result cache to use, or None to check
+                every file
+            start_time: Time the check started
+
+        Returns:
+            CSpellCheckResult: Spell check results with issues and summary
+        """
+        if cache_root is None:
+            issues, success, raw_output, raw_stderr = (
+                check(files, on_issue, fail_fast) if files else ([], True, "", "")
+            )
+            return self._build_spellcheck_result(
+                path,
+                issues,
+                success=success,
+                stopped=fail_fast and bool(issues),
+                raw_output=raw_output,
+                raw_stderr=raw_stderr,
+                start_time=start_time,
+            )
+
+        cwd = os.getcwd()
+        file_paths = [os.path.abspath(file) for file in files]
+        content_hashes: dict[str, str] = {}
+        for file_path in file_paths:
+            try:
+                content_hashes[file_path] = hash_file_content(file_path)
+            except OSError:
+                continue
+
+        cached_issues: dict[str, list[dict[str, Any]]] = {
+            file_path: [
+                {
+                    "file": get_report_name(file_path, cwd),
+                    "line": line,
+                    "column": column,
+                    "word": word,
+                    "suggestions": suggestions,
+                }
+                for line, column, word, suggestions in entries
+            ]
+            for file_path, entries in self._spell_cache.lookup(
+                cache_root, content_hashes
+            ).items()
+        }
+        misses = [
+            file
+            for file, file_path in zip(files, file_paths, strict=True)
+            if file_path not in cached_issues
+        ]
+        self.logger.debug(
+            f"Spell check: {len(cached_issues)} cached, {len(misses)} to check"
+        )
+
+        for file_path in file_paths:
+            for issue in cached_issues.get(file_path, []):
+                if on_issue is not None:
+                    on_issue(issue)
+                if fail_fast:
+                    self._spell_cache.flush(cache_root)
+                    return self._build_spellcheck_result(
+                        path,
+                        [issue],
+                        success=True,
+                        stopped=True,
+                        raw_output="",
+                        raw_stderr="",
+                        start_time=start_time,
+                    )
+
+        fresh, success, raw_output, raw_stderr = (
+            check(misses, on_issue, fail_fast) if misses else ([], True, "", "")
+        )
+        stopped = fail_fast and bool(fresh)
+
+        # Attribute fresh issues to the checked files
+        fresh_issues: dict[str, list[dict[str, Any]]] = {}
+        for issue in fresh:
+            file_path = os.path.normpath(os.path.join(cwd, str(issue["file"])))
+            fresh_issues.setdefault(file_path, []).append(issue)
+
+        if success and not stopped:
+            self._spell_cache.store(
+                cache_root,
+                {
+                    file_path: {
+                        "hash": content_hashes[file_path],
+                        "issues": [
+                            [
+                                issue["line"],
+                                issue["column"],
+                                issue["word"],
+                                issue["suggestions"],
+                            ]
+                            for issue in fresh_issues.get(file_path, [])
+                        ],
+                    }
+                    for file_path in map(os.path.abspath, misses)
+                    if file_path in content_hashes
+                },
+            )
+        self._spell_cache.flush(cache_root)
+
+        if stopped:
+            issues = fresh
+        else:
+            # Rebuild the report in file order from cached and fresh results
+            issues = []
+            for file_path in file_paths:
+                issues.extend(cached_issues.get(file_path) or [])
+                issues.extend(fresh_issues.pop(file_path, []))
+            for remaining in fresh_issues.values():
+                issues.extend(remaining)
+
+        return self._build_spellcheck_result(
+            path,
+            issues,
+            success=success,
+            stopped=stopped,
+            raw_output=raw_output,
+            raw_stderr=raw_stderr,
+            start_time=start_time,
+        )
+
+    def _prepare_spell_cache(
+        self,
+        target: Path,
+        backend: str,
+        executable: str | None,
+        show_suggestions: bool,
+    ) -> Path | None:
+        """Drop the cached results the current settings make stale.
+
+        Args:
+            target: Absolute path being checked
+            backend: Spell checker that runs (not "auto")
+            executable: CSpell executable, None for npx or the Python backend
+            show_suggestions: Whether CSpell computes spelling suggestions
+
+        Returns:
+            Path | None: Project whose result cache applies, or None if the
+            configuration cannot be read (the check then runs uncached)
+        """
+        try:
+            config, root = self._load_spell_config(target)
+        except CheckServiceError as e:
+            self.logger.debug(f"Not using the spell check cache: {e}")
+            return None
+
+        project_word_lists = self._get_project_word_lists(root)
+        base_word_lists = [
+            Path(definition["path"])
+            for definition in config.get("dictionaryDefinitions", [])
+            if isinstance(definition, dict)
+            and definition.get("path")
+            and Path(definition["path"]) not in project_word_lists
+        ]
+        if backend == CSpellConfig.BACKEND_PYTHON:
+            base_word_lists.extend(
+                self._get_system_word_lists(self._get_languages(config))
+            )
+        checker = {
+            "backend": backend,
+            "executable": (
+                get_binary_fingerprint(executable) if executable is not None else None
+            ),
+            "extensions": sorted(CSpellConfig.SPELL_CHECK_EXTENSIONS),
+            "suggestions": show_suggestions and backend == CSpellConfig.BACKEND_CSPELL,
+        }
+
+        case_sensitive = bool(config.get("caseSensitive", False))
+        self._spell_cache.prepare(
+            root,
+            get_settings_fingerprint(
+                config, checker, base_word_lists, CacheConfig.SPELL_CACHE_VERSION
+            ),
+            get_dictionary_fingerprint(config, project_word_lists),
+            lambda: get_dictionary_words(config, project_word_lists, case_sensitive),
+            case_sensitive,
+            bool(config.get("allowCompoundWords", False)),
+        )
+        return root
+
+    def _run_native_checks(
+        self,
+        settings: dict[str, Any],
+        files: list[str],
+        on_issue: Callable[[dict[str, Any]], None] | None,
+        fail_fast: bool,
+    ) -> tuple[list[dict[str, Any]], bool, str, str]:
+        """Check files with the built-in Python spell checker.
+
+        Files are spread over worker processes when they do not fit in one
+        ``CSpellConfig.FILES_PER_TASK`` batch.
+
+        Args:
+            settings: Settings from ``build_spell_settings``
+            files: Absolute paths of the files to check
+            on_issue: Called with each issue as soon as it is found
+            fail_fast: Whether to stop at the first unknown word
+
+        Returns:
+            tuple[list[dict[str, Any]], bool, str, str]: Issues in file
+            order, True (the check always completes), and empty standard
+            output and error
+
+        Raises:
+            CheckServiceError: If the check fails
+        """
+        try:
+            batches = [
+                files[index : index + CSpellConfig.FILES_PER_TASK]
+                for index in range(0, len(files), CSpellConfig.FILES_PER_TASK)
+            ]
+
+            issues: list[dict[str, Any]] = []
+            stopped = False
+            for batch_issues in self._iter_native_issues(batches, settings):
+                for issue in batch_issues:
+                    issues.append(issue)
+                    if on_issue is not None:
+                        on_issue(issue)
+                    if fail_fast:
+                        stopped = True
+                        break
+                if stopped:
+                    break
+        except Exception as e:
+            raise CheckServiceError(
+                message=f"Python spell check failed: {e}",
+                operation="execution",
+                reason=f"Python spell check failed: {e}",
+                details=f"Exception type: {type(e).__name__}",
+            ) from e
+
+        return issues, True, "", ""
+
+    @staticmethod
+    def _iter_native_issues(
+        batches: list[list[str]], settings: dict[str, Any]
+    ) -> Iterator[list[dict[str, Any]]]:
+        """Check file batches, yielding their issues in batch order.
+
+        A single batch is checked in the current process. Batches not yet
+        started are cancelled when the caller stops iterating.
+
+        Args:
+            batches: Absolute file paths, grouped per task
+            settings: Settings from ``build_spell_settings``
+
+        Yields:
+            list[dict[str, Any]]: Issues of each batch
+        """
+        cwd = os.getcwd()
+        if len(batches) <= 1:
+            yield check_spell_files(batches[0] if batches else [], settings, cwd)
+            return
+
+        pool = ProcessPoolExecutor(
+            max_workers=min(os.cpu_count() or 1, len(batches)),
+            initializer=init_spell_worker,
+            initargs=(settings,),
+        )
+        try:
+            futures = [
+                pool.submit(check_spell_files_in_worker, batch, cwd)
+                for batch in batches
+            ]
+            for future in futures:
+                yield future.result()
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _load_spell_config(self, target: Path) -> tuple[dict[str, Any], Path]:
+        """Load the CSpell configuration that applies to a path.
+
+        Merges the WOMM global CSpell configuration with the nearest project
+        ``cspell.json``.
+
+        Args:
+            target: Absolute path being checked
+
+        Returns:
+            tuple[dict[str, Any], Path]: Merged configuration, and the
+            directory ignore paths and word lists are relative to
+
+        Raises:
+            CheckServiceError: If a configuration file is invalid
+        """
+        config_paths = [CSpellConfig.get_global_config_path()]
+        project_config = find_cspell_config(
+            target, CSpellConfig.PROJECT_CONFIG_FILE_NAME
+        )
+        if project_config is not None:
+            config_paths.append(project_config)
+
+        configs = []
+        for config_path in config_paths:
+            if not config_path.is_file():
+                continue
+            try:
+                configs.append(load_cspell_config(config_path))
+            except (OSError, ValueError) as e:
+                raise CheckServiceError(
+                    message=f"Failed to read CSpell configuration: {e}",
+                    operation="config_parsing",
+                    reason=f"Failed to read CSpell configuration: {e}",
+                    details=f"Configuration file: {config_path}",
+                ) from e
+
+        root = (
+            project_config.parent
+            if project_config is not None
+            else target if target.is_dir() else target.parent
+        )
+        return merge_cspell_configs(configs), root
+
+    @staticmethod
+    def _get_languages(config: dict[str, Any]) -> list[str]:
+        """List the languages of a CSpell configuration.
+
+        Args:
+            config: Merged CSpell configuration
+
+        Returns:
+            list[str]: Lower-case language codes, without region ("en-US"
+            gives "en")
+        """
+        return [
+            language.strip().split("-")[0].split("_")[0].lower()
+            for language in str(
+                config.get("language", CSpellConfig.DEFAULT_LANGUAGE)
+            ).split(",")
+        ]
+
+    @staticmethod
+    def _get_system_word_lists(languages: list[str]) -> list[Path]:
+        """List the system word lists available for languages.
+
+        Args:
+            languages: Language codes (see ``_get_languages``)
+
+        Returns:
+            list[Path]: Existing word lists from
+            ``CSpellConfig.SYSTEM_WORD_LISTS``
+        """
+        return [
+            Path(word_list)
+            for language in languages
+            for word_list in CSpellConfig.SYSTEM_WORD_LISTS.get(language, ())
+            if Path(word_list).is_file()
+        ]
+
+    @staticmethod
+    def _get_defined_word_lists(config: dict[str, Any]) -> list[Path]:
+        """List the plain text word lists of ``dictionaryDefinitions``.
+
+        Args:
+            config: Configuration from ``_load_spell_config``
+
+        Returns:
+            list[Path]: Paths of the ``.txt`` dictionary definitions
+        """
+        return [
+            Path(definition["path"])
+            for definition in config.get("dictionaryDefinitions", [])
+            if isinstance(definition, dict)
+            and str(definition.get("path", "")).endswith(".txt")
+        ]
+
+    @staticmethod
+    def _get_project_word_lists(root: Path) -> list[Path]:
+        """List the word lists of a project.
+
+        Args:
+            root: Project directory
+
+        Returns:
+            list[Path]: ``.cspell-dict/*.txt`` files, sorted
+        """
+        return sorted((root / CSpellConfig.DICTIONARY_DIR_NAME).glob("*.txt"))
+
+    def _load_native_settings(
+        self, config: dict[str, Any], root: Path
+    ) -> dict[str, Any]:
+        """Load the settings of the built-in Python spell checker.
+
+        Known words come from the configuration, the project
+        ``.cspell-dict/*.txt`` word lists and plain text
+        ``dictionaryDefinitions``, and the system word lists of the
+        configured languages.
+
+        Args:
+            config: Configuration from ``_load_spell_config``
+            root: Directory from ``_load_spell_config``
+
+        Returns:
+            dict[str, Any]: Settings from ``build_spell_settings``
+
+        Raises:
+            CheckServiceError: If no base word list is available
+        """
+        languages = self._get_languages(config)
+        system_word_lists = self._get_system_word_lists(languages)
+        defined_word_lists = self._get_defined_word_lists(config)
+        if not system_word_lists and not defined_word_lists:
+            raise CheckServiceError(
+                message="No word list available for the Python spell checker",
+                operation="native_settings",
+                reason="No system word list found",
+                details=(
+                    f"Install a word list for {', '.join(languages)} "
+                    f"(such as {CSpellConfig.SYSTEM_WORD_LISTS['en'][0]}), "
+                    "add plain text dictionaryDefinitions to cspell.json or "
+                    "install CSpell"
+                ),
+            )
+
+        words = [
+            word
+            for word_list in (
+                *system_word_lists,
+                *defined_word_lists,
+                *self._get_project_word_lists(root),
+            )
+            for word in load_word_list(word_list)
+        ]
+        self.logger.debug(f"Python spell checker loaded {len(words)} words")
+        return build_spell_settings(
+            config,
+            root,
+            words,
+            CSpellConfig.DEFAULT_MIN_WORD_LENGTH,
+            CSpellConfig.DEFAULT_IGNORE_PATTERNS,
+            CSpellConfig.DEFAULT_IGNORE_PATHS,
+        )
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# SPELL CACHE SERVICE - Persistent Spell Check Result Cache Service
+# Project: works-on-my-machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Spell Cache Service - Singleton service for the persistent spell check cache.
+
+Stores the unknown words of each checked file on disk, one cache file per
+project, with size-bounded least-recently-used eviction. Results are reused
+while the file content, the spell check settings and the project words are
+unchanged; after project words are added, only the files reporting them are
+checked again (see ``get_invalidated_files``).
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import logging
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from threading import Lock
+from typing import Any, ClassVar
+
+# Local imports
+from ...shared.configs.cache_config import CacheConfig
+from ...utils.cspell.spell_cache_utils import (
+    get_invalidated_files,
+    load_spell_cache,
+    save_spell_cache,
+)
+
+# ///////////////////////////////////////////////////////////////
+# SPELL CACHE SERVICE CLASS
+# ///////////////////////////////////////////////////////////////
+
+
+class SpellCacheService:
+    """Singleton service for persistent per-file spell check results."""
+
+    _instance: ClassVar[SpellCacheService | None] = None
+    _initialized: ClassVar[bool] = False
+    _lock: ClassVar[Lock] = Lock()
+
+    def __new__(cls) -> SpellCacheService:
+        """Create or return the singleton instance.
+
+        Returns:
+            SpellCacheService: The singleton instance
+        """
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self) -> None:
+        """Initialize spell cache service (only once)."""
+        if SpellCacheService._initialized:
+            return
+
+        self.logger = logging.getLogger(__name__)
+        self._caches: dict[Path, dict[str, Any]] = {}
+        self._dirty: set[Path] = set()
+        self._cache_lock = Lock()
+        SpellCacheService._initialized = True
+
+    # ///////////////////////////////////////////////////////////////
+    # PUBLIC METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def prepare(
+        self,
+        project_root: Path,
+        settings_fingerprint: str,
+        dictionary_fingerprint: str,
+        load_dictionary_words: Callable[[], list[str]],
+        case_sensitive: bool,
+        allow_compound_words: bool,
+    ) -> None:
+        """Drop the results the current settings and project words make stale.
+
+        Args:
+            project_root: Project the results belong to
+            settings_fingerprint: Fingerprint from ``get_settings_fingerprint``
+            dictionary_fingerprint: Fingerprint from
+                ``get_dictionary_fingerprint``
+            load_dictionary_words: Returns the normalized project words; only
+                called when the dictionary fingerprint changed
+            case_sensitive: Whether words are compared with case
+            allow_compound_words: Whether compound words are accepted
+        """
+        with self._cache_lock:
+            cache = self._get_cache(project_root)
+            files: OrderedDict[str, Any] = cache["files"]
+
+            if cache["settings"] != settings_fingerprint:
+                if files:
+                    self.logger.debug(
+                        f"Spell check settings changed, dropping {len(files)} "
+                        "cached results"
+                    )
+                files.clear()
+                cache["settings"] = settings_fingerprint
+                self._dirty.add(project_root)
+
+            if cache["dictionary"] == dictionary_fingerprint:
+                return
+
+            words = load_dictionary_words()
+            stale = (
+                get_invalidated_files(
+                    files, cache["words"], words, case_sensitive, allow_compound_words
+                )
+                if files
+                else set()
+            )
+            if stale is None:
+                self.logger.debug(
+                    f"Project words removed, dropping {len(files)} cached results"
+                )
+                files.clear()
+            else:
+                for file_path in stale:
+                    files.pop(file_path, None)
+                if stale:
+                    self.logger.debug(
+                        f"Project words added, dropping {len(stale)} cached results"
+                    )
+            cache["dictionary"] = dictionary_fingerprint
+            cache["words"] = words
+            self._dirty.add(project_root)
+
+    def lookup(
+        self, project_root: Path, content_hashes: dict[str, str]
+    ) -> dict[str, list[list[Any]]]:
+        """Look up cached results and mark them as recently used.
+
+        Args:
+            project_root: Project the results belong to
+            content_hashes: Content hash of each file path
+
+        Returns:
+            dict[str, list[list[Any]]]: Cached
+            ``[line, column, word, suggestions]`` issues of each file path
+            whose content is unchanged
+        """
+        with self._cache_lock:
+            files = self._get_cache(project_root)["files"]
+            hits: dict[str, list[list[Any]]] = {}
+            for file_path, content_hash in content_hashes.items():
+                entry = files.get(file_path)
+                if entry is not None and entry.get("hash") == content_hash:
+                    files.move_to_end(file_path)
+                    hits[file_path] = entry.get("issues", [])
+            if hits:
+                self._dirty.add(project_root)
+            return hits
+
+    def store(self, project_root: Path, new_entries: dict[str, Any]) -> None:
+        """Add results to the cache, evicting the least recently used ones.
+
+        Args:
+            project_root: Project the results belong to
+            new_entries: ``{"hash": ..., "issues": [[line, column, word,
+                suggestions]]}`` entries keyed by file path
+        """
+        if not new_entries:
+            return
+
+        with self._cache_lock:
+            files = self._get_cache(project_root)["files"]
+            for file_path, entry in new_entries.items():
+                files[file_path] = entry
+                files.move_to_end(file_path)
+            while len(files) > CacheConfig.SPELL_CACHE_MAX_ENTRIES:
+                files.popitem(last=False)
+            self._dirty.add(project_root)
+
+    def flush(self, project_root: Path) -> None:
+        """Write a project's cache to disk if it changed.
+
+        Failures are logged and ignored: the cache is only an optimization.
+
+        Args:
+            project_root: Project whose cache to write
+        """
+        with self._cache_lock:
+            if project_root not in self._dirty:
+                return
+            if not CacheConfig.is_cache_dir_writable():
+                return
+            try:
+                save_spell_cache(
+                    CacheConfig.get_spell_cache_path(project_root),
+                    CacheConfig.SPELL_CACHE_VERSION,
+                    self._caches[project_root],
+                )
+                self._dirty.discard(project_root)
+            except OSError as e:
+                self.logger.debug(f"Could not save spell cache: {e}")
+
+    # ///////////////////////////////////////////////////////////////
+    # PRIVATE METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def _get_cache(self, project_root: Path) -> dict[str, Any]:
+        """Return a project's cache, loading it from disk on first use.
+
+        Args:
+            project_root: Project whose cache to return
+
+        Returns:
+            dict[str, Any]: Cache as returned by ``load_spell_cache``
+        """
+        cache = self._caches.get(project_root)
+        if cache is None:
+            cache = load_spell_cache(
+                CacheConfig.get_spell_cache_path(project_root),
+                CacheConfig.SPELL_CACHE_VERSION,
+            )
+            self._caches[project_root] = cache
+        return cache
@@ -18,7 +18,6 @@ from __future__ import annotations
 # ///////////////////////////////////////////////////////////////
 # Standard library imports
 import logging
-import shutil
 from threading import Lock
 from typing import ClassVar
 
@@ -29,6 +28,8 @@ from ...shared.configs.dependencies import DevToolsConfig
 from ...shared.configs.dependencies.dependencies_hierarchy import DependenciesHierarchy
 from ...shared.results import DevToolAvailabilityResult
 from ..common.command_runner_service import CommandRunnerService
+from ..common.path_index_service import PathIndexService
+from ..common.probe_cache_service import ProbeCacheService
 
 # ///////////////////////////////////////////////////////////////
 # LOGGER SETUP
@@ -61,8 +62,9 @@ class DevToolsService:
             return
 
         try:
-            self.cache: dict[str, bool] = {}
+            self.cache: dict[str, tuple[bool, str | None]] = {}
             self._command_runner = CommandRunnerService()
+            self._path_index = PathIndexService()
             DevToolsService._initialized = True
 
         except Exception as e:
@@ -105,7 +107,7 @@ class DevToolsService:
             # Check cache first
             cache_key = f"tool:{tool}"
             if cache_key in self.cache:
-                is_available = self.cache[cache_key]
+                is_available, path = self.cache[cache_key]
                 language = self._find_language_for_tool(tool)
                 return DevToolAvailabilityResult(
                     success=True,
@@ -113,10 +115,12 @@ class DevToolsService:
                     tool_name=tool,
                     is_available=is_available,
                     language=language,
+                    path=path,
                 )
 
             # Check if tool is available
-            available = shutil.which(tool) is not None
+            path = self._path_index.which(tool)
+            available = path is not None
 
             # For special tools, check via alternative methods
             if not available and tool in DevToolsConfig.TOOL_CONFIGS:
@@ -125,7 +129,7 @@ class DevToolsService:
                 if check_method == "npx":
                     # Check via npx
                     try:
-                        result = self._command_runner.run_silent(
+                        result = self._command_runner.run_probe(
                             ["npx", tool, "--version"]
                         )
                         available = result.success
@@ -133,7 +137,7 @@ class DevToolsService:
                         logger.debug(f"Failed to check tool {tool} via npx: {e}")
                         available = False
 
-            self.cache[cache_key] = available
+            self.cache[cache_key] = (available, path)
 
             # Find language
             language = self._find_language_for_tool(tool)
@@ -144,6 +148,7 @@ class DevToolsService:
                 tool_name=tool,
                 is_available=available,
                 language=language,
+                path=path,
             )
 
         except ValidationServiceError:
@@ -313,9 +318,10 @@ class DevToolsService:
 
             logger.info(f"Successfully installed {tool}")
 
-            # Invalidate cache
-            if tool in self.cache:
-                del self.cache[tool]
+            # Invalidate caches
+            self.cache.pop(f"tool:{tool}", None)
+            ProbeCacheService().invalidate()
+            self._path_index.invalidate()
 
             # Check again after installation
             return self.check_tool_availability(tool)
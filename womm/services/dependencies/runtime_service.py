@@ -19,7 +19,6 @@ from __future__ import annotations
 # Standard library imports
 import logging
 import platform
-import shutil
 from threading import Lock
 from typing import ClassVar
 
@@ -30,6 +29,8 @@ from ...shared.configs.dependencies import RuntimeConfig
 from ...shared.configs.dependencies.dependencies_hierarchy import DependenciesHierarchy
 from ...shared.results import RuntimeInstallationResult
 from ..common.command_runner_service import CommandRunnerService
+from ..common.path_index_service import PathIndexService
+from ..common.probe_cache_service import ProbeCacheService
 
 # ///////////////////////////////////////////////////////////////
 # LOGGER SETUP
@@ -65,6 +66,7 @@ class RuntimeService:
             self.system = platform.system()
             self.cache: dict[str, tuple[bool, str | None]] = {}
             self._command_runner = CommandRunnerService()
+            self._path_index = PathIndexService()
             RuntimeService._initialized = True
 
         except Exception as e:
@@ -160,8 +162,8 @@ class RuntimeService:
         try:
             # Try python3 first, then python
             for cmd in ["python3", "python"]:
-                if shutil.which(cmd):
-                    result = self._command_runner.run_silent([cmd, "--version"])
+                if self._path_index.which(cmd):
+                    result = self._command_runner.run_probe([cmd, "--version"])
                     if result.returncode == 0 and result.stdout:
                         version = result.stdout.strip().split()[1]
                         return True, version
@@ -173,8 +175,8 @@ class RuntimeService:
     def _check_node(self) -> tuple[bool, str | None]:
         """Check if Node.js is installed."""
         try:
-            if shutil.which("node"):
-                result = self._command_runner.run_silent(["node", "--version"])
+            if self._path_index.which("node"):
+                result = self._command_runner.run_probe(["node", "--version"])
                 if result.returncode == 0 and result.stdout:
                     version = result.stdout.strip().lstrip("v")
                     return True, version
@@ -186,8 +188,8 @@ class RuntimeService:
     def _check_git(self) -> tuple[bool, str | None]:
         """Check if Git is installed."""
         try:
-            if shutil.which("git"):
-                result = self._command_runner.run_silent(["git", "--version"])
+            if self._path_index.which("git"):
+                result = self._command_runner.run_probe(["git", "--version"])
                 if result.returncode == 0 and result.stdout:
                     version = result.stdout.strip().split()[2]
                     return True, version
@@ -340,9 +342,10 @@ class RuntimeService:
 
             logger.info(f"Successfully installed {runtime} via {best_manager}")
 
-            # Invalidate cache
-            if runtime in self.cache:
-                del self.cache[runtime]
+            # Invalidate caches
+            self.cache.pop(runtime, None)
+            ProbeCacheService().invalidate()
+            self._path_index.invalidate()
 
             # Check again after installation
             return self.check_runtime_installation(runtime)
@@ -403,7 +406,7 @@ class RuntimeService:
                 return False
 
             # Check if the package manager itself is available
-            if not shutil.which(rpm_name):
+            if not self._path_index.which(rpm_name):
                 logger.warning(f"Runtime package manager {rpm_name} not found in PATH")
                 return False
 
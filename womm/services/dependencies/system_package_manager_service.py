@@ -31,6 +31,7 @@ from ...shared.results import (
     PackageManagerPlatformResult,
 )
 from ..common.command_runner_service import CommandRunnerService
+from ..common.probe_cache_service import ProbeCacheService
 
 # ///////////////////////////////////////////////////////////////
 # LOGGER SETUP
@@ -168,16 +169,33 @@ class SystemPackageManagerService:
                 # Use subprocess directly with shell=True for Windows scripts (.ps1)
                 import subprocess
 
-                # nosec B602: shell=True is safe here - command and version_flag
-                # are from internal config, not user input
-                result = subprocess.run(  # noqa: S602
-                    f"{command} {version_flag}",
-                    capture_output=True,
-                    text=True,
-                    shell=True,  # nosec B602
-                    timeout=10,
-                    check=False,  # We handle errors ourselves
-                )
+                probe_command = [str(command), str(version_flag)]
+                probe_cache = ProbeCacheService()
+                cached = probe_cache.lookup(probe_command)
+                if cached is not None:
+                    result = subprocess.CompletedProcess(
+                        probe_command,
+                        cached["returncode"],
+                        cached["stdout"],
+                        cached["stderr"],
+                    )
+                else:
+                    # nosec B602: shell=True is safe here - command and
+                    # version_flag are from internal config, not user input
+                    result = subprocess.run(  # noqa: S602
+                        f"{command} {version_flag}",
+                        capture_output=True,
+                        text=True,
+                        shell=True,  # nosec B602
+                        timeout=10,
+                        check=False,  # We handle errors ourselves
+                    )
+                    probe_cache.store(
+                        probe_command,
+                        result.returncode,
+                        result.stdout,
+                        result.stderr,
+                    )
 
                 # Check if command succeeded (returncode == 0)
                 if result.returncode == 0 and result.stdout:
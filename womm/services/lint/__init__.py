@@ -17,6 +17,7 @@ from __future__ import annotations
 # ///////////////////////////////////////////////////////////////
 # Local imports
 from .core_service import LintService
+from .lint_cache_service import LintCacheService
 from .python_lint_service import PythonLintService
 
 # ///////////////////////////////////////////////////////////////
@@ -24,6 +25,7 @@ from .python_lint_service import PythonLintService
 # ///////////////////////////////////////////////////////////////
 
 __all__ = [
+    "LintCacheService",
     "LintService",
     "PythonLintService",
 ]
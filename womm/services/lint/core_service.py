@@ -17,24 +17,54 @@ from __future__ import annotations
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
 # Standard library imports
+import atexit
 import json
 import logging
+import os
 import re
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 from pathlib import Path
-from threading import Lock
-from typing import ClassVar
+from threading import Event, Lock
+from typing import Any, ClassVar
 
 # Local imports
-from ...exceptions.common import TimeoutError, ValidationServiceError
+from ...exceptions.common import (
+    CommandCancelledError,
+    TimeoutError,
+    ValidationServiceError,
+)
 from ...exceptions.lint import (
     LintServiceError,
     ToolAvailabilityServiceError,
     ToolExecutionServiceError,
 )
-from ...shared.result_models import ToolResult
-from ...utils.lint import get_tool_version as get_tool_version_util
-from ...utils.lint import parse_lint_output, validate_lint_result
+from ...shared.configs.command_config import CommandConfig
+from ...shared.configs.lint import PythonLintingConfig
+from ...shared.result_models import CommandResult, ToolResult
+from ...utils.lint import (
+    FIX_PIPELINE_TOOLS,
+    check_files,
+    format_files,
+    format_issues,
+    get_argument_budget,
+    get_tool_version,
+    is_in_process_available,
+    is_syntax_error,
+    merge_json_outputs,
+    order_shards_by_cost,
+    parse_json_line,
+    parse_lint_output,
+    run_tool_in_process,
+    shard_targets,
+    validate_lint_result,
+)
 from ..common.command_runner_service import CommandRunnerService
+from ..common.timing_service import TimingService
 
 # ///////////////////////////////////////////////////////////////
 # LOGGER SETUP
@@ -72,6 +102,10 @@ class LintService:
 
         self.logger = logging.getLogger(__name__)
         self.command_runner = CommandRunnerService()
+        self.timing_service = TimingService()
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._shard_executor: ThreadPoolExecutor | None = None
+        self._pool_lock = Lock()
         LintService._initialized = True
 
     # ///////////////////////////////////////////////////////////////
@@ -127,7 +161,7 @@ class LintService:
                 )
 
             # Now get the version using the utility function
-            return get_tool_version_util(tool_name, self.command_runner)
+            return get_tool_version(tool_name, self.command_runner)
 
         except ToolAvailabilityServiceError:
             raise
@@ -147,15 +181,48 @@ class LintService:
         target_dirs: list[str],
         cwd: Path,
         json_output: bool = False,
+        max_files_per_shard: int | None = None,
+        in_process: bool = False,
+        on_issue: Callable[[Any], None] | None = None,
+        cancel_event: Event | None = None,
+        fail_fast: bool = False,
+        timing_root: Path | None = None,
     ) -> ToolResult:
         """Run a linting tool in check mode.
 
+        Targets are split into shards that fit the OS argument limit (and
+        ``max_files_per_shard``); shards run in parallel and their outputs
+        are merged into a single result.
+
+        With ``on_issue`` and ``json_output``, ``args`` must make the tool
+        print a JSON-lines report: each record is parsed and passed to
+        ``on_issue`` as soon as it is printed, and the raw output is not
+        kept in memory. The result data is the list of records.
+
+        With ``cancel_event``, setting the event kills the tool's running
+        processes and their children. With ``fail_fast`` as well, the first
+        failing shard sets it; the result then only covers the shards that
+        completed, which is still a failing result.
+
+        With ``timing_root``, each invocation's duration is recorded for that
+        project and its timeout is derived from previous durations (see
+        ``CommandConfig.TOOL_TIMEOUT``); otherwise the default tool timeout
+        applies.
+
         Args:
             tool_name: Name of the tool (ruff, black, isort, etc.)
             args: Additional arguments for the tool
             target_dirs: List of directories/files to process
             cwd: Working directory
             json_output: Whether to parse JSON output
+            max_files_per_shard: Maximum targets per invocation (None = no limit)
+            in_process: Whether to run the tool in a worker process of the
+                in-process backend when it supports the tool
+            on_issue: Called with each report record as it is parsed, possibly
+                from several threads at once (streamed runs only)
+            cancel_event: Event that cancels the tool's processes when set
+            fail_fast: Whether a failing shard sets ``cancel_event``
+            timing_root: Project the tool's run durations are recorded for
 
         Returns:
             ToolResult: Result of the tool execution
@@ -164,6 +231,8 @@ class LintService:
             LintServiceError: If input validation fails
             ToolExecutionError: If tool execution fails or times out
             LintValidationError: If JSON parsing fails
+            CommandCancelledError: If the check was cancelled before any
+                shard failed
         """
         try:
             # Input validation
@@ -196,66 +265,78 @@ class LintService:
 
             full_command = [tool_name, *args, *relative_targets]
 
+            # Records of a streamed run, collected as they are parsed
+            streamed: list[Any] | None = None
+            on_record: Callable[[Any], None] | None = None
+            if on_issue is not None and json_output:
+                records: list[Any] = []
+                report_issue = on_issue
+
+                def collect_record(record: Any) -> None:
+                    records.append(record)
+                    report_issue(record)
+
+                streamed = records
+                on_record = collect_record
+
             try:
-                result = self.command_runner.run_silent(
-                    full_command,
-                    cwd=cwd_path,
+                results = self._run_sharded(
+                    [tool_name, *args],
+                    relative_targets,
+                    cwd_path,
+                    max_files_per_shard,
+                    in_process,
+                    on_record,
+                    cancel_event,
+                    fail_fast,
+                    timing_root,
+                    f"{tool_name}:check",
                 )
 
-                # Parse output
-                text = result.stdout or result.stderr or ""
+                # Parse output; streamed runs do not keep it, so their
+                # message is rebuilt from the records
+                text = (
+                    format_issues(streamed, str(cwd))
+                    if streamed is not None
+                    else "\n".join(
+                        output
+                        for output in (r.stdout or r.stderr or "" for r in results)
+                        if output
+                    )
+                )
                 issues = 0
                 parsed_data = None
 
-                # Try to parse JSON if requested and available
-                if json_output and result.stdout:
-                    try:
-                        # Filter out log lines that are not JSON (common with bandit)
-                        stdout_lines = result.stdout.strip().split("\n")
-                        json_lines = []
-                        json_started = False
-
-                        for line in stdout_lines:
-                            stripped_line = line.strip()
-                            if stripped_line.startswith(("{", "[")):
-                                json_started = True
-                            if json_started:
-                                json_lines.append(stripped_line)
-
-                        if json_lines:
-                            json_content = "\n".join(json_lines)
-                            parsed_data = json.loads(json_content)
-                            if isinstance(parsed_data, list):
-                                issues = len(parsed_data)
-                            elif isinstance(parsed_data, dict):
-                                issues = len(parsed_data.get("results", []))
-                        else:
-                            # No valid JSON found, treat as no issues
-                            parsed_data = {"results": []}
-                            issues = 0
-
-                    except json.JSONDecodeError as e:
-                        raise ValidationServiceError(
-                            message=f"Failed to parse {tool_name} JSON output: {e}",
-                            validation_type="json_parsing",
-                            file_path=str(cwd),
-                            reason=f"Failed to parse {tool_name} JSON output: {e}",
-                            details=f"Raw output: {result.stdout[:200]}...",
-                        ) from e
-                elif json_output and not result.stdout:
-                    # No output means no issues found (common with bandit)
-                    parsed_data = {"results": []}
-                    issues = 0
+                # Parse JSON if requested, shard by shard, then merge
+                if streamed is not None:
+                    parsed_data = streamed
+                    issues = len(streamed)
+                elif json_output:
+                    parsed_data = merge_json_outputs(
+                        [
+                            self._parse_json_output(tool_name, result.stdout, cwd)
+                            for result in results
+                        ],
+                        tool_name in PythonLintingConfig.JSON_REPORT_OBJECT_TOOLS,
+                    )
+                    if isinstance(parsed_data, list):
+                        issues = len(parsed_data)
+                    elif isinstance(parsed_data, dict):
+                        issues = len(parsed_data.get("results", []))
 
                 # Count issues from text output if no JSON
-                if not json_output and result.returncode != 0 and text:
+                if not json_output:
                     # Simple heuristic: count lines with ":" which usually indicate issues
                     issues = sum(
-                        1 for line in text.splitlines() if ":" in line and line.strip()
+                        1
+                        for result in results
+                        if result.returncode != 0
+                        for line in (result.stdout or result.stderr or "").splitlines()
+                        if ":" in line and line.strip()
                     )
 
                 return ToolResult(
-                    success=bool(result),
+                    success=all(results),
                     tool_name=tool_name,
                     message=text or f"{tool_name} check completed",
                     files_checked=len(target_dirs),
@@ -263,12 +344,14 @@ class LintService:
                     data=parsed_data,
                 )
 
+            except CommandCancelledError:
+                raise
             except TimeoutError as e:
                 raise ToolExecutionServiceError(
-                    message="Tool execution timed out after 5 minutes",
+                    message=f"Tool execution timed out after {e.timeout_seconds:g}s",
                     tool_name=tool_name,
                     operation="check",
-                    reason="Tool execution timed out after 5 minutes",
+                    reason=f"Tool execution timed out after {e.timeout_seconds:g}s",
                     details=f"Command: {' '.join(full_command)}",
                 ) from e
             except Exception as e:
@@ -284,6 +367,7 @@ class LintService:
             LintServiceError,
             ToolExecutionServiceError,
             ValidationServiceError,
+            CommandCancelledError,
         ):
             # Re-raise specialized exceptions as-is
             raise
@@ -301,14 +385,25 @@ class LintService:
         args: list[str],
         target_dirs: list[str],
         cwd: Path,
+        max_files_per_shard: int | None = None,
+        in_process: bool = False,
+        timing_root: Path | None = None,
     ) -> ToolResult:
         """Run a linting tool in fix mode.
 
+        Targets are sharded as in ``run_tool_check``; shards touch disjoint
+        files so they can safely run in parallel. Timeouts are derived as in
+        ``run_tool_check``.
+
         Args:
             tool_name: Name of the tool (ruff, black, isort, etc.)
             args: Additional arguments for the tool (should include --fix or equivalent)
             target_dirs: List of directories/files to process
             cwd: Working directory
+            max_files_per_shard: Maximum targets per invocation (None = no limit)
+            in_process: Whether to run the tool in a worker process of the
+                in-process backend when it supports the tool
+            timing_root: Project the tool's run durations are recorded for
 
         Returns:
             ToolResult: Result of the tool execution
@@ -349,29 +444,28 @@ class LintService:
             full_command = [tool_name, *args, *relative_targets]
 
             try:
-                result = self.command_runner.run_silent(
-                    full_command,
-                    cwd=cwd_path,
+                results = self._run_sharded(
+                    [tool_name, *args],
+                    relative_targets,
+                    cwd_path,
+                    max_files_per_shard,
+                    in_process,
+                    timing_root=timing_root,
+                    timing_key=f"{tool_name}:fix",
                 )
 
-                text = result.stdout or result.stderr or ""
+                outputs = [result.stdout or result.stderr or "" for result in results]
+                text = "\n".join(output for output in outputs if output)
 
                 # For fix operations, we assume all found issues were fixed if successful
-                fixed_issues = 0
-                if bool(result) and text:
-                    # Try to extract number of fixed issues from output
-                    # This is tool-specific and might need refinement
-                    lines = text.splitlines()
-                    for line in lines:
-                        if "fixed" in line.lower() or "formatted" in line.lower():
-                            # Try to extract numbers from the line
-                            numbers = re.findall(r"\d+", line)
-                            if numbers:
-                                fixed_issues = int(numbers[0])
-                                break
+                fixed_issues = sum(
+                    self._count_fixed_issues(output)
+                    for result, output in zip(results, outputs, strict=True)
+                    if bool(result) and output
+                )
 
                 return ToolResult(
-                    success=bool(result),
+                    success=all(results),
                     tool_name=tool_name,
                     message=text or f"{tool_name} fix completed",
                     files_checked=len(target_dirs),
@@ -380,10 +474,10 @@ class LintService:
 
             except TimeoutError as e:
                 raise ToolExecutionServiceError(
-                    message="Tool execution timed out after 5 minutes",
+                    message=f"Tool execution timed out after {e.timeout_seconds:g}s",
                     tool_name=tool_name,
                     operation="fix",
-                    reason="Tool execution timed out after 5 minutes",
+                    reason=f"Tool execution timed out after {e.timeout_seconds:g}s",
                     details=f"Command: {' '.join(full_command)}",
                 ) from e
             except Exception as e:
@@ -406,6 +500,188 @@ class LintService:
                 details=f"Exception type: {type(e).__name__}, Tool: {tool_name}",
             ) from e
 
+    def run_fix_pipeline(
+        self,
+        tool_names: list[str],
+        target_files: list[str],
+        cwd: Path,
+        batch_size: int,
+        timing_root: Path | None = None,
+    ) -> dict[str, ToolResult]:
+        """Fix files with several formatters in a single read/write pass.
+
+        Each file is read once, passed through the tools in order in memory
+        and written back atomically only if it changed. Batches of files are
+        formatted in parallel on the in-process backend worker pool, within
+        the deadline of ``_wait_for_batches``.
+
+        Args:
+            tool_names: Pipeline tools to apply (see ``FIX_PIPELINE_TOOLS``)
+            target_files: Files to fix
+            cwd: Working directory tool configuration is read from
+            batch_size: Number of files per worker task
+            timing_root: Project batch durations are recorded for and
+                timeouts derived from (None = default tool timeout)
+
+        Returns:
+            dict[str, ToolResult]: Tool name -> result mapping, in pipeline order
+
+        Raises:
+            LintServiceError: If input validation fails
+            ToolExecutionServiceError: If the pipeline fails or times out
+        """
+        if not tool_names or not target_files:
+            raise LintServiceError(
+                message="Tools and target files cannot be empty",
+                operation="run_fix_pipeline",
+                details=f"Tools: {tool_names}, Files: {len(target_files)}",
+            )
+
+        pipeline_tools = [t for t in FIX_PIPELINE_TOOLS if t in tool_names]
+        cwd_path = Path(cwd)
+        files = [str(cwd_path / target) for target in target_files]
+        batches = [
+            files[index : index + batch_size]
+            for index in range(0, len(files), batch_size)
+        ]
+
+        try:
+            pool = self._get_process_pool()
+            futures = [
+                pool.submit(format_files, batch, str(cwd_path), pipeline_tools)
+                for batch in batches
+            ]
+            outcomes = [
+                outcome
+                for batch_outcomes in self._wait_for_batches(
+                    futures, timing_root, f"{'+'.join(pipeline_tools)}:pipeline"
+                )
+                for outcome in batch_outcomes
+            ]
+        except TimeoutError as e:
+            raise ToolExecutionServiceError(
+                message="Fix pipeline timed out",
+                tool_name=",".join(pipeline_tools),
+                operation="fix",
+                reason=f"Fix pipeline timed out after {e.timeout_seconds:g}s",
+                details=f"Files: {len(files)}, Batch size: {batch_size}",
+            ) from e
+        except Exception as e:
+            raise ToolExecutionServiceError(
+                message=f"Fix pipeline failed: {e}",
+                tool_name=",".join(pipeline_tools),
+                operation="fix",
+                reason=f"Fix pipeline failed: {e}",
+                details=f"Exception type: {type(e).__name__}",
+            ) from e
+
+        results: dict[str, ToolResult] = {}
+        for tool_name in pipeline_tools:
+            changed = [
+                os.path.relpath(path, cwd_path)
+                for path, changed_by, _ in outcomes
+                if tool_name in changed_by
+            ]
+            errors = [
+                f"error: cannot format {os.path.relpath(path, cwd_path)}: "
+                f"{file_errors[tool_name]}"
+                for path, _, file_errors in outcomes
+                if tool_name in file_errors
+            ]
+            lines = [*errors, *(f"fixed {path}" for path in changed)]
+            results[tool_name] = ToolResult(
+                success=not errors,
+                tool_name=tool_name,
+                message="\n".join(lines) or f"{tool_name} fix completed",
+                files_checked=len(target_files),
+                fixed_issues=len(changed),
+            )
+        return results
+
+    def run_builtin_check(
+        self,
+        tool_name: str,
+        target_files: list[str],
+        cwd: Path,
+        batch_size: int,
+        check_imports: bool = True,
+        timing_root: Path | None = None,
+    ) -> ToolResult:
+        """Run the built-in ast checks, without spawning external tools.
+
+        Files are checked in the current process when they fit in one batch,
+        otherwise batches are spread over the in-process backend worker pool.
+        Only syntax errors make the checks fail; import issues are advisory.
+
+        Args:
+            tool_name: Name to report results under
+            target_files: Files to check
+            cwd: Working directory
+            batch_size: Number of files per worker task
+            check_imports: Whether to report unused and duplicate imports
+            timing_root: Project batch durations are recorded for and
+                timeouts derived from (None = default tool timeout)
+
+        Returns:
+            ToolResult: Result with the issues, in ruff's JSON shape, as data
+
+        Raises:
+            LintServiceError: If input validation fails
+            ToolExecutionServiceError: If the checks fail or time out
+        """
+        if not target_files:
+            raise LintServiceError(
+                message="Target files cannot be empty",
+                operation="run_builtin_check",
+                details="Empty target files list provided for built-in check",
+            )
+
+        batches = [
+            target_files[index : index + batch_size]
+            for index in range(0, len(target_files), batch_size)
+        ]
+        try:
+            if len(batches) == 1:
+                issues = check_files(batches[0], str(cwd), check_imports)
+            else:
+                pool = self._get_process_pool()
+                futures = [
+                    pool.submit(check_files, batch, str(cwd), check_imports)
+                    for batch in batches
+                ]
+                issues = [
+                    issue
+                    for batch_issues in self._wait_for_batches(
+                        futures, timing_root, f"{tool_name}:check"
+                    )
+                    for issue in batch_issues
+                ]
+        except TimeoutError as e:
+            raise ToolExecutionServiceError(
+                message="Built-in checks timed out",
+                tool_name=tool_name,
+                operation="check",
+                reason=f"Built-in checks timed out after {e.timeout_seconds:g}s",
+                details=f"Files: {len(target_files)}, Batch size: {batch_size}",
+            ) from e
+        except Exception as e:
+            raise ToolExecutionServiceError(
+                message=f"Built-in checks failed: {e}",
+                tool_name=tool_name,
+                operation="check",
+                reason=f"Built-in checks failed: {e}",
+                details=f"Exception type: {type(e).__name__}",
+            ) from e
+
+        return ToolResult(
+            success=not any(is_syntax_error(issue) for issue in issues),
+            tool_name=tool_name,
+            message=format_issues(issues, str(cwd)) or f"{tool_name} check completed",
+            files_checked=len(target_files),
+            issues_found=len(issues),
+            data=issues,
+        )
+
     def parse_output(self, output: str, tool_name: str) -> dict[str, object]:
         """Parse linting tool output into structured format.
 
@@ -434,3 +710,443 @@ class LintService:
             LintValidationError: If result validation fails
         """
         return validate_lint_result(result)
+
+    def shutdown_process_pool(self) -> None:
+        """Stop the in-process backend workers, if they were started."""
+        with self._pool_lock:
+            pool, self._process_pool = self._process_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    # ///////////////////////////////////////////////////////////////
+    # PRIVATE METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def _run_sharded(
+        self,
+        command: list[str],
+        targets: list[str],
+        cwd: Path,
+        max_files_per_shard: int | None,
+        in_process: bool = False,
+        on_record: Callable[[Any], None] | None = None,
+        cancel_event: Event | None = None,
+        fail_fast: bool = False,
+        timing_root: Path | None = None,
+        timing_key: str = "",
+    ) -> list[CommandResult]:
+        """Run a command over targets split into argument-limit-sized shards.
+
+        Shards are started largest first, so the last one to finish is not a
+        large shard started after all the small ones. They run on the shard
+        thread pool shared by all tools (see ``_get_shard_executor``), so
+        tools checked concurrently do not each start a process per CPU.
+
+        Args:
+            command: Executable and fixed arguments
+            targets: Files or directories to append to the command
+            cwd: Working directory
+            max_files_per_shard: Maximum targets per invocation (None = no limit)
+            in_process: Whether to use the in-process backend when available
+            on_record: Stream each shard's JSON-lines output to this callback
+                instead of collecting it (takes precedence over ``in_process``)
+            cancel_event: Event that cancels the running and queued shards
+                when set; it is also set if a shard errors or is interrupted
+            fail_fast: Set ``cancel_event`` as soon as a shard fails
+            timing_root: Project shard durations are recorded for and
+                timeouts derived from (None = default tool timeout)
+            timing_key: Timing key of the command (e.g. ``"ruff:check"``)
+
+        Returns:
+            list[CommandResult]: One result per completed shard, in target
+            order; shards cancelled after another shard failed are left out
+
+        Raises:
+            CommandCancelledError: If shards were cancelled and none of the
+                completed ones failed
+            TimeoutError: If a shard does not finish in time
+        """
+        timeout = self._get_tool_timeout(timing_root, timing_key)
+        if on_record is not None:
+            run = partial(
+                self._run_streamed,
+                on_record=on_record,
+                cancel_event=cancel_event,
+                timeout=timeout,
+            )
+        elif in_process and is_in_process_available(command[0]):
+            run = partial(
+                self._run_in_process, cancel_event=cancel_event, timeout=timeout
+            )
+        else:
+            run = partial(
+                self._run_subprocess, cancel_event=cancel_event, timeout=timeout
+            )
+
+        def run_shard(shard: list[str]) -> CommandResult | None:
+            try:
+                result = run([*command, *shard], cwd)
+            except CommandCancelledError:
+                return None
+            except TimeoutError:
+                if timing_root is not None:
+                    # Count the run as long as its timeout so the next one grows
+                    self.timing_service.record(timing_root, timing_key, timeout)
+                raise
+            if timing_root is not None:
+                self.timing_service.record(
+                    timing_root, timing_key, result.execution_time
+                )
+            if fail_fast and not result and cancel_event is not None:
+                self.logger.debug(f"{command[0]} failed, cancelling remaining work")
+                cancel_event.set()
+            return result
+
+        shards = shard_targets(
+            command, targets, get_argument_budget(), max_files_per_shard
+        )
+        if len(shards) > 1:
+            self.logger.debug(
+                f"Running {command[0]} on {len(targets)} targets "
+                f"in {len(shards)} shards"
+            )
+        executor = self._get_shard_executor()
+        futures = {
+            index: executor.submit(run_shard, shards[index])
+            for index in order_shards_by_cost(shards, str(cwd))
+        }
+        try:
+            results = [futures[index].result() for index in range(len(shards))]
+        except BaseException:
+            # Stop the other shards instead of waiting for them
+            if cancel_event is not None:
+                cancel_event.set()
+            for future in futures.values():
+                future.cancel()
+            raise
+
+        completed = [result for result in results if result is not None]
+        if len(completed) < len(results) and all(completed):
+            # Without a failed shard, a partial result would read as a pass
+            raise CommandCancelledError(
+                command=command[0],
+                details=f"{len(results) - len(completed)} of {len(results)} "
+                "shards cancelled",
+            )
+        return completed
+
+    def _run_subprocess(
+        self,
+        command: list[str],
+        cwd: Path,
+        cancel_event: Event | None = None,
+        timeout: float | None = None,
+    ) -> CommandResult:
+        """Run a tool command in a new process.
+
+        Args:
+            command: Command to execute
+            cwd: Working directory
+            cancel_event: Event that kills the process when set
+            timeout: Timeout in seconds (default: command runner timeout)
+
+        Returns:
+            CommandResult: Result of the command
+
+        Raises:
+            TimeoutError: If the tool does not finish in time
+            CommandCancelledError: If the command was cancelled
+        """
+        return self.command_runner.run_silent(
+            command, cwd=cwd, cancel_event=cancel_event, timeout=timeout
+        )
+
+    def _run_streamed(
+        self,
+        command: list[str],
+        cwd: Path,
+        on_record: Callable[[Any], None],
+        cancel_event: Event | None = None,
+        timeout: float | None = None,
+    ) -> CommandResult:
+        """Run a tool command, parsing its JSON-lines output as it arrives.
+
+        Args:
+            command: Command to execute
+            cwd: Working directory
+            on_record: Called with each parsed record
+            cancel_event: Event that kills the process when set
+            timeout: Timeout in seconds (default: command runner timeout)
+
+        Returns:
+            CommandResult: Result of the command, without its standard output
+
+        Raises:
+            ValidationServiceError: If a record cannot be parsed
+            TimeoutError: If the tool does not finish in time
+            CommandCancelledError: If the command was cancelled
+        """
+        with self.command_runner.stream(
+            command, cwd=cwd, cancel_event=cancel_event, timeout=timeout
+        ) as stream:
+            for line in stream:
+                try:
+                    record = parse_json_line(line)
+                except json.JSONDecodeError as e:
+                    raise ValidationServiceError(
+                        operation="json_parsing",
+                        field=f"{command[0]} output",
+                        file_path=str(cwd),
+                        reason=f"Failed to parse {command[0]} JSON output: {e}",
+                        details=f"Raw output: {line[:200]}...",
+                    ) from e
+                if record is not None:
+                    on_record(record)
+            return stream.to_result(include_stdout=False)
+
+    def _run_in_process(
+        self,
+        command: list[str],
+        cwd: Path,
+        cancel_event: Event | None = None,
+        timeout: float | None = None,
+    ) -> CommandResult:
+        """Run a tool command through the in-process backend.
+
+        The command runs in a long-lived worker process, so only the first
+        invocation per worker pays for interpreter startup and imports. Falls
+        back to a subprocess if the worker pool is unusable. Cancelling drops
+        a queued command; a command already running finishes in its worker,
+        which is shared, but its result is discarded.
+
+        Args:
+            command: Command to execute
+            cwd: Working directory
+            cancel_event: Event that cancels the command when set
+            timeout: Timeout in seconds (default: command runner timeout)
+
+        Returns:
+            CommandResult: Result of the command
+
+        Raises:
+            TimeoutError: If the tool does not finish in time
+            CommandCancelledError: If the command was cancelled
+        """
+        start_time = time.time()
+        try:
+            future = self._get_process_pool().submit(
+                run_tool_in_process, command[0], command[1:], str(cwd)
+            )
+        except (BrokenProcessPool, RuntimeError, OSError) as e:
+            self.logger.debug(f"In-process backend unavailable, using subprocess: {e}")
+            return self._run_subprocess(command, cwd, cancel_event, timeout)
+
+        if timeout is None:
+            timeout = self.command_runner.timeout
+        poll_interval = (
+            CommandConfig.CANCEL_POLL_INTERVAL if cancel_event is not None else timeout
+        )
+        deadline = time.monotonic() + timeout
+        try:
+            while True:
+                try:
+                    returncode, stdout, stderr = future.result(
+                        timeout=min(poll_interval, max(deadline - time.monotonic(), 0))
+                    )
+                    break
+                except FutureTimeoutError as e:
+                    if cancel_event is not None and cancel_event.is_set():
+                        future.cancel()
+                        raise CommandCancelledError(
+                            command=" ".join(command),
+                            details="In-process backend",
+                        ) from e
+                    if time.monotonic() >= deadline:
+                        raise TimeoutError(
+                            command=" ".join(command),
+                            timeout_seconds=timeout,
+                            details="In-process backend",
+                        ) from e
+        except BrokenProcessPool as e:
+            self.logger.debug(f"In-process worker died, using subprocess: {e}")
+            self.shutdown_process_pool()
+            return self._run_subprocess(command, cwd, cancel_event, timeout)
+
+        return CommandResult(
+            returncode=returncode,
+            stdout=stdout,
+            stderr=stderr,
+            command=command,
+            cwd=cwd,
+            execution_time=time.time() - start_time,
+        )
+
+    def _get_tool_timeout(self, timing_root: Path | None, timing_key: str) -> float:
+        """Return the timeout of a tool invocation.
+
+        Args:
+            timing_root: Project whose timing history to use (None = default)
+            timing_key: Timing key of the invocation
+
+        Returns:
+            float: Timeout in seconds
+        """
+        if timing_root is None:
+            return CommandConfig.TOOL_TIMEOUT
+        return self.timing_service.get_timeout(
+            timing_root,
+            timing_key,
+            CommandConfig.TOOL_TIMEOUT,
+            CommandConfig.TOOL_TIMEOUT_MIN,
+            CommandConfig.TOOL_TIMEOUT_MAX,
+        )
+
+    def _wait_for_batches(
+        self, futures: list[Future[Any]], timing_root: Path | None, timing_key: str
+    ) -> list[Any]:
+        """Wait for batches submitted to the in-process backend worker pool.
+
+        Each batch gets the timeout of ``timing_key`` (see
+        ``_get_tool_timeout``), and all of them share a single deadline: one
+        timeout per wave of batches the pool runs at once. The mean batch
+        duration is recorded for ``timing_root``.
+
+        Args:
+            futures: Batches in submission order
+            timing_root: Project batch durations are recorded for and
+                timeouts derived from (None = default tool timeout)
+            timing_key: Timing key of the batches (e.g. ``"ast:check"``)
+
+        Returns:
+            list[Any]: Result of each batch, in submission order
+
+        Raises:
+            TimeoutError: If the batches do not finish by the deadline
+        """
+        timeout = self._get_tool_timeout(timing_root, timing_key)
+        waves = -(-len(futures) // (os.cpu_count() or 1))
+        start_time = time.monotonic()
+        deadline = start_time + timeout * waves
+
+        results = []
+        try:
+            for future in futures:
+                results.append(
+                    future.result(timeout=max(0.0, deadline - time.monotonic()))
+                )
+        except FutureTimeoutError as e:
+            for future in futures:
+                future.cancel()
+            if timing_root is not None:
+                # Count the batches as long as their timeout so the next one grows
+                self.timing_service.record(timing_root, timing_key, timeout)
+            raise TimeoutError(
+                command=timing_key, timeout_seconds=timeout * waves
+            ) from e
+
+        if timing_root is not None:
+            self.timing_service.record(
+                timing_root, timing_key, (time.monotonic() - start_time) / waves
+            )
+        return results
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Return the in-process backend worker pool, creating it on first use.
+
+        Returns:
+            ProcessPoolExecutor: Worker pool shared by all tools
+        """
+        with self._pool_lock:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count() or 1
+                )
+                atexit.register(self.shutdown_process_pool)
+            return self._process_pool
+
+    def _get_shard_executor(self) -> ThreadPoolExecutor:
+        """Return the shard thread pool, creating it on first use.
+
+        Returns:
+            ThreadPoolExecutor: Pool of one thread per CPU, shared by all
+            tools, so at most that many tool processes run at once
+        """
+        with self._pool_lock:
+            if self._shard_executor is None:
+                self._shard_executor = ThreadPoolExecutor(
+                    max_workers=os.cpu_count() or 1, thread_name_prefix="womm-shard"
+                )
+            return self._shard_executor
+
+    def _parse_json_output(self, tool_name: str, stdout: str, cwd: Path) -> Any:
+        """Parse the JSON report printed by a tool.
+
+        Args:
+            tool_name: Name of the tool
+            stdout: Standard output of the tool
+            cwd: Working directory (for error reporting)
+
+        Returns:
+            Any: Parsed report (an empty report of the tool's shape if there
+            is none)
+
+        Raises:
+            ValidationServiceError: If the JSON report cannot be parsed
+        """
+        empty_report: Any = (
+            {"results": []}
+            if tool_name in PythonLintingConfig.JSON_REPORT_OBJECT_TOOLS
+            else []
+        )
+
+        # No output means no issues found (common with bandit)
+        if not stdout:
+            return empty_report
+
+        try:
+            # Filter out log lines that are not JSON (common with bandit)
+            stdout_lines = stdout.strip().split("\n")
+            json_lines = []
+            json_started = False
+
+            for line in stdout_lines:
+                stripped_line = line.strip()
+                if stripped_line.startswith(("{", "[")):
+                    json_started = True
+                if json_started:
+                    json_lines.append(stripped_line)
+
+            if not json_lines:
+                # No valid JSON found, treat as no issues
+                return empty_report
+
+            return json.loads("\n".join(json_lines))
+
+        except json.JSONDecodeError as e:
+            raise ValidationServiceError(
+                operation="json_parsing",
+                field=f"{tool_name} output",
+                file_path=str(cwd),
+                reason=f"Failed to parse {tool_name} JSON output: {e}",
+                details=f"Raw output: {stdout[:200]}...",
+            ) from e
+
+    @staticmethod
+    def _count_fixed_issues(text: str) -> int:
+        """Extract the number of fixed issues from a fix run's output.
+
+        This is tool-specific and might need refinement.
+
+        Args:
+            text: Tool output
+
+        Returns:
+            int: Number found on the first "fixed"/"formatted" line, or 0
+        """
+        for line in text.splitlines():
+            if "fixed" in line.lower() or "formatted" in line.lower():
+                # Try to extract numbers from the line
+                numbers = re.findall(r"\d+", line)
+                if numbers:
+                    return int(numbers[0])
+        return 0
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# LINT CACHE SERVICE - Persistent Lint Result Cache Service
+# Project: works-on-my-machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Lint Cache Service - Singleton service for the persistent lint result cache.
+
+Stores per-file lint results on disk, one cache file per project, with
+size-bounded least-recently-used eviction. Cache keys are built by the
+caller (see ``get_lint_cache_key``) so this service stays tool-agnostic.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from threading import Lock
+from typing import Any, ClassVar
+
+# Local imports
+from ...shared.configs.cache_config import CacheConfig
+from ...utils.lint import load_lint_cache, save_lint_cache
+
+# ///////////////////////////////////////////////////////////////
+# LINT CACHE SERVICE CLASS
+# ///////////////////////////////////////////////////////////////
+
+
+class LintCacheService:
+    """Singleton service for persistent per-file lint results."""
+
+    _instance: ClassVar[LintCacheService | None] = None
+    _initialized: ClassVar[bool] = False
+    _lock: ClassVar[Lock] = Lock()
+
+    def __new__(cls) -> LintCacheService:
+        """Create or return the singleton instance.
+
+        Returns:
+            LintCacheService: The singleton instance
+        """
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super().__new__(cls)
+        return cls._instance
+
+    def __init__(self) -> None:
+        """Initialize lint cache service (only once)."""
+        if LintCacheService._initialized:
+            return
+
+        self.logger = logging.getLogger(__name__)
+        self._caches: dict[Path, OrderedDict[str, Any]] = {}
+        self._dirty: set[Path] = set()
+        self._cache_lock = Lock()
+        LintCacheService._initialized = True
+
+    # ///////////////////////////////////////////////////////////////
+    # PUBLIC METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def lookup(self, project_root: Path, keys: dict[str, str]) -> dict[str, Any]:
+        """Look up cached results and mark them as recently used.
+
+        Args:
+            project_root: Project the results belong to
+            keys: Cache key for each file path
+
+        Returns:
+            dict[str, Any]: Cached entry for each file path that was found
+        """
+        with self._cache_lock:
+            entries = self._get_entries(project_root)
+            hits: dict[str, Any] = {}
+            for file_path, key in keys.items():
+                entry = entries.get(key)
+                if entry is not None:
+                    entries.move_to_end(key)
+                    hits[file_path] = entry
+            if hits:
+                self._dirty.add(project_root)
+            return hits
+
+    def store(self, project_root: Path, new_entries: dict[str, Any]) -> None:
+        """Add entries to the cache, evicting the least recently used ones.
+
+        Args:
+            project_root: Project the results belong to
+            new_entries: Entries keyed by cache key
+        """
+        if not new_entries:
+            return
+
+        with self._cache_lock:
+            entries = self._get_entries(project_root)
+            for key, entry in new_entries.items():
+                entries[key] = entry
+                entries.move_to_end(key)
+            while len(entries) > CacheConfig.LINT_CACHE_MAX_ENTRIES:
+                entries.popitem(last=False)
+            self._dirty.add(project_root)
+
+    def flush(self, project_root: Path) -> None:
+        """Write a project's cache to disk if it changed.
+
+        Failures are logged and ignored: the cache is only an optimization.
+
+        Args:
+            project_root: Project whose cache to write
+        """
+        with self._cache_lock:
+            if project_root not in self._dirty:
+                return
+            if not CacheConfig.is_cache_dir_writable():
+                return
+            try:
+                save_lint_cache(
+                    CacheConfig.get_lint_cache_path(project_root),
+                    CacheConfig.LINT_CACHE_VERSION,
+                    self._caches[project_root],
+                )
+                self._dirty.discard(project_root)
+            except OSError as e:
+                self.logger.debug(f"Could not save lint cache: {e}")
+
+    # ///////////////////////////////////////////////////////////////
+    # PRIVATE METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def _get_entries(self, project_root: Path) -> OrderedDict[str, Any]:
+        """Return a project's entries, loading them from disk on first use.
+
+        Args:
+            project_root: Project whose entries to return
+
+        Returns:
+            OrderedDict[str, Any]: Entries, least recently used first
+        """
+        entries = self._caches.get(project_root)
+        if entries is None:
+            entries = load_lint_cache(
+                CacheConfig.get_lint_cache_path(project_root),
+                CacheConfig.LINT_CACHE_VERSION,
+            )
+            self._caches[project_root] = entries
+        return entries
@@ -17,20 +17,47 @@ from __future__ import annotations
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
 # Standard library imports
+import json
 import logging
+import os
+import sys
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from threading import Lock
-from typing import ClassVar
+from threading import Event, Lock
+from typing import Any, ClassVar
 
 # Local imports
+from ...exceptions.common import CommandCancelledError
 from ...exceptions.lint import (
     LintServiceError,
     ToolAvailabilityServiceError,
     ToolExecutionServiceError,
 )
+from ...shared.configs.cache_config import CacheConfig
 from ...shared.configs.lint import PythonLintingConfig
 from ...shared.result_models import ToolResult
+from ...utils.lint import (
+    AST_CHECKS_VERSION,
+    FIX_PIPELINE_TOOLS,
+    find_config_dirs,
+    format_issues,
+    get_in_process_version,
+    get_json_error_files,
+    get_lint_cache_key,
+    get_tool_config_fingerprint,
+    hash_file_content,
+    is_fix_pipeline_supported,
+    is_in_process_available,
+    is_syntax_error,
+    split_json_issues,
+    split_json_metrics,
+    sum_json_metrics,
+)
+from ..common.timing_service import TimingService
 from .core_service import LintService
+from .lint_cache_service import LintCacheService
 
 # ///////////////////////////////////////////////////////////////
 # PYTHON LINTING SERVICE CLASS
@@ -62,7 +89,10 @@ class PythonLintService:
 
         self.logger = logging.getLogger(__name__)
         self.lint_service = LintService()
+        self.lint_cache = LintCacheService()
+        self.timing_service = TimingService()
         self._available_tools: dict[str, bool] | None = None
+        self._tool_versions: dict[str, str] = {}
         PythonLintService._initialized = True
 
     # ///////////////////////////////////////////////////////////////
@@ -108,14 +138,64 @@ class PythonLintService:
             ) from e
 
     def check_python_code(
-        self, target_dirs: list[str], cwd: Path, tools: list[str] | None = None
+        self,
+        target_dirs: list[str],
+        cwd: Path,
+        tools: list[str] | None = None,
+        jobs: int = PythonLintingConfig.DEFAULT_JOBS,
+        shard_size: int = PythonLintingConfig.MAX_FILES_PER_SHARD,
+        use_cache: bool = True,
+        in_process: bool = False,
+        fast_tier: bool = True,
+        on_issue: Callable[[str, Any], None] | None = None,
+        fail_fast: bool = False,
+        timing_root: Path | None = None,
     ) -> dict[str, ToolResult]:
         """Run Python linting tools in check mode.
 
+        Check mode is read-only, so tools run concurrently on up to ``jobs``
+        threads, the ones expected to finish first (from their previous
+        durations on this project) starting first. Results are returned in
+        tool order regardless of which tool finishes first. With
+        ``use_cache``, files whose content, tool version and tool configuration
+        are unchanged since a previous run are not linted again; their cached
+        issues are merged into the results. With ``in_process``, tools that
+        support it run in reusable worker processes instead of a new
+        interpreter per invocation.
+
+        With ``fast_tier``, built-in ast checks run first when ruff does not
+        run, and are reported under ``PythonLintingConfig.FAST_TIER_TOOL``.
+        If they find syntax errors, the external tools are skipped: every one
+        of them would fail on the same files. They also report unused imports;
+        those never fail the check. When ruff runs, its own parser reports
+        syntax errors instead: the ast checks use the running interpreter's
+        grammar, which may predate syntax the project targets.
+
+        With ``on_issue``, tools that can print a JSON-lines report stream it
+        and report each new issue while they run, as do the built-in checks;
+        cached issues are only part of the results.
+
+        With ``fail_fast``, the first tool or shard that reports issues or
+        errors cancels the others: queued work is dropped and running tool
+        processes are killed along with their children. Cancelled tools are
+        left out of the results. Tool processes are killed the same way if
+        the check is interrupted.
+
         Args:
             target_dirs: List of directories/files to lint
             cwd: Working directory
             tools: Specific tools to run (if None, run all available)
+            jobs: Maximum number of tools running at once (1 = sequential)
+            shard_size: Maximum number of files per tool invocation
+            use_cache: Whether to reuse and update the lint result cache
+            in_process: Whether to use the in-process backend when available
+            fast_tier: Whether to run the built-in checks first when ruff
+                does not run
+            on_issue: Called with the tool name and each issue found, possibly
+                from several threads at once
+            fail_fast: Whether to stop all tools at the first failure
+            timing_root: Project tool durations are recorded for (defaults to
+                ``cwd``; differs when ``cwd`` is a temporary copy)
 
         Returns:
             dict[str, ToolResult]: Tool name -> result mapping
@@ -141,6 +221,16 @@ class PythonLintService:
                     details=f"Invalid working directory: {cwd}",
                 )
 
+            if jobs < 1:
+                raise LintServiceError(
+                    message="Number of jobs must be at least 1",
+                    operation="check_python_code",
+                    details=f"Invalid jobs value: {jobs}",
+                )
+
+            if timing_root is None:
+                timing_root = cwd
+
             available_tools = self.get_available_tools()
             tools_to_run = tools or [
                 t for t, available in available_tools.items() if available
@@ -154,36 +244,111 @@ class PythonLintService:
                     details="All configured tools are unavailable",
                 )
 
-            results: dict[str, ToolResult] = {}
+            runnable_tools: list[str] = []
             for tool_name in tools_to_run:
                 if not available_tools.get(tool_name, False):
                     self.logger.warning(f"Tool {tool_name} is not available, skipping")
                     continue
+                runnable_tools.append(tool_name)
 
-                config = PythonLintingConfig.TOOLS_CONFIG[tool_name]
-                try:
-                    result = self.lint_service.run_tool_check(
-                        tool_name=tool_name,
-                        args=config["check_args"],
-                        target_dirs=target_dirs,
-                        cwd=cwd,
-                        json_output=config["json_support"],
+            results: dict[str, ToolResult] = {}
+            if fast_tier and "ruff" not in runnable_tools:
+                fast_result = self._run_fast_tier(
+                    target_dirs, cwd, use_cache, timing_root=timing_root
+                )
+                if fast_result is not None:
+                    results[PythonLintingConfig.FAST_TIER_TOOL] = fast_result
+                    fast_issues = fast_result.data or []
+                    if on_issue is not None:
+                        for issue in fast_issues:
+                            on_issue(PythonLintingConfig.FAST_TIER_TOOL, issue)
+                    skip_reason = None
+                    if any(is_syntax_error(issue) for issue in fast_issues):
+                        skip_reason = "Syntax errors found"
+                    elif fail_fast and not fast_result.success:
+                        skip_reason = "Built-in checks failed with --fail-fast"
+                    if skip_reason:
+                        self.logger.info(f"{skip_reason}, skipping linting tools")
+                        if use_cache:
+                            self.lint_cache.flush(cwd)
+                        self.timing_service.flush(timing_root)
+                        return results
+
+            # Quick tools first: their results come early, and with fail_fast
+            # they can cancel the slow ones before they get far
+            scheduled_tools = sorted(
+                runnable_tools,
+                key=lambda tool_name: self._get_expected_duration(
+                    tool_name, timing_root
+                ),
+            )
+            cancel_event = Event()
+
+            def run_tool(tool_name: str) -> ToolResult:
+                if cancel_event.is_set():
+                    raise CommandCancelledError(
+                        command=tool_name, details="Cancelled before it started"
                     )
-                    results[tool_name] = result
-                    self.logger.debug(f"✓ {tool_name} check completed")
-                except (LintServiceError, ToolExecutionServiceError):
-                    # Re-raise specialized exceptions as-is
-                    raise
-                except Exception as e:
-                    # Wrap unexpected external exceptions
-                    raise ToolExecutionServiceError(
-                        message=f"Failed to run {tool_name}: {e}",
-                        tool_name=tool_name,
-                        operation="check",
-                        reason=f"Failed to run {tool_name}: {e}",
-                        details=f"Exception type: {type(e).__name__}, Tool: {tool_name}",
-                    ) from e
+                result = self._run_check_tool(
+                    tool_name,
+                    target_dirs,
+                    cwd,
+                    shard_size,
+                    use_cache,
+                    in_process,
+                    on_issue,
+                    cancel_event,
+                    fail_fast,
+                    timing_root,
+                )
+                if fail_fast and not result.success:
+                    cancel_event.set()
+                return result
+
+            if jobs == 1 or len(runnable_tools) <= 1:
+                tool_results: dict[str, ToolResult] = {}
+                for tool_name in scheduled_tools:
+                    try:
+                        tool_results[tool_name] = run_tool(tool_name)
+                    except CommandCancelledError:
+                        break
+                results.update(
+                    (tool_name, tool_results[tool_name])
+                    for tool_name in runnable_tools
+                    if tool_name in tool_results
+                )
+            else:
+                with ThreadPoolExecutor(
+                    max_workers=min(jobs, len(runnable_tools)),
+                    thread_name_prefix="womm-lint",
+                ) as executor:
+                    futures: dict[str, Future[ToolResult]] = {
+                        tool_name: executor.submit(run_tool, tool_name)
+                        for tool_name in scheduled_tools
+                    }
+
+                    # Collect in tool order; the first failing tool (in that
+                    # order) raises, as in sequential mode
+                    try:
+                        for tool_name in runnable_tools:
+                            try:
+                                results[tool_name] = futures[tool_name].result()
+                            except CommandCancelledError:
+                                continue
+                    except BaseException:
+                        # Kill the other tools instead of waiting for them,
+                        # including on Ctrl+C
+                        cancel_event.set()
+                        raise
+
+            if fail_fast and cancel_event.is_set():
+                skipped = [name for name in runnable_tools if name not in results]
+                if skipped:
+                    self.logger.info(f"Fail-fast: cancelled {', '.join(skipped)}")
 
+            if use_cache:
+                self.lint_cache.flush(cwd)
+            self.timing_service.flush(timing_root)
             return results
 
         except (
@@ -202,14 +367,29 @@ class PythonLintService:
             ) from e
 
     def fix_python_code(
-        self, target_dirs: list[str], cwd: Path, tools: list[str] | None = None
+        self,
+        target_dirs: list[str],
+        cwd: Path,
+        tools: list[str] | None = None,
+        shard_size: int = PythonLintingConfig.MAX_FILES_PER_SHARD,
+        in_process: bool = False,
+        single_pass: bool = True,
     ) -> dict[str, ToolResult]:
         """Run Python linting tools in fix mode.
 
+        With ``single_pass``, isort and black are applied together: each file
+        is read once, formatted in memory and written back only if it changed
+        (see ``LintService.run_fix_pipeline``). This requires their packages
+        to be importable and a black configuration the pipeline supports;
+        otherwise each tool runs as its own command.
+
         Args:
             target_dirs: List of directories/files to fix
             cwd: Working directory
             tools: Specific tools to run (if None, run all available fixable tools)
+            shard_size: Maximum number of files per tool invocation
+            in_process: Whether to use the in-process backend when available
+            single_pass: Whether to run isort and black as a single pass
 
         Returns:
             dict[str, ToolResult]: Tool name -> result mapping
@@ -238,12 +418,15 @@ class PythonLintService:
             available_tools = self.get_available_tools()
             fixable_tools = [
                 t
-                for t, config in PythonLintingConfig.TOOLS_CONFIG.items()
-                if config["fix_args"] or t in PythonLintingConfig.FIXABLE_TOOLS
+                for t in PythonLintingConfig.TOOLS_CONFIG
+                if PythonLintingConfig.get_tool_args(t, "fix")
+                or t in PythonLintingConfig.FIXABLE_TOOLS
             ]
             tools_to_run = tools or [
                 t for t in fixable_tools if available_tools.get(t, False)
             ]
+            # Tools rewrite the same files: keep a deterministic order
+            tools_to_run = sorted(tools_to_run, key=self._fix_order_key)
 
             if not tools_to_run:
                 raise ToolAvailabilityServiceError(
@@ -253,18 +436,38 @@ class PythonLintService:
                     details="All configured fixable tools are unavailable",
                 )
 
+            pipeline_tools = (
+                self._get_pipeline_tools(
+                    tools_to_run, available_tools, target_dirs, cwd
+                )
+                if single_pass
+                else []
+            )
+
             results: dict[str, ToolResult] = {}
             for tool_name in tools_to_run:
                 if not available_tools.get(tool_name, False):
                     self.logger.warning(f"Tool {tool_name} is not available, skipping")
                     continue
 
-                config = PythonLintingConfig.TOOLS_CONFIG[tool_name]
-                fix_args = config["fix_args"]
+                if tool_name in pipeline_tools:
+                    if tool_name == pipeline_tools[0]:
+                        results.update(
+                            self.lint_service.run_fix_pipeline(
+                                tool_names=pipeline_tools,
+                                target_files=target_dirs,
+                                cwd=cwd,
+                                batch_size=PythonLintingConfig.FIX_PIPELINE_BATCH_SIZE,
+                                timing_root=cwd,
+                            )
+                        )
+                        self.logger.debug(
+                            f"✓ {', '.join(pipeline_tools)} fix completed"
+                        )
+                    continue
 
-                # For tools that fix by default (black, isort), use empty args
-                if not fix_args and tool_name in PythonLintingConfig.FIXABLE_TOOLS:
-                    fix_args = []
+                # Tools that fix by default (black, isort) have empty args
+                fix_args = PythonLintingConfig.get_tool_args(tool_name, "fix")
 
                 if tool_name == "bandit":
                     # Bandit doesn't have fix mode, skip
@@ -277,6 +480,9 @@ class PythonLintService:
                         args=fix_args,
                         target_dirs=target_dirs,
                         cwd=cwd,
+                        max_files_per_shard=shard_size,
+                        in_process=in_process,
+                        timing_root=cwd,
                     )
                     results[tool_name] = result
                     self.logger.debug(f"✓ {tool_name} fix completed")
@@ -293,6 +499,7 @@ class PythonLintService:
                         details=f"Exception type: {type(e).__name__}, Tool: {tool_name}",
                     ) from e
 
+            self.timing_service.flush(cwd)
             return results
 
         except (
@@ -350,3 +557,551 @@ class PythonLintService:
                 operation="get_tool_summary",
                 details=f"Exception type: {type(e).__name__}",
             ) from e
+
+    # ///////////////////////////////////////////////////////////////
+    # PRIVATE METHODS
+    # ///////////////////////////////////////////////////////////////
+
+    def _run_check_tool(
+        self,
+        tool_name: str,
+        target_dirs: list[str],
+        cwd: Path,
+        shard_size: int,
+        use_cache: bool = False,
+        in_process: bool = False,
+        on_issue: Callable[[str, Any], None] | None = None,
+        cancel_event: Event | None = None,
+        fail_fast: bool = False,
+        timing_root: Path | None = None,
+    ) -> ToolResult:
+        """Run a single Python linting tool in check mode.
+
+        Results of a run cut short by ``cancel_event`` are not cached: files
+        of cancelled shards would be recorded as clean.
+
+        Args:
+            tool_name: Name of the tool to run
+            target_dirs: List of directories/files to lint
+            cwd: Working directory
+            shard_size: Maximum number of files per tool invocation
+            use_cache: Whether to reuse and update the lint result cache
+            in_process: Whether to use the in-process backend when available
+            on_issue: Called with the tool name and each issue of a streamed run
+            cancel_event: Event that cancels the tool's processes when set
+            fail_fast: Whether a failing shard sets ``cancel_event``
+            timing_root: Project tool durations are recorded for
+
+        Returns:
+            ToolResult: Result of the tool execution
+
+        Raises:
+            LintServiceError: If input validation fails
+            ToolExecutionServiceError: If tool execution fails
+            CommandCancelledError: If the tool was cancelled before any
+                shard failed
+        """
+        # Key every file target by absolute path and content, the form tools
+        # report file names in; directories are never cached
+        root = cwd.resolve()
+        file_paths = {
+            target: os.path.normpath(os.path.join(root, target))
+            for target in target_dirs
+        }
+        fingerprint = (
+            self._get_cache_fingerprint(
+                tool_name,
+                cwd,
+                in_process,
+                [path for path in file_paths.values() if os.path.isfile(path)],
+            )
+            if use_cache
+            else ""
+        )
+        if not fingerprint:
+            return self._run_tool_check(
+                tool_name,
+                target_dirs,
+                cwd,
+                shard_size,
+                in_process,
+                on_issue,
+                cancel_event,
+                fail_fast,
+                timing_root,
+            )
+
+        keys: dict[str, str] = {}
+        for file_path in file_paths.values():
+            if not os.path.isfile(file_path):
+                continue
+            try:
+                keys[file_path] = get_lint_cache_key(
+                    fingerprint, file_path, hash_file_content(file_path)
+                )
+            except OSError:
+                continue
+
+        hits = self.lint_cache.lookup(cwd, keys)
+        misses = [target for target in target_dirs if file_paths[target] not in hits]
+        self.logger.debug(f"{tool_name}: {len(hits)} cached, {len(misses)} to check")
+
+        fresh = (
+            self._run_tool_check(
+                tool_name,
+                misses,
+                cwd,
+                shard_size,
+                in_process,
+                on_issue,
+                cancel_event,
+                fail_fast,
+                timing_root,
+            )
+            if misses
+            else None
+        )
+
+        if PythonLintingConfig.has_json_support(tool_name):
+            result, new_entries = self._merge_cached_json_result(
+                tool_name, target_dirs, root, hits, keys, fresh
+            )
+        else:
+            result, new_entries = self._merge_cached_text_result(
+                tool_name, target_dirs, root, hits, keys, fresh
+            )
+
+        if cancel_event is None or not cancel_event.is_set():
+            self.lint_cache.store(cwd, new_entries)
+        return result
+
+    def _run_tool_check(
+        self,
+        tool_name: str,
+        target_dirs: list[str],
+        cwd: Path,
+        shard_size: int,
+        in_process: bool = False,
+        on_issue: Callable[[str, Any], None] | None = None,
+        cancel_event: Event | None = None,
+        fail_fast: bool = False,
+        timing_root: Path | None = None,
+    ) -> ToolResult:
+        """Run a single Python linting tool in check mode, without caching.
+
+        Tools with ``stream_args`` switch to their JSON-lines report when
+        ``on_issue`` is given, so issues are reported while they run.
+
+        Args:
+            tool_name: Name of the tool to run
+            target_dirs: List of directories/files to lint
+            cwd: Working directory
+            shard_size: Maximum number of files per tool invocation
+            in_process: Whether to use the in-process backend when available
+            on_issue: Called with the tool name and each issue of a streamed run
+            cancel_event: Event that cancels the tool's processes when set
+            fail_fast: Whether a failing shard sets ``cancel_event``
+            timing_root: Project tool durations are recorded for (defaults to
+                ``cwd``)
+
+        Returns:
+            ToolResult: Result of the tool execution
+
+        Raises:
+            LintServiceError: If input validation fails
+            ToolExecutionServiceError: If tool execution fails
+            CommandCancelledError: If the tool was cancelled before any
+                shard failed
+        """
+        stream_issue = (
+            partial(on_issue, tool_name)
+            if on_issue is not None and PythonLintingConfig.has_stream_args(tool_name)
+            else None
+        )
+        try:
+            result = self.lint_service.run_tool_check(
+                tool_name=tool_name,
+                args=PythonLintingConfig.get_tool_args(
+                    tool_name, "stream" if stream_issue is not None else "check"
+                ),
+                target_dirs=target_dirs,
+                cwd=cwd,
+                json_output=PythonLintingConfig.has_json_support(tool_name),
+                max_files_per_shard=shard_size,
+                in_process=in_process,
+                on_issue=stream_issue,
+                cancel_event=cancel_event,
+                fail_fast=fail_fast,
+                timing_root=timing_root or cwd,
+            )
+            self.logger.debug(f"✓ {tool_name} check completed")
+            return result
+        except (LintServiceError, ToolExecutionServiceError, CommandCancelledError):
+            # Re-raise specialized exceptions as-is
+            raise
+        except Exception as e:
+            # Wrap unexpected external exceptions
+            raise ToolExecutionServiceError(
+                message=f"Failed to run {tool_name}: {e}",
+                tool_name=tool_name,
+                operation="check",
+                reason=f"Failed to run {tool_name}: {e}",
+                details=f"Exception type: {type(e).__name__}, Tool: {tool_name}",
+            ) from e
+
+    def _run_fast_tier(
+        self,
+        target_dirs: list[str],
+        cwd: Path,
+        use_cache: bool = False,
+        check_imports: bool = True,
+        timing_root: Path | None = None,
+    ) -> ToolResult | None:
+        """Run the built-in ast checks on the file targets.
+
+        Parsing in Python costs more per file than a ruff run, so with
+        ``use_cache`` files checked before with the same content reuse their
+        issues from the lint result cache.
+
+        Args:
+            target_dirs: List of directories/files to lint
+            cwd: Working directory
+            use_cache: Whether to reuse and update the lint result cache
+            check_imports: Whether to report unused and duplicate imports
+            timing_root: Project batch durations are recorded for
+
+        Returns:
+            ToolResult | None: Result of the checks, or None if no target is
+            a file
+        """
+        tool_name = PythonLintingConfig.FAST_TIER_TOOL
+        target_files = [
+            target
+            for target in target_dirs
+            if os.path.isfile(os.path.join(cwd, target))
+        ]
+        if not target_files:
+            return None
+
+        keys: dict[str, str] = {}
+        if use_cache:
+            fingerprint = get_tool_config_fingerprint(
+                cwd,
+                tool_name,
+                f"{AST_CHECKS_VERSION}-{sys.version_info.major}."
+                f"{sys.version_info.minor}-{'imports' if check_imports else 'syntax'}",
+                [],
+                [],
+                CacheConfig.LINT_CACHE_VERSION,
+            )
+            root = cwd.resolve()
+            for target in target_files:
+                file_path = os.path.normpath(os.path.join(root, target))
+                try:
+                    keys[target] = get_lint_cache_key(
+                        fingerprint, file_path, hash_file_content(file_path)
+                    )
+                except OSError:
+                    continue
+        hits = self.lint_cache.lookup(cwd, keys) if keys else {}
+        misses = [target for target in target_files if target not in hits]
+
+        fresh: list[Any] = []
+        if misses:
+            fresh = (
+                self.lint_service.run_builtin_check(
+                    tool_name=tool_name,
+                    target_files=misses,
+                    cwd=cwd,
+                    batch_size=PythonLintingConfig.FAST_TIER_BATCH_SIZE,
+                    check_imports=check_imports,
+                    timing_root=timing_root,
+                ).data
+                or []
+            )
+        self.logger.debug(f"{tool_name}: {len(hits)} cached, {len(misses)} checked")
+
+        fresh_by_file: dict[str, list[Any]] = {}
+        for issue in fresh:
+            fresh_by_file.setdefault(issue["filename"], []).append(issue)
+        if keys:
+            self.lint_cache.store(
+                cwd,
+                {
+                    keys[target]: fresh_by_file.get(target, [])
+                    for target in misses
+                    if target in keys
+                },
+            )
+
+        issues = [
+            issue
+            for target in target_files
+            for issue in (
+                hits[target] if target in hits else fresh_by_file.get(target, [])
+            )
+        ]
+        return ToolResult(
+            success=not any(is_syntax_error(issue) for issue in issues),
+            tool_name=tool_name,
+            message=format_issues(issues, str(cwd)) or f"{tool_name} check completed",
+            files_checked=len(target_files),
+            issues_found=len(issues),
+            data=issues,
+        )
+
+    @staticmethod
+    def _get_pipeline_tools(
+        tools_to_run: list[str],
+        available_tools: dict[str, bool],
+        target_dirs: list[str],
+        cwd: Path,
+    ) -> list[str]:
+        """Select the fix tools to run through the single-pass pipeline.
+
+        Args:
+            tools_to_run: Fix tools in run order
+            available_tools: Tool availability
+            target_dirs: Fix targets (the pipeline only takes files)
+            cwd: Working directory
+
+        Returns:
+            list[str]: Pipeline tools in run order, or an empty list if the
+            pipeline cannot be used
+        """
+        pipeline_tools = [
+            tool_name
+            for tool_name in tools_to_run
+            if tool_name in FIX_PIPELINE_TOOLS and available_tools.get(tool_name)
+        ]
+        if not all(os.path.isfile(os.path.join(cwd, t)) for t in target_dirs):
+            return []
+        if not is_fix_pipeline_supported(pipeline_tools, str(cwd)):
+            return []
+        return pipeline_tools
+
+    def _get_expected_duration(self, tool_name: str, cwd: Path) -> float:
+        """Return how long a tool's check invocations took on a project.
+
+        Args:
+            tool_name: Name of the tool
+            cwd: Project directory
+
+        Returns:
+            float: Median duration in seconds, infinite for tools that never
+            ran on the project (they start last, in tool order)
+        """
+        duration = self.timing_service.get_expected_duration(cwd, f"{tool_name}:check")
+        return float("inf") if duration is None else duration
+
+    @staticmethod
+    def _fix_order_key(tool_name: str) -> int:
+        """Sort key placing tools in ``PythonLintingConfig.FIX_ORDER``.
+
+        Args:
+            tool_name: Name of the tool
+
+        Returns:
+            int: Position in the fix order (unknown tools run last)
+        """
+        fix_order = PythonLintingConfig.FIX_ORDER
+        return fix_order.index(tool_name) if tool_name in fix_order else len(fix_order)
+
+    def _get_cache_fingerprint(
+        self,
+        tool_name: str,
+        cwd: Path,
+        in_process: bool = False,
+        file_paths: list[str] | None = None,
+    ) -> str:
+        """Compute the lint result cache fingerprint of a tool.
+
+        Configuration files in directories between ``cwd`` and the linted
+        files are part of the fingerprint, as the tools apply the closest
+        configuration to each file.
+
+        Args:
+            tool_name: Name of the tool
+            cwd: Project root containing the tool configuration
+            in_process: Whether the tool runs through the in-process backend,
+                whose package version may differ from the executable's
+            file_paths: Absolute paths of the files to cache results for
+
+        Returns:
+            str: Fingerprint, or an empty string if the tool version is
+            unknown (results are then not cached)
+        """
+        in_process = in_process and is_in_process_available(tool_name)
+        version_key = f"{tool_name}:in-process" if in_process else tool_name
+        version = self._tool_versions.get(version_key)
+        if version is None:
+            try:
+                version = (
+                    get_in_process_version(tool_name)
+                    if in_process
+                    else self.lint_service.get_tool_version(tool_name)
+                )
+            except Exception as e:
+                self.logger.debug(f"Lint cache disabled for {tool_name}: {e}")
+                version = ""
+            self._tool_versions[version_key] = version
+        if not version:
+            return ""
+
+        root = cwd.resolve()
+        config_files = PythonLintingConfig.CONFIG_FILES.get(tool_name, [])
+        return get_tool_config_fingerprint(
+            root,
+            tool_name,
+            version,
+            PythonLintingConfig.get_tool_args(tool_name, "check"),
+            config_files,
+            CacheConfig.LINT_CACHE_VERSION,
+            find_config_dirs(root, file_paths or [], config_files),
+        )
+
+    def _merge_cached_json_result(
+        self,
+        tool_name: str,
+        target_dirs: list[str],
+        cwd: Path,
+        hits: dict[str, Any],
+        keys: dict[str, str],
+        fresh: ToolResult | None,
+    ) -> tuple[ToolResult, dict[str, Any]]:
+        """Combine cached and fresh results of a tool with a JSON report.
+
+        Issues are attributed to files through the ``filename`` of each
+        report item; files the tool reported errors for are not cached.
+
+        Args:
+            tool_name: Name of the tool
+            target_dirs: All targets of the check, in order
+            cwd: Resolved working directory
+            hits: Cached entries by file path
+            keys: Cache keys by file path
+            fresh: Result of checking the cache misses (None if there were none)
+
+        Returns:
+            tuple: Merged result and new cache entries keyed by cache key
+        """
+        fresh_data = fresh.data if fresh is not None else None
+        fresh_issues = split_json_issues(fresh_data, cwd) if fresh_data else {}
+        fresh_metrics = split_json_metrics(fresh_data, cwd)
+        error_files = get_json_error_files(fresh_data, cwd)
+
+        # A failed run that reported nothing did not really check the files
+        cacheable = fresh is None or fresh.success or fresh.issues_found > 0
+
+        issues: list[Any] = []
+        metrics: dict[str, Any] = {}
+        cached_issues = 0
+        new_entries: dict[str, Any] = {}
+
+        for target in target_dirs:
+            file_path = os.path.normpath(os.path.join(cwd, target))
+            entry = hits.get(file_path)
+            if entry is not None:
+                issues.extend(entry["issues"])
+                metrics.update(entry["metrics"])
+                cached_issues += len(entry["issues"])
+                continue
+
+            file_issues = fresh_issues.pop(file_path, [])
+            file_metrics = fresh_metrics.pop(file_path, {})
+            issues.extend(file_issues)
+            metrics.update(file_metrics)
+            if cacheable and file_path in keys and file_path not in error_files:
+                new_entries[keys[file_path]] = {
+                    "issues": file_issues,
+                    "metrics": file_metrics,
+                }
+
+        # Issues of files inside directory targets
+        for remaining in fresh_issues.values():
+            issues.extend(remaining)
+        for remaining in fresh_metrics.values():
+            metrics.update(remaining)
+
+        if not hits and fresh is not None:
+            return fresh, new_entries
+
+        data: Any = issues
+        if tool_name in PythonLintingConfig.JSON_REPORT_OBJECT_TOOLS:
+            data = dict(fresh_data) if isinstance(fresh_data, dict) else {"errors": []}
+            data["results"] = issues
+            if metrics:
+                data["metrics"] = {**metrics, "_totals": sum_json_metrics(metrics)}
+
+        result = ToolResult(
+            success=(fresh is None or fresh.success) and cached_issues == 0,
+            tool_name=tool_name,
+            message=(
+                json.dumps(data, indent=2) if issues else f"{tool_name} check completed"
+            ),
+            files_checked=len(target_dirs),
+            issues_found=len(issues),
+            data=data,
+        )
+        return result, new_entries
+
+    def _merge_cached_text_result(
+        self,
+        tool_name: str,
+        target_dirs: list[str],
+        cwd: Path,
+        hits: dict[str, Any],
+        keys: dict[str, str],
+        fresh: ToolResult | None,
+    ) -> tuple[ToolResult, dict[str, Any]]:
+        """Combine cached and fresh results of a tool with text output.
+
+        Text output cannot be reliably attributed to files, so only files the
+        output does not mention are cached, as clean; cache hits therefore
+        never carry issues.
+
+        Args:
+            tool_name: Name of the tool
+            target_dirs: All targets of the check, in order
+            cwd: Resolved working directory
+            hits: Cached entries by file path
+            keys: Cache keys by file path
+            fresh: Result of checking the cache misses (None if there were none)
+
+        Returns:
+            tuple: Merged result and new cache entries keyed by cache key
+        """
+        new_entries: dict[str, Any] = {}
+        if fresh is not None:
+            text = fresh.message or ""
+            candidates = {
+                file_path: key
+                for file_path, key in keys.items()
+                if file_path not in hits
+            }
+            mentioned = {
+                file_path
+                for file_path in candidates
+                if file_path in text or os.path.relpath(file_path, cwd) in text
+            }
+            # A failed run that names no file did not really check the files
+            if fresh.success or mentioned:
+                new_entries = {
+                    key: {"issues": [], "metrics": {}}
+                    for file_path, key in candidates.items()
+                    if file_path not in mentioned
+                }
+
+        if not hits and fresh is not None:
+            return fresh, new_entries
+
+        result = ToolResult(
+            success=fresh is None or fresh.success,
+            tool_name=tool_name,
+            message=(fresh.message if fresh is not None else "")
+            or f"{tool_name} check completed",
+            files_checked=len(target_dirs),
+            issues_found=fresh.issues_found if fresh is not None else 0,
+            data=fresh.data if fresh is not None else None,
+        )
+        return result, new_entries
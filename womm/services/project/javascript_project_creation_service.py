@@ -23,7 +23,6 @@ from __future__ import annotations
 # Standard library imports
 import logging
 import re
-import shutil
 from pathlib import Path
 from threading import Lock
 from typing import Any, ClassVar
@@ -45,6 +44,7 @@ from ...utils.project import (
     validate_project_type,
 )
 from ..common.command_runner_service import CommandRunnerService
+from ..common.path_index_service import PathIndexService
 from .template_service import TemplateService
 
 # ///////////////////////////////////////////////////////////////
@@ -83,6 +83,7 @@ class JavaScriptProjectCreationService:
 
         self._template_service = TemplateService()
         self._command_runner = CommandRunnerService()
+        self._path_index = PathIndexService()
         self._template_dir = (
             get_assets_module_path() / "languages" / "javascript" / "templates"
         )
@@ -318,7 +319,7 @@ class JavaScriptProjectCreationService:
             validate_project_type(project_type)
 
             # Check if npm is available
-            if not shutil.which("npm"):
+            if not self._path_index.which("npm"):
                 raise ProjectServiceError(
                     message="npm is not installed or not in PATH",
                     operation="setup_dev_tools",
@@ -391,7 +392,7 @@ class JavaScriptProjectCreationService:
         """
         try:
             # Check if git is available
-            if not shutil.which("git"):
+            if not self._path_index.which("git"):
                 logger.info("Git not found, skipping repository initialization")
                 return ProjectCreationResult(
                     success=True,
@@ -401,7 +402,7 @@ class JavaScriptProjectCreationService:
                 )
 
             # Initialize git repository using CommandRunnerService
-            git_path = shutil.which("git")
+            git_path = self._path_index.which("git")
             result = self._command_runner.run(
                 [git_path, "init"],
                 description="Initialize Git repository",
@@ -446,7 +447,7 @@ class JavaScriptProjectCreationService:
         """
         try:
             # Initialize husky using CommandRunnerService
-            npx_path = shutil.which("npx")
+            npx_path = self._path_index.which("npx")
             result = self._command_runner.run(
                 [npx_path, "husky", "install"],
                 description="Install Husky Git hooks",
@@ -456,7 +457,7 @@ class JavaScriptProjectCreationService:
             if result.returncode == 0:
                 try:
                     # Add pre-commit hook using CommandRunnerService
-                    npx_path = shutil.which("npx")
+                    npx_path = self._path_index.which("npx")
                     self._command_runner.run(
                         [
                             npx_path,
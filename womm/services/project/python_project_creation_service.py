@@ -43,6 +43,7 @@ from ...utils.project import (
     validate_project_name,
     validate_project_path,
 )
+from ..common.path_index_service import PathIndexService
 from .template_service import TemplateService
 
 # ///////////////////////////////////////////////////////////////
@@ -80,6 +81,7 @@ class PythonProjectCreationService:
             return
 
         self._template_service = TemplateService()
+        self._path_index = PathIndexService()
         self._template_dir = (
             get_assets_module_path() / "languages" / "python" / "py" / "templates"
         )
@@ -321,9 +323,7 @@ class PythonProjectCreationService:
             self._validation_service.validate_project_path(project_path)
 
             # Check if git is available
-            import shutil
-
-            if not shutil.which("git"):
+            if not self._path_index.which("git"):
                 logger.info("Git not found, skipping repository initialization")
                 return ProjectCreationResult(
                     success=True,
@@ -21,7 +21,6 @@ import json
 import logging
 import os
 import platform
-import shutil
 from pathlib import Path
 
 # Local imports
@@ -45,6 +44,7 @@ from ...utils.system import (
     get_best_package_manager,
 )
 from ..common.command_runner_service import CommandRunnerService
+from ..common.path_index_service import PathIndexService
 
 # ///////////////////////////////////////////////////////////////
 # LOGGER SETUP
@@ -52,6 +52,7 @@ from ..common.command_runner_service import CommandRunnerService
 
 logger = logging.getLogger(__name__)
 _command_runner = CommandRunnerService()
+_path_index = PathIndexService()
 
 
 # ///////////////////////////////////////////////////////////////
@@ -214,26 +215,39 @@ class SystemDetectorService:
         try:
             managers: dict[str, dict[str, str | bool]] = {}
 
-            for (
-                manager_name,
-                metadata,
-            ) in SystemDetectorConfig.get_windows_package_managers().items():
-                command = metadata["command"]
-                availability_result = _command_runner.check_command_available(command)
-                if availability_result.is_available:
-                    try:
-                        result = _command_runner.run_silent([command, "--version"])
-                        version = extract_version_from_stdout(
-                            result.stdout if bool(result) else None
-                        )
-                    except Exception as e:
-                        logger.warning(f"Failed to get {manager_name} version: {e}")
-                        version = "unknown"
-
-                    managers[manager_name] = create_package_manager_entry(
-                        manager_name, version, metadata
+            available = {
+                manager_name: metadata
+                for manager_name, metadata in (
+                    SystemDetectorConfig.get_windows_package_managers().items()
+                )
+                if _command_runner.check_command_available(
+                    str(metadata["command"])
+                ).is_available
+            }
+            # Probe every available manager at once
+            results = _command_runner.run_many_sync(
+                [
+                    [str(metadata["command"]), "--version"]
+                    for metadata in available.values()
+                ],
+                probe=True,
+                return_exceptions=True,
+            )
+            for (manager_name, metadata), result in zip(
+                available.items(), results, strict=True
+            ):
+                if isinstance(result, BaseException):
+                    logger.warning(f"Failed to get {manager_name} version: {result}")
+                    version = "unknown"
+                else:
+                    version = extract_version_from_stdout(
+                        result.stdout if bool(result) else None
                     )
 
+                managers[manager_name] = create_package_manager_entry(
+                    manager_name, version, metadata
+                )
+
             return managers
 
         except Exception as e:
@@ -258,12 +272,13 @@ class SystemDetectorService:
         try:
             managers: dict[str, dict[str, str | bool]] = {}
 
+            available: dict[str, dict[str, str | int]] = {}
             for (
                 manager_name,
                 metadata,
-            ) in SystemDetectorConfig.MACOS_PACKAGE_MANAGERS.items():
-                command = metadata["command"]
-                # Homebrew uses check_command_available, MacPorts uses shutil.which
+            ) in SystemDetectorConfig.get_macos_package_managers().items():
+                command = str(metadata["command"])
+                # Homebrew uses check_command_available, MacPorts a PATH lookup
                 availability_result = (
                     _command_runner.check_command_available(command)
                     if command == "brew"
@@ -272,31 +287,41 @@ class SystemDetectorService:
                 is_available = (
                     availability_result.is_available
                     if availability_result
-                    else bool(shutil.which(command))
+                    else bool(_path_index.which(command))
                 )
-
                 if is_available:
-                    try:
-                        version_args = (
-                            ["--version"] if command == "brew" else ["version"]
-                        )
-                        result = _command_runner.run_silent([command, *version_args])
-                        version = (
-                            extract_version_first_line(
-                                result.stdout if bool(result) else None
-                            )
-                            if command == "brew"
-                            else extract_version_from_stdout(
-                                result.stdout if bool(result) else None
-                            )
-                        )
-                    except Exception as e:
-                        logger.warning(f"Failed to get {manager_name} version: {e}")
-                        version = "unknown"
-
-                    managers[manager_name] = create_package_manager_entry(
-                        manager_name, version, metadata
+                    available[manager_name] = metadata
+
+            # Probe every available manager at once
+            results = _command_runner.run_many_sync(
+                [
+                    [
+                        str(metadata["command"]),
+                        "--version" if metadata["command"] == "brew" else "version",
+                    ]
+                    for metadata in available.values()
+                ],
+                probe=True,
+                return_exceptions=True,
+            )
+            for (manager_name, metadata), result in zip(
+                available.items(), results, strict=True
+            ):
+                if isinstance(result, BaseException):
+                    logger.warning(f"Failed to get {manager_name} version: {result}")
+                    version = "unknown"
+                elif metadata["command"] == "brew":
+                    version = extract_version_first_line(
+                        result.stdout if bool(result) else None
                     )
+                else:
+                    version = extract_version_from_stdout(
+                        result.stdout if bool(result) else None
+                    )
+
+                managers[manager_name] = create_package_manager_entry(
+                    manager_name, version, metadata
+                )
 
             return managers
 
@@ -322,12 +347,13 @@ class SystemDetectorService:
         try:
             managers: dict[str, dict[str, str | bool]] = {}
 
+            available: dict[str, dict[str, str | int]] = {}
             for (
                 manager_name,
                 metadata,
-            ) in SystemDetectorConfig.LINUX_PACKAGE_MANAGERS.items():
-                command = metadata["command"]
-                # APT uses check_command_available, others use shutil.which
+            ) in SystemDetectorConfig.get_linux_package_managers().items():
+                command = str(metadata["command"])
+                # APT uses check_command_available, others a PATH lookup
                 availability_result = (
                     _command_runner.check_command_available(command)
                     if command == "apt"
@@ -336,23 +362,35 @@ class SystemDetectorService:
                 is_available = (
                     availability_result.is_available
                     if availability_result
-                    else bool(shutil.which(command))
+                    else bool(_path_index.which(command))
                 )
-
                 if is_available:
-                    try:
-                        result = _command_runner.run_silent([command, "--version"])
-                        version = extract_version_first_line(
-                            result.stdout if bool(result) else None
-                        )
-                    except Exception as e:
-                        logger.warning(f"Failed to get {manager_name} version: {e}")
-                        version = "unknown"
-
-                    managers[manager_name] = create_package_manager_entry(
-                        manager_name, version, metadata
+                    available[manager_name] = metadata
+
+            # Probe every available manager at once
+            results = _command_runner.run_many_sync(
+                [
+                    [str(metadata["command"]), "--version"]
+                    for metadata in available.values()
+                ],
+                probe=True,
+                return_exceptions=True,
+            )
+            for (manager_name, metadata), result in zip(
+                available.items(), results, strict=True
+            ):
+                if isinstance(result, BaseException):
+                    logger.warning(f"Failed to get {manager_name} version: {result}")
+                    version = "unknown"
+                else:
+                    version = extract_version_first_line(
+                        result.stdout if bool(result) else None
                     )
 
+                managers[manager_name] = create_package_manager_entry(
+                    manager_name, version, metadata
+                )
+
             return managers
 
         except Exception as e:
@@ -380,30 +418,36 @@ class SystemDetectorService:
 
             # Editors/IDEs - filter by platform for relevance
             editor_configs = self._get_platform_editors(platform_name)
-            for cmd, name in editor_configs.items():
-                cmd_path = shutil.which(cmd)
-                if cmd_path:
-                    version = "unknown"
-                    try:
-                        # Use full path returned by shutil.which to handle .CMD/.BAT on Windows
-                        result = _command_runner.run_silent([cmd_path, "--version"])
-                        if result.returncode == 0 and result.stdout:
-                            version = extract_version_first_line(result.stdout)
-                        else:
-                            # Log when version extraction fails
-                            logger.debug(
-                                f"Could not extract version for {cmd}: "
-                                f"returncode={result.returncode}, stdout={bool(result.stdout)}"
-                            )
-                    except Exception as e:
-                        logger.debug(f"Failed to get version for {cmd}: {e}")
-
-                    envs[cmd] = create_editor_entry(cmd, name, version)
+            editor_paths = {
+                cmd: cmd_path
+                for cmd in editor_configs
+                if (cmd_path := _path_index.which(cmd))
+            }
+            # Use full paths returned by the PATH lookup to handle .CMD/.BAT on Windows
+            results = _command_runner.run_many_sync(
+                [[cmd_path, "--version"] for cmd_path in editor_paths.values()],
+                probe=True,
+                return_exceptions=True,
+            )
+            for cmd, result in zip(editor_paths, results, strict=True):
+                version = "unknown"
+                if isinstance(result, BaseException):
+                    logger.debug(f"Failed to get version for {cmd}: {result}")
+                elif result.returncode == 0 and result.stdout:
+                    version = extract_version_first_line(result.stdout)
+                else:
+                    # Log when version extraction fails
+                    logger.debug(
+                        f"Could not extract version for {cmd}: "
+                        f"returncode={result.returncode}, stdout={bool(result.stdout)}"
+                    )
+
+                envs[cmd] = create_editor_entry(cmd, editor_configs[cmd], version)
 
             # Shells - filter by platform for relevance
             shell_configs = self._get_platform_shells(platform_name)
             for cmd, name in shell_configs.items():
-                if shutil.which(cmd):
+                if _path_index.which(cmd):
                     version = self._get_shell_version(cmd)
                     envs[f"shell_{cmd}"] = create_shell_entry(cmd, name)
                     # Add version to shell entry if available
@@ -532,7 +576,7 @@ class SystemDetectorService:
                             return f"{version_parts[0]}.{version_parts[1]}"
             else:
                 # Other shells: try --version
-                result = _command_runner.run_silent([shell, "--version"])
+                result = _command_runner.run_probe([shell, "--version"])
                 if result.returncode == 0 and result.stdout:
                     version = extract_version_first_line(result.stdout)
                     if version and version != "unknown":
@@ -556,11 +600,11 @@ class SystemDetectorService:
         """
         try:
             if self.system_info["platform"] == "Windows" and (
-                shutil.which("powershell") or shutil.which("pwsh")
+                _path_index.which("powershell") or _path_index.which("pwsh")
             ):
                 # Can install Chocolatey via PowerShell
                 return "chocolatey"
-            elif self.system_info["platform"] == "Darwin" and shutil.which("curl"):
+            elif self.system_info["platform"] == "Darwin" and _path_index.which("curl"):
                 # Can install Homebrew via curl
                 return "homebrew"
 
@@ -45,6 +45,7 @@ from ...utils.system import (
 )
 from ...utils.womm_setup import get_default_womm_path
 from ..common.command_runner_service import CommandRunnerService
+from ..common.path_index_service import PathIndexService
 
 # ///////////////////////////////////////////////////////////////
 # LOGGER SETUP
@@ -52,6 +53,7 @@ from ..common.command_runner_service import CommandRunnerService
 
 logger = logging.getLogger(__name__)
 _command_runner = CommandRunnerService()
+_path_index = PathIndexService()
 
 
 # ///////////////////////////////////////////////////////////////
@@ -376,9 +378,7 @@ class SystemEnvironmentService:
                 )
 
             # Try to reload shell configuration using bash
-            import shutil
-
-            bash_path = shutil.which("bash")
+            bash_path = _path_index.which("bash")
             if not bash_path:
                 logger.info("bash not available, environment refresh skipped")
                 return EnvironmentRefreshResult(
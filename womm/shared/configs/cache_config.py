@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# CACHE CONFIG - Global on-disk cache configuration for WOMM
+# Project: works-on-my-machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Global on-disk cache configuration values.
+
+This config class centralizes the cache directory layout so that every
+persistent cache (file index, tool results, probes...) lives under the
+same per-user root and can be wiped in one place.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import hashlib
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import ClassVar
+
+# ///////////////////////////////////////////////////////////////
+# CLASS DEFINITION
+# ///////////////////////////////////////////////////////////////
+
+
+@dataclass(frozen=True)
+class CacheConfig:
+    """Cache configuration (static, read-only).
+
+    Contains cache constants and path methods for WOMM persistent caches.
+    """
+
+    # ///////////////////////////////////////////////////////////
+    # CACHE DIRECTORY
+    # ///////////////////////////////////////////////////////////
+
+    CACHE_DIR_NAME: ClassVar[str] = ".cache"
+
+    # Directory name under the XDG cache home (POSIX systems)
+    XDG_CACHE_DIR_NAME: ClassVar[str] = "womm"
+
+    # ///////////////////////////////////////////////////////////
+    # FILE INDEX
+    # ///////////////////////////////////////////////////////////
+
+    FILE_INDEX_DIR_NAME: ClassVar[str] = "file_index"
+    FILE_INDEX_VERSION: ClassVar[int] = 1
+
+    # Directories modified less than this many seconds before a scan are
+    # re-listed next time (guards against coarse filesystem mtime resolution)
+    FILE_INDEX_RACY_WINDOW: ClassVar[float] = 2.0
+
+    # ///////////////////////////////////////////////////////////
+    # LINT RESULTS
+    # ///////////////////////////////////////////////////////////
+
+    LINT_CACHE_DIR_NAME: ClassVar[str] = "lint_results"
+    LINT_CACHE_VERSION: ClassVar[int] = 1
+
+    # Per-project entry limit (one entry per file and tool); least recently
+    # used entries are evicted first
+    LINT_CACHE_MAX_ENTRIES: ClassVar[int] = 100_000
+
+    # ///////////////////////////////////////////////////////////
+    # SPELL CHECK RESULTS
+    # ///////////////////////////////////////////////////////////
+
+    SPELL_CACHE_DIR_NAME: ClassVar[str] = "spell_results"
+    SPELL_CACHE_VERSION: ClassVar[int] = 2
+
+    # Per-project entry limit (one entry per file); least recently used
+    # entries are evicted first
+    SPELL_CACHE_MAX_ENTRIES: ClassVar[int] = 100_000
+
+    # ///////////////////////////////////////////////////////////
+    # TOOL TIMINGS
+    # ///////////////////////////////////////////////////////////
+
+    TIMINGS_DIR_NAME: ClassVar[str] = "timings"
+    TIMINGS_VERSION: ClassVar[int] = 1
+
+    # Most recent durations kept per tool; older samples are dropped so the
+    # history follows the project as it grows
+    TIMINGS_MAX_SAMPLES: ClassVar[int] = 20
+
+    # File name of the timings that do not belong to a project (tool probes)
+    TIMINGS_GLOBAL_NAME: ClassVar[str] = "global"
+
+    # ///////////////////////////////////////////////////////////
+    # BINARY PROBES
+    # ///////////////////////////////////////////////////////////
+
+    PROBE_CACHE_FILE_NAME: ClassVar[str] = "probes.json"
+    PROBE_CACHE_VERSION: ClassVar[int] = 2
+
+    # Seconds a probe result is reused while its binary is unchanged; also
+    # bounds how long changes the fingerprint cannot see (a package added
+    # next to an unchanged binary) go unnoticed
+    PROBE_CACHE_TTL: ClassVar[float] = 24 * 60 * 60
+
+    # Entry limit; the oldest entries are evicted first
+    PROBE_CACHE_MAX_ENTRIES: ClassVar[int] = 1_000
+
+    # ///////////////////////////////////////////////////////////
+    # CSPELL DETECTION
+    # ///////////////////////////////////////////////////////////
+
+    CSPELL_DETECTION_FILE_NAME: ClassVar[str] = "cspell_detection.json"
+    CSPELL_DETECTION_VERSION: ClassVar[int] = 1
+
+    # ///////////////////////////////////////////////////////////
+    # PATH METHODS
+    # ///////////////////////////////////////////////////////////
+
+    @classmethod
+    def get_cache_dir(cls) -> Path:
+        """Return the root directory used for WOMM persistent caches.
+
+        Caches are per user: ``~/.womm/.cache`` on Windows, and
+        ``$XDG_CACHE_HOME/womm`` (default ``~/.cache/womm``) elsewhere. They
+        are never stored next to the installed package, which may be a
+        read-only install or a development checkout.
+
+        Returns:
+            Path to cache directory
+        """
+        if os.name == "nt":
+            return Path.home() / ".womm" / cls.CACHE_DIR_NAME
+        xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+        cache_home = Path(xdg_cache_home) if xdg_cache_home else Path.home() / ".cache"
+        return cache_home / cls.XDG_CACHE_DIR_NAME
+
+    @classmethod
+    def is_cache_dir_writable(cls) -> bool:
+        """Check whether persistent caches can be written.
+
+        The cache directory is created if needed. The answer is computed once
+        per directory and process, so callers can check before every write.
+
+        Returns:
+            True if the cache directory exists and is writable
+        """
+        try:
+            cache_dir = cls.get_cache_dir()
+        except RuntimeError:
+            # The home directory cannot be determined
+            return False
+        return _is_directory_writable(cache_dir)
+
+    @classmethod
+    def get_project_cache_key(cls, project_root: Path) -> str:
+        """Return a stable, filesystem-safe key for a project root.
+
+        Args:
+            project_root: Project root directory
+
+        Returns:
+            Short hexadecimal digest of the resolved project root
+        """
+        resolved = str(project_root.resolve())
+        return hashlib.sha256(resolved.encode("utf-8")).hexdigest()[:16]
+
+    @classmethod
+    def get_file_index_path(cls, project_root: Path) -> Path:
+        """Return the file index location for a project root.
+
+        By default this is ``<cache dir>/file_index/<key>.json``.
+
+        Args:
+            project_root: Project root directory
+
+        Returns:
+            Path to the project's file index
+        """
+        return (
+            cls.get_cache_dir()
+            / cls.FILE_INDEX_DIR_NAME
+            / f"{cls.get_project_cache_key(project_root)}.json"
+        )
+
+    @classmethod
+    def get_lint_cache_path(cls, project_root: Path) -> Path:
+        """Return the lint result cache location for a project root.
+
+        By default this is ``<cache dir>/lint_results/<key>.json``.
+
+        Args:
+            project_root: Project root directory
+
+        Returns:
+            Path to the project's lint result cache
+        """
+        return (
+            cls.get_cache_dir()
+            / cls.LINT_CACHE_DIR_NAME
+            / f"{cls.get_project_cache_key(project_root)}.json"
+        )
+
+    @classmethod
+    def get_spell_cache_path(cls, project_root: Path) -> Path:
+        """Return the spell check result cache location for a project root.
+
+        By default this is ``<cache dir>/spell_results/<key>.json``.
+
+        Args:
+            project_root: Project root directory
+
+        Returns:
+            Path to the project's spell check result cache
+        """
+        return (
+            cls.get_cache_dir()
+            / cls.SPELL_CACHE_DIR_NAME
+            / f"{cls.get_project_cache_key(project_root)}.json"
+        )
+
+    @classmethod
+    def get_probe_cache_path(cls) -> Path:
+        """Return the binary probe cache location.
+
+        By default this is ``<cache dir>/probes.json``.
+
+        Returns:
+            Path to the probe cache
+        """
+        return cls.get_cache_dir() / cls.PROBE_CACHE_FILE_NAME
+
+    @classmethod
+    def get_cspell_detection_path(cls) -> Path:
+        """Return the CSpell detection result location.
+
+        By default this is ``<cache dir>/cspell_detection.json``.
+
+        Returns:
+            Path to the CSpell detection result
+        """
+        return cls.get_cache_dir() / cls.CSPELL_DETECTION_FILE_NAME
+
+    @classmethod
+    def get_timings_path(cls, project_root: Path | None) -> Path:
+        """Return the tool timing history location for a project root.
+
+        By default this is ``<cache dir>/timings/<key>.json``, or
+        ``<cache dir>/timings/global.json`` without a project root.
+
+        Args:
+            project_root: Project root directory, or None for global timings
+
+        Returns:
+            Path to the timing history
+        """
+        name = (
+            cls.get_project_cache_key(project_root)
+            if project_root is not None
+            else cls.TIMINGS_GLOBAL_NAME
+        )
+        return cls.get_cache_dir() / cls.TIMINGS_DIR_NAME / f"{name}.json"
+
+
+# ///////////////////////////////////////////////////////////////
+# HELPER FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+@lru_cache(maxsize=4)
+def _is_directory_writable(directory: Path) -> bool:
+    """Create a directory if needed and check that it is writable.
+
+    Args:
+        directory: Directory to check
+
+    Returns:
+        True if the directory exists and is writable
+    """
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return False
+    return os.access(directory, os.W_OK)
+
+
+__all__ = ["CacheConfig"]
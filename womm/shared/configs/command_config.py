@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# COMMAND CONFIG - Command execution configuration for WOMM
+# Project: works-on-my-machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Command execution configuration values.
+
+This config class centralizes the limits used when running external
+commands, so the command runner and the services built on it agree on
+how much output is kept in memory and how long a command may run.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+from dataclasses import dataclass
+from typing import ClassVar
+
+# ///////////////////////////////////////////////////////////////
+# CLASS DEFINITION
+# ///////////////////////////////////////////////////////////////
+
+
+@dataclass(frozen=True)
+class CommandConfig:
+    """Command execution configuration (static, read-only).
+
+    Contains constants for executable lookup, streamed command output,
+    cancellation and timeouts derived from previous run durations.
+    """
+
+    # ///////////////////////////////////////////////////////////
+    # EXECUTABLE LOOKUP
+    # ///////////////////////////////////////////////////////////
+
+    # Minimum seconds between checks that the PATH directories did not
+    # change; PATH itself is compared on every lookup
+    PATH_INDEX_CHECK_INTERVAL: ClassVar[float] = 1.0
+
+    # ///////////////////////////////////////////////////////////
+    # STREAMED OUTPUT
+    # ///////////////////////////////////////////////////////////
+
+    # Characters of each output stream kept in memory before spilling the
+    # rest to a temporary file
+    STREAM_SPOOL_MAX_SIZE: ClassVar[int] = 8 * 1024 * 1024
+
+    # ///////////////////////////////////////////////////////////
+    # CANCELLATION
+    # ///////////////////////////////////////////////////////////
+
+    # Seconds between cancellation checks while a cancellable command runs
+    CANCEL_POLL_INTERVAL: ClassVar[float] = 0.1
+
+    # ///////////////////////////////////////////////////////////
+    # BATCH EXECUTION
+    # ///////////////////////////////////////////////////////////
+
+    # Commands of a batch running at once (most are short probes that spend
+    # their time starting up, not using a CPU)
+    BATCH_CONCURRENCY: ClassVar[int] = 8
+
+    # ///////////////////////////////////////////////////////////
+    # ADAPTIVE TIMEOUTS
+    # ///////////////////////////////////////////////////////////
+
+    # Timeouts are this percentile of previous durations times the
+    # multiplier, once at least TIMING_MIN_SAMPLES durations are known
+    TIMEOUT_PERCENTILE: ClassVar[float] = 95.0
+    TIMEOUT_MULTIPLIER: ClassVar[float] = 3.0
+    TIMING_MIN_SAMPLES: ClassVar[int] = 3
+
+    # Lint tool runs (seconds): default without history, and bounds
+    TOOL_TIMEOUT: ClassVar[float] = 300.0
+    TOOL_TIMEOUT_MIN: ClassVar[float] = 60.0
+    TOOL_TIMEOUT_MAX: ClassVar[float] = 1800.0
+
+    # Version and availability probes (seconds): default without history,
+    # and bounds. Probes are never retried, so a hung executable fails fast
+    PROBE_TIMEOUT: ClassVar[float] = 10.0
+    PROBE_TIMEOUT_MIN: ClassVar[float] = 3.0
+    PROBE_TIMEOUT_MAX: ClassVar[float] = 30.0
+
+
+__all__ = ["CommandConfig"]
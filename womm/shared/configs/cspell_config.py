@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# CSPELL CONFIG - Spell Checking Configuration for WOMM
+# Project: works-on-my-machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Spell checking configuration values.
+
+This config class centralizes the spell checking backends, the CSpell
+configuration files they read, the files handed to CSpell and the settings
+of the built-in Python backend, which checks spelling without Node.js.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+from dataclasses import dataclass
+from pathlib import Path
+from typing import ClassVar
+
+# ///////////////////////////////////////////////////////////////
+# CLASS DEFINITION
+# ///////////////////////////////////////////////////////////////
+
+
+@dataclass(frozen=True)
+class CSpellConfig:
+    """Spell checking configuration (static, read-only).
+
+    Contains backend names, configuration file locations and the
+    settings of the built-in Python backend.
+    """
+
+    # ///////////////////////////////////////////////////////////
+    # BACKENDS
+    # ///////////////////////////////////////////////////////////
+
+    BACKEND_AUTO: ClassVar[str] = "auto"
+    BACKEND_CSPELL: ClassVar[str] = "cspell"
+    BACKEND_PYTHON: ClassVar[str] = "python"
+    BACKENDS: ClassVar[tuple[str, ...]] = (
+        BACKEND_AUTO,
+        BACKEND_CSPELL,
+        BACKEND_PYTHON,
+    )
+
+    # "auto" runs CSpell when it is installed and the Python backend otherwise
+    DEFAULT_BACKEND: ClassVar[str] = BACKEND_AUTO
+
+    # ///////////////////////////////////////////////////////////
+    # CONFIGURATION FILES
+    # ///////////////////////////////////////////////////////////
+
+    GLOBAL_CONFIG_FILE_NAME: ClassVar[str] = "cspell.global.json"
+    REPORTER_FILE_NAME: ClassVar[str] = "cspell_reporter.cjs"
+    PROJECT_CONFIG_FILE_NAME: ClassVar[str] = "cspell.json"
+    DICTIONARY_DIR_NAME: ClassVar[str] = ".cspell-dict"
+
+    # ///////////////////////////////////////////////////////////
+    # CSPELL BACKEND
+    # ///////////////////////////////////////////////////////////
+
+    # Extensions of the files WOMM lists for CSpell when checking a
+    # directory (text, documentation, configuration and source files)
+    SPELL_CHECK_EXTENSIONS: ClassVar[set[str]] = {
+        # Text and documentation
+        ".md",
+        ".mdx",
+        ".rst",
+        ".txt",
+        # Configuration
+        ".cfg",
+        ".ini",
+        ".json",
+        ".toml",
+        ".yaml",
+        ".yml",
+        # Python
+        ".py",
+        ".pyi",
+        # Web
+        ".cjs",
+        ".css",
+        ".html",
+        ".js",
+        ".jsx",
+        ".mjs",
+        ".scss",
+        ".ts",
+        ".tsx",
+        ".vue",
+        # Shell
+        ".bat",
+        ".cmd",
+        ".ps1",
+        ".sh",
+        # Other sources
+        ".c",
+        ".cpp",
+        ".cs",
+        ".go",
+        ".h",
+        ".hpp",
+        ".java",
+        ".kt",
+        ".rb",
+        ".rs",
+        ".swift",
+    }
+
+    # Each CSpell process loads its dictionaries before checking anything,
+    # so a shard should hold enough files to outweigh that start-up cost
+    MIN_FILES_PER_SHARD: ClassVar[int] = 200
+
+    # ///////////////////////////////////////////////////////////
+    # PYTHON BACKEND
+    # ///////////////////////////////////////////////////////////
+
+    # The CSpell language dictionaries ship with Node.js packages; the
+    # Python backend uses the word lists of the system instead
+    SYSTEM_WORD_LISTS: ClassVar[dict[str, tuple[str, ...]]] = {
+        "en": (
+            "/usr/share/dict/words",
+            "/usr/share/dict/american-english",
+            "/usr/share/dict/british-english",
+        ),
+        "fr": ("/usr/share/dict/french",),
+    }
+
+    # CSpell defaults for settings the configuration files do not set
+    DEFAULT_LANGUAGE: ClassVar[str] = "en"
+    DEFAULT_MIN_WORD_LENGTH: ClassVar[int] = 4
+
+    # Text CSpell ignores by default (URLs, e-mails, hexadecimal values,
+    # UUIDs, hashes and encoded data)
+    DEFAULT_IGNORE_PATTERNS: ClassVar[tuple[str, ...]] = (
+        r"(?:https?|ftp)://[^\s\"'<>()]+",
+        r"[\w.%+-]+@[\w.-]+\.[A-Za-z]{2,}",
+        r"\b0x[0-9a-fA-F]+\b",
+        r"#[0-9a-fA-F]{3,8}\b",
+        r"\b[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}\b",
+        r"\b(?=[0-9a-f]*[0-9])(?=[0-9a-f]*[a-f])[0-9a-f]{7,}\b",
+        r"[A-Za-z0-9+/]{40,}={0,2}",
+    )
+
+    # Paths CSpell ignores by default
+    DEFAULT_IGNORE_PATHS: ClassVar[tuple[str, ...]] = (
+        ".git/**",
+        "node_modules/**",
+        "package-lock.json",
+    )
+
+    # Files per worker task; a target that fits in one batch is checked
+    # without starting worker processes
+    FILES_PER_TASK: ClassVar[int] = 32
+
+    # ///////////////////////////////////////////////////////////
+    # PATH METHODS
+    # ///////////////////////////////////////////////////////////
+
+    @classmethod
+    def get_global_config_path(cls) -> Path:
+        """Get the path of the CSpell configuration shipped with WOMM.
+
+        Returns:
+            Path: Path to cspell.global.json
+        """
+        return Path(__file__).parent / cls.GLOBAL_CONFIG_FILE_NAME
+
+    @classmethod
+    def get_reporter_path(cls) -> Path:
+        """Get the path of the JSON lines CSpell reporter shipped with WOMM.
+
+        Returns:
+            Path: Path to cspell_reporter.cjs
+        """
+        return Path(__file__).parent / cls.REPORTER_FILE_NAME
+
+
+__all__ = ["CSpellConfig"]
@@ -0,0 +1,68 @@
+// ///////////////////////////////////////////////////////////////
+// CSPELL REPORTER - Machine-Readable CSpell Reporter for WOMM
+// Project: works-on-my-machine
+// ///////////////////////////////////////////////////////////////
+
+/*
+ * CSpell reporter writing one JSON record per line on standard output,
+ * loaded with `cspell lint --reporter <path of this file>`.
+ *
+ * Records:
+ *   {"type": "issue", "file", "line", "column", "word", "suggestions"}
+ *   {"type": "result", "files", "issues", "errors"}
+ *
+ * File paths are absolute; WOMM makes them relative for display.
+ */
+
+"use strict";
+
+const { fileURLToPath } = require("url");
+
+function toPath(uri) {
+  if (typeof uri !== "string" || !uri.startsWith("file:")) {
+    return uri || "";
+  }
+  try {
+    return fileURLToPath(uri);
+  } catch {
+    return uri;
+  }
+}
+
+function write(record) {
+  process.stdout.write(`${JSON.stringify(record)}\n`);
+}
+
+function getReporter() {
+  return {
+    issue(issue) {
+      const suggestions = issue.suggestionsEx
+        ? issue.suggestionsEx.map((suggestion) => suggestion.word)
+        : issue.suggestions || [];
+      write({
+        type: "issue",
+        file: toPath(issue.uri),
+        line: issue.row,
+        column: issue.col,
+        word: issue.text,
+        suggestions,
+      });
+    },
+    info() {},
+    debug() {},
+    progress() {},
+    error(message, error) {
+      process.stderr.write(`${message}: ${error && error.message}\n`);
+    },
+    result(result) {
+      write({
+        type: "result",
+        files: result.files,
+        issues: result.issues,
+        errors: result.errors,
+      });
+    },
+  };
+}
+
+module.exports = { getReporter };
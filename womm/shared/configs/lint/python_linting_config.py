@@ -11,6 +11,7 @@ This config class exposes constants used by Python linting services:
 - Tool configurations (ruff, black, isort, bandit)
 - Check and fix arguments
 - JSON support flags
+- Fix ordering, check-mode concurrency and file list sharding
 """
 
 from __future__ import annotations
@@ -38,6 +39,8 @@ class PythonLintingConfig:
     TOOLS_CONFIG: ClassVar[dict[str, dict[str, list[str] | bool]]] = {
         "ruff": {
             "check_args": ["check", "--no-fix", "--output-format", "json"],
+            # Same report as one JSON object per line, parsed as it is printed
+            "stream_args": ["check", "--no-fix", "--output-format", "json-lines"],
             "fix_args": ["check", "--fix"],
             "json_support": True,
         },
@@ -58,12 +61,97 @@ class PythonLintingConfig:
         },
     }
 
+    # Configuration files read by each tool; their content is part of the
+    # lint result cache fingerprint (only [tool.<name>] and requires-python
+    # for pyproject.toml)
+    CONFIG_FILES: ClassVar[dict[str, list[str]]] = {
+        "ruff": ["pyproject.toml", "ruff.toml", ".ruff.toml"],
+        "black": ["pyproject.toml"],
+        "isort": ["pyproject.toml", ".isort.cfg", "setup.cfg", "tox.ini"],
+        "bandit": ["pyproject.toml", ".bandit"],
+    }
+
+    # Tools whose JSON report is an object with a "results" list (the others
+    # print a plain list of issues)
+    JSON_REPORT_OBJECT_TOOLS: ClassVar[list[str]] = ["bandit"]
+
     # ///////////////////////////////////////////////////////////
     # FIXABLE TOOLS
     # ///////////////////////////////////////////////////////////
 
     FIXABLE_TOOLS: ClassVar[list[str]] = ["black", "isort"]
 
+    # Fix mode rewrites files in place, so tools run one after another in
+    # this order (isort must run before black)
+    FIX_ORDER: ClassVar[list[str]] = ["ruff", "isort", "black"]
+
+    # ///////////////////////////////////////////////////////////
+    # CONCURRENCY
+    # ///////////////////////////////////////////////////////////
+
+    # Number of tools run concurrently in check mode (1 = sequential)
+    DEFAULT_JOBS: ClassVar[int] = 4
+
+    # Maximum number of files passed to a single tool invocation; longer
+    # lists are split into shards (also capped by the OS argument limit)
+    # that run in parallel
+    MAX_FILES_PER_SHARD: ClassVar[int] = 1000
+
+    # Number of files per worker task in the single-pass fix pipeline
+    FIX_PIPELINE_BATCH_SIZE: ClassVar[int] = 50
+
+    # ///////////////////////////////////////////////////////////
+    # FAST TIER
+    # ///////////////////////////////////////////////////////////
+
+    # Name the built-in ast checks are reported under
+    FAST_TIER_TOOL: ClassVar[str] = "ast"
+
+    # Number of files per worker task; smaller sets are checked in-process
+    FAST_TIER_BATCH_SIZE: ClassVar[int] = 200
+
+    # ///////////////////////////////////////////////////////////
+    # TOOL CONFIGURATION ACCESSORS
+    # ///////////////////////////////////////////////////////////
+
+    @classmethod
+    def get_tool_args(cls, tool_name: str, mode: str) -> list[str]:
+        """Return the arguments of a tool for a run mode.
+
+        Args:
+            tool_name: Name of the tool
+            mode: Run mode (``check``, ``stream`` or ``fix``)
+
+        Returns:
+            list[str]: Arguments (empty if the tool has none for the mode)
+        """
+        args = cls.TOOLS_CONFIG[tool_name].get(f"{mode}_args", [])
+        return list(args) if isinstance(args, list) else []
+
+    @classmethod
+    def has_stream_args(cls, tool_name: str) -> bool:
+        """Check whether a tool can report issues as JSON lines.
+
+        Args:
+            tool_name: Name of the tool
+
+        Returns:
+            bool: True if the tool has ``stream_args``
+        """
+        return "stream_args" in cls.TOOLS_CONFIG[tool_name]
+
+    @classmethod
+    def has_json_support(cls, tool_name: str) -> bool:
+        """Check whether a tool prints a JSON report in check mode.
+
+        Args:
+            tool_name: Name of the tool
+
+        Returns:
+            bool: True if the tool's check output is JSON
+        """
+        return cls.TOOLS_CONFIG[tool_name].get("json_support") is True
+
 
 # ///////////////////////////////////////////////////////////////
 # PUBLIC API
@@ -77,6 +77,9 @@ class FileScannerConfig:
         "token",
     ]
 
+    # Number of discovered files validated together by the security filter
+    SECURITY_FILTER_BATCH_SIZE: ClassVar[int] = 256
+
 
 # ///////////////////////////////////////////////////////////////
 # SECURITY PATTERNS CONFIG CLASS
@@ -57,6 +57,7 @@ from .project_results import (
 )
 from .security_results import (
     CommandValidationResult,
+    PathBatchValidationResult,
     PathValidationResult,
     SecurityReportResult,
     SecurityResult,
@@ -106,6 +107,7 @@ __all__ = [
     "PackageManagerAvailabilityResult",
     "PackageManagerPlatformResult",
     "PackageManagerResult",
+    "PathBatchValidationResult",
     "PathOperationResult",
     "PathValidationResult",
     "PrerequisitesCheckResult",
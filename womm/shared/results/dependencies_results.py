@@ -171,6 +171,8 @@ class DevToolAvailabilityResult(BaseResult):
     tool_name: str = ""
     is_available: bool = False
     language: str = ""
+    # Resolved executable; None if unavailable or only reachable through npx
+    path: str | None = None
 
 
 # ///////////////////////////////////////////////////////////////
@@ -91,6 +91,27 @@ class PathValidationResult(BaseResult):
     validation_reason: str = ""
 
 
+# ///////////////////////////////////////////////////////////////
+# PATH BATCH VALIDATION RESULT
+# ///////////////////////////////////////////////////////////////
+
+
+@dataclass
+class PathBatchValidationResult(BaseResult):
+    """Result for security validation of many paths at once."""
+
+    base_dir: str = ""
+    valid_paths: list[str] | None = None
+    rejected_paths: dict[str, str] | None = None  # path -> validation reason
+
+    def __post_init__(self) -> None:
+        """Initialize derived fields."""
+        if self.valid_paths is None:
+            self.valid_paths = []
+        if self.rejected_paths is None:
+            self.rejected_paths = {}
+
+
 # ///////////////////////////////////////////////////////////////
 # SECURITY REPORT RESULT
 # ///////////////////////////////////////////////////////////////
@@ -121,6 +142,7 @@ class SecurityReportResult(BaseResult):
 
 __all__ = [
     "CommandValidationResult",
+    "PathBatchValidationResult",
     "PathValidationResult",
     "SecurityReportResult",
     "SecurityResult",
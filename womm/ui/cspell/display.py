@@ -31,7 +31,7 @@ from ..common.ezpl_bridge import ezconsole, ezprinter
 # ///////////////////////////////////////////////////////////////
 
 
-def display_spell_issues_table(issues: list[dict[str, str | int]]) -> None:
+def display_spell_issues_table(issues: list[dict[str, Any]]) -> None:
     """
     Display spell check issues in a Rich table format.
 
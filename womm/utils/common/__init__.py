@@ -8,8 +8,13 @@
 Common pure utility functions for Works On My Machine.
 
 This package contains stateless utility functions shared across the codebase:
-- File scanning utilities (Python detection, path exclusion)
+- File scanning utilities (Python detection, path exclusion, pruned walking)
+- File index utilities (persistent incremental scanning)
+- Path index utilities (indexed executable lookup)
 - Path resolution utilities (project root, assets, scripts)
+- Process group utilities (cancellable child processes)
+- Probe cache utilities (binary fingerprinting)
+- Timing history utilities (scheduling and adaptive timeouts)
 """
 
 from __future__ import annotations
@@ -18,10 +23,28 @@ from __future__ import annotations
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
 # Local imports
+from .file_index_utils import (
+    get_scanner_fingerprint,
+    load_file_index,
+    save_file_index,
+    walk_python_files_indexed,
+)
 from .file_scanner_utils import (
     contains_security_sensitive_pattern,
     is_python_file,
+    iter_python_files_parallel,
+    scan_directory_entries,
     should_exclude_path,
+    walk_python_files,
+    walk_python_files_parallel,
+)
+from .path_index_utils import (
+    build_path_index,
+    get_directory_mtimes,
+    get_executable_extensions,
+    get_path_directories,
+    is_executable_file,
+    lookup_executable,
 )
 from .path_resolver_utils import (
     get_assets_module_path,
@@ -32,20 +55,59 @@ from .path_resolver_utils import (
     resolve_script_path,
     validate_script_exists,
 )
+from .probe_cache_utils import (
+    get_binary_fingerprint,
+    get_path_fingerprint,
+    is_probe_entry_valid,
+    load_probe_cache,
+    save_probe_cache,
+)
+from .process_utils import get_process_group_options, kill_process_tree
+from .timing_utils import (
+    compute_timeout,
+    get_percentile,
+    load_timings,
+    save_timings,
+)
 
 # ///////////////////////////////////////////////////////////////
 # PUBLIC API
 # ///////////////////////////////////////////////////////////////
 
 __all__ = [
+    "build_path_index",
+    "compute_timeout",
     "contains_security_sensitive_pattern",
     "get_assets_module_path",
     "get_bin_module_path",
+    "get_binary_fingerprint",
+    "get_directory_mtimes",
+    "get_executable_extensions",
+    "get_path_directories",
+    "get_path_fingerprint",
+    "get_percentile",
+    "get_process_group_options",
     "get_project_root",
+    "get_scanner_fingerprint",
     "get_shared_module_path",
+    "is_executable_file",
     "is_pip_installation",
+    "is_probe_entry_valid",
     "is_python_file",
+    "iter_python_files_parallel",
+    "kill_process_tree",
+    "load_file_index",
+    "load_probe_cache",
+    "load_timings",
+    "lookup_executable",
     "resolve_script_path",
+    "save_file_index",
+    "save_probe_cache",
+    "save_timings",
+    "scan_directory_entries",
     "should_exclude_path",
     "validate_script_exists",
+    "walk_python_files",
+    "walk_python_files_indexed",
+    "walk_python_files_parallel",
 ]
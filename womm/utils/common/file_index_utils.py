@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# FILE INDEX UTILS - Incremental File Index Utilities
+# Project: works-on-my-machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Pure utility functions for the persistent file index.
+
+The index records, for every scanned directory, its modification time and
+the Python files and subdirectories it contained. A directory's mtime changes
+whenever an entry is added, removed or renamed in it, so unchanged
+directories can be reused from the index without being listed again.
+
+This module provides stateless functions for:
+- Scanner configuration fingerprinting
+- Index loading and atomic saving
+- Index-assisted directory walking
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import hashlib
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Any
+
+# Local imports
+from ...shared.configs.security import FileScannerConfig
+from .file_scanner_utils import scan_directory_entries, should_exclude_path
+
+# ///////////////////////////////////////////////////////////////
+# FINGERPRINT FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def get_scanner_fingerprint(version: int) -> str:
+    """Compute a fingerprint of the file scanner configuration.
+
+    Any change to excluded directories or Python extensions yields a
+    different fingerprint, which invalidates existing indexes.
+
+    Args:
+        version: Index format version
+
+    Returns:
+        str: Hexadecimal fingerprint
+    """
+    payload = json.dumps(
+        {
+            "version": version,
+            "excluded_dirs": sorted(FileScannerConfig.EXCLUDED_DIRS),
+            "extensions": sorted(FileScannerConfig.PYTHON_EXTENSIONS),
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# ///////////////////////////////////////////////////////////////
+# PERSISTENCE FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def load_file_index(index_path: Path, fingerprint: str) -> dict[str, Any]:
+    """Load directory entries from an index file.
+
+    Args:
+        index_path: Index file location
+        fingerprint: Expected scanner fingerprint
+
+    Returns:
+        dict[str, Any]: Directory entries keyed by relative path, or an empty
+        dict if the index is missing, unreadable or stale
+    """
+    try:
+        with index_path.open(encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or data.get("fingerprint") != fingerprint:
+        return {}
+
+    directories = data.get("directories")
+    return directories if isinstance(directories, dict) else {}
+
+
+def save_file_index(
+    index_path: Path, fingerprint: str, root: Path, directories: dict[str, Any]
+) -> None:
+    """Atomically write directory entries to an index file.
+
+    Args:
+        index_path: Index file location
+        fingerprint: Scanner fingerprint the entries were built with
+        root: Project root the entries are relative to
+        directories: Directory entries keyed by relative path
+
+    Raises:
+        OSError: If the index cannot be written
+    """
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "fingerprint": fingerprint,
+        "root": str(root),
+        "directories": directories,
+    }
+
+    fd, tmp_name = tempfile.mkstemp(
+        dir=index_path.parent, prefix=f".{index_path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, separators=(",", ":"))
+        os.replace(tmp_name, index_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+# ///////////////////////////////////////////////////////////////
+# INDEXED WALK FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def walk_python_files_indexed(
+    root: Path, cached: dict[str, Any], racy_window: float, workers: int = 1
+) -> tuple[list[Path], dict[str, Any], int]:
+    """Walk a directory tree, reusing index entries for unchanged directories.
+
+    Each directory still costs one ``stat`` call, but only directories whose
+    mtime differs from the index are listed again. Directories modified
+    within ``racy_window`` seconds of the scan are stored without an mtime so
+    that changes made in the same timestamp tick are picked up next time.
+
+    With several ``workers``, directories are checked and listed by a pool
+    of threads, as in ``walk_python_files_parallel``, and files are sorted.
+
+    Args:
+        root: Directory to walk
+        cached: Directory entries from a previous index (may be empty)
+        racy_window: Seconds during which a fresh mtime is not trusted
+        workers: Number of threads checking directories (1 = serial walk)
+
+    Returns:
+        tuple: Python files found, updated directory entries, and the number
+        of directories that had to be listed
+
+    Raises:
+        OSError: If ``root`` itself cannot be read
+    """
+    python_files: list[Path] = []
+    directories: dict[str, Any] = {}
+    listed = 0
+
+    if should_exclude_path(root):
+        return python_files, directories, listed
+
+    root_str = os.fspath(root)
+    racy_threshold_ns = int((time.time() - racy_window) * 1e9)
+
+    def add_directory(
+        rel: str, result: tuple[int, list[str], list[str], bool]
+    ) -> list[str]:
+        nonlocal listed
+        mtime_ns, files, subdirs, relisted = result
+        listed += relisted
+        directories[rel] = {
+            "mtime_ns": mtime_ns if mtime_ns < racy_threshold_ns else None,
+            "files": files,
+            "subdirs": subdirs,
+        }
+        current = os.path.join(root_str, rel) if rel else root_str
+        python_files.extend(Path(os.path.join(current, name)) for name in files)
+        return [os.path.join(rel, name) if rel else name for name in subdirs]
+
+    if workers <= 1:
+        pending = [""]
+        while pending:
+            rel = pending.pop()
+            try:
+                result = _index_directory(root_str, rel, cached.get(rel))
+            except OSError:
+                if not rel:
+                    raise
+                continue
+            # Reverse so subdirectories are visited in listing order
+            pending.extend(reversed(add_directory(rel, result)))
+        return python_files, directories, listed
+
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="womm-scan"
+    ) as executor:
+        queued: dict[Future[tuple[int, list[str], list[str], bool]], str] = {
+            executor.submit(_index_directory, root_str, "", cached.get("")): ""
+        }
+        while queued:
+            done, _ = wait(queued, return_when=FIRST_COMPLETED)
+            for future in done:
+                rel = queued.pop(future)
+                try:
+                    result = future.result()
+                except OSError:
+                    if not rel:
+                        raise
+                    continue
+                for subdir in add_directory(rel, result):
+                    queued[
+                        executor.submit(
+                            _index_directory, root_str, subdir, cached.get(subdir)
+                        )
+                    ] = subdir
+
+    python_files.sort()
+    return python_files, directories, listed
+
+
+def _index_directory(
+    root_str: str, rel: str, entry: dict[str, Any] | None
+) -> tuple[int, list[str], list[str], bool]:
+    """Check one directory against its index entry, listing it if it changed.
+
+    Args:
+        root_str: Walked root directory
+        rel: Directory path relative to the root ("" for the root)
+        entry: Index entry of the directory, if any
+
+    Returns:
+        tuple: Directory mtime (ns), Python file names, subdirectory names,
+        and whether the directory had to be listed
+
+    Raises:
+        OSError: If the directory cannot be read
+    """
+    current = os.path.join(root_str, rel) if rel else root_str
+    mtime_ns = os.stat(current).st_mtime_ns
+    if entry is not None and entry.get("mtime_ns") == mtime_ns:
+        return mtime_ns, entry["files"], entry["subdirs"], False
+    files, subdirs = scan_directory_entries(current)
+    return mtime_ns, files, subdirs, True
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = [
+    "get_scanner_fingerprint",
+    "load_file_index",
+    "save_file_index",
+    "walk_python_files_indexed",
+]
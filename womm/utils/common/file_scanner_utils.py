@@ -11,6 +11,7 @@ This module provides stateless functions for:
 - Python file detection
 - Path exclusion checking
 - File extension validation
+- Pruned directory walking (serial and threaded)
 """
 
 from __future__ import annotations
@@ -19,6 +20,11 @@ from __future__ import annotations
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
 # Standard library imports
+import os
+import re
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import lru_cache
 from pathlib import Path
 
 # Local imports
@@ -74,11 +80,217 @@ def should_exclude_path(path: Path) -> bool:
         return True
 
 
+# ///////////////////////////////////////////////////////////////
+# DIRECTORY WALKING FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def scan_directory_entries(
+    directory: str, extensions: set[str] | None = None
+) -> tuple[list[str], list[str]]:
+    """List one directory, splitting Python files from subdirectories.
+
+    Excluded names are dropped before any type check. File type checks use
+    the ``os.DirEntry`` cache, avoiding a ``stat`` call per entry on most
+    platforms. Symlinked directories are not reported as subdirectories,
+    matching ``Path.rglob`` behaviour.
+
+    Args:
+        directory: Directory to list
+        extensions: Lower-case file extensions to report (default:
+            ``FileScannerConfig.PYTHON_EXTENSIONS``)
+
+    Returns:
+        tuple[list[str], list[str]]: Matching file names and subdirectory
+        names, in listing order
+
+    Raises:
+        OSError: If the directory cannot be listed
+    """
+    excluded_dirs = FileScannerConfig.EXCLUDED_DIRS
+    if extensions is None:
+        extensions = FileScannerConfig.PYTHON_EXTENSIONS
+    files: list[str] = []
+    subdirs: list[str] = []
+
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name in excluded_dirs:
+                continue
+
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.name)
+                elif (
+                    os.path.splitext(entry.name)[1].lower() in extensions
+                    and entry.is_file()
+                ):
+                    files.append(entry.name)
+            except OSError:
+                # Entry vanished or is unreadable - skip it
+                continue
+
+    return files, subdirs
+
+
+def walk_python_files(
+    root: Path, recursive: bool = True, extensions: set[str] | None = None
+) -> Iterator[Path]:
+    """Walk a directory and yield Python files, pruning excluded directories.
+
+    Excluded directories are skipped before descending, so their content is
+    never listed.
+
+    Args:
+        root: Directory to walk
+        recursive: Whether to descend into subdirectories
+        extensions: Lower-case file extensions to yield instead of the
+            Python ones
+
+    Yields:
+        Path: Python files (or files with ``extensions``) found under ``root``
+
+    Raises:
+        OSError: If ``root`` itself cannot be listed
+    """
+    # Ancestors of the root count as path parts too (see should_exclude_path)
+    if should_exclude_path(root):
+        return
+
+    root_str = os.fspath(root)
+    pending = [root_str]
+
+    while pending:
+        current = pending.pop()
+        try:
+            files, subdirs = scan_directory_entries(current, extensions)
+        except OSError:
+            # Only the root directory is mandatory, subdirectories are best-effort
+            if current == root_str:
+                raise
+            continue
+
+        for name in files:
+            yield Path(os.path.join(current, name))
+
+        if recursive:
+            # Reverse so subdirectories are visited in listing order
+            pending.extend(os.path.join(current, name) for name in reversed(subdirs))
+
+
+def walk_python_files_parallel(
+    root: Path,
+    recursive: bool = True,
+    workers: int = 4,
+    extensions: set[str] | None = None,
+) -> list[Path]:
+    """Walk a directory with a pool of threads listing directories concurrently.
+
+    Intended for latency-bound filesystems (NFS, SMB) where each directory
+    listing waits on the network. Results are sorted so the output does not
+    depend on thread scheduling.
+
+    Args:
+        root: Directory to walk
+        recursive: Whether to descend into subdirectories
+        workers: Maximum number of concurrent directory listings
+        extensions: Lower-case file extensions to return instead of the
+            Python ones
+
+    Returns:
+        list[Path]: Python files (or files with ``extensions``) found under
+        ``root``, sorted
+
+    Raises:
+        OSError: If ``root`` itself cannot be listed
+    """
+    return sorted(iter_python_files_parallel(root, recursive, workers, extensions))
+
+
+def iter_python_files_parallel(
+    root: Path,
+    recursive: bool = True,
+    workers: int = 4,
+    extensions: set[str] | None = None,
+) -> Iterator[Path]:
+    """Walk a directory with a pool of threads, yielding files as they are found.
+
+    Subdirectories are queued as soon as their parent is listed, and the
+    files of each directory are yielded as soon as its listing completes, so
+    their order depends on thread scheduling. Listings still queued are
+    cancelled if the iteration stops early.
+
+    Args:
+        root: Directory to walk
+        recursive: Whether to descend into subdirectories
+        workers: Maximum number of concurrent directory listings
+        extensions: Lower-case file extensions to yield instead of the
+            Python ones
+
+    Yields:
+        Path: Python files (or files with ``extensions``) found under ``root``
+
+    Raises:
+        OSError: If ``root`` itself cannot be listed
+    """
+    if should_exclude_path(root):
+        return
+
+    root_str = os.fspath(root)
+
+    with ThreadPoolExecutor(
+        max_workers=max(1, workers), thread_name_prefix="womm-scan"
+    ) as executor:
+        pending: dict[Future[tuple[list[str], list[str]]], str] = {
+            executor.submit(scan_directory_entries, root_str, extensions): root_str
+        }
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    current = pending.pop(future)
+                    try:
+                        files, subdirs = future.result()
+                    except OSError:
+                        # Only the root directory is mandatory
+                        if current == root_str:
+                            raise
+                        continue
+
+                    if recursive:
+                        for name in subdirs:
+                            subdir = os.path.join(current, name)
+                            pending[
+                                executor.submit(
+                                    scan_directory_entries, subdir, extensions
+                                )
+                            ] = subdir
+
+                    for name in files:
+                        yield Path(os.path.join(current, name))
+        finally:
+            for future in pending:
+                future.cancel()
+
+
 # ///////////////////////////////////////////////////////////////
 # SECURITY PATTERN FUNCTIONS
 # ///////////////////////////////////////////////////////////////
 
 
+@lru_cache(maxsize=8)
+def _compile_literal_patterns(patterns: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile literal substrings into a single alternation.
+
+    Args:
+        patterns: Literal substrings
+
+    Returns:
+        re.Pattern[str]: Compiled pattern (never matches if empty)
+    """
+    return re.compile("|".join(re.escape(pattern) for pattern in patterns) or r"(?!)")
+
+
 def contains_security_sensitive_pattern(file_path: Path | str) -> bool:
     """Check if a file path contains security-sensitive patterns.
 
@@ -89,11 +301,10 @@ def contains_security_sensitive_pattern(file_path: Path | str) -> bool:
         bool: True if path contains security-sensitive patterns, False otherwise
     """
     try:
-        file_str = str(file_path).lower()
-        return any(
-            pattern in file_str
-            for pattern in FileScannerConfig.SECURITY_SENSITIVE_PATTERNS
+        matcher = _compile_literal_patterns(
+            tuple(FileScannerConfig.SECURITY_SENSITIVE_PATTERNS)
         )
+        return matcher.search(str(file_path).lower()) is not None
     except Exception:
         # Return False on error - conservative approach
         return False
@@ -106,5 +317,9 @@ def contains_security_sensitive_pattern(file_path: Path | str) -> bool:
 __all__ = [
     "contains_security_sensitive_pattern",
     "is_python_file",
+    "iter_python_files_parallel",
+    "scan_directory_entries",
     "should_exclude_path",
+    "walk_python_files",
+    "walk_python_files_parallel",
 ]
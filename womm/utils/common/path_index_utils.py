@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# PATH INDEX UTILS - Executable Search Path Index Utilities
+# Project: works-on-my-machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Pure utility functions for the executable search path index.
+
+``shutil.which`` splits ``PATH`` and stats every candidate in every
+directory on each call. The index lists each ``PATH`` directory once and
+maps file names to the directories containing them, so a lookup only
+checks the few files that actually exist, in the order ``shutil.which``
+would have found them.
+
+This module provides stateless functions for:
+- PATH directory and PATHEXT extension listing
+- Index building and change detection
+- Executable lookup
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import os
+
+# ///////////////////////////////////////////////////////////////
+# SEARCH PATH FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def get_path_directories(path: str) -> list[str]:
+    """List the directories searched for executables, like ``shutil.which``.
+
+    Args:
+        path: Value of the ``PATH`` environment variable
+
+    Returns:
+        list[str]: Absolute directories in search order, without duplicates
+        (the current directory comes first on Windows)
+    """
+    entries = path.split(os.pathsep) if path else []
+    if os.name == "nt" and "NoDefaultCurrentDirectoryInExePath" not in os.environ:
+        entries.insert(0, os.curdir)
+
+    directories: list[str] = []
+    seen: set[str] = set()
+    for entry in entries:
+        directory = os.path.abspath(entry or os.curdir)
+        key = os.path.normcase(directory)
+        if key not in seen:
+            seen.add(key)
+            directories.append(directory)
+    return directories
+
+
+def get_executable_extensions() -> list[str]:
+    """List the extensions that make a file executable.
+
+    Returns:
+        list[str]: Lower-case ``PATHEXT`` extensions on Windows, empty
+        elsewhere
+    """
+    if os.name != "nt":
+        return []
+    pathext = os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD")
+    return [ext.lower() for ext in pathext.split(os.pathsep) if ext]
+
+
+def get_directory_mtimes(directories: list[str]) -> list[int | None]:
+    """Return the modification times of directories.
+
+    Args:
+        directories: Directories to stat
+
+    Returns:
+        list[int | None]: Modification time (ns) of each directory, or None
+        for directories that cannot be read
+    """
+    mtimes: list[int | None] = []
+    for directory in directories:
+        try:
+            mtimes.append(os.stat(directory).st_mtime_ns)
+        except OSError:
+            mtimes.append(None)
+    return mtimes
+
+
+# ///////////////////////////////////////////////////////////////
+# INDEX FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def build_path_index(directories: list[str]) -> dict[str, list[tuple[int, str]]]:
+    """Map the file names of directories to where they are found.
+
+    Args:
+        directories: Directories in search order
+
+    Returns:
+        dict[str, list[tuple[int, str]]]: Search position and full path of
+        every file with a given name, keyed by normalized name (case-folded
+        on Windows), first match first
+    """
+    index: dict[str, list[tuple[int, str]]] = {}
+    for position, directory in enumerate(directories):
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    index.setdefault(os.path.normcase(entry.name), []).append(
+                        (position, entry.path)
+                    )
+        except OSError:
+            continue
+    return index
+
+
+def is_executable_file(path: str) -> bool:
+    """Check a candidate the way ``shutil.which`` does.
+
+    Args:
+        path: Candidate path
+
+    Returns:
+        bool: True if the path exists, is executable and is not a directory
+    """
+    return (
+        os.path.exists(path)
+        and os.access(path, os.F_OK | os.X_OK)
+        and not os.path.isdir(path)
+    )
+
+
+def lookup_executable(
+    index: dict[str, list[tuple[int, str]]], command: str, extensions: list[str]
+) -> str | None:
+    """Find the executable a bare command name resolves to.
+
+    Args:
+        index: Index built by ``build_path_index``
+        command: Command name without directory
+        extensions: Executable extensions (``get_executable_extensions``)
+
+    Returns:
+        str | None: Full path of the first executable match in search order,
+        or None if there is none
+    """
+    if not extensions or os.path.splitext(command)[1].lower() in extensions:
+        names = [command]
+    else:
+        names = [command + ext for ext in extensions]
+
+    # Directory order first, then extension order, as shutil.which
+    candidates = sorted(
+        (position, order, path)
+        for order, name in enumerate(names)
+        for position, path in index.get(os.path.normcase(name), ())
+    )
+    for _, _, path in candidates:
+        if is_executable_file(path):
+            return path
+    return None
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = [
+    "build_path_index",
+    "get_directory_mtimes",
+    "get_executable_extensions",
+    "get_path_directories",
+    "is_executable_file",
+    "lookup_executable",
+]
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# PROBE CACHE UTILS - Binary Probe Cache Utilities
+# Project: works-on-my-machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Pure utility functions for the persistent binary probe cache.
+
+The output of a probe such as ``node --version`` only changes when the
+binary does. A probe result is stored with the fingerprint of the binary
+it ran (resolved path, inode, size and modification time) and of the
+``PATH`` it was resolved from, and reused until either changes or the
+entry expires.
+
+This module provides stateless functions for:
+- Binary and PATH fingerprinting
+- Cache loading and atomic saving
+- Entry validation
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+# ///////////////////////////////////////////////////////////////
+# FINGERPRINT FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def get_binary_fingerprint(executable_path: str) -> list[Any] | None:
+    """Fingerprint a binary.
+
+    Args:
+        executable_path: Path of the executable, as resolved on PATH
+
+    Returns:
+        list[Any] | None: Real path, inode, size and modification time (ns),
+        or None if the executable cannot be read
+    """
+    try:
+        stat = os.stat(executable_path)
+    except OSError:
+        return None
+    return [
+        os.path.realpath(executable_path),
+        stat.st_ino,
+        stat.st_size,
+        stat.st_mtime_ns,
+    ]
+
+
+def get_path_fingerprint() -> str:
+    """Fingerprint the executable search path.
+
+    Returns:
+        str: Digest of ``PATH`` (and ``PATHEXT`` on Windows)
+    """
+    raw = f"{os.environ.get('PATH', '')}\0{os.environ.get('PATHEXT', '')}"
+    return hashlib.sha256(raw.encode("utf-8", errors="replace")).hexdigest()[:16]
+
+
+def is_probe_entry_valid(
+    entry: Any,
+    binary_fingerprint: list[Any],
+    path_fingerprint: str,
+    now: float,
+    ttl: float,
+) -> bool:
+    """Check whether a cached probe result can be reused.
+
+    Args:
+        entry: Cached entry
+        binary_fingerprint: Current fingerprint of the probed binary
+        path_fingerprint: Current fingerprint of ``PATH``
+        now: Current time (seconds since the epoch)
+        ttl: Maximum entry age in seconds
+
+    Returns:
+        bool: True if the entry is well-formed, recent and was recorded for
+        the same binary and ``PATH``
+    """
+    return (
+        isinstance(entry, dict)
+        and entry.get("binary") == binary_fingerprint
+        and entry.get("path") == path_fingerprint
+        and isinstance(entry.get("time"), (int, float))
+        and 0 <= now - entry["time"] <= ttl
+        and isinstance(entry.get("returncode"), int)
+    )
+
+
+# ///////////////////////////////////////////////////////////////
+# STORAGE FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def load_probe_cache(cache_path: Path, cache_version: int) -> dict[str, Any]:
+    """Load probe cache entries, oldest first.
+
+    Args:
+        cache_path: Cache file location
+        cache_version: Expected cache format version
+
+    Returns:
+        dict[str, Any]: Entries keyed by probe key, or an empty dict if the
+        cache is missing, unreadable or from another format version
+    """
+    try:
+        with cache_path.open(encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or data.get("version") != cache_version:
+        return {}
+
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def save_probe_cache(
+    cache_path: Path, cache_version: int, entries: dict[str, Any]
+) -> None:
+    """Atomically write probe cache entries.
+
+    Args:
+        cache_path: Cache file location
+        cache_version: Cache format version
+        entries: Entries keyed by probe key, oldest first
+
+    Raises:
+        OSError: If the cache cannot be written
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"version": cache_version, "entries": entries}
+
+    fd, tmp_name = tempfile.mkstemp(
+        dir=cache_path.parent, prefix=f".{cache_path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, separators=(",", ":"))
+        os.replace(tmp_name, cache_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = [
+    "get_binary_fingerprint",
+    "get_path_fingerprint",
+    "is_probe_entry_valid",
+    "load_probe_cache",
+    "save_probe_cache",
+]
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# PROCESS UTILS - Child Process Group Utilities
+# Project: works-on-my-machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Child process group utilities for Works On My Machine.
+
+Tools such as black and cspell (through npx) start processes of their
+own. Killing only the tool's process leaves those running, so cancellable
+commands are started in a process group of their own and the whole group
+is killed when they are cancelled.
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import os
+import signal
+import subprocess
+from typing import Any
+
+# ///////////////////////////////////////////////////////////////
+# PROCESS GROUP FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def get_process_group_options() -> dict[str, Any]:
+    """Return ``subprocess.Popen`` options starting a new process group.
+
+    Returns:
+        dict[str, Any]: Platform-specific Popen keyword arguments
+    """
+    if os.name == "nt":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+def kill_process_tree(process: subprocess.Popen[Any]) -> None:
+    """Kill a process started with ``get_process_group_options`` and its children.
+
+    Errors are ignored: the processes may already have exited.
+
+    Args:
+        process: Process to kill
+    """
+    if os.name == "nt":
+        if process.poll() is None:
+            taskkill = os.path.join(
+                os.environ.get("SYSTEMROOT", r"C:\Windows"), "System32", "taskkill.exe"
+            )
+            result = subprocess.run(
+                [taskkill, "/F", "/T", "/PID", str(process.pid)],
+                capture_output=True,
+                check=False,
+            )
+            if result.returncode != 0:
+                process.kill()
+        return
+
+    try:
+        # The group outlives its leader while children are still running
+        os.killpg(process.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        if process.poll() is None:
+            process.kill()
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = ["get_process_group_options", "kill_process_tree"]
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# TIMING UTILS - Tool Timing History Utilities
+# Project: works-on-my-machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Pure utility functions for the tool timing history.
+
+Recorded wall times of previous runs are used to start the slowest work
+first and to derive timeouts that fit the project, instead of one fixed
+timeout that is either too short for large projects or far too long for
+a hung executable.
+
+This module provides stateless functions for:
+- Timing history loading and atomic saving
+- Percentile and timeout computation
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import json
+import math
+import os
+import tempfile
+from pathlib import Path
+
+# ///////////////////////////////////////////////////////////////
+# STORAGE FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def load_timings(timings_path: Path, timings_version: int) -> dict[str, list[float]]:
+    """Load a timing history.
+
+    Args:
+        timings_path: Timing history location
+        timings_version: Expected format version
+
+    Returns:
+        dict[str, list[float]]: Durations in seconds per key, oldest first, or
+        an empty dict if the history is missing, unreadable or from another
+        format version
+    """
+    try:
+        with timings_path.open(encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or data.get("version") != timings_version:
+        return {}
+
+    samples = data.get("samples")
+    if not isinstance(samples, dict):
+        return {}
+    return {
+        key: [float(value) for value in values if isinstance(value, (int, float))]
+        for key, values in samples.items()
+        if isinstance(values, list)
+    }
+
+
+def save_timings(
+    timings_path: Path, timings_version: int, samples: dict[str, list[float]]
+) -> None:
+    """Atomically write a timing history.
+
+    Args:
+        timings_path: Timing history location
+        timings_version: Format version
+        samples: Durations in seconds per key, oldest first
+
+    Raises:
+        OSError: If the history cannot be written
+    """
+    timings_path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"version": timings_version, "samples": samples}
+
+    fd, tmp_name = tempfile.mkstemp(
+        dir=timings_path.parent, prefix=f".{timings_path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, separators=(",", ":"))
+        os.replace(tmp_name, timings_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+# ///////////////////////////////////////////////////////////////
+# COMPUTATION FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def get_percentile(samples: list[float], percentile: float) -> float:
+    """Return a percentile of durations (nearest-rank method).
+
+    Args:
+        samples: Durations, in any order (must not be empty)
+        percentile: Percentile between 0 and 100
+
+    Returns:
+        float: Smallest duration that at least ``percentile`` percent of the
+        durations do not exceed
+    """
+    ordered = sorted(samples)
+    rank = math.ceil(percentile / 100 * len(ordered))
+    return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+
+def compute_timeout(
+    samples: list[float],
+    default: float,
+    minimum: float,
+    maximum: float,
+    percentile: float,
+    multiplier: float,
+    min_samples: int,
+) -> float:
+    """Derive a timeout from previous durations.
+
+    Args:
+        samples: Previous durations in seconds
+        default: Timeout used while fewer than ``min_samples`` are known
+        minimum: Lower bound of derived timeouts
+        maximum: Upper bound of derived timeouts
+        percentile: Percentile of the durations the timeout is based on
+        multiplier: Headroom applied to that percentile
+        min_samples: Durations needed before the history is trusted
+
+    Returns:
+        float: Timeout in seconds
+    """
+    if len(samples) < min_samples:
+        return default
+    timeout = get_percentile(samples, percentile) * multiplier
+    return min(max(timeout, minimum), maximum)
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = ["compute_timeout", "get_percentile", "load_timings", "save_timings"]
@@ -17,20 +17,92 @@ from __future__ import annotations
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
 # Local imports
+from .cspell_detection_utils import (
+    find_cspell_executable,
+    get_directory_states,
+    get_global_bin_dirs,
+    get_local_bin_dirs,
+    is_cspell_detection_valid,
+    load_cspell_detection,
+    save_cspell_detection,
+)
 from .cspell_utils import (
     export_spell_results_to_json,
     format_dictionary_info,
     format_project_status,
     format_spell_check_results,
 )
+from .native_spell_utils import (
+    build_spell_settings,
+    check_spell_files,
+    check_spell_files_in_worker,
+    check_text,
+    collect_spell_files,
+    compile_glob,
+    compile_ignore_regex,
+    find_cspell_config,
+    get_report_name,
+    init_spell_worker,
+    is_ignored_path,
+    is_known_word,
+    iter_words,
+    load_cspell_config,
+    load_word_list,
+    merge_cspell_configs,
+    normalize_word,
+    normalize_words,
+    split_camel_case,
+)
+from .spell_cache_utils import (
+    build_word_index,
+    get_dictionary_fingerprint,
+    get_dictionary_words,
+    get_invalidated_files,
+    get_settings_fingerprint,
+    load_spell_cache,
+    save_spell_cache,
+)
 
 # ///////////////////////////////////////////////////////////////
 # PUBLIC API
 # ///////////////////////////////////////////////////////////////
 
 __all__ = [
+    "build_spell_settings",
+    "build_word_index",
+    "check_spell_files",
+    "check_spell_files_in_worker",
+    "check_text",
+    "collect_spell_files",
+    "compile_glob",
+    "compile_ignore_regex",
     "export_spell_results_to_json",
+    "find_cspell_config",
+    "find_cspell_executable",
     "format_dictionary_info",
     "format_project_status",
     "format_spell_check_results",
+    "get_dictionary_fingerprint",
+    "get_dictionary_words",
+    "get_directory_states",
+    "get_global_bin_dirs",
+    "get_invalidated_files",
+    "get_local_bin_dirs",
+    "get_report_name",
+    "get_settings_fingerprint",
+    "init_spell_worker",
+    "is_cspell_detection_valid",
+    "is_ignored_path",
+    "is_known_word",
+    "iter_words",
+    "load_cspell_config",
+    "load_cspell_detection",
+    "load_spell_cache",
+    "load_word_list",
+    "merge_cspell_configs",
+    "normalize_word",
+    "normalize_words",
+    "save_cspell_detection",
+    "save_spell_cache",
+    "split_camel_case",
 ]
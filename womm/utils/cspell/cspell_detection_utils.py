@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# CSPELL DETECTION UTILS - CSpell Executable Detection Utilities
+# Project: works-on-my-machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Pure utility functions for persistent CSpell detection.
+
+Detecting CSpell through ``npx cspell --version`` and ``npm list -g``
+takes seconds. The detection result is stored with the executable it
+resolved to, and reused until that executable or ``PATH`` changes. When
+CSpell was not found, the result is reused until one of the directories
+it could be installed to changes.
+
+This module provides stateless functions for:
+- CSpell executable lookup in npm directories
+- Detection validation
+- Detection loading and atomic saving
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+# Local imports
+from ..common.probe_cache_utils import get_binary_fingerprint
+
+# ///////////////////////////////////////////////////////////////
+# VARIABLES
+# ///////////////////////////////////////////////////////////////
+
+# Executable names npm links CSpell as
+CSPELL_EXECUTABLE_NAMES = (
+    ("cspell.cmd", "cspell.exe", "cspell") if os.name == "nt" else ("cspell",)
+)
+
+# ///////////////////////////////////////////////////////////////
+# LOOKUP FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def get_local_bin_dirs(start: Path) -> list[Path]:
+    """List the ``node_modules/.bin`` directories npx searches first.
+
+    Args:
+        start: Directory to search from
+
+    Returns:
+        list[Path]: ``node_modules/.bin`` of ``start`` and its parents,
+        nearest first (whether they exist or not)
+    """
+    return [
+        directory / "node_modules" / ".bin" for directory in (start, *start.parents)
+    ]
+
+
+def get_global_bin_dirs(global_prefix: str, npm_cache: str) -> list[Path]:
+    """List the global directories CSpell can be installed to.
+
+    Args:
+        global_prefix: Output of ``npm prefix -g`` (empty if unknown)
+        npm_cache: Output of ``npm config get cache`` (empty if unknown)
+
+    Returns:
+        list[Path]: Global npm bin directory, then the npx cache root
+    """
+    directories = []
+    if global_prefix:
+        prefix = Path(global_prefix)
+        directories.append(prefix if os.name == "nt" else prefix / "bin")
+    if npm_cache:
+        directories.append(Path(npm_cache) / "_npx")
+    return directories
+
+
+def find_cspell_executable(bin_dirs: list[Path]) -> str | None:
+    """Find a CSpell executable in bin directories.
+
+    The npx cache root is searched one package level deep
+    (``_npx/<hash>/node_modules/.bin``), most recent package first.
+
+    Args:
+        bin_dirs: Directories in search order
+
+    Returns:
+        str | None: Path of the first CSpell executable, or None
+    """
+    for bin_dir in bin_dirs:
+        if bin_dir.name == "_npx":
+            try:
+                packages = sorted(
+                    bin_dir.iterdir(),
+                    key=lambda package: package.stat().st_mtime_ns,
+                    reverse=True,
+                )
+            except OSError:
+                continue
+            candidates = [package / "node_modules" / ".bin" for package in packages]
+        else:
+            candidates = [bin_dir]
+
+        for candidate in candidates:
+            for name in CSPELL_EXECUTABLE_NAMES:
+                executable = candidate / name
+                if executable.is_file():
+                    return str(executable)
+    return None
+
+
+def get_directory_states(directories: list[Path]) -> list[list[Any]]:
+    """Record the modification times of directories.
+
+    Args:
+        directories: Directories to record
+
+    Returns:
+        list[list[Any]]: Path and modification time (ns) of each directory,
+        None for directories that do not exist
+    """
+    states = []
+    for directory in directories:
+        try:
+            mtime = directory.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        states.append([str(directory), mtime])
+    return states
+
+
+# ///////////////////////////////////////////////////////////////
+# VALIDATION FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def is_cspell_detection_valid(
+    entry: Any, path_fingerprint: str, local_bin_dirs: list[Path]
+) -> bool:
+    """Check whether a stored detection result can be reused.
+
+    Args:
+        entry: Stored detection result
+        path_fingerprint: Current fingerprint of ``PATH``
+        local_bin_dirs: ``node_modules/.bin`` directories of the current
+            project (from ``get_local_bin_dirs``)
+
+    Returns:
+        bool: True if ``PATH`` did not change and either the resolved
+        executable is unchanged or, without one, no directory CSpell could
+        be installed to changed
+    """
+    if not isinstance(entry, dict) or entry.get("path") != path_fingerprint:
+        return False
+    if not isinstance(entry.get("installed"), bool):
+        return False
+
+    executable = entry.get("executable")
+    if executable:
+        return get_binary_fingerprint(executable) == entry.get("binary")
+
+    directories = entry.get("directories")
+    return (
+        isinstance(directories, list)
+        and all(isinstance(state, list) and len(state) == 2 for state in directories)
+        and get_directory_states([Path(state[0]) for state in directories])
+        == directories
+        and find_cspell_executable(local_bin_dirs) is None
+    )
+
+
+# ///////////////////////////////////////////////////////////////
+# STORAGE FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def load_cspell_detection(
+    detection_path: Path, detection_version: int
+) -> dict[str, Any]:
+    """Load a stored CSpell detection result.
+
+    Args:
+        detection_path: Detection result location
+        detection_version: Expected format version
+
+    Returns:
+        dict[str, Any]: Detection result, or an empty dict if it is missing,
+        unreadable or from another format version
+    """
+    try:
+        with detection_path.open(encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or data.get("version") != detection_version:
+        return {}
+
+    entry = data.get("detection")
+    return entry if isinstance(entry, dict) else {}
+
+
+def save_cspell_detection(
+    detection_path: Path, detection_version: int, entry: dict[str, Any]
+) -> None:
+    """Atomically write a CSpell detection result.
+
+    Args:
+        detection_path: Detection result location
+        detection_version: Format version
+        entry: Detection result
+
+    Raises:
+        OSError: If the result cannot be written
+    """
+    detection_path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"version": detection_version, "detection": entry}
+
+    fd, tmp_name = tempfile.mkstemp(
+        dir=detection_path.parent, prefix=f".{detection_path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, separators=(",", ":"))
+        os.replace(tmp_name, detection_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = [
+    "find_cspell_executable",
+    "get_directory_states",
+    "get_global_bin_dirs",
+    "get_local_bin_dirs",
+    "is_cspell_detection_valid",
+    "load_cspell_detection",
+    "save_cspell_detection",
+]
@@ -0,0 +1,702 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# NATIVE SPELL UTILS - Built-In Python Spell Checking
+# Project: works-on-my-machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Pure utility functions for the built-in Python spell checking backend.
+
+Files are checked against a word set built from the CSpell configuration
+files, the project word lists and the word lists of the system, without
+starting Node.js. Text is split into words the way CSpell does it
+(``camelCase``, ``PascalCase``, ``snake_case`` and ``kebab-case`` parts are
+checked separately) and issues use the shape of parsed CSpell output, so
+they can be reported like CSpell's.
+
+CSpell features that need its Node.js packages are not supported: named
+dictionaries (``python``, ``softwareTerms``...), ``import`` and
+``includeRegExpList`` are ignored.
+
+This module provides stateless functions for:
+- CSpell configuration loading and merging
+- Glob and ignore pattern compilation
+- Word splitting and lookup
+- File collection and checking
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import bisect
+import json
+import os
+import re
+import unicodedata
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+# ///////////////////////////////////////////////////////////////
+# VARIABLES
+# ///////////////////////////////////////////////////////////////
+
+# Runs of letters, with inner apostrophes ("don't", "l'option")
+WORD_PATTERN = re.compile(r"[^\W\d_]+(?:['’][^\W\d_]+)*")
+
+# Regular expressions written as JavaScript literals ("/pattern/flags")
+JS_REGEX_PATTERN = re.compile(r"^/(?P<source>.*)/(?P<flags>[a-z]*)$", re.DOTALL)
+
+# Shortest part accepted in compound words ("filename" = "file" + "name")
+COMPOUND_MIN_PART_LENGTH = 3
+
+# Files with a NUL byte in their first bytes are treated as binary
+BINARY_SNIFF_SIZE = 8192
+
+# Settings of the worker process, set by init_spell_worker
+_worker_settings: dict[str, Any] | None = None
+
+# ///////////////////////////////////////////////////////////////
+# CONFIGURATION FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def find_cspell_config(start: Path, file_name: str) -> Path | None:
+    """Find the CSpell configuration that applies to a path.
+
+    Args:
+        start: File or directory being checked
+        file_name: Configuration file name
+
+    Returns:
+        Path | None: Nearest configuration file in ``start`` or one of its
+        parents, or None if there is none
+    """
+    directory = start if start.is_dir() else start.parent
+    for candidate in (directory, *directory.parents):
+        config_path = candidate / file_name
+        if config_path.is_file():
+            return config_path
+    return None
+
+
+def load_cspell_config(config_path: Path) -> dict[str, Any]:
+    """Load a CSpell configuration file.
+
+    Args:
+        config_path: Configuration file
+
+    Returns:
+        dict[str, Any]: Configuration, with ``dictionaryDefinitions`` paths
+        made absolute
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not a JSON object
+    """
+    config = json.loads(config_path.read_text(encoding="utf-8"))
+    if not isinstance(config, dict):
+        raise ValueError(f"{config_path} does not contain a JSON object")
+
+    for definition in config.get("dictionaryDefinitions", []):
+        if isinstance(definition, dict) and definition.get("path"):
+            definition["path"] = str(config_path.parent / definition["path"])
+    return config
+
+
+def merge_cspell_configs(configs: list[dict[str, Any]]) -> dict[str, Any]:
+    """Merge CSpell configurations, later ones taking precedence.
+
+    Lists (words, ignore paths, overrides...) are concatenated, other
+    settings are replaced.
+
+    Args:
+        configs: Configurations, lowest precedence first
+
+    Returns:
+        dict[str, Any]: Merged configuration
+    """
+    merged: dict[str, Any] = {}
+    for config in configs:
+        for key, value in config.items():
+            if isinstance(value, list) and isinstance(merged.get(key), list):
+                merged[key] = [*merged[key], *value]
+            elif isinstance(value, dict) and isinstance(merged.get(key), dict):
+                merged[key] = {**merged[key], **value}
+            else:
+                merged[key] = value
+    return merged
+
+
+def load_word_list(word_list_path: Path) -> list[str]:
+    """Load a plain text word list (one word per line).
+
+    Args:
+        word_list_path: Word list file
+
+    Returns:
+        list[str]: Words, without comments and CSpell prefixes, or an empty
+        list if the file cannot be read
+    """
+    try:
+        text = word_list_path.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return []
+
+    words = []
+    for line in text.splitlines():
+        word = line.split("#", 1)[0].strip()
+        # Forbidden ("!") and case-sensitive ("~") markers are not supported
+        if word and not word.startswith("!"):
+            words.append(word.lstrip("~+").rstrip("+"))
+    return words
+
+
+def build_spell_settings(
+    config: dict[str, Any],
+    root: Path,
+    words: list[str],
+    default_min_word_length: int,
+    default_ignore_patterns: tuple[str, ...],
+    default_ignore_paths: tuple[str, ...],
+) -> dict[str, Any]:
+    """Build the settings used to check files from a merged configuration.
+
+    Args:
+        config: Merged CSpell configuration
+        root: Directory ignore paths and overrides are relative to
+        words: Known words from word lists, in addition to ``words``
+        default_min_word_length: Minimum word length if not configured
+        default_ignore_patterns: Regular expressions of text to ignore
+        default_ignore_paths: Globs of files to ignore
+
+    Returns:
+        dict[str, Any]: Picklable settings for ``check_spell_files``
+    """
+    case_sensitive = bool(config.get("caseSensitive", False))
+    patterns = {
+        pattern["name"]: pattern["pattern"]
+        for pattern in config.get("patterns", [])
+        if isinstance(pattern, dict) and "name" in pattern and "pattern" in pattern
+    }
+
+    ignore_patterns = [re.compile(pattern) for pattern in default_ignore_patterns]
+    for entry in config.get("ignoreRegExpList", []):
+        pattern = compile_ignore_regex(patterns.get(entry, entry))
+        if pattern is not None:
+            ignore_patterns.append(pattern)
+
+    overrides = []
+    for override in config.get("overrides", []):
+        if not isinstance(override, dict):
+            continue
+        filenames = override.get("filename", [])
+        if isinstance(filenames, str):
+            filenames = [filenames]
+        overrides.append(
+            {
+                "globs": [compile_glob(filename) for filename in filenames],
+                "words": normalize_words(override.get("words", []), case_sensitive),
+                "ignore_words": normalize_words(
+                    override.get("ignoreWords", []), case_sensitive
+                ),
+            }
+        )
+
+    return {
+        "root": str(root),
+        "words": normalize_words([*config.get("words", []), *words], case_sensitive),
+        "ignore_words": normalize_words(config.get("ignoreWords", []), case_sensitive),
+        "flag_words": normalize_words(config.get("flagWords", []), case_sensitive),
+        "case_sensitive": case_sensitive,
+        "allow_compound_words": bool(config.get("allowCompoundWords", False)),
+        "min_word_length": int(config.get("minWordLength", default_min_word_length)),
+        "enable_glob_dot": bool(config.get("enableGlobDot", False)),
+        "ignore_paths": [
+            compile_glob(glob)
+            for glob in (*default_ignore_paths, *config.get("ignorePaths", []))
+            if isinstance(glob, str)
+        ],
+        "ignore_patterns": ignore_patterns,
+        "overrides": overrides,
+    }
+
+
+# ///////////////////////////////////////////////////////////////
+# PATTERN FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def compile_glob(glob: str) -> re.Pattern[str]:
+    """Compile a CSpell glob to a regular expression over relative paths.
+
+    Globs without a leading ``/`` match at any depth, and a glob matching a
+    directory also matches everything below it, like ``.gitignore`` entries.
+
+    Args:
+        glob: Glob (``*``, ``**``, ``?`` and ``{a,b}`` are supported)
+
+    Returns:
+        re.Pattern[str]: Pattern matching POSIX paths relative to the root
+    """
+    anchored = glob.startswith("/")
+    glob = glob.strip("/")
+    parts: list[str] = []
+    index = 0
+    while index < len(glob):
+        char = glob[index]
+        if glob.startswith("**/", index):
+            parts.append("(?:.*/)?")
+            index += 3
+            continue
+        if glob.startswith("**", index):
+            parts.append(".*")
+            index += 2
+            continue
+        if char == "*":
+            parts.append("[^/]*")
+        elif char == "?":
+            parts.append("[^/]")
+        elif char == "{" and "}" in glob[index:]:
+            end = glob.index("}", index)
+            alternatives = glob[index + 1 : end].split(",")
+            parts.append(
+                "(?:" + "|".join(re.escape(item) for item in alternatives) + ")"
+            )
+            index = end
+        else:
+            parts.append(re.escape(char))
+        index += 1
+
+    prefix = "" if anchored else "(?:.*/)?"
+    return re.compile(f"{prefix}{''.join(parts)}(?:/.*)?", re.DOTALL)
+
+
+def compile_ignore_regex(pattern: Any) -> re.Pattern[str] | None:
+    """Compile an ``ignoreRegExpList`` entry.
+
+    Args:
+        pattern: Regular expression, plain or as a JavaScript literal
+
+    Returns:
+        re.Pattern[str] | None: Compiled expression, or None if the entry is
+        not a valid regular expression (such as a CSpell predefined pattern
+        name)
+    """
+    if not isinstance(pattern, str) or not pattern:
+        return None
+
+    flags = 0
+    literal = JS_REGEX_PATTERN.match(pattern)
+    if literal:
+        pattern = literal.group("source")
+        flags |= re.IGNORECASE if "i" in literal.group("flags") else 0
+        flags |= re.MULTILINE if "m" in literal.group("flags") else 0
+        flags |= re.DOTALL if "s" in literal.group("flags") else 0
+    elif pattern.isalnum():
+        # CSpell predefined pattern names ("Urls", "Email"...)
+        return None
+
+    try:
+        return re.compile(pattern, flags)
+    except re.error:
+        return None
+
+
+def is_ignored_path(relative_path: str, settings: dict[str, Any]) -> bool:
+    """Check whether a path is excluded by the ignore paths.
+
+    Args:
+        relative_path: POSIX path relative to the settings root
+        settings: Settings from ``build_spell_settings``
+
+    Returns:
+        bool: True if the path must not be checked
+    """
+    return any(glob.fullmatch(relative_path) for glob in settings["ignore_paths"])
+
+
+# ///////////////////////////////////////////////////////////////
+# WORD FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def normalize_word(word: str, case_sensitive: bool) -> str:
+    """Normalize a word for lookup.
+
+    Args:
+        word: Word to normalize
+        case_sensitive: Whether case and accents are significant
+
+    Returns:
+        str: Word as stored in word sets
+    """
+    if case_sensitive:
+        return word
+    decomposed = unicodedata.normalize("NFD", word.lower())
+    return "".join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def normalize_words(words: Any, case_sensitive: bool) -> frozenset[str]:
+    """Normalize a list of words into a word set.
+
+    Args:
+        words: Words (non-string entries are ignored)
+        case_sensitive: Whether case and accents are significant
+
+    Returns:
+        frozenset[str]: Normalized words
+    """
+    if not isinstance(words, (list, tuple, set, frozenset)):
+        return frozenset()
+    return frozenset(
+        normalize_word(word, case_sensitive)
+        for word in words
+        if isinstance(word, str) and word
+    )
+
+
+def split_camel_case(token: str) -> list[tuple[int, str]]:
+    """Split a token at case changes, like CSpell.
+
+    ``parseHTTPResponse`` gives ``parse``, ``HTTP`` and ``Response``.
+
+    Args:
+        token: Run of letters
+
+    Returns:
+        list[tuple[int, str]]: Offset in the token and text of each part
+    """
+    parts: list[tuple[int, str]] = []
+    start = 0
+    for index in range(1, len(token)):
+        previous, char = token[index - 1], token[index]
+        following = token[index + 1] if index + 1 < len(token) else ""
+        if char.isupper() and (
+            previous.islower() or (previous.isupper() and following.islower())
+        ):
+            parts.append((start, token[start:index]))
+            start = index
+    parts.append((start, token[start:]))
+    return parts
+
+
+def iter_words(text: str) -> Iterator[tuple[int, str]]:
+    """Yield the words of a text, split like CSpell does.
+
+    Args:
+        text: Text to split
+
+    Yields:
+        tuple[int, str]: Offset in the text and the word (a run of letters,
+        to split with ``split_camel_case`` if it is not known as a whole)
+    """
+    for match in WORD_PATTERN.finditer(text):
+        yield match.start(), match.group()
+
+
+def is_known_word(
+    word: str,
+    words: frozenset[str] | set[str],
+    case_sensitive: bool,
+    allow_compound_words: bool,
+) -> bool:
+    """Check a word against a word set.
+
+    Args:
+        word: Word to check
+        words: Normalized known words
+        case_sensitive: Whether case and accents are significant
+        allow_compound_words: Whether concatenations of known words are known
+
+    Returns:
+        bool: True if the word is known
+    """
+    normalized = normalize_word(word, case_sensitive)
+    if normalized in words:
+        return True
+    if case_sensitive and (word.istitle() or word.isupper()) and word.lower() in words:
+        return True
+
+    # Possessives and elisions ("user's", "l'option")
+    for apostrophe in ("'", "’"):
+        if apostrophe in normalized:
+            head, _, tail = normalized.rpartition(apostrophe)
+            if tail == "s" and head in words:
+                return True
+            if len(head) <= 2 and tail in words:
+                return True
+
+    return allow_compound_words and _is_compound_word(normalized, words)
+
+
+# ///////////////////////////////////////////////////////////////
+# CHECK FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def check_text(
+    text: str,
+    file_name: str,
+    settings: dict[str, Any],
+    extra_words: frozenset[str] = frozenset(),
+) -> list[dict[str, Any]]:
+    """Check the spelling of a text.
+
+    Args:
+        text: Text to check
+        file_name: File name to report issues under
+        settings: Settings from ``build_spell_settings``
+        extra_words: Additional known words (from overrides)
+
+    Returns:
+        list[dict[str, Any]]: Issues (``file``, ``line``, ``column``,
+        ``word`` and empty ``suggestions``), in text order
+    """
+    # Blank ignored text out, keeping offsets and line breaks
+    for pattern in settings["ignore_patterns"]:
+        text = pattern.sub(lambda match: re.sub(r"[^\n]", " ", match.group()), text)
+
+    line_starts = [0]
+    line_starts.extend(match.end() for match in re.finditer("\n", text))
+
+    words = settings["words"] | extra_words if extra_words else settings["words"]
+
+    issues: list[dict[str, Any]] = []
+    for offset, token in iter_words(text):
+        # Words known as a whole ("JavaScript") are not split
+        if not _is_unknown_word(token, words, settings):
+            continue
+        for part_offset, part in split_camel_case(token):
+            if not _is_unknown_word(part, words, settings):
+                continue
+            position = offset + part_offset
+            line = bisect.bisect_right(line_starts, position)
+            issues.append(
+                {
+                    "file": file_name,
+                    "line": line,
+                    "column": position - line_starts[line - 1] + 1,
+                    "word": part,
+                    "suggestions": [],
+                }
+            )
+    return issues
+
+
+def collect_spell_files(target: Path, settings: dict[str, Any]) -> list[Path]:
+    """List the files to check under a target.
+
+    Args:
+        target: File or directory to check
+        settings: Settings from ``build_spell_settings``
+
+    Returns:
+        list[Path]: Files in walk order, without ignored paths and (unless
+        ``enableGlobDot`` is set) hidden files
+    """
+    if target.is_file():
+        return [target]
+
+    root = settings["root"]
+    enable_glob_dot = settings["enable_glob_dot"]
+    files: list[Path] = []
+    for directory, dir_names, file_names in os.walk(target):
+        relative_dir = os.path.relpath(directory, root).replace(os.sep, "/")
+        relative_dir = "" if relative_dir == "." else f"{relative_dir}/"
+        dir_names[:] = sorted(
+            name
+            for name in dir_names
+            if (enable_glob_dot or not name.startswith("."))
+            and not is_ignored_path(f"{relative_dir}{name}", settings)
+        )
+        files.extend(
+            Path(directory, name)
+            for name in sorted(file_names)
+            if (enable_glob_dot or not name.startswith("."))
+            and not is_ignored_path(f"{relative_dir}{name}", settings)
+        )
+    return files
+
+
+def check_spell_files(
+    file_paths: list[str], settings: dict[str, Any], cwd: str
+) -> list[dict[str, Any]]:
+    """Check the spelling of several files.
+
+    Binary and unreadable files are skipped.
+
+    Args:
+        file_paths: Absolute paths of the files to check
+        settings: Settings from ``build_spell_settings``
+        cwd: Directory reported file names are relative to
+
+    Returns:
+        list[dict[str, Any]]: Issues of all files, in file order
+    """
+    issues: list[dict[str, Any]] = []
+    for file_path in file_paths:
+        try:
+            with open(file_path, "rb") as handle:
+                content = handle.read()
+        except OSError:
+            continue
+        if b"\0" in content[:BINARY_SNIFF_SIZE]:
+            continue
+
+        relative_path = os.path.relpath(file_path, settings["root"])
+        relative_path = relative_path.replace(os.sep, "/")
+        extra_words = frozenset().union(
+            *(
+                override["words"] | override["ignore_words"]
+                for override in settings["overrides"]
+                if any(glob.fullmatch(relative_path) for glob in override["globs"])
+            )
+        )
+        issues.extend(
+            check_text(
+                content.decode("utf-8", errors="replace"),
+                get_report_name(file_path, cwd),
+                settings,
+                extra_words,
+            )
+        )
+    return issues
+
+
+def get_report_name(file_path: str, cwd: str) -> str:
+    """Return the name a file is reported under, like CSpell.
+
+    Args:
+        file_path: Absolute file path
+        cwd: Working directory
+
+    Returns:
+        str: POSIX path relative to ``cwd``, or the absolute path for files
+        outside of it
+    """
+    try:
+        relative_path = os.path.relpath(file_path, cwd)
+    except ValueError:
+        return file_path
+    if relative_path.startswith(".."):
+        return file_path
+    return relative_path.replace(os.sep, "/")
+
+
+def init_spell_worker(settings: dict[str, Any]) -> None:
+    """Keep the check settings in a worker process.
+
+    Used as ``ProcessPoolExecutor`` initializer, so the word set is sent to
+    each worker once instead of with every task.
+
+    Args:
+        settings: Settings from ``build_spell_settings``
+    """
+    global _worker_settings
+    _worker_settings = settings
+
+
+def check_spell_files_in_worker(
+    file_paths: list[str], cwd: str
+) -> list[dict[str, Any]]:
+    """Check files with the settings given to ``init_spell_worker``.
+
+    Args:
+        file_paths: Absolute paths of the files to check
+        cwd: Directory reported file names are relative to
+
+    Returns:
+        list[dict[str, Any]]: Issues of all files, in file order
+    """
+    if _worker_settings is None:
+        raise RuntimeError("Spell check worker was not initialized")
+    return check_spell_files(file_paths, _worker_settings, cwd)
+
+
+# ///////////////////////////////////////////////////////////////
+# HELPER FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _is_unknown_word(
+    word: str, words: frozenset[str], settings: dict[str, Any]
+) -> bool:
+    """Check whether a word must be reported.
+
+    Args:
+        word: Word to check
+        words: Normalized known words
+        settings: Settings from ``build_spell_settings``
+
+    Returns:
+        bool: True if the word is flagged, or long enough, not ignored and
+        not known
+    """
+    normalized = normalize_word(word, settings["case_sensitive"])
+    if normalized in settings["flag_words"]:
+        return True
+    if (
+        len(word) < settings["min_word_length"]
+        or normalized in settings["ignore_words"]
+    ):
+        return False
+    return not is_known_word(
+        word, words, settings["case_sensitive"], settings["allow_compound_words"]
+    )
+
+
+def _is_compound_word(word: str, words: frozenset[str] | set[str]) -> bool:
+    """Check whether a word is a concatenation of known words.
+
+    Args:
+        word: Normalized word
+        words: Normalized known words
+
+    Returns:
+        bool: True if the word splits into known parts of at least
+        ``COMPOUND_MIN_PART_LENGTH`` characters
+    """
+    if len(word) < 2 * COMPOUND_MIN_PART_LENGTH:
+        return False
+
+    # reachable[i]: word[:i] splits into known parts
+    reachable = [True] + [False] * len(word)
+    for end in range(COMPOUND_MIN_PART_LENGTH, len(word) + 1):
+        for start in range(end - COMPOUND_MIN_PART_LENGTH, -1, -1):
+            if reachable[start] and word[start:end] in words:
+                if start == 0 and end == len(word):
+                    continue  # The whole word is not a compound
+                reachable[end] = True
+                break
+    return reachable[len(word)]
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = [
+    "build_spell_settings",
+    "check_spell_files",
+    "check_spell_files_in_worker",
+    "check_text",
+    "collect_spell_files",
+    "compile_glob",
+    "compile_ignore_regex",
+    "find_cspell_config",
+    "get_report_name",
+    "init_spell_worker",
+    "is_ignored_path",
+    "is_known_word",
+    "iter_words",
+    "load_cspell_config",
+    "load_word_list",
+    "merge_cspell_configs",
+    "normalize_word",
+    "normalize_words",
+    "split_camel_case",
+]
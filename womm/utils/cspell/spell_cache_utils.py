@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# SPELL CACHE UTILS - Spell Check Result Cache Utilities
+# Project: works-on-my-machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Pure utility functions for the persistent spell check result cache.
+
+The unknown words of each file are cached with the hash of its content.
+Settings that can change any result (spell checker, configuration, base
+dictionaries) are summarized by a settings fingerprint; the project words
+(configuration ``words`` and ``.cspell-dict/*.txt`` word lists) by a
+dictionary fingerprint. When only the project words change, an inverted
+index of the cached unknown words finds the files affected by the words
+added, so the other results are kept.
+
+This module provides stateless functions for:
+- Settings and dictionary fingerprinting
+- Invalidation of results after dictionary changes
+- Cache loading and atomic saving
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+# Local imports
+from ..lint.lint_cache_utils import hash_file_content
+from .native_spell_utils import load_word_list, normalize_word, normalize_words
+
+# ///////////////////////////////////////////////////////////////
+# VARIABLES
+# ///////////////////////////////////////////////////////////////
+
+# Configuration keys holding project words rather than settings
+DICTIONARY_CONFIG_KEYS = ("words", "ignoreWords")
+
+# ///////////////////////////////////////////////////////////////
+# FINGERPRINT FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def get_settings_fingerprint(
+    config: dict[str, Any],
+    checker: dict[str, Any],
+    word_list_paths: list[Path],
+    cache_version: int,
+) -> str:
+    """Fingerprint everything besides file content and project words that
+    affects spell check results.
+
+    Args:
+        config: Merged CSpell configuration
+        checker: Description of the spell checker (backend, executable...)
+        word_list_paths: Base word lists the checker reads
+        cache_version: Cache format version
+
+    Returns:
+        str: Hexadecimal fingerprint
+    """
+    digest = hashlib.sha256()
+    settings = {
+        key: value for key, value in config.items() if key not in DICTIONARY_CONFIG_KEYS
+    }
+    digest.update(
+        json.dumps(
+            {"cache_version": cache_version, "checker": checker, "config": settings},
+            sort_keys=True,
+            default=str,
+        ).encode("utf-8")
+    )
+    _update_with_files(digest, word_list_paths)
+    return digest.hexdigest()
+
+
+def get_dictionary_fingerprint(
+    config: dict[str, Any], word_list_paths: list[Path]
+) -> str:
+    """Fingerprint the project words.
+
+    Args:
+        config: Merged CSpell configuration
+        word_list_paths: Project word lists (``.cspell-dict/*.txt``)
+
+    Returns:
+        str: Hexadecimal fingerprint of the configuration words and the
+        content of the word lists
+    """
+    digest = hashlib.sha256()
+    digest.update(
+        json.dumps(
+            {key: config.get(key, []) for key in DICTIONARY_CONFIG_KEYS},
+            sort_keys=True,
+            default=str,
+        ).encode("utf-8")
+    )
+    _update_with_files(digest, word_list_paths)
+    return digest.hexdigest()
+
+
+def get_dictionary_words(
+    config: dict[str, Any], word_list_paths: list[Path], case_sensitive: bool
+) -> list[str]:
+    """List the project words, normalized.
+
+    Args:
+        config: Merged CSpell configuration
+        word_list_paths: Project word lists (``.cspell-dict/*.txt``)
+        case_sensitive: Whether words are compared with case
+
+    Returns:
+        list[str]: Sorted normalized words
+    """
+    words = [word for key in DICTIONARY_CONFIG_KEYS for word in config.get(key, [])]
+    for word_list_path in word_list_paths:
+        words.extend(load_word_list(word_list_path))
+    return sorted(normalize_words(words, case_sensitive))
+
+
+def _update_with_files(digest: Any, file_paths: list[Path]) -> None:
+    """Add the names and content hashes of files to a digest.
+
+    Args:
+        digest: ``hashlib`` hash object
+        file_paths: Files to add; missing files are recorded as missing
+    """
+    for file_path in file_paths:
+        try:
+            content_hash = hash_file_content(str(file_path))
+        except OSError:
+            content_hash = "-"
+        digest.update(f"\0{file_path}\0{content_hash}".encode())
+
+
+# ///////////////////////////////////////////////////////////////
+# INVALIDATION FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def build_word_index(
+    files: dict[str, Any], case_sensitive: bool
+) -> dict[str, set[str]]:
+    """Map cached unknown words to the files they were reported in.
+
+    Args:
+        files: Cache entries keyed by file path
+        case_sensitive: Whether words are compared with case
+
+    Returns:
+        dict[str, set[str]]: File paths keyed by normalized unknown word
+    """
+    index: dict[str, set[str]] = {}
+    for file_path, entry in files.items():
+        for issue in entry.get("issues", []):
+            index.setdefault(normalize_word(str(issue[2]), case_sensitive), set()).add(
+                file_path
+            )
+    return index
+
+
+def get_invalidated_files(
+    files: dict[str, Any],
+    old_words: list[str],
+    new_words: list[str],
+    case_sensitive: bool,
+    allow_compound_words: bool,
+) -> set[str] | None:
+    """Find the cached results a change of project words makes stale.
+
+    Adding a word can only make unknown words known, so only the files
+    reporting it are affected; with compound words, the files reporting a
+    longer word containing it. Removing a word can make any file report it.
+
+    Args:
+        files: Cache entries keyed by file path
+        old_words: Normalized project words of the cached results
+        new_words: Normalized current project words
+        case_sensitive: Whether words are compared with case
+        allow_compound_words: Whether compound words are accepted
+
+    Returns:
+        set[str] | None: Paths of the stale entries, or None if every entry
+        is stale
+    """
+    old, new = set(old_words), set(new_words)
+    if old - new:
+        return None
+
+    added = new - old
+    index = build_word_index(files, case_sensitive)
+    if allow_compound_words:
+        return set().union(
+            *(
+                file_paths
+                for unknown_word, file_paths in index.items()
+                if any(word in unknown_word for word in added)
+            )
+        )
+    return set().union(*(index.get(word, set()) for word in added))
+
+
+# ///////////////////////////////////////////////////////////////
+# PERSISTENCE FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def load_spell_cache(cache_path: Path, cache_version: int) -> dict[str, Any]:
+    """Load a spell check result cache.
+
+    Args:
+        cache_path: Cache file location
+        cache_version: Expected cache format version
+
+    Returns:
+        dict[str, Any]: ``settings`` fingerprint, ``dictionary`` fingerprint
+        and ``words``, and ``files`` entries (least recently used first); empty
+        if the cache is missing, unreadable or from another format version
+    """
+    empty: dict[str, Any] = {
+        "settings": "",
+        "dictionary": "",
+        "words": [],
+        "files": OrderedDict(),
+    }
+    try:
+        with cache_path.open(encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return empty
+
+    if not isinstance(data, dict) or data.get("version") != cache_version:
+        return empty
+
+    files = data.get("files")
+    words = data.get("words")
+    if not isinstance(files, dict) or not isinstance(words, list):
+        return empty
+
+    return {
+        "settings": str(data.get("settings", "")),
+        "dictionary": str(data.get("dictionary", "")),
+        "words": words,
+        "files": OrderedDict(files),
+    }
+
+
+def save_spell_cache(
+    cache_path: Path, cache_version: int, cache: dict[str, Any]
+) -> None:
+    """Atomically write a spell check result cache.
+
+    Args:
+        cache_path: Cache file location
+        cache_version: Cache format version
+        cache: Cache as returned by ``load_spell_cache``
+
+    Raises:
+        OSError: If the cache cannot be written
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"version": cache_version, **cache}
+
+    fd, tmp_name = tempfile.mkstemp(
+        dir=cache_path.parent, prefix=f".{cache_path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, separators=(",", ":"))
+        os.replace(tmp_name, cache_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = [
+    "build_word_index",
+    "get_dictionary_fingerprint",
+    "get_dictionary_words",
+    "get_invalidated_files",
+    "get_settings_fingerprint",
+    "load_spell_cache",
+    "save_spell_cache",
+]
@@ -12,6 +12,11 @@ This package contains stateless utility functions for:
 - Result validation
 - Tool detection and version extraction
 - Exporting lint results
+- Sharding long target lists across tool invocations
+- Persistent lint result caching
+- In-process execution of Python-based tools
+- Built-in syntax and import checks using the ast module
+- Single-pass formatting of files with several tools
 """
 
 from __future__ import annotations
@@ -20,22 +25,106 @@ from __future__ import annotations
 # IMPORTS
 # ///////////////////////////////////////////////////////////////
 # Local imports
+from .ast_lint_utils import (
+    AST_CHECKS_VERSION,
+    DUPLICATE_IMPORT_CODE,
+    SYNTAX_ERROR_CODE,
+    UNUSED_IMPORT_CODE,
+    check_files,
+    check_source,
+    format_issues,
+    is_syntax_error,
+)
+from .fix_pipeline_utils import (
+    BLACK_SUPPORTED_OPTIONS,
+    FIX_PIPELINE_TOOLS,
+    decode_source,
+    format_files,
+    is_fix_pipeline_supported,
+    load_black_config,
+    write_file_atomic,
+)
+from .inprocess_utils import (
+    IN_PROCESS_ENTRY_POINTS,
+    get_in_process_version,
+    is_in_process_available,
+    run_tool_in_process,
+)
+from .lint_cache_utils import (
+    find_config_dirs,
+    get_json_error_files,
+    get_lint_cache_key,
+    get_tool_config_fingerprint,
+    hash_file_content,
+    load_lint_cache,
+    save_lint_cache,
+    split_json_issues,
+    split_json_metrics,
+    sum_json_metrics,
+)
 from .lint_utils import (
     check_tool_availability,
     export_lint_results_to_json,
     get_tool_version,
+    parse_json_line,
     parse_lint_output,
+    relocate_tool_result,
     validate_lint_result,
 )
+from .shard_utils import (
+    get_argument_budget,
+    get_argument_size,
+    get_shard_cost,
+    merge_json_outputs,
+    order_shards_by_cost,
+    shard_targets,
+)
 
 # ///////////////////////////////////////////////////////////////
 # PUBLIC API
 # ///////////////////////////////////////////////////////////////
 
 __all__ = [
+    "AST_CHECKS_VERSION",
+    "BLACK_SUPPORTED_OPTIONS",
+    "DUPLICATE_IMPORT_CODE",
+    "FIX_PIPELINE_TOOLS",
+    "IN_PROCESS_ENTRY_POINTS",
+    "SYNTAX_ERROR_CODE",
+    "UNUSED_IMPORT_CODE",
+    "check_files",
+    "check_source",
     "check_tool_availability",
+    "decode_source",
     "export_lint_results_to_json",
+    "format_files",
+    "format_issues",
+    "get_argument_budget",
+    "get_argument_size",
+    "get_in_process_version",
+    "find_config_dirs",
+    "get_json_error_files",
+    "get_lint_cache_key",
+    "get_shard_cost",
+    "get_tool_config_fingerprint",
     "get_tool_version",
+    "hash_file_content",
+    "is_fix_pipeline_supported",
+    "is_in_process_available",
+    "is_syntax_error",
+    "load_black_config",
+    "load_lint_cache",
+    "merge_json_outputs",
+    "order_shards_by_cost",
+    "parse_json_line",
     "parse_lint_output",
+    "relocate_tool_result",
+    "run_tool_in_process",
+    "save_lint_cache",
+    "shard_targets",
+    "split_json_issues",
+    "split_json_metrics",
+    "sum_json_metrics",
     "validate_lint_result",
+    "write_file_atomic",
 ]
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# AST LINT UTILS - Built-In Fast Lint Checks
+# Project: works-on-my-machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Pure utility functions for the built-in fast lint tier.
+
+Each file is parsed once with the standard library ``ast`` module, without
+spawning any external tool. Syntax errors are reported first so the slower
+tools are not all run against a file none of them can parse. Unused and
+duplicate imports can be reported alongside them for runs without ruff;
+they are advisory and never make the checks fail. Issues use ruff's JSON
+shape and rule codes so they read like the rest of the lint output.
+
+This module provides stateless functions for:
+- Syntax error detection
+- Unused and duplicate import detection
+- Issue formatting
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import ast
+import os
+import re
+from typing import Any
+
+# ///////////////////////////////////////////////////////////////
+# VARIABLES
+# ///////////////////////////////////////////////////////////////
+
+# Bump when the checks change, so cached results are discarded
+AST_CHECKS_VERSION = 2
+
+SYNTAX_ERROR_CODE = "E999"
+UNUSED_IMPORT_CODE = "F401"
+DUPLICATE_IMPORT_CODE = "F811"
+
+# Identifiers anywhere in the source, including strings and comments
+IDENTIFIER_PATTERN = re.compile(rb"[A-Za-z_][A-Za-z0-9_]*")
+
+# Matches bare noqa comments and noqa comments listing rule codes
+NOQA_PATTERN = re.compile(
+    r"#\s*noqa(?::\s*(?P<codes>[A-Z]+[0-9]+(?:[,\s]+[A-Z]+[0-9]+)*))?"
+)
+
+# ///////////////////////////////////////////////////////////////
+# CHECK FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def check_files(
+    file_paths: list[str], cwd: str, check_imports: bool = True
+) -> list[dict[str, Any]]:
+    """Run the built-in checks on several files.
+
+    Args:
+        file_paths: Files to check, absolute or relative to ``cwd``
+        cwd: Directory relative file paths are resolved against
+        check_imports: Whether to report unused and duplicate imports
+
+    Returns:
+        list[dict[str, Any]]: Issues of all files, in file order
+    """
+    issues: list[dict[str, Any]] = []
+    for file_path in file_paths:
+        try:
+            with open(os.path.join(cwd, file_path), "rb") as handle:
+                source = handle.read()
+        except OSError as e:
+            issues.append(
+                _make_issue(
+                    file_path, SYNTAX_ERROR_CODE, f"Cannot read file: {e}", 1, 1
+                )
+            )
+            continue
+        issues.extend(check_source(source, file_path, check_imports))
+    return issues
+
+
+def check_source(
+    source: bytes, file_name: str, check_imports: bool = True
+) -> list[dict[str, Any]]:
+    """Run the built-in checks on a file's content.
+
+    Import checks are deliberately cheap and conservative: only imports
+    placed directly in the module body are checked, and a name counts as
+    used if it appears anywhere else in the file, strings and comments
+    included. Imports in ``__init__.py`` files and explicit re-exports
+    (``import x as x``) are never reported as unused. Issues are reported
+    on the line of the imported name, where a ``# noqa`` comment suppresses
+    them, as with ruff.
+
+    Args:
+        source: Raw file content (its encoding declaration is honoured)
+        file_name: Name reported in issues
+        check_imports: Whether to report unused and duplicate imports
+
+    Returns:
+        list[dict[str, Any]]: Syntax error issue if the file does not parse,
+        otherwise its import issues
+    """
+    try:
+        tree = ast.parse(source, filename=file_name)
+    except SyntaxError as e:
+        return [
+            _make_issue(
+                file_name,
+                SYNTAX_ERROR_CODE,
+                f"SyntaxError: {e.msg}",
+                e.lineno or 1,
+                e.offset or 1,
+            )
+        ]
+    except (ValueError, UnicodeDecodeError) as e:
+        return [_make_issue(file_name, SYNTAX_ERROR_CODE, f"SyntaxError: {e}", 1, 1)]
+
+    if not check_imports:
+        return []
+
+    imports = [
+        statement
+        for statement in tree.body
+        if isinstance(statement, ast.Import)
+        or (isinstance(statement, ast.ImportFrom) and statement.module != "__future__")
+    ]
+    if not imports:
+        return []
+
+    lines = source.splitlines()
+    issues = _find_import_issues(imports, lines, file_name)
+    return [issue for issue in issues if not _is_suppressed(issue, lines)]
+
+
+def is_syntax_error(issue: dict[str, Any]) -> bool:
+    """Check whether an issue reports a file that cannot be parsed.
+
+    Args:
+        issue: Issue returned by ``check_source``
+
+    Returns:
+        bool: True for syntax errors
+    """
+    return issue.get("code") == SYNTAX_ERROR_CODE
+
+
+def format_issues(issues: list[dict[str, Any]], cwd: str) -> str:
+    """Format issues as ``path:row:column: CODE message`` lines.
+
+    Args:
+        issues: Issues returned by ``check_files``, or other issues in ruff's
+            JSON shape (ruff reports syntax errors without a code)
+        cwd: Directory paths are shown relative to
+
+    Returns:
+        str: One line per issue
+    """
+    return "\n".join(
+        f"{os.path.relpath(os.path.join(cwd, issue['filename']), cwd)}:"
+        f"{issue['location']['row']}:{issue['location']['column']}: "
+        f"{issue['code'] + ' ' if issue.get('code') else ''}{issue['message']}"
+        for issue in issues
+    )
+
+
+# ///////////////////////////////////////////////////////////////
+# PRIVATE FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def _find_import_issues(
+    imports: list[ast.Import | ast.ImportFrom], lines: list[bytes], file_name: str
+) -> list[dict[str, Any]]:
+    """Find unused and duplicate module-level imports.
+
+    Args:
+        imports: Import statements of the module body, in source order
+        lines: Raw source lines
+        file_name: Name reported in issues
+
+    Returns:
+        list[dict[str, Any]]: Issues in source order
+    """
+    import_rows = {
+        row
+        for statement in imports
+        for row in range(statement.lineno, (statement.end_lineno or 0) + 1)
+        if b";" not in lines[row - 1]
+    }
+    used = set(
+        IDENTIFIER_PATTERN.findall(
+            b"\n".join(
+                line
+                for row, line in enumerate(lines, start=1)
+                if row not in import_rows
+            )
+        )
+    )
+    check_unused = os.path.basename(file_name) != "__init__.py"
+
+    issues: list[dict[str, Any]] = []
+    seen: dict[tuple[str, str], int] = {}
+    for statement in imports:
+        module = (
+            "." * statement.level + (statement.module or "")
+            if isinstance(statement, ast.ImportFrom)
+            else ""
+        )
+        for alias in statement.names:
+            if alias.name == "*":
+                continue
+            bound = alias.asname or alias.name.split(".")[0]
+            qualified = f"{module}.{alias.name}" if module else alias.name
+
+            unused = bound.isascii() and bound.encode() not in used
+
+            # A repeated import only redefines an unused name if the name
+            # is never used; otherwise the use may sit between the two
+            key = (bound, qualified)
+            if key in seen:
+                if unused:
+                    issues.append(
+                        _make_issue(
+                            file_name,
+                            DUPLICATE_IMPORT_CODE,
+                            f"Redefinition of unused `{bound}` from line {seen[key]}",
+                            alias.lineno,
+                            alias.col_offset + 1,
+                        )
+                    )
+                continue
+            seen[key] = alias.lineno
+
+            if check_unused and alias.asname != alias.name and unused:
+                issues.append(
+                    _make_issue(
+                        file_name,
+                        UNUSED_IMPORT_CODE,
+                        f"`{qualified}` imported but unused",
+                        alias.lineno,
+                        alias.col_offset + 1,
+                    )
+                )
+
+    return issues
+
+
+def _is_suppressed(issue: dict[str, Any], lines: list[bytes]) -> bool:
+    """Check whether an issue's line carries a matching noqa comment.
+
+    Args:
+        issue: Issue to check
+        lines: Raw source lines
+
+    Returns:
+        bool: True if the issue is suppressed
+    """
+    row = issue["location"]["row"]
+    if row > len(lines):
+        return False
+    match = NOQA_PATTERN.search(lines[row - 1].decode("utf-8", errors="replace"))
+    if match is None:
+        return False
+    codes = match.group("codes")
+    return codes is None or issue["code"] in re.split(r"[,\s]+", codes)
+
+
+def _make_issue(
+    file_name: str, code: str, message: str, row: int, column: int
+) -> dict[str, Any]:
+    """Build an issue in ruff's JSON report shape.
+
+    Args:
+        file_name: File the issue belongs to
+        code: Rule code
+        message: Issue description
+        row: 1-based line
+        column: 1-based column
+
+    Returns:
+        dict[str, Any]: Issue
+    """
+    return {
+        "code": code,
+        "message": message,
+        "filename": file_name,
+        "location": {"row": row, "column": column},
+    }
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = [
+    "AST_CHECKS_VERSION",
+    "DUPLICATE_IMPORT_CODE",
+    "SYNTAX_ERROR_CODE",
+    "UNUSED_IMPORT_CODE",
+    "check_files",
+    "check_source",
+    "format_issues",
+    "is_syntax_error",
+]
@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# FIX PIPELINE UTILS - Single-Pass Formatting Utilities
+# Project: works-on-my-machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Pure utility functions for the single-pass fix pipeline.
+
+Running isort and then black as separate processes reads and rewrites every
+file twice. The pipeline reads each file once, applies isort and black to
+the source in memory, and writes it back atomically only when its bytes
+changed, so unchanged files keep their modification time. Formatting
+functions are meant to be executed in worker processes.
+
+This module provides stateless functions for:
+- Pipeline support detection (packages and black configuration)
+- Source decoding and atomic writing
+- Per-file formatting with isort and black
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import io
+import os
+import re
+import tempfile
+import tokenize
+from dataclasses import replace
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+
+# Local imports
+from .inprocess_utils import is_in_process_available
+
+# ///////////////////////////////////////////////////////////////
+# VARIABLES
+# ///////////////////////////////////////////////////////////////
+
+# Tools the pipeline applies, in order
+FIX_PIPELINE_TOOLS = ("isort", "black")
+
+# black configuration keys the pipeline honours; projects using any other
+# formatting option fall back to running black as a command
+BLACK_SUPPORTED_OPTIONS = frozenset(
+    {
+        "line_length",
+        "target_version",
+        "skip_string_normalization",
+        "skip_magic_trailing_comma",
+        "preview",
+        "fast",
+        "include",
+        "exclude",
+        "extend_exclude",
+        "force_exclude",
+        "required_version",
+        "workers",
+        "quiet",
+        "verbose",
+        "color",
+    }
+)
+
+# ///////////////////////////////////////////////////////////////
+# SUPPORT FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+@lru_cache(maxsize=8)
+def load_black_config(cwd: str) -> dict[str, Any] | None:
+    """Load the black configuration that applies to a project.
+
+    Args:
+        cwd: Directory black would run from
+
+    Returns:
+        dict[str, Any] | None: Configuration with normalized keys (plus the
+        ``_root`` directory it was found in), or None if it uses options the
+        pipeline does not support or cannot be read
+    """
+    from black.files import find_pyproject_toml, parse_pyproject_toml
+
+    try:
+        config_path = find_pyproject_toml((cwd,))
+        config = parse_pyproject_toml(config_path) if config_path else {}
+    except (OSError, ValueError):
+        return None
+
+    if not set(config) <= BLACK_SUPPORTED_OPTIONS:
+        return None
+
+    config["_root"] = str(Path(config_path).parent) if config_path else cwd
+    return config
+
+
+def is_fix_pipeline_supported(tool_names: list[str], cwd: str) -> bool:
+    """Check whether the single-pass pipeline can replace the given tools.
+
+    Args:
+        tool_names: Fix tools to run through the pipeline
+        cwd: Project directory
+
+    Returns:
+        bool: True if every tool is a pipeline tool whose package is
+        importable, and the black configuration is supported
+    """
+    if not tool_names or not set(tool_names) <= set(FIX_PIPELINE_TOOLS):
+        return False
+    if not all(is_in_process_available(tool_name) for tool_name in tool_names):
+        return False
+    return "black" not in tool_names or load_black_config(cwd) is not None
+
+
+# ///////////////////////////////////////////////////////////////
+# IO FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def decode_source(content: bytes) -> tuple[str, str, str]:
+    """Decode Python source the way black does.
+
+    Args:
+        content: Raw file content
+
+    Returns:
+        tuple[str, str, str]: Source with ``\\n`` newlines, encoding, and the
+        newline sequence of the first line
+
+    Raises:
+        SyntaxError: If the encoding declaration is invalid
+        UnicodeDecodeError: If the content does not match its encoding
+    """
+    buffer = io.BytesIO(content)
+    encoding, lines = tokenize.detect_encoding(buffer.readline)
+    if not lines:
+        return "", encoding, "\n"
+
+    newline = "\r\n" if lines[0][-2:] == b"\r\n" else "\n"
+    buffer.seek(0)
+    with io.TextIOWrapper(buffer, encoding) as wrapper:
+        return wrapper.read(), encoding, newline
+
+
+def write_file_atomic(file_path: str, content: bytes) -> None:
+    """Replace a file's content atomically, keeping its permissions.
+
+    Args:
+        file_path: File to replace
+        content: New content
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    directory, name = os.path.split(file_path)
+    mode = os.stat(file_path).st_mode
+    fd, tmp_name = tempfile.mkstemp(dir=directory or ".", prefix=f".{name}.")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(content)
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, file_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+# ///////////////////////////////////////////////////////////////
+# FORMATTING FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def format_files(
+    file_paths: list[str], cwd: str, tool_names: list[str]
+) -> list[tuple[str, list[str], dict[str, str]]]:
+    """Apply the pipeline tools to files, writing back changed files.
+
+    Args:
+        file_paths: Absolute paths of the files to format
+        cwd: Project directory tool configuration is read from
+        tool_names: Pipeline tools to apply (see ``FIX_PIPELINE_TOOLS``)
+
+    Returns:
+        list[tuple[str, list[str], dict[str, str]]]: For each file, its path,
+        the tools that changed it and an error message per failed tool
+    """
+    builders = {"isort": _get_isort_formatter, "black": _get_black_formatter}
+    formatters = [
+        (tool_name, builders[tool_name](cwd))
+        for tool_name in FIX_PIPELINE_TOOLS
+        if tool_name in tool_names
+    ]
+    return [_format_file(file_path, formatters) for file_path in file_paths]
+
+
+def _format_file(
+    file_path: str, formatters: list[tuple[str, Any]]
+) -> tuple[str, list[str], dict[str, str]]:
+    """Read a file once, apply formatters in order and write it if changed.
+
+    Args:
+        file_path: Absolute file path
+        formatters: ``(tool_name, formatter)`` pairs; a formatter takes the
+            source and file path and returns the new source
+
+    Returns:
+        tuple[str, list[str], dict[str, str]]: Path, tools that changed the
+        file and error messages per failed tool
+    """
+    changed_by: list[str] = []
+    errors: dict[str, str] = {}
+    try:
+        with open(file_path, "rb") as handle:
+            original = handle.read()
+        source, encoding, newline = decode_source(original)
+    except (OSError, SyntaxError, UnicodeDecodeError) as e:
+        return file_path, changed_by, {name: str(e) for name, _ in formatters}
+
+    for tool_name, formatter in formatters:
+        try:
+            formatted = formatter(source, file_path)
+        except Exception as e:
+            errors[tool_name] = str(e) or type(e).__name__
+            continue
+        if formatted != source:
+            changed_by.append(tool_name)
+            source = formatted
+
+    if changed_by:
+        content = source.replace("\n", newline).encode(encoding)
+        if content != original:
+            try:
+                write_file_atomic(file_path, content)
+            except OSError as e:
+                errors.update({tool_name: str(e) for tool_name in changed_by})
+                changed_by = []
+
+    return file_path, changed_by, errors
+
+
+@lru_cache(maxsize=8)
+def _get_isort_formatter(cwd: str) -> Any:
+    """Build an isort formatter for a project.
+
+    Args:
+        cwd: Directory isort configuration is searched from
+
+    Returns:
+        Any: Formatter taking source and file path
+    """
+    import isort
+    from isort.exceptions import ExistingSyntaxErrors, FileSkipped
+
+    config = isort.Config(settings_path=cwd)
+
+    def format_source(source: str, file_path: str) -> str:
+        try:
+            return isort.code(
+                source,
+                config=config,
+                file_path=Path(file_path),
+                disregard_skip=not config.filter_files,
+            )
+        except (FileSkipped, ExistingSyntaxErrors):
+            # The isort command leaves these files untouched without failing
+            return source
+
+    return format_source
+
+
+@lru_cache(maxsize=8)
+def _get_black_formatter(cwd: str) -> Any:
+    """Build a black formatter for a project.
+
+    Args:
+        cwd: Directory black configuration is searched from
+
+    Returns:
+        Any: Formatter taking source and file path
+    """
+    import black
+    from black.const import DEFAULT_LINE_LENGTH
+    from black.mode import TargetVersion
+    from black.report import NothingChanged
+
+    config = load_black_config(cwd) or {}
+    mode = black.Mode(
+        target_versions={
+            TargetVersion[version.upper()]
+            for version in config.get("target_version", [])
+        },
+        line_length=config.get("line_length", DEFAULT_LINE_LENGTH),
+        string_normalization=not config.get("skip_string_normalization", False),
+        magic_trailing_comma=not config.get("skip_magic_trailing_comma", False),
+        preview=config.get("preview", False),
+    )
+    # black formats stub files by their extension
+    stub_mode = replace(mode, is_pyi=True)
+    fast = config.get("fast", False)
+    root = config.get("_root", cwd)
+    force_exclude = config.get("force_exclude")
+    force_exclude_regex = (
+        re.compile(f"(?x){force_exclude}" if "\n" in force_exclude else force_exclude)
+        if force_exclude
+        else None
+    )
+
+    def format_source(source: str, file_path: str) -> str:
+        if force_exclude_regex is not None:
+            relative = "/" + Path(os.path.relpath(file_path, root)).as_posix()
+            if force_exclude_regex.search(relative):
+                return source
+        try:
+            return black.format_file_contents(
+                source,
+                fast=fast,
+                mode=stub_mode if file_path.endswith(".pyi") else mode,
+            )
+        except NothingChanged:
+            return source
+
+    return format_source
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = [
+    "BLACK_SUPPORTED_OPTIONS",
+    "FIX_PIPELINE_TOOLS",
+    "decode_source",
+    "format_files",
+    "is_fix_pipeline_supported",
+    "load_black_config",
+    "write_file_atomic",
+]
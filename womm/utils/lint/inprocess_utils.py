@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# INPROCESS UTILS - In-Process Lint Tool Execution
+# Project: works-on-my-machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Pure utility functions for running Python lint tools through their APIs.
+
+black and isort are Python packages, so they can be run from an already
+started interpreter instead of paying interpreter startup and imports for
+every invocation. The entry points below call the same command line
+functions the console scripts call, with output captured, so results match
+a subprocess run. They are meant to be executed in worker processes.
+
+This module provides stateless functions for:
+- In-process availability and version detection
+- In-process tool execution with captured output
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import importlib.metadata
+import importlib.util
+import io
+import os
+from collections.abc import Callable
+from contextlib import redirect_stderr, redirect_stdout
+from functools import cache
+
+# ///////////////////////////////////////////////////////////////
+# ENTRY POINTS
+# ///////////////////////////////////////////////////////////////
+
+
+def _run_black(args: list[str]) -> int:
+    """Run black's command line interface.
+
+    Args:
+        args: Command line arguments
+
+    Returns:
+        int: Exit code
+    """
+    import black
+    import click
+
+    # One worker: black's process pool would write diffs to the real stdout
+    os.environ["BLACK_NUM_WORKERS"] = "1"
+    try:
+        return black.main.main(args=args, prog_name="black", standalone_mode=False) or 0
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except click.exceptions.Abort:
+        return 1
+
+
+def _run_isort(args: list[str]) -> int:
+    """Run isort's command line interface.
+
+    Args:
+        args: Command line arguments
+
+    Returns:
+        int: Exit code
+    """
+    from isort.main import main
+
+    main(args)
+    return 0
+
+
+IN_PROCESS_ENTRY_POINTS: dict[str, tuple[str, Callable[[list[str]], int]]] = {
+    "black": ("black", _run_black),
+    "isort": ("isort", _run_isort),
+}
+
+# ///////////////////////////////////////////////////////////////
+# EXECUTION FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+@cache
+def is_in_process_available(tool_name: str) -> bool:
+    """Check whether a tool can run in-process.
+
+    Args:
+        tool_name: Name of the tool
+
+    Returns:
+        bool: True if the tool has an in-process entry point and its package
+        is importable
+    """
+    entry = IN_PROCESS_ENTRY_POINTS.get(tool_name)
+    if entry is None:
+        return False
+    try:
+        return importlib.util.find_spec(entry[0]) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def get_in_process_version(tool_name: str) -> str:
+    """Return the version of the package used by the in-process backend.
+
+    It can differ from the executable found on PATH.
+
+    Args:
+        tool_name: Name of the tool
+
+    Returns:
+        str: Package version, or an empty string if it is not installed
+    """
+    entry = IN_PROCESS_ENTRY_POINTS.get(tool_name)
+    if entry is None:
+        return ""
+    try:
+        return importlib.metadata.version(entry[0])
+    except importlib.metadata.PackageNotFoundError:
+        return ""
+
+
+def run_tool_in_process(
+    tool_name: str, args: list[str], cwd: str
+) -> tuple[int, str, str]:
+    """Run a tool in the current process with captured output.
+
+    Changes the working directory for the duration of the call, so this
+    must only run in a process that executes one tool at a time.
+
+    Args:
+        tool_name: Name of the tool (see ``IN_PROCESS_ENTRY_POINTS``)
+        args: Command line arguments, without the executable
+        cwd: Working directory
+
+    Returns:
+        tuple[int, str, str]: Exit code, standard output and standard error
+
+    Raises:
+        KeyError: If the tool has no in-process entry point
+    """
+    entry_point = IN_PROCESS_ENTRY_POINTS[tool_name][1]
+    # black writes diffs to sys.stdout.buffer, so capture bytes
+    stdout_bytes, stderr_bytes = io.BytesIO(), io.BytesIO()
+    stdout = io.TextIOWrapper(stdout_bytes, encoding="utf-8", write_through=True)
+    stderr = io.TextIOWrapper(stderr_bytes, encoding="utf-8", write_through=True)
+
+    previous_cwd = os.getcwd()
+    os.chdir(cwd)
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            try:
+                returncode = entry_point(args)
+            except SystemExit as e:
+                returncode = (
+                    e.code if isinstance(e.code, int) else int(e.code is not None)
+                )
+    finally:
+        os.chdir(previous_cwd)
+
+    stdout.flush()
+    stderr.flush()
+    return returncode, _decode_output(stdout_bytes), _decode_output(stderr_bytes)
+
+
+def _decode_output(buffer: io.BytesIO) -> str:
+    """Decode captured output like ``subprocess.run(text=True)`` would.
+
+    Args:
+        buffer: Bytes written to the captured stream
+
+    Returns:
+        str: Decoded text with universal newlines
+    """
+    text = buffer.getvalue().decode("utf-8", errors="replace")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = [
+    "IN_PROCESS_ENTRY_POINTS",
+    "get_in_process_version",
+    "is_in_process_available",
+    "run_tool_in_process",
+]
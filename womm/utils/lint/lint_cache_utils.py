@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# LINT CACHE UTILS - Lint Result Cache Utilities
+# Project: works-on-my-machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Pure utility functions for the persistent lint result cache.
+
+Cache entries are keyed by file path, file content hash and a fingerprint of
+the tool (name, version, arguments and configuration). A file whose content
+and tool configuration are unchanged gets the same result as last time, so
+it does not need to be linted again.
+
+This module provides stateless functions for:
+- File content hashing and tool configuration fingerprinting
+- Cache loading and atomic saving
+- Attributing tool output to individual files
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+# ///////////////////////////////////////////////////////////////
+# HASHING FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def hash_file_content(file_path: str) -> str:
+    """Hash the content of a file.
+
+    Args:
+        file_path: File to hash
+
+    Returns:
+        str: Hexadecimal BLAKE2b digest of the file content
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    with open(file_path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_tool_config_fingerprint(
+    project_root: Path,
+    tool_name: str,
+    version: str,
+    args: list[str],
+    config_files: list[str],
+    cache_version: int,
+    config_dirs: list[Path] | None = None,
+) -> str:
+    """Compute a fingerprint of everything besides file content that affects
+    a tool's output.
+
+    For ``pyproject.toml`` only the ``[tool.<tool_name>]`` table and
+    ``project.requires-python`` (tools infer their target version from it)
+    are taken into account, so unrelated edits do not invalidate the cache;
+    other configuration files are hashed as a whole. For ruff, configuration
+    files named by ``extend`` are hashed as well, recursively.
+
+    Args:
+        project_root: Project root containing the configuration files
+        tool_name: Name of the tool
+        version: Tool version string
+        args: Arguments the tool is run with
+        config_files: Configuration file names read by the tool
+        cache_version: Cache format version
+        config_dirs: Directories below ``project_root`` whose configuration
+            files also apply to some of the linted files (see
+            ``find_config_dirs``)
+
+    Returns:
+        str: Hexadecimal fingerprint
+    """
+    digest = hashlib.sha256()
+    digest.update(
+        json.dumps(
+            {
+                "cache_version": cache_version,
+                "tool": tool_name,
+                "version": version,
+                "args": args,
+            },
+            sort_keys=True,
+        ).encode("utf-8")
+    )
+
+    for directory in [project_root, *(config_dirs or [])]:
+        for name in config_files:
+            config_path = directory / name
+            digest.update(f"\0{os.path.relpath(config_path, project_root)}\0".encode())
+            _hash_config_file(digest, config_path, tool_name, {config_path.resolve()})
+
+    return digest.hexdigest()
+
+
+def find_config_dirs(
+    project_root: Path, file_paths: list[str], config_files: list[str]
+) -> list[Path]:
+    """Find directories below the project root holding configuration files
+    that apply to some of the given files.
+
+    Tools such as ruff use the configuration closest to each file, so
+    configuration files between a file and the project root affect its
+    results as much as the root ones.
+
+    Args:
+        project_root: Resolved project root
+        file_paths: Absolute paths of the linted files
+        config_files: Configuration file names read by the tool
+
+    Returns:
+        list[Path]: Directories containing at least one configuration file,
+        sorted
+    """
+    found: set[Path] = set()
+    checked: set[Path] = {project_root}
+    for file_path in file_paths:
+        directory = Path(file_path).parent
+        while directory not in checked and project_root in directory.parents:
+            checked.add(directory)
+            if any((directory / name).is_file() for name in config_files):
+                found.add(directory)
+            directory = directory.parent
+    return sorted(found)
+
+
+def _hash_config_file(
+    digest: Any, config_path: Path, tool_name: str, seen: set[Path]
+) -> None:
+    """Add a configuration file, and the files it extends, to a digest.
+
+    Args:
+        digest: Hash object to update
+        config_path: Configuration file to hash
+        tool_name: Name of the tool
+        seen: Resolved files already hashed, guarding against ``extend``
+            cycles
+    """
+    try:
+        content = config_path.read_bytes()
+    except OSError:
+        return
+
+    data = _load_toml(content) if config_path.suffix == ".toml" else None
+    if data is None:
+        digest.update(content)
+        return
+
+    if config_path.name == "pyproject.toml":
+        table = data.get("tool", {}).get(tool_name, {})
+        relevant = {
+            "tool": table,
+            "requires-python": data.get("project", {}).get("requires-python"),
+        }
+        digest.update(json.dumps(relevant, sort_keys=True, default=str).encode())
+    else:
+        table = data
+        digest.update(content)
+
+    extend = table.get("extend") if tool_name == "ruff" else None
+    if not isinstance(extend, str):
+        return
+    parent = (config_path.parent / os.path.expanduser(extend)).resolve()
+    if parent in seen:
+        return
+    seen.add(parent)
+    digest.update(f"\0extend:{parent}\0".encode())
+    _hash_config_file(digest, parent, tool_name, seen)
+
+
+def _load_toml(content: bytes) -> dict[str, Any] | None:
+    """Parse TOML configuration content.
+
+    Args:
+        content: Raw file content
+
+    Returns:
+        dict[str, Any] | None: Parsed document, or None if it cannot be
+        parsed (or no TOML parser is available)
+    """
+    try:
+        import tomllib  # Python 3.11+ stdlib
+    except ImportError:
+        try:
+            import tomli as tomllib  # type: ignore[import-untyped]
+        except ImportError:
+            return None
+
+    try:
+        return tomllib.loads(content.decode("utf-8"))
+    except (UnicodeDecodeError, ValueError):
+        return None
+
+
+# ///////////////////////////////////////////////////////////////
+# PERSISTENCE FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def load_lint_cache(cache_path: Path, cache_version: int) -> OrderedDict[str, Any]:
+    """Load lint cache entries, least recently used first.
+
+    Args:
+        cache_path: Cache file location
+        cache_version: Expected cache format version
+
+    Returns:
+        OrderedDict[str, Any]: Entries keyed by cache key, or an empty dict if
+        the cache is missing, unreadable or from another format version
+    """
+    try:
+        with cache_path.open(encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return OrderedDict()
+
+    if not isinstance(data, dict) or data.get("version") != cache_version:
+        return OrderedDict()
+
+    entries = data.get("entries")
+    return OrderedDict(entries) if isinstance(entries, dict) else OrderedDict()
+
+
+def save_lint_cache(
+    cache_path: Path, cache_version: int, entries: OrderedDict[str, Any]
+) -> None:
+    """Atomically write lint cache entries.
+
+    Args:
+        cache_path: Cache file location
+        cache_version: Cache format version
+        entries: Entries keyed by cache key, least recently used first
+
+    Raises:
+        OSError: If the cache cannot be written
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {"version": cache_version, "entries": entries}
+
+    fd, tmp_name = tempfile.mkstemp(
+        dir=cache_path.parent, prefix=f".{cache_path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, separators=(",", ":"))
+        os.replace(tmp_name, cache_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def get_lint_cache_key(fingerprint: str, file_path: str, content_hash: str) -> str:
+    """Build the cache key of a file for a given tool fingerprint.
+
+    Args:
+        fingerprint: Tool configuration fingerprint
+        file_path: Absolute file path
+        content_hash: Hash of the file content
+
+    Returns:
+        str: Cache key
+    """
+    raw = f"{fingerprint}\0{file_path}\0{content_hash}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+# ///////////////////////////////////////////////////////////////
+# ATTRIBUTION FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def split_json_issues(data: Any, cwd: Path) -> dict[str, list[Any]]:
+    """Group the issues of a JSON report by absolute file path.
+
+    Supports ruff (list of diagnostics) and bandit (``results`` list) reports,
+    whose items carry a ``filename`` relative to ``cwd`` or absolute.
+
+    Args:
+        data: Parsed JSON report
+        cwd: Directory the tool ran in
+
+    Returns:
+        dict[str, list[Any]]: Issues keyed by normalized absolute path
+    """
+    root = Path(cwd).resolve()
+    items = data if isinstance(data, list) else data.get("results", [])
+    issues: dict[str, list[Any]] = {}
+    for item in items:
+        filename = item.get("filename") if isinstance(item, dict) else None
+        key = os.path.normpath(os.path.join(root, filename)) if filename else ""
+        issues.setdefault(key, []).append(item)
+    return issues
+
+
+def split_json_metrics(data: Any, cwd: Path) -> dict[str, dict[str, Any]]:
+    """Group the per-file metrics of a bandit report by absolute file path.
+
+    Args:
+        data: Parsed JSON report
+        cwd: Directory the tool ran in
+
+    Returns:
+        dict[str, dict[str, Any]]: ``{name: metrics}`` keyed by normalized
+        absolute path (empty for reports without metrics)
+    """
+    if not isinstance(data, dict):
+        return {}
+    root = Path(cwd).resolve()
+    return {
+        os.path.normpath(os.path.join(root, name)): {name: values}
+        for name, values in data.get("metrics", {}).items()
+        if name != "_totals"
+    }
+
+
+def get_json_error_files(data: Any, cwd: Path) -> set[str]:
+    """Return the files a JSON report flagged as failed to process.
+
+    Args:
+        data: Parsed JSON report
+        cwd: Directory the tool ran in
+
+    Returns:
+        set[str]: Normalized absolute paths of files with errors
+    """
+    if not isinstance(data, dict):
+        return set()
+    root = Path(cwd).resolve()
+    return {
+        os.path.normpath(os.path.join(root, error["filename"]))
+        for error in data.get("errors", [])
+        if isinstance(error, dict) and error.get("filename")
+    }
+
+
+def sum_json_metrics(metrics: dict[str, Any]) -> dict[str, Any]:
+    """Recompute bandit ``_totals`` from per-file metrics.
+
+    Args:
+        metrics: Per-file metrics keyed by file name
+
+    Returns:
+        dict[str, Any]: Summed numeric metrics
+    """
+    totals: dict[str, Any] = {}
+    for name, values in metrics.items():
+        if name == "_totals" or not isinstance(values, dict):
+            continue
+        for metric, value in values.items():
+            if isinstance(value, (int, float)):
+                totals[metric] = totals.get(metric, 0) + value
+    return totals
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = [
+    "find_config_dirs",
+    "get_json_error_files",
+    "get_lint_cache_key",
+    "get_tool_config_fingerprint",
+    "hash_file_content",
+    "load_lint_cache",
+    "save_lint_cache",
+    "split_json_issues",
+    "split_json_metrics",
+    "sum_json_metrics",
+]
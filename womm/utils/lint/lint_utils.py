@@ -21,9 +21,12 @@ from __future__ import annotations
 # ///////////////////////////////////////////////////////////////
 # Standard library imports
 import json
+import re
 import shutil
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 # Local imports
 from ...exceptions.common import ValidationServiceError
@@ -32,9 +35,13 @@ from ...exceptions.lint import (
     ToolAvailabilityServiceError,
     ToolExecutionServiceError,
 )
-from ...services import CommandRunnerService
 from ...shared.results import ToolResult
 
+if TYPE_CHECKING:
+    # Annotation only: importing services here would make this package and
+    # the lint services import each other
+    from ...services import CommandRunnerService
+
 # ///////////////////////////////////////////////////////////////
 # TOOL DETECTION FUNCTIONS
 # ///////////////////////////////////////////////////////////////
@@ -60,10 +67,8 @@ def check_tool_availability(
         if not shutil.which(tool_name):
             return False
 
-        # Try to run --version with a timeout
-        result = command_runner.run_silent(
-            [tool_name, "--version"],
-        )
+        # Try to run --version with a short timeout
+        result = command_runner.run_probe([tool_name, "--version"])
 
         return bool(result)
 
@@ -102,9 +107,7 @@ def get_tool_version(tool_name: str, command_runner: CommandRunnerService) -> st
             )
 
         # Get version
-        result = command_runner.run_silent(
-            [tool_name, "--version"],
-        )
+        result = command_runner.run_probe([tool_name, "--version"])
 
         if not bool(result):
             raise ToolExecutionServiceError(
@@ -212,6 +215,67 @@ def parse_lint_output(output: str, tool_name: str) -> dict[str, object]:
         ) from e
 
 
+def parse_json_line(line: str) -> Any | None:
+    """Parse one line of a JSON-lines report as soon as it is printed.
+
+    Args:
+        line: Output line
+
+    Returns:
+        Any | None: Parsed record, or None for blank and non-JSON log lines
+
+    Raises:
+        json.JSONDecodeError: If a JSON record is malformed
+    """
+    stripped = line.strip()
+    if not stripped.startswith(("{", "[")):
+        return None
+    return json.loads(stripped)
+
+
+def relocate_tool_result(
+    result: ToolResult, old_root: Path, new_root: Path
+) -> ToolResult:
+    """Rewrite paths under ``old_root`` in a tool result to ``new_root``.
+
+    Used when a tool ran on a copy of the project (e.g. staged content
+    exported to a temporary directory) so reports point at the real files.
+    Both the given and the resolved ``old_root`` are replaced, in one pass
+    and longest first, so one being a suffix of the other (``/var/...`` and
+    ``/private/var/...`` on macOS) cannot corrupt paths. A root only matches
+    at the start of a path and must be followed by a separator or end it.
+
+    Args:
+        result: Tool result to relocate
+        old_root: Directory the tool actually ran on
+        new_root: Directory to report instead
+
+    Returns:
+        ToolResult: Copy of the result with message and data rewritten
+    """
+    old_prefixes = sorted(
+        {str(old_root), str(old_root.resolve())},
+        key=lambda prefix: (-len(prefix), prefix),
+    )
+    pattern = re.compile(
+        r"(?<![\w.\-/\\])(?:"
+        + "|".join(re.escape(prefix) for prefix in old_prefixes)
+        + r")(?![^/\\\s\"':,)\]])"
+    )
+    new_prefix = str(new_root)
+
+    def relocate(value: Any) -> Any:
+        if isinstance(value, str):
+            return pattern.sub(lambda _match: new_prefix, value)
+        if isinstance(value, list):
+            return [relocate(item) for item in value]
+        if isinstance(value, dict):
+            return {relocate(key): relocate(item) for key, item in value.items()}
+        return value
+
+    return replace(result, message=relocate(result.message), data=relocate(result.data))
+
+
 # ///////////////////////////////////////////////////////////////
 # VALIDATION FUNCTIONS
 # ///////////////////////////////////////////////////////////////
@@ -348,6 +412,8 @@ __all__ = [
     "check_tool_availability",
     "export_lint_results_to_json",
     "get_tool_version",
+    "parse_json_line",
     "parse_lint_output",
+    "relocate_tool_result",
     "validate_lint_result",
 ]
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+# ///////////////////////////////////////////////////////////////
+# SHARD UTILS - Command Line Sharding Utilities
+# Project: works-on-my-machine
+# ///////////////////////////////////////////////////////////////
+
+"""
+Pure utility functions for splitting long file lists across tool invocations.
+
+Passing every file of a large project as an argument to a single process
+can exceed the operating system argument limit (``E2BIG``) and leaves all
+but one core idle. These helpers split target lists into shards that fit
+the limit, order them so the largest start first, and merge the JSON
+reports produced by each shard.
+
+This module provides stateless functions for:
+- Argument size budget computation
+- Target list sharding and scheduling
+- JSON report merging
+"""
+
+from __future__ import annotations
+
+# ///////////////////////////////////////////////////////////////
+# IMPORTS
+# ///////////////////////////////////////////////////////////////
+# Standard library imports
+import os
+import stat
+import sys
+from typing import Any
+
+# ///////////////////////////////////////////////////////////////
+# VARIABLES
+# ///////////////////////////////////////////////////////////////
+
+# CreateProcess limits the whole command line to 32767 UTF-16 characters
+WINDOWS_COMMAND_LINE_LIMIT = 32767
+
+# Used when the platform does not report ARG_MAX
+DEFAULT_ARG_MAX = 131072
+
+# Safety margin recommended by POSIX for xargs-style tools
+ARG_MAX_HEADROOM = 2048
+
+# ///////////////////////////////////////////////////////////////
+# BUDGET FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def get_argument_budget() -> int:
+    """Return the number of bytes available for command line arguments.
+
+    On POSIX systems the environment shares the ``ARG_MAX`` space with argv,
+    so its current size is subtracted.
+
+    Returns:
+        int: Usable argument size in bytes (or characters on Windows)
+    """
+    if sys.platform == "win32":
+        return WINDOWS_COMMAND_LINE_LIMIT - ARG_MAX_HEADROOM
+
+    try:
+        arg_max = os.sysconf("SC_ARG_MAX")
+    except (AttributeError, OSError, ValueError):
+        arg_max = -1
+    if arg_max <= 0:
+        arg_max = DEFAULT_ARG_MAX
+
+    environ_size = sum(
+        get_argument_size(f"{key}={value}") for key, value in os.environ.items()
+    )
+    return max(arg_max - environ_size - ARG_MAX_HEADROOM, 0)
+
+
+def get_argument_size(argument: str) -> int:
+    """Return the space a single argument takes on the command line.
+
+    Args:
+        argument: Command line argument
+
+    Returns:
+        int: Size in bytes including separator (and pointer on POSIX)
+    """
+    if sys.platform == "win32":
+        # Surrounding quotes and a separating space
+        return len(argument) + 3
+    return len(os.fsencode(argument)) + 1 + 8
+
+
+# ///////////////////////////////////////////////////////////////
+# SHARDING FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def shard_targets(
+    command: list[str],
+    targets: list[str],
+    budget: int,
+    max_files: int | None = None,
+) -> list[list[str]]:
+    """Split targets into shards whose command lines fit in ``budget``.
+
+    Target order is preserved across shards. A target that does not fit
+    even on its own gets a shard of its own.
+
+    Args:
+        command: Executable and fixed arguments prefixed to every shard
+        targets: Files or directories to distribute
+        budget: Maximum command line size (see ``get_argument_budget``)
+        max_files: Maximum number of targets per shard (None = no limit)
+
+    Returns:
+        list[list[str]]: Target shards (a single empty shard if no targets)
+    """
+    if not targets:
+        return [[]]
+
+    base_size = sum(get_argument_size(argument) for argument in command)
+    shards: list[list[str]] = []
+    current: list[str] = []
+    current_size = base_size
+
+    for target in targets:
+        size = get_argument_size(target)
+        full = max_files is not None and len(current) >= max_files
+        if current and (full or current_size + size > budget):
+            shards.append(current)
+            current = []
+            current_size = base_size
+        current.append(target)
+        current_size += size
+
+    shards.append(current)
+    return shards
+
+
+def get_shard_cost(shard: list[str], cwd: str) -> float:
+    """Estimate how long a shard takes to process from its targets' sizes.
+
+    Args:
+        shard: Files or directories, absolute or relative to ``cwd``
+        cwd: Directory relative targets are resolved against
+
+    Returns:
+        float: Total file size in bytes; infinite if the shard contains a
+        directory, whose content is unknown
+    """
+    cost = 0.0
+    for target in shard:
+        try:
+            target_stat = os.stat(os.path.join(cwd, target))
+        except OSError:
+            continue
+        if stat.S_ISDIR(target_stat.st_mode):
+            return float("inf")
+        cost += target_stat.st_size
+    return cost
+
+
+def order_shards_by_cost(shards: list[list[str]], cwd: str) -> list[int]:
+    """Return shard indices, most expensive first.
+
+    Starting the longest shards first keeps one large shard from running
+    alone at the end while the other workers sit idle (longest processing
+    time first scheduling).
+
+    Args:
+        shards: Target shards (see ``shard_targets``)
+        cwd: Directory relative targets are resolved against
+
+    Returns:
+        list[int]: Indices into ``shards``; equal costs keep target order
+    """
+    costs = [get_shard_cost(shard, cwd) for shard in shards]
+    return sorted(range(len(shards)), key=lambda index: -costs[index])
+
+
+# ///////////////////////////////////////////////////////////////
+# MERGE FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+def merge_json_outputs(outputs: list[Any], object_report: bool) -> Any:
+    """Merge JSON reports produced by several shards of the same tool.
+
+    List reports (ruff) are concatenated. Object reports (bandit) have their
+    ``results`` and ``errors`` lists concatenated, per-file ``metrics``
+    combined and numeric ``_totals`` summed; other keys are taken from the
+    first report. Reports of the other shape are skipped.
+
+    Args:
+        outputs: Parsed JSON reports in shard order
+        object_report: Whether the tool prints an object report (see
+            ``PythonLintingConfig.JSON_REPORT_OBJECT_TOOLS``) rather than a
+            list of issues
+
+    Returns:
+        Any: Merged report, a list or a dict depending on ``object_report``
+    """
+    if not object_report:
+        return [
+            item for output in outputs if isinstance(output, list) for item in output
+        ]
+
+    reports = [output for output in outputs if isinstance(output, dict)]
+    if len(reports) == 1:
+        return reports[0]
+    if not reports:
+        return {"results": []}
+
+    merged: dict[str, Any] = dict(reports[0])
+    for key in ("results", "errors"):
+        if any(key in report for report in reports):
+            merged[key] = [item for report in reports for item in report.get(key, [])]
+
+    if any("metrics" in report for report in reports):
+        metrics: dict[str, Any] = {}
+        totals: dict[str, Any] = {}
+        for report in reports:
+            for name, values in report.get("metrics", {}).items():
+                if name != "_totals":
+                    metrics[name] = values
+                    continue
+                for metric, value in values.items():
+                    if isinstance(value, (int, float)):
+                        totals[metric] = totals.get(metric, 0) + value
+                    else:
+                        totals.setdefault(metric, value)
+        metrics["_totals"] = totals
+        merged["metrics"] = metrics
+
+    return merged
+
+
+# ///////////////////////////////////////////////////////////////
+# PUBLIC API
+# ///////////////////////////////////////////////////////////////
+
+__all__ = [
+    "get_argument_budget",
+    "get_argument_size",
+    "get_shard_cost",
+    "merge_json_outputs",
+    "order_shards_by_cost",
+    "shard_targets",
+]
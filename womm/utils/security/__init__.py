@@ -18,11 +18,14 @@ from __future__ import annotations
 # ///////////////////////////////////////////////////////////////
 # Local imports
 from .security_validation_utils import (
+    get_dangerous_file_regex,
+    get_path_filter_regex,
     has_dangerous_command_patterns,
     has_dangerous_file_patterns,
     has_excessive_traversal,
     is_dangerous_argument,
     is_system_directory,
+    is_system_path,
     validate_chmod_permissions,
     validate_chown_owner,
     validate_permission_command,
@@ -33,11 +36,14 @@ from .security_validation_utils import (
 # ///////////////////////////////////////////////////////////////
 
 __all__ = [
+    "get_dangerous_file_regex",
+    "get_path_filter_regex",
     "has_dangerous_command_patterns",
     "has_dangerous_file_patterns",
     "has_excessive_traversal",
     "is_dangerous_argument",
     "is_system_directory",
+    "is_system_path",
     "validate_chmod_permissions",
     "validate_chown_owner",
     "validate_permission_command",
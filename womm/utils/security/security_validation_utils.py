@@ -18,10 +18,68 @@ from __future__ import annotations
 # ///////////////////////////////////////////////////////////////
 # Standard library imports
 import re
+from functools import lru_cache
 from pathlib import Path
 
 # Local imports
-from ...shared.configs.security import SecurityPatternsConfig
+from ...shared.configs.security import FileScannerConfig, SecurityPatternsConfig
+
+# ///////////////////////////////////////////////////////////////
+# PATTERN COMPILATION FUNCTIONS
+# ///////////////////////////////////////////////////////////////
+
+
+@lru_cache(maxsize=32)
+def _compile_path_filter(
+    sensitive_patterns: tuple[str, ...], dangerous_patterns: tuple[str, ...]
+) -> re.Pattern[str]:
+    """Compile literal and regex path patterns into one alternation.
+
+    Args:
+        sensitive_patterns: Literal substrings (matched case-insensitively)
+        dangerous_patterns: Regular expressions (matched case-insensitively)
+
+    Returns:
+        re.Pattern[str]: Pattern with ``sensitive`` and ``dangerous`` groups
+    """
+    branches = []
+    if sensitive_patterns:
+        literals = "|".join(re.escape(pattern) for pattern in sensitive_patterns)
+        branches.append(f"(?P<sensitive>{literals})")
+    if dangerous_patterns:
+        regexes = "|".join(f"(?:{pattern})" for pattern in dangerous_patterns)
+        branches.append(f"(?P<dangerous>{regexes})")
+    # An empty alternation would match everything, use a never-matching pattern
+    return re.compile("|".join(branches) or r"(?!)", re.IGNORECASE)
+
+
+def get_dangerous_file_regex() -> re.Pattern[str]:
+    """Get the compiled matcher for dangerous file path patterns.
+
+    Returns:
+        re.Pattern[str]: Compiled ``SecurityPatternsConfig.DANGEROUS_FILE_PATTERNS``
+    """
+    return _compile_path_filter(
+        (), tuple(SecurityPatternsConfig.DANGEROUS_FILE_PATTERNS)
+    )
+
+
+def get_path_filter_regex() -> re.Pattern[str]:
+    """Get the combined matcher used to filter scanned files.
+
+    Combines ``FileScannerConfig.SECURITY_SENSITIVE_PATTERNS`` (group
+    ``sensitive``) and ``SecurityPatternsConfig.DANGEROUS_FILE_PATTERNS``
+    (group ``dangerous``) so a path is checked in a single regex pass.
+    The compiled pattern is cached and rebuilt only if the config changes.
+
+    Returns:
+        re.Pattern[str]: Combined compiled pattern
+    """
+    return _compile_path_filter(
+        tuple(FileScannerConfig.SECURITY_SENSITIVE_PATTERNS),
+        tuple(SecurityPatternsConfig.DANGEROUS_FILE_PATTERNS),
+    )
+
 
 # ///////////////////////////////////////////////////////////////
 # COMMAND VALIDATION FUNCTIONS
@@ -139,10 +197,7 @@ def has_dangerous_file_patterns(file_path: str) -> bool:
     Returns:
         bool: True if dangerous patterns found
     """
-    return any(
-        re.search(pattern, file_path, re.IGNORECASE)
-        for pattern in SecurityPatternsConfig.DANGEROUS_FILE_PATTERNS
-    )
+    return get_dangerous_file_regex().search(file_path) is not None
 
 
 def has_excessive_traversal(file_path: str, max_traversal: int = 2) -> bool:
@@ -161,6 +216,55 @@ def has_excessive_traversal(file_path: str, max_traversal: int = 2) -> bool:
     return traversal_count > max_traversal
 
 
+@lru_cache(maxsize=8)
+def _compile_system_rules(
+    system_directories: tuple[str, ...],
+) -> tuple[frozenset[str], tuple[str, ...]]:
+    """Precompute exact matches and prefixes for system directories.
+
+    Args:
+        system_directories: System directories from the security config
+
+    Returns:
+        tuple: Normalized exact-match paths and prefixes
+    """
+    # Known system subdirectories of filesystem roots
+    system_subdirs = ["Windows", "System32", "Program Files", "Program Files (x86)"]
+    exact: set[str] = set()
+    prefixes: list[str] = []
+
+    for system_dir in system_directories:
+        system_dir_normalized = system_dir.replace("\\", "/")
+
+        # For root directories like "C:\\" or "/", only match the root itself or
+        # a known system subdirectory, not everything on the same drive
+        if system_dir_normalized in ("C:/", "/"):
+            root = system_dir_normalized.rstrip("/")
+            exact.add(root)
+            prefixes.extend(f"{root}/{subdir}/" for subdir in system_subdirs)
+        # For specific system directories, use startswith
+        else:
+            prefixes.append(system_dir_normalized)
+
+    return frozenset(exact), tuple(prefixes)
+
+
+def is_system_path(path_str: str) -> bool:
+    """Check if an already-resolved path string points into a system directory.
+
+    Args:
+        path_str: Resolved absolute path
+
+    Returns:
+        bool: True if it's a system directory
+    """
+    exact, prefixes = _compile_system_rules(
+        tuple(SecurityPatternsConfig.SYSTEM_DIRECTORIES)
+    )
+    path_normalized = path_str.replace("\\", "/")
+    return path_normalized in exact or path_normalized.startswith(prefixes)
+
+
 def is_system_directory(path: Path) -> bool:
     """Check if a path is a system directory.
 
@@ -171,40 +275,7 @@ def is_system_directory(path: Path) -> bool:
         bool: True if it's a system directory
     """
     try:
-        path_str = str(path.resolve())
-        path_normalized = path_str.replace("\\", "/")
-
-        for system_dir in SecurityPatternsConfig.SYSTEM_DIRECTORIES:
-            system_dir_normalized = system_dir.replace("\\", "/")
-
-            # For root directories like "C:\\" or "/", check that the path
-            # is actually in a system subdirectory, not just on the same drive
-            if system_dir_normalized in ("C:/", "/"):
-                # Only match if path is exactly the root or in a known system subdirectory
-                if path_normalized == system_dir_normalized.rstrip("/"):
-                    return True
-                # Check for known system subdirectories
-                system_subdirs = [
-                    "Windows",
-                    "System32",
-                    "Program Files",
-                    "Program Files (x86)",
-                ]
-                if any(
-                    path_normalized.startswith(
-                        (
-                            f"{system_dir_normalized.rstrip('/')}/{subdir}/",
-                            f"{system_dir_normalized.rstrip('/')}\\{subdir}\\",
-                        )
-                    )
-                    for subdir in system_subdirs
-                ):
-                    return True
-            # For specific system directories, use startswith
-            elif path_normalized.startswith(system_dir_normalized):
-                return True
-
-        return False
+        return is_system_path(str(path.resolve()))
     except Exception:
         # If path resolution fails, be conservative
         return True